@@ -15,6 +15,7 @@ from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from src.core.config import get_settings
 from src.infrastructure.database.base import Base
+from src.infrastructure.database.partitions import is_partition_table
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -27,6 +28,31 @@ logger = logging.getLogger(__name__)
 target_metadata = Base.metadata
 
 
+def include_object(
+    obj: object,
+    name: str | None,
+    type_: str,
+    reflected: bool,
+    compare_to: object | None,
+) -> bool:
+    """Leave partitions of partitioned tables out of autogenerate.
+
+    Partitions are created by helpers and scheduled jobs rather than
+    declared as models, so they would otherwise be dropped.
+
+    Returns:
+        bool: Whether the object is compared with the models.
+    """
+    _ = obj
+    return not (
+        type_ == "table"
+        and reflected
+        and compare_to is None
+        and name is not None
+        and is_partition_table(name, target_metadata)
+    )
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -51,6 +77,7 @@ def run_migrations_offline() -> None:
         dialect_opts={"paramstyle": "named"},
         compare_type=True,
         compare_server_default=True,
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -68,6 +95,7 @@ def do_run_migrations(connection: Connection) -> None:
         target_metadata=target_metadata,
         compare_type=True,
         compare_server_default=True,
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -11,6 +11,8 @@ Key components:
   - Request context with correlation ID tracking
   - Structured logging with performance metrics
   - Centralized error handling with consistent responses
+- **routes**: Routers mounted by the application factory
+  - Protected debug endpoints for runtime diagnostics
 - **schemas**: Pydantic models for validation and serialization
   - Standardized error response format
   - Request/response DTOs with detailed validation
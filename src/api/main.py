@@ -8,27 +8,39 @@ It handles:
 - Health check and monitoring endpoints
 - Database connection verification
 - OpenTelemetry instrumentation
+- Garbage collector tuning and startup freeze
+- Event loop lag monitoring and protected debug endpoints
+- Periodic query statistics summaries
 
 The module follows a layered middleware approach where middleware are
 executed in reverse order of registration, ensuring proper request/response
 processing flow.
 """
 
+import asyncio
+import contextlib
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
-from typing import Annotated, Any, cast
+from typing import Annotated, Any
 
 from fastapi import Depends, FastAPI
 from loguru import logger
+from sqlalchemy.pool import QueuePool
 
 from src.api.middleware.error_handler import register_exception_handlers
 from src.api.middleware.request_context import RequestContextMiddleware
+from src.api.middleware.request_deadline import RequestDeadlineMiddleware
 from src.api.middleware.request_logging import RequestLoggingMiddleware
 from src.api.middleware.security_headers import SecurityHeadersMiddleware
+from src.api.routes.debug import router as debug_router
+from src.api.routes.debug import should_mount_debug_router
 from src.api.utils.responses import ORJSONResponse
 from src.core.config import Settings, get_settings
 from src.core.logging import setup_logging
-from src.core.observability import instrument_app, setup_tracing
+from src.core.loop_monitor import EventLoopMonitor
+from src.core.observability import instrument_app, setup_metrics, setup_tracing
+from src.core.runtime import configure_gc, freeze_gc
+from src.infrastructure.database.query_stats import log_query_stats_periodically
 from src.infrastructure.database.session import (
     check_database_connection,
     close_database,
@@ -59,6 +71,27 @@ async def lifespan(app_instance: FastAPI) -> AsyncGenerator[None]:
         msg = f"Database connection failed: {error_msg}"
         raise RuntimeError(msg)
 
+    runtime_config = get_settings().runtime_config
+
+    # Freeze everything allocated during startup so GC skips it from now on
+    if runtime_config.gc_freeze_on_startup:
+        freeze_gc()
+
+    # Start event loop lag monitoring
+    loop_monitor: EventLoopMonitor | None = None
+    if runtime_config.enable_loop_monitor:
+        loop_monitor = EventLoopMonitor.from_settings(get_settings())
+        loop_monitor.start()
+
+    # Periodically log the top statements by total database time
+    query_stats_task: asyncio.Task[None] | None = None
+    db_config = get_settings().database_config
+    if db_config.enable_query_stats and db_config.query_stats_log_interval_s > 0:
+        query_stats_task = asyncio.create_task(
+            log_query_stats_periodically(db_config.query_stats_log_interval_s),
+            name="query-stats-summary",
+        )
+
     # Log startup with app info
     logger.info(
         "Application startup complete - {} v{}",
@@ -68,8 +101,14 @@ async def lifespan(app_instance: FastAPI) -> AsyncGenerator[None]:
 
     yield
 
-    # Shutdown: Cleanup database connections
+    # Shutdown: Stop monitoring and cleanup database connections
     logger.info("Application shutdown initiated")
+    if loop_monitor is not None:
+        await loop_monitor.stop()
+    if query_stats_task is not None:
+        query_stats_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await query_stats_task
     await close_database()
     logger.info("Application shutdown complete")
 
@@ -89,8 +128,12 @@ def create_app(settings: Settings | None = None) -> FastAPI:
     # Setup logging first
     setup_logging(settings)
 
-    # Setup tracing
+    # Setup tracing and metrics
     setup_tracing(settings)
+    setup_metrics(settings)
+
+    # Apply GC thresholds and pause telemetry
+    configure_gc(settings)
 
     application = FastAPI(
         title=settings.app_name,
@@ -110,6 +153,11 @@ def create_app(settings: Settings | None = None) -> FastAPI:
     # Order is important: middleware are executed in reverse order of registration
     # So the last middleware added is the first to process requests
 
+    # 4. Request deadline middleware (cancels overdue and abandoned requests)
+    application.add_middleware(
+        RequestDeadlineMiddleware, timeout_s=settings.request_timeout_s
+    )
+
     # 3. Request logging middleware (logs requests/responses)
     application.add_middleware(RequestLoggingMiddleware, log_config=settings.log_config)
 
@@ -151,14 +199,20 @@ def create_app(settings: Settings | None = None) -> FastAPI:
 
         # Log pool metrics if database is healthy
         if is_healthy:
-            engine = get_engine()
-            pool = engine.pool
-            logger.bind(
-                metric_type="db.pool.health",
-                checked_out=cast("Any", pool).checkedout(),
-                size=cast("Any", pool).size(),
-                overflow=cast("Any", pool).overflow(),
-            ).info("Database pool health check")
+            pool = get_engine().pool
+            # Without a client-side pool, as behind a transaction pooler,
+            # there are no sizes to report
+            if isinstance(pool, QueuePool):
+                logger.bind(
+                    metric_type="db.pool.health",
+                    checked_out=pool.checkedout(),
+                    size=pool.size(),
+                    overflow=pool.overflow(),
+                ).info("Database pool health check")
+            else:
+                logger.bind(metric_type="db.pool.health", status=pool.status()).info(
+                    "Database pool health check"
+                )
 
         if not is_healthy:
             # Log error but don't fail the health check entirely
@@ -188,6 +242,12 @@ def create_app(settings: Settings | None = None) -> FastAPI:
             "debug": app_settings.debug,
         }
 
+    # Protected diagnostic endpoints
+    if should_mount_debug_router(settings):
+        application.include_router(debug_router)
+    elif settings.observability_config.enable_debug_endpoints:
+        logger.warning("Debug endpoints require a debug token in production")
+
     # Instrument application for tracing (at the end)
     instrument_app(application, settings)
 
@@ -0,0 +1,265 @@
+"""Request deadline middleware cancelling abandoned and overdue requests.
+
+Without a deadline, a request whose client gave up long ago keeps running,
+and with it any database statement it is waiting on keeps a pool connection
+busy. This middleware gives every request a deadline and cancels the
+handler when the deadline passes or the client disconnects. Cancelling the
+handler cancels the statement in flight: asyncpg sends a cancel request to
+the server and the connection is returned to the pool.
+
+Key features:
+- **Deadline sources**: The configured default, shortened by the
+  X-Request-Timeout header (seconds) or by route defaults declared with
+  request_timeout()
+- **Context propagation**: The deadline is stored in RequestContext, where
+  database code reads it to bound statement timeouts
+- **Disconnect detection**: Once the request body has been read, the
+  remaining ASGI messages are watched for http.disconnect
+- **Timeout response**: Requests cancelled at the deadline before a response
+  started get a 504 error response
+
+This is a pure ASGI middleware so that the handler runs in a task it owns
+and can cancel.
+"""
+
+import asyncio
+import contextlib
+from collections.abc import Callable
+from typing import Any, Final, Literal
+
+from loguru import logger
+from starlette import status
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.api.schemas.errors import ErrorResponse
+from src.api.utils.responses import ORJSONResponse
+from src.core.context import Deadline, RequestContext, generate_request_id
+from src.core.exceptions import ErrorCode, Severity
+
+REQUEST_TIMEOUT_HEADER: Final[str] = "X-Request-Timeout"
+_REQUEST_TIMEOUT_HEADER_KEY: Final[bytes] = REQUEST_TIMEOUT_HEADER.lower().encode()
+_BODY_HEADER_KEYS: Final[frozenset[bytes]] = frozenset(
+    {b"content-length", b"transfer-encoding"}
+)
+
+type CancelReason = Literal["deadline", "disconnect"]
+
+
+def parse_timeout_header(value: str | None) -> float | None:
+    """Parse the X-Request-Timeout header.
+
+    Args:
+        value: The header value in seconds, if present.
+
+    Returns:
+        float | None: The timeout, or None if missing or not a positive number.
+    """
+    if not value:
+        return None
+    try:
+        timeout = float(value)
+    except ValueError:
+        return None
+    return timeout if 0 < timeout < float("inf") else None
+
+
+def request_timeout(timeout_s: float) -> Callable[[], None]:
+    """Create a route dependency shortening the request deadline.
+
+    Args:
+        timeout_s: Maximum seconds the route may take.
+
+    Returns:
+        Callable[[], None]: Dependency to pass to the route's dependencies.
+
+    Example:
+        @router.get("/search", dependencies=[Depends(request_timeout(5))])
+        async def search() -> list[Item]: ...
+    """
+
+    def apply_request_timeout() -> None:
+        deadline = RequestContext.get_deadline()
+        if deadline is not None:
+            deadline.tighten(timeout_s)
+
+    return apply_request_timeout
+
+
+class _DisconnectWatcher:
+    """Receive wrapper noticing client disconnects while the handler runs.
+
+    Messages are passed through until the request body is complete. From
+    then on, a background task owns the underlying receive, so a disconnect
+    is noticed even when the handler never calls receive again.
+    """
+
+    def __init__(self, receive: Receive, *, has_body: bool) -> None:
+        self._receive = receive
+        self._messages: asyncio.Queue[Message] = asyncio.Queue()
+        self._task: asyncio.Task[None] | None = None
+        self.disconnected = asyncio.Event()
+        if not has_body:
+            self._start()
+
+    def _start(self) -> None:
+        self._task = asyncio.create_task(self._pump(), name="disconnect-watcher")
+
+    async def _pump(self) -> None:
+        while True:
+            message = await self._receive()
+            self._messages.put_nowait(message)
+            if message["type"] == "http.disconnect":
+                self.disconnected.set()
+                return
+
+    async def receive(self) -> Message:
+        """Receive the next ASGI message for the handler.
+
+        Returns:
+            Message: The next message from the client.
+        """
+        if self._task is None:
+            message = await self._receive()
+            if message["type"] == "http.disconnect":
+                self.disconnected.set()
+            elif not message.get("more_body", False):
+                self._start()
+            return message
+        if self.disconnected.is_set() and self._messages.empty():
+            return {"type": "http.disconnect"}
+        return await self._messages.get()
+
+    async def close(self) -> None:
+        """Stop watching the connection."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+
+
+class RequestDeadlineMiddleware:
+    """ASGI middleware enforcing request deadlines.
+
+    Args:
+        app: The ASGI application.
+        timeout_s: Default request deadline in seconds.
+    """
+
+    def __init__(self, app: ASGIApp, timeout_s: float) -> None:
+        self.app = app
+        self.timeout_s = timeout_s
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run the request with a deadline.
+
+        Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive callable.
+            send: The ASGI send callable.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        header_timeout = parse_timeout_header(
+            headers.get(_REQUEST_TIMEOUT_HEADER_KEY, b"").decode("latin-1")
+        )
+        deadline = Deadline.after(min(self.timeout_s, header_timeout or self.timeout_s))
+        watcher = _DisconnectWatcher(
+            receive, has_body=not _BODY_HEADER_KEYS.isdisjoint(headers)
+        )
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        # The handler task copies the current context, including the deadline
+        RequestContext.set_deadline(deadline)
+        handler: asyncio.Future[None] = asyncio.ensure_future(
+            self.app(scope, watcher.receive, send_wrapper)
+        )
+        try:
+            reason = await self._wait(handler, deadline, watcher)
+            if reason is not None:
+                await self._cancel(handler, reason, scope, deadline)
+        except asyncio.CancelledError:
+            handler.cancel()
+            raise
+        finally:
+            await watcher.close()
+            RequestContext.set_deadline(None)
+
+        if reason is None:
+            handler.result()
+        elif reason == "deadline" and not response_started:
+            await self._send_timeout_response(scope, receive, send)
+
+    @staticmethod
+    async def _wait(
+        handler: asyncio.Future[None], deadline: Deadline, watcher: _DisconnectWatcher
+    ) -> CancelReason | None:
+        """Wait for the handler, the deadline or a disconnect.
+
+        Returns:
+            CancelReason | None: Why the handler must be cancelled, or None
+                if it completed.
+        """
+        disconnected = asyncio.create_task(watcher.disconnected.wait())
+        waiters: set[asyncio.Future[Any]] = {handler, disconnected}
+        try:
+            while not handler.done():
+                remaining = deadline.remaining()
+                if remaining <= 0:
+                    return "deadline"
+                await asyncio.wait(
+                    waiters,
+                    timeout=remaining,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if disconnected.done() and not handler.done():
+                    return "disconnect"
+        finally:
+            disconnected.cancel()
+        return None
+
+    @staticmethod
+    async def _cancel(
+        handler: asyncio.Future[None],
+        reason: CancelReason,
+        scope: Scope,
+        deadline: Deadline,
+    ) -> None:
+        """Cancel the handler and wait until it has unwound."""
+        logger.warning(
+            "Cancelling request {} {}: {}",
+            scope["method"],
+            scope["path"],
+            "deadline exceeded" if reason == "deadline" else "client disconnected",
+            reason=reason,
+            overdue_ms=round(-deadline.remaining() * 1000, 2),
+        )
+        handler.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await handler
+
+    @staticmethod
+    async def _send_timeout_response(
+        scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        """Send the 504 response of a request cancelled at its deadline."""
+        error_response = ErrorResponse(
+            error_code=ErrorCode.DEADLINE_EXCEEDED.value,
+            message="Request did not complete before its deadline",
+            correlation_id=RequestContext.get_correlation_id(),
+            request_id=generate_request_id(),
+            severity=Severity.MEDIUM.value,
+        )
+        response = ORJSONResponse(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            content=error_response.model_dump(mode="json"),
+        )
+        await response(scope, receive, send)
@@ -8,6 +8,8 @@ Features:
 - **Performance tracking**: Request duration and slow request detection
 - **Client identification**: IP extraction with proxy header support
 - **Request/response metrics**: Size tracking for bandwidth monitoring
+- **Resource accounting**: CPU time, database statements and time, pool
+  checkout wait and sampled allocation bytes per request
 - **Exclusion patterns**: Configurable path exclusion (e.g., health checks)
 - **Error handling**: Logs failures while preserving exception propagation
 
@@ -15,16 +17,53 @@ The middleware integrates with the correlation ID system to ensure all logs
 for a single request can be easily aggregated and analyzed.
 """
 
+import random
 import time
+import tracemalloc
 import uuid
 from collections.abc import Awaitable, Callable
+from contextlib import AbstractContextManager, nullcontext
 
 from fastapi import Request, Response
 from loguru import logger
 from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from src.core.config import LogConfig, get_settings
+from src.core.resource_usage import (
+    RequestUsage,
+    get_request_usage,
+    request_usage_scope,
+    track_usage,
+)
+
+
+class _UsageTrackingApp:
+    """ASGI wrapper charging the CPU time of the downstream app to the request.
+
+    BaseHTTPMiddleware runs the downstream app in its own task, so the
+    measurement has to happen inside that task rather than around call_next.
+
+    Args:
+        app: The downstream ASGI application.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run the downstream app, tracking usage if a request is accounted.
+
+        Args:
+            scope: ASGI connection scope.
+            receive: ASGI receive channel.
+            send: ASGI send channel.
+        """
+        usage = get_request_usage()
+        if usage is None:
+            await self.app(scope, receive, send)
+            return
+        await track_usage(self.app(scope, receive, send), usage)
 
 
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
@@ -33,6 +72,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
     This simplified middleware:
     - Logs request start/completion with timing
     - Tracks basic performance metrics
+    - Accounts CPU, database and pool wait time per request
     - Excludes configured paths
     - Integrates with correlation IDs
 
@@ -47,6 +87,39 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         self.excluded_paths = set(log_config.excluded_paths)
         self.settings = get_settings()
 
+        if log_config.enable_request_accounting:
+            self.app = _UsageTrackingApp(app)
+            if (
+                log_config.request_alloc_sample_rate > 0
+                and not tracemalloc.is_tracing()
+            ):
+                tracemalloc.start()
+                logger.info(
+                    "tracemalloc started for request allocation sampling - rate: {}",
+                    log_config.request_alloc_sample_rate,
+                )
+
+    def _usage_scope(
+        self, request: Request
+    ) -> AbstractContextManager[RequestUsage | None]:
+        """Create the resource accounting scope for a request.
+
+        Args:
+            request: The incoming request.
+
+        Returns:
+            AbstractContextManager[RequestUsage | None]: Scope yielding the
+                request accumulator, or None if accounting is disabled.
+        """
+        if not self.log_config.enable_request_accounting:
+            return nullcontext()
+
+        sample_rate = self.log_config.request_alloc_sample_rate
+        return request_usage_scope(
+            scope=request.scope,
+            track_allocations=sample_rate > 0 and random.random() < sample_rate,  # noqa: S311 - sampling, not crypto
+        )
+
     def _get_client_ip(self, request: Request) -> str:
         """Extract real client IP considering proxy headers.
 
@@ -122,13 +195,16 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             request_size = 0
 
         # Bind request context for this request
-        with logger.contextualize(
-            request_id=request_id,
-            method=request.method,
-            path=request.url.path,
-            client_host=client_ip,
-            user_agent=user_agent,
-            request_size=request_size,
+        with (
+            logger.contextualize(
+                request_id=request_id,
+                method=request.method,
+                path=request.url.path,
+                client_host=client_ip,
+                user_agent=user_agent,
+                request_size=request_size,
+            ),
+            self._usage_scope(request) as usage,
         ):
             # Log request start
             logger.info(
@@ -155,6 +231,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
                     duration_ms=round(duration_ms, 2),
                     error_type=type(exc).__name__,
                     error_message=str(exc),
+                    **(usage.as_log_fields() if usage is not None else {}),
                 )
 
                 # Re-raise the exception
@@ -177,6 +254,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
                     status_code=response.status_code,
                     duration_ms=round(duration_ms, 2),
                     response_size=response_size,
+                    **(usage.as_log_fields() if usage is not None else {}),
                 )
 
                 # Add request ID to response
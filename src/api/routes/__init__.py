@@ -0,0 +1,6 @@
+"""API routers grouped by concern.
+
+Routers in this package are mounted by the application factory:
+
+- **debug**: Protected diagnostic endpoints (task stacks, runtime state)
+"""
@@ -0,0 +1,138 @@
+"""Protected diagnostic endpoints for runtime introspection.
+
+These endpoints expose process internals that help diagnose latency
+problems in a running instance without attaching a profiler. They are
+only mounted when enabled in the observability configuration and require
+the configured debug token, which is mandatory in production.
+
+Endpoints:
+- **GET /debug/tasks**: Stacks of all asyncio tasks on the event loop
+- **GET /debug/query-stats**: Aggregated statistics per statement fingerprint
+- **DELETE /debug/query-stats**: Reset the query statistics window
+- **GET /debug/slow-plans**: Execution plans captured for slow queries
+- **DELETE /debug/slow-plans**: Discard captured plans
+"""
+
+import secrets
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header, Query, status
+
+from src.core.config import Settings, get_settings
+from src.core.exceptions import UnauthorizedError
+from src.core.loop_monitor import dump_task_stacks
+from src.infrastructure.database.explain import get_plan_capture
+from src.infrastructure.database.query_stats import QueryStatsOrder, get_query_stats
+from src.infrastructure.database.statement_cache import get_statement_cache_stats
+
+MAX_QUERY_STATS_LIMIT = 500
+
+DEBUG_TOKEN_HEADER = "X-Debug-Token"  # noqa: S105 - header name, not a secret
+
+
+async def require_debug_access(
+    settings: Annotated[Settings, Depends(get_settings)],
+    debug_token: Annotated[str | None, Header(alias=DEBUG_TOKEN_HEADER)] = None,
+) -> None:
+    """Verify the caller is allowed to use the debug endpoints.
+
+    Args:
+        settings: Application settings.
+        debug_token: Token sent in the X-Debug-Token header.
+
+    Raises:
+        UnauthorizedError: If a token is configured and the header is
+            missing or does not match.
+    """
+    expected = settings.observability_config.debug_token
+    if expected is None:
+        return
+    if debug_token is None or not secrets.compare_digest(debug_token, expected):
+        raise UnauthorizedError("Invalid or missing debug token")
+
+
+def should_mount_debug_router(settings: Settings) -> bool:
+    """Decide whether the debug router can be mounted.
+
+    Args:
+        settings: Application settings.
+
+    Returns:
+        bool: True if debug endpoints are enabled and safely protected.
+    """
+    observability_config = settings.observability_config
+    if not observability_config.enable_debug_endpoints:
+        return False
+    # Never expose unauthenticated diagnostics in production
+    return (
+        settings.environment != "production"
+        or observability_config.debug_token is not None
+    )
+
+
+router = APIRouter(
+    prefix="/debug",
+    tags=["debug"],
+    dependencies=[Depends(require_debug_access)],
+)
+
+
+@router.get("/tasks")
+async def task_stacks() -> dict[str, object]:
+    """Dump the stacks of all asyncio tasks.
+
+    Returns:
+        dict[str, object]: Task count and per-task stack information.
+    """
+    tasks = dump_task_stacks()
+    return {"task_count": len(tasks), "tasks": tasks}
+
+
+@router.get("/query-stats")
+async def query_stats(
+    limit: Annotated[int, Query(ge=1, le=MAX_QUERY_STATS_LIMIT)] = 50,
+    order_by: QueryStatsOrder = "total",
+) -> dict[str, object]:
+    """Return aggregated statistics per normalized statement.
+
+    Args:
+        limit: Maximum number of statements to return.
+        order_by: Sort key - total time, mean time, calls or p99.
+
+    Returns:
+        dict[str, object]: Collection window, prepared statement cache hit
+            rate and the top statements.
+    """
+    snapshot = get_query_stats().snapshot(limit=limit, order_by=order_by)
+    snapshot["statement_cache"] = get_statement_cache_stats().as_dict()
+    return snapshot
+
+
+@router.delete("/query-stats", status_code=status.HTTP_204_NO_CONTENT)
+async def reset_query_stats() -> None:
+    """Discard collected query statistics and start a new window."""
+    get_query_stats().reset()
+    get_statement_cache_stats().reset()
+
+
+@router.get("/slow-plans")
+async def slow_plans(
+    settings: Annotated[Settings, Depends(get_settings)],
+) -> dict[str, object]:
+    """Return execution plans captured for slow queries, most recent first.
+
+    Args:
+        settings: Application settings.
+
+    Returns:
+        dict[str, object]: Capture status and the captured plans.
+    """
+    enabled = settings.database_config.explain_slow_queries
+    plans = get_plan_capture().plans() if enabled else []
+    return {"enabled": enabled, "plan_count": len(plans), "plans": plans}
+
+
+@router.delete("/slow-plans", status_code=status.HTTP_204_NO_CONTENT)
+async def clear_slow_plans() -> None:
+    """Discard captured slow query plans."""
+    get_plan_capture().clear()
@@ -1,7 +1,8 @@
 """Utility modules for API-specific functionality.
 
 This package contains helper modules and utilities used across the API layer:
-- **responses**: High-performance JSON response classes using orjson
+- **responses**: High-performance JSON response classes using orjson and a
+  streaming CSV export response
 - Additional utilities for request processing and response formatting
 
 These utilities are designed to improve API performance and developer
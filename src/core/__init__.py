@@ -8,7 +8,10 @@ of the Tributum application:
 - **exceptions**: Structured exception hierarchy with error codes
 - **error_context**: Sensitive data sanitization for safe logging
 - **logging**: Structured logging with cloud provider integrations
-- **observability**: Distributed tracing with OpenTelemetry
+- **observability**: Distributed tracing and metrics with OpenTelemetry
+- **runtime**: Garbage collector tuning and pause telemetry
+- **loop_monitor**: Event loop lag monitoring and blocking-call detection
+- **resource_usage**: Request-scoped CPU, database and pool wait accounting
 - **types**: Type aliases for better code clarity
 
 These modules implement cross-cutting concerns that ensure consistency,
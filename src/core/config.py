@@ -56,6 +56,17 @@ class LogConfig(BaseModel):
         gt=0,
         description="Slow query threshold in milliseconds",
     )
+    enable_request_accounting: bool = Field(
+        default=True,
+        description="Report CPU, database and pool wait time per request",
+    )
+    request_alloc_sample_rate: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of requests reporting allocated bytes. "
+        "Values above 0 start tracemalloc, which slows down every allocation.",
+    )
     sensitive_fields: list[str] = Field(
         default_factory=lambda: [
             "password",
@@ -93,8 +104,28 @@ class ObservabilityConfig(BaseModel):
         le=1.0,
         description="Trace sampling rate (0.0 to 1.0)",
     )
+    enable_metrics: bool = Field(
+        default=True,
+        description="Enable OpenTelemetry metrics (exported for OTLP/AWS exporters)",
+    )
+    metrics_export_interval_ms: int = Field(
+        default=60000,
+        gt=0,
+        description="Interval between metric exports in milliseconds",
+    )
+    enable_debug_endpoints: bool = Field(
+        default=False,
+        description="Expose diagnostic endpoints under /debug",
+    )
+    debug_token: str | None = Field(
+        default=None,
+        description="Token required in the X-Debug-Token header for /debug "
+        "endpoints. Mandatory in production.",
+    )
 
-    @field_validator("exporter_endpoint", "gcp_project_id", mode="before")
+    @field_validator(
+        "exporter_endpoint", "gcp_project_id", "debug_token", mode="before"
+    )
     @classmethod
     def empty_str_to_none(cls, v: str | None) -> str | None:
         """Convert empty strings to None for nullable fields."""
@@ -103,6 +134,63 @@ class ObservabilityConfig(BaseModel):
         return v
 
 
+# Built-in engine profiles, individually overridable per setting
+DEFAULT_ENGINE_PROFILES: dict[str, dict[str, Any]] = {
+    "analytics": {
+        "pool_size": 2,
+        "max_overflow": 0,
+        "pool_timeout": 10.0,
+        "statement_timeout_ms": 300_000,
+        "work_mem": "64MB",
+        "jit": True,
+    },
+}
+
+
+class EngineProfileConfig(BaseModel):
+    """Connection pool and server settings of a named database engine profile.
+
+    Each profile gets its own engine and pool, so a slow workload cannot
+    take the connections of latency-sensitive endpoints.
+    """
+
+    pool_size: int = Field(
+        default=5,
+        ge=1,
+        le=100,
+        description="Number of connections to maintain in the pool",
+    )
+    max_overflow: int = Field(
+        default=0,
+        ge=0,
+        le=50,
+        description="Maximum overflow connections above pool_size",
+    )
+    pool_timeout: float = Field(
+        default=30.0,
+        gt=0,
+        le=300,
+        description="Timeout in seconds for acquiring a connection from the pool",
+    )
+    statement_timeout_ms: int | None = Field(
+        default=None,
+        ge=0,
+        description="Server-side statement timeout of the profile's sessions",
+    )
+    work_mem: str | None = Field(
+        default=None,
+        description="PostgreSQL work_mem of the profile's sessions (e.g. 64MB)",
+    )
+    jit: bool = Field(
+        default=False,
+        description="Whether PostgreSQL JIT compilation is enabled",
+    )
+    server_settings: dict[str, str] = Field(
+        default_factory=dict,
+        description="Additional PostgreSQL settings applied on connect",
+    )
+
+
 class DatabaseConfig(BaseModel):
     """Database configuration settings."""
 
@@ -132,10 +220,147 @@ class DatabaseConfig(BaseModel):
         default=True,
         description="Whether to test connections before using them",
     )
+    pool_pre_ping_idle_seconds: float = Field(
+        default=30.0,
+        ge=0,
+        le=3600,
+        description=(
+            "Only test connections idle in the pool for at least this many "
+            "seconds (0 tests on every checkout)"
+        ),
+    )
     echo: bool = Field(
         default=False,
         description="Whether to log SQL statements (use only for debugging)",
     )
+    engine_profiles: dict[str, EngineProfileConfig] = Field(
+        default_factory=lambda: {
+            name: EngineProfileConfig(**values)
+            for name, values in DEFAULT_ENGINE_PROFILES.items()
+        },
+        description="Named engine profiles with their own pools, selected per "
+        "dependency or repository. The top-level pool settings form the "
+        "default profile.",
+    )
+    deadline_statement_timeout: bool = Field(
+        default=True,
+        description="Bound the statement timeout of each transaction by the "
+        "remaining request deadline when it is tighter than the default request "
+        "deadline and the statement timeout (one extra statement per such "
+        "transaction)",
+    )
+    read_only_session_mode: Literal["autocommit", "transaction"] = Field(
+        default="transaction",
+        description="How read-only sessions run: a READ ONLY transaction that "
+        "PostgreSQL enforces and that is rolled back instead of committed, or "
+        "autocommit statements without BEGIN/ROLLBACK round trips. Autocommit "
+        "is not enforced: a statement that writes is committed immediately. "
+        "Ignored behind a transaction pooler, where sessions use transactions.",
+    )
+    statement_cache_size: int = Field(
+        default=100,
+        ge=0,
+        description="Prepared statements cached per connection (0 disables)",
+    )
+    max_cached_statement_lifetime: int = Field(
+        default=300,
+        ge=0,
+        description="Seconds a statement stays in the asyncpg statement cache "
+        "(0 keeps statements until evicted)",
+    )
+    sql_commenter_mode: Literal["off", "stable", "full"] = Field(
+        default="stable",
+        description="SQL comments appended to statements: stable route and "
+        "controller tags, full per-request trace context (defeats the "
+        "prepared statement cache) or none",
+    )
+    pooler_mode: Literal["none", "transaction"] = Field(
+        default="none",
+        description="Connection pooler in front of PostgreSQL. 'transaction' "
+        "(e.g. PgBouncer in transaction mode) disables the statement caches, "
+        "names prepared statements uniquely and applies server settings per "
+        "transaction instead of per connection",
+    )
+    pooler_pool_size: int = Field(
+        default=0,
+        ge=0,
+        description="Client-side pool size per engine behind a transaction "
+        "pooler (0 opens a connection per checkout)",
+    )
+    n_plus_one_detection: Literal["off", "warn", "raise"] | None = Field(
+        default=None,
+        description="N+1 query detection mode. Defaults to warn outside of "
+        "production and off in production. Requires request accounting.",
+    )
+    n_plus_one_threshold: int = Field(
+        default=10,
+        ge=2,
+        description="Executions of the same statement fingerprint within one "
+        "request that are reported as an N+1 pattern",
+    )
+    enable_query_metrics: bool = Field(
+        default=True,
+        description="Record the duration of every statement in a histogram",
+    )
+    enable_query_stats: bool = Field(
+        default=True,
+        description="Aggregate per-statement call counts and latencies in process",
+    )
+    query_stats_max_entries: int = Field(
+        default=500,
+        ge=10,
+        le=10000,
+        description="Maximum number of statement fingerprints kept in memory",
+    )
+    query_stats_log_interval_s: int = Field(
+        default=300,
+        ge=0,
+        description="Interval between query statistics log summaries in seconds "
+        "(0 disables the summaries)",
+    )
+    explain_slow_queries: bool = Field(
+        default=False,
+        description="Capture execution plans of slow SELECT statements on a "
+        "separate connection. Requires SQL logging.",
+    )
+    explain_analyze: bool = Field(
+        default=False,
+        description="Use EXPLAIN (ANALYZE, BUFFERS), which executes the query "
+        "again, instead of a plain EXPLAIN",
+    )
+    explain_max_plans: int = Field(
+        default=100,
+        ge=1,
+        le=1000,
+        description="Maximum number of captured plans kept in memory",
+    )
+    explain_timeout_ms: int = Field(
+        default=5000,
+        ge=100,
+        description="Statement timeout for plan capture in milliseconds",
+    )
+
+    @field_validator("engine_profiles", mode="before")
+    @classmethod
+    def merge_engine_profile_defaults(cls, v: object) -> object:
+        """Merge configured profiles into the built-in profile defaults.
+
+        Overriding a single setting of a built-in profile (e.g. through
+        DATABASE_CONFIG__ENGINE_PROFILES__ANALYTICS__POOL_SIZE) keeps its
+        other defaults.
+        """
+        if not isinstance(v, dict):
+            return v
+        merged: dict[str, object] = {
+            name: dict(values) for name, values in DEFAULT_ENGINE_PROFILES.items()
+        }
+        for name, values in v.items():
+            defaults = merged.get(name)
+            if isinstance(defaults, dict) and isinstance(values, dict):
+                merged[name] = {**defaults, **values}
+            else:
+                merged[name] = values
+        return merged
 
     @field_validator("database_url", mode="after")
     @classmethod
@@ -165,6 +390,51 @@ class DatabaseConfig(BaseModel):
         return self.database_url  # pragma: no cover
 
 
+class RuntimeConfig(BaseModel):
+    """Python runtime tuning configuration."""
+
+    gc_freeze_on_startup: bool = Field(
+        default=True,
+        description="Call gc.freeze() once application startup has completed, "
+        "so full collections skip the objects created during startup",
+    )
+    gc_thresholds: tuple[int, int, int] | None = Field(
+        default=None,
+        description="Garbage collector thresholds (gen0, gen1, gen2). "
+        "Interpreter defaults are kept if not specified.",
+    )
+    enable_gc_metrics: bool = Field(
+        default=True,
+        description="Record garbage collection pauses per generation as histograms",
+    )
+    enable_loop_monitor: bool = Field(
+        default=False,
+        description="Measure event loop lag and capture stacks of blocking calls",
+    )
+    loop_monitor_interval_ms: int = Field(
+        default=100,
+        gt=0,
+        le=10000,
+        description="Interval between event loop lag probes in milliseconds",
+    )
+    loop_lag_threshold_ms: int = Field(
+        default=250,
+        gt=0,
+        description="Event loop stall that triggers a blocking-call stack capture",
+    )
+
+    @field_validator("gc_thresholds", mode="after")
+    @classmethod
+    def validate_gc_thresholds(
+        cls, v: tuple[int, int, int] | None
+    ) -> tuple[int, int, int] | None:
+        """Validate that GC thresholds are non-negative."""
+        if v is not None and any(threshold < 0 for threshold in v):
+            msg = "GC thresholds must be non-negative integers"
+            raise ValueError(msg)
+        return v
+
+
 class Settings(BaseSettings):
     """Main settings class for the application."""
 
@@ -193,6 +463,13 @@ class Settings(BaseSettings):
     openapi_url: str | None = Field(
         default="/openapi.json", description="OpenAPI schema URL"
     )
+    request_timeout_s: float = Field(
+        default=30.0,
+        gt=0,
+        le=3600,
+        description="Default request deadline in seconds. Clients can shorten "
+        "it with the X-Request-Timeout header, routes with request_timeout().",
+    )
 
     # Logging configuration
     log_config: LogConfig = Field(
@@ -209,6 +486,11 @@ class Settings(BaseSettings):
         default_factory=DatabaseConfig, description="Database configuration"
     )
 
+    # Runtime configuration
+    runtime_config: RuntimeConfig = Field(
+        default_factory=RuntimeConfig, description="Python runtime configuration"
+    )
+
     def model_post_init(self, __context: object) -> None:
         """Post initialization to set environment-based defaults."""
         super().model_post_init(__context)
@@ -217,6 +499,11 @@ class Settings(BaseSettings):
         if self.log_config.log_formatter_type is None:
             self.log_config.log_formatter_type = self._detect_formatter()
 
+        if self.database_config.n_plus_one_detection is None:
+            self.database_config.n_plus_one_detection = (
+                "off" if self.environment == "production" else "warn"
+            )
+
         if self.environment == "production":
             # Production defaults
             if self.observability_config.exporter_type == "console":
@@ -12,16 +12,68 @@ Key features:
 
 The primary use case is correlation ID propagation for distributed tracing,
 but the pattern can be extended for other request-scoped data like user
-context, feature flags, or request metadata.
+context, feature flags, or request metadata. The request deadline is carried
+the same way, so database code can bound statement timeouts by the time the
+client is still willing to wait.
 """
 
+import time
 import uuid
-from contextvars import ContextVar
+from contextvars import Context, ContextVar
 
 # Context variable for storing correlation ID across async boundaries
 _correlation_id_var: ContextVar[str | None] = ContextVar("correlation_id", default=None)
 
 
+class Deadline:
+    """Point in monotonic time by which a request must complete.
+
+    The object is shared by reference between the middleware that enforces
+    the deadline and the request handler, so a handler tightening it (for
+    example through a route default) is seen by the middleware as well.
+
+    Args:
+        expires_at: Expiry as a time.monotonic() value.
+    """
+
+    __slots__ = ("expires_at",)
+
+    def __init__(self, expires_at: float) -> None:
+        self.expires_at = expires_at
+
+    @classmethod
+    def after(cls, timeout_s: float) -> "Deadline":
+        """Create a deadline expiring after a timeout from now.
+
+        Args:
+            timeout_s: Seconds until the deadline expires.
+
+        Returns:
+            Deadline: The new deadline.
+        """
+        return cls(time.monotonic() + timeout_s)
+
+    def remaining(self) -> float:
+        """Seconds left until the deadline, negative once it has passed.
+
+        Returns:
+            float: The remaining time in seconds.
+        """
+        return self.expires_at - time.monotonic()
+
+    def tighten(self, timeout_s: float) -> None:
+        """Move the deadline earlier if a timeout from now expires sooner.
+
+        Args:
+            timeout_s: Seconds from now.
+        """
+        self.expires_at = min(self.expires_at, time.monotonic() + timeout_s)
+
+
+# Context variable for storing the request deadline
+_deadline_var: ContextVar[Deadline | None] = ContextVar("deadline", default=None)
+
+
 class RequestContext:
     """Manages request context using contextvars for async-safe storage.
 
@@ -48,6 +100,39 @@ class RequestContext:
         """
         return _correlation_id_var.get()
 
+    @staticmethod
+    def get_correlation_id_from(context: Context) -> str | None:
+        """Get the correlation ID stored in a specific context.
+
+        Used by code that inspects another task's context (for example from
+        a watchdog thread) instead of the current one.
+
+        Args:
+            context: The context to read, e.g. from asyncio.Task.get_context().
+
+        Returns:
+            str | None: The correlation ID if set in that context, None otherwise.
+        """
+        return context.get(_correlation_id_var)
+
+    @staticmethod
+    def set_deadline(deadline: Deadline | None) -> None:
+        """Set the deadline of the current request.
+
+        Args:
+            deadline: The request deadline, or None to remove it.
+        """
+        _deadline_var.set(deadline)
+
+    @staticmethod
+    def get_deadline() -> Deadline | None:
+        """Get the deadline of the current request.
+
+        Returns:
+            Deadline | None: The deadline if set, None otherwise.
+        """
+        return _deadline_var.get()
+
     @staticmethod
     def clear() -> None:
         """Clear all context variables.
@@ -56,6 +141,7 @@ class RequestContext:
         clean state for the next request.
         """
         _correlation_id_var.set(None)
+        _deadline_var.set(None)
 
 
 def generate_correlation_id() -> str:
@@ -50,6 +50,10 @@ class ErrorCode(Enum):
     UNAUTHORIZED = "UNAUTHORIZED"
     """Authentication failed or user is not authorized for this action."""
 
+    # Timeout errors
+    DEADLINE_EXCEEDED = "DEADLINE_EXCEEDED"
+    """The request did not complete before its deadline."""
+
 
 class Severity(Enum):
     """Severity levels for errors in the Tributum application.
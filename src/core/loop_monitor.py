@@ -0,0 +1,220 @@
+"""Event loop lag monitoring with blocking-call stack capture.
+
+Anything that runs synchronously on the event loop thread - a blocking
+driver call inside a route, heavy sanitization, a JSON formatter running
+inline - delays every other request served by the process. This module
+makes such stalls visible.
+
+Key components:
+- **Lag probe**: An asyncio task that sleeps for a fixed interval and records
+  how late it was woken up as a histogram
+- **Watchdog thread**: Notices when the probe stops making progress and
+  captures the stack of the event loop thread while it is still blocked,
+  tagged with the correlation ID of the task that was running
+- **Task dump**: On-demand snapshot of all asyncio task stacks for the
+  debug endpoints
+
+The watchdog only reads interpreter state (thread frames and the loop's
+current task) and never touches the loop itself, so it keeps working while
+the loop is stuck.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import io
+import sys
+import threading
+import time
+import traceback
+from typing import TYPE_CHECKING, Final
+
+from loguru import logger
+
+from src.core.context import RequestContext
+from src.core.observability import get_meter
+
+if TYPE_CHECKING:
+    from opentelemetry.metrics import Histogram
+
+    from src.core.config import Settings
+
+LOOP_LAG_METRIC_NAME: Final[str] = "runtime.event_loop.lag"
+MAX_STACK_FRAMES: Final[int] = 30
+
+
+class EventLoopMonitor:
+    """Measures event loop scheduling lag and reports blocking calls.
+
+    Args:
+        interval: Seconds between lag probes.
+        threshold: Stall duration in seconds that triggers a stack capture.
+        histogram: Optional histogram for lag samples. Created from the
+            module meter if not provided.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        threshold: float,
+        histogram: Histogram | None = None,
+    ) -> None:
+        self.interval = interval
+        self.threshold = threshold
+        self._histogram = histogram or get_meter(__name__).create_histogram(
+            LOOP_LAG_METRIC_NAME,
+            unit="ms",
+            description="Delay between scheduled and actual event loop wake-ups",
+        )
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._probe_task: asyncio.Task[None] | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stop_event = threading.Event()
+        self._heartbeat = 0.0
+        self._reported_heartbeat = 0.0
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> EventLoopMonitor:
+        """Create a monitor from the runtime configuration.
+
+        Args:
+            settings: Application settings.
+
+        Returns:
+            EventLoopMonitor: Monitor configured with the runtime settings.
+        """
+        runtime_config = settings.runtime_config
+        return cls(
+            interval=runtime_config.loop_monitor_interval_ms / 1000,
+            threshold=runtime_config.loop_lag_threshold_ms / 1000,
+        )
+
+    @property
+    def running(self) -> bool:
+        """Whether the monitor has been started and not stopped."""
+        return self._probe_task is not None
+
+    def start(self) -> None:
+        """Start the lag probe and the watchdog thread.
+
+        Must be called from within the event loop to monitor.
+        """
+        if self.running:
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.perf_counter()
+        self._stop_event.clear()
+
+        self._probe_task = self._loop.create_task(
+            self._probe(), name="event-loop-monitor"
+        )
+        self._watchdog = threading.Thread(
+            target=self._watch, name="event-loop-watchdog", daemon=True
+        )
+        self._watchdog.start()
+
+        logger.info(
+            "Event loop monitor started - interval: {}ms, threshold: {}ms",
+            round(self.interval * 1000),
+            round(self.threshold * 1000),
+        )
+
+    async def stop(self) -> None:
+        """Stop the lag probe and wait for the watchdog thread to exit."""
+        if self._probe_task is None:
+            return
+
+        self._stop_event.set()
+        self._probe_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._probe_task
+        self._probe_task = None
+
+        if self._watchdog is not None:
+            await asyncio.to_thread(self._watchdog.join, self.interval * 2)
+            self._watchdog = None
+
+        logger.info("Event loop monitor stopped")
+
+    async def _probe(self) -> None:
+        """Sleep repeatedly and record how late each wake-up was."""
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.perf_counter()
+            self._heartbeat = now
+            self._histogram.record(max(now - expected, 0.0) * 1000)
+
+    def _watch(self) -> None:
+        """Watchdog loop running in a separate thread."""
+        check_interval = min(self.interval, self.threshold) / 2
+        while not self._stop_event.wait(check_interval):
+            heartbeat = self._heartbeat
+            stalled = time.perf_counter() - heartbeat - self.interval
+            if stalled >= self.threshold and heartbeat != self._reported_heartbeat:
+                self._reported_heartbeat = heartbeat
+                self._report_blocked(stalled)
+
+    def _report_blocked(self, stalled: float) -> None:
+        """Capture and log the stack of the blocked event loop thread.
+
+        Args:
+            stalled: Seconds the loop has been unresponsive so far.
+        """
+        frame = (
+            sys._current_frames().get(self._loop_thread_id)
+            if self._loop_thread_id is not None
+            else None
+        )
+        stack = (
+            "".join(traceback.format_stack(frame, limit=MAX_STACK_FRAMES))
+            if frame is not None
+            else None
+        )
+
+        task = asyncio.current_task(self._loop) if self._loop is not None else None
+        correlation_id = (
+            RequestContext.get_correlation_id_from(task.get_context())
+            if task is not None
+            else None
+        )
+
+        logger.warning(
+            "Event loop blocked for at least {:.0f}ms",
+            stalled * 1000,
+            blocked_ms=round(stalled * 1000, 2),
+            threshold_ms=round(self.threshold * 1000, 2),
+            task_name=task.get_name() if task is not None else None,
+            correlation_id=correlation_id,
+            stack=stack,
+        )
+
+
+def dump_task_stacks() -> list[dict[str, object]]:
+    """Snapshot the stacks of all asyncio tasks on the running loop.
+
+    Returns:
+        list[dict[str, object]]: One entry per task with its name, coroutine,
+            correlation ID and formatted stack.
+    """
+    tasks = []
+    for task in asyncio.all_tasks():
+        buffer = io.StringIO()
+        task.print_stack(limit=MAX_STACK_FRAMES, file=buffer)
+        coro = task.get_coro()
+        tasks.append(
+            {
+                "name": task.get_name(),
+                "coroutine": getattr(coro, "__qualname__", repr(coro)),
+                "done": task.done(),
+                "correlation_id": RequestContext.get_correlation_id_from(
+                    task.get_context()
+                ),
+                "stack": buffer.getvalue(),
+            }
+        )
+    return sorted(tasks, key=lambda entry: str(entry["name"]))
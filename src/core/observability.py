@@ -12,6 +12,7 @@ Supported backends:
 
 Key features:
 - **Auto-instrumentation**: FastAPI and SQLAlchemy instrumentation
+- **Metrics**: OpenTelemetry meters for runtime and database histograms
 - **Correlation propagation**: Links traces with logs via correlation IDs
 - **Dynamic loading**: Cloud exporters loaded only when needed
 - **Sampling control**: Configurable trace sampling for cost management
@@ -32,10 +33,13 @@ from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Final
 
 from loguru import logger
-from opentelemetry import trace
+from opentelemetry import metrics, trace
+from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
 from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
 from opentelemetry.sdk.trace.export import (
@@ -197,6 +201,70 @@ def get_tracer(name: str) -> trace.Tracer:
     return trace.get_tracer(name)
 
 
+@lru_cache(maxsize=32)
+def get_meter(name: str) -> metrics.Meter:
+    """Get a meter instance for the given component.
+
+    Instruments created from the meter are no-ops until setup_metrics
+    installs a meter provider, so they are safe to create at import time.
+
+    Args:
+        name: Component name, typically __name__.
+
+    Returns:
+        metrics.Meter: OpenTelemetry meter instance.
+    """
+    return metrics.get_meter(name)
+
+
+def setup_metrics(settings: Settings) -> None:
+    """Configure OpenTelemetry metrics export.
+
+    Metrics are only exported for the OTLP-based exporters (OTLP and AWS).
+    For other exporter types the global no-op meter provider is kept, so
+    recording measurements costs next to nothing.
+
+    Args:
+        settings: Application settings.
+    """
+    observability_config = settings.observability_config
+    if not observability_config.enable_metrics:
+        logger.info("Metrics disabled by configuration")
+        return
+
+    if observability_config.exporter_type not in ("aws", "otlp"):
+        logger.info(
+            "Metrics export not configured for exporter type {}",
+            observability_config.exporter_type,
+        )
+        return
+
+    endpoint = observability_config.exporter_endpoint or "http://localhost:4317"
+    reader = PeriodicExportingMetricReader(
+        OTLPMetricExporter(
+            endpoint=endpoint,
+            insecure=settings.environment == "development",
+        ),
+        export_interval_millis=observability_config.metrics_export_interval_ms,
+    )
+    resource = Resource.create(
+        {
+            SERVICE_NAME_KEY: settings.app_name,
+            SERVICE_VERSION_KEY: settings.app_version,
+            ENVIRONMENT_KEY: settings.environment,
+        }
+    )
+    metrics.set_meter_provider(
+        MeterProvider(resource=resource, metric_readers=[reader])
+    )
+
+    logger.info(
+        "Metrics configured",
+        endpoint=endpoint,
+        export_interval_ms=observability_config.metrics_export_interval_ms,
+    )
+
+
 def setup_tracing(settings: Settings) -> None:
     """Configure OpenTelemetry tracing with pluggable exporters.
 
@@ -258,14 +326,19 @@ def instrument_app(app: FastAPI, settings: Settings) -> None:
         server_request_hook=add_correlation_id_to_span,
     )
 
-    # Instrument SQLAlchemy if database is configured
+    # Instrument SQLAlchemy if database is configured. Trace context comments
+    # make every statement text unique and defeat the prepared statement
+    # cache, so they are only added in "full" commenter mode.
     if settings.database_config:
-        SQLAlchemyInstrumentor().instrument(
-            enable_commenter=True,
-            commenter_options={
-                "opentelemetry_values": True,
-            },
-        )
+        if settings.database_config.sql_commenter_mode == "full":
+            SQLAlchemyInstrumentor().instrument(
+                enable_commenter=True,
+                commenter_options={
+                    "opentelemetry_values": True,
+                },
+            )
+        else:
+            SQLAlchemyInstrumentor().instrument(enable_commenter=False)
 
     # Instrument HTTP clients if libraries are available
     if importlib.util.find_spec("httpx") and importlib.util.find_spec(
@@ -0,0 +1,262 @@
+"""Request-scoped resource accounting.
+
+Wall-clock duration alone cannot tell a request that waited on the database
+from one that burned CPU or one that queued for a pooled connection. This
+module keeps a single accumulator per request in a context variable; the
+layers that know about a resource (the ASGI stack, the SQLAlchemy cursor
+hooks, the connection pool) add to it, and the request logging middleware
+reports the totals.
+
+Key components:
+- **RequestUsage**: Mutable accumulator for CPU time, database statements
+  (total and per fingerprint), database time, pool checkout wait and
+  (optionally) allocated bytes
+- **request_usage_scope**: Context manager installing the accumulator for
+  the current request
+- **track_usage**: Awaitable wrapper that measures thread CPU time (and
+  sampled tracemalloc deltas) for each step of the request's coroutine, so
+  only its own work is counted even when many requests share the loop
+
+Outside of a request (startup, background jobs, tests) get_request_usage()
+returns None and contributors simply skip accounting.
+"""
+
+from __future__ import annotations
+
+import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Generator, Iterator, Mapping
+
+_request_usage_var: ContextVar[RequestUsage | None] = ContextVar(
+    "request_usage", default=None
+)
+
+NANOSECONDS_PER_MILLISECOND = 1_000_000
+
+
+class RequestUsage:
+    """Resources consumed while serving a single request.
+
+    Times are stored as integer nanoseconds so that many small increments
+    do not accumulate floating point error. Allocation bytes are the traced
+    memory growth of each step, summed over the request; memory allocated
+    and released within the same step is not counted.
+
+    Args:
+        scope: ASGI scope of the request, used to resolve the matched route.
+        track_allocations: Whether allocation bytes are measured for this
+            request. Requires tracemalloc to be tracing.
+    """
+
+    __slots__ = (
+        "_scope",
+        "alloc_bytes",
+        "cpu_time_ns",
+        "db_statements",
+        "db_time_ns",
+        "pool_wait_ns",
+        "statement_counts",
+        "track_allocations",
+    )
+
+    def __init__(
+        self,
+        *,
+        scope: Mapping[str, Any] | None = None,
+        track_allocations: bool = False,
+    ) -> None:
+        self._scope = scope
+        self.cpu_time_ns = 0
+        self.db_statements = 0
+        self.db_time_ns = 0
+        self.pool_wait_ns = 0
+        self.alloc_bytes = 0
+        self.statement_counts: dict[str, int] = {}
+        self.track_allocations = track_allocations
+
+    @property
+    def route(self) -> str | None:
+        """Route template of the request, falling back to the raw path.
+
+        The router stores the matched route in the ASGI scope only once the
+        request has been dispatched, so this is resolved on access.
+        """
+        if self._scope is None:
+            return None
+        route_path = getattr(self._scope.get("route"), "path", None)
+        return route_path if isinstance(route_path, str) else self._scope.get("path")
+
+    @property
+    def controller(self) -> str | None:
+        """Name of the endpoint function handling the request, if matched."""
+        if self._scope is None:
+            return None
+        endpoint = getattr(self._scope.get("route"), "endpoint", None)
+        name = getattr(endpoint, "__name__", None)
+        return name if isinstance(name, str) else None
+
+    def count_statement(self, key: str) -> int:
+        """Count one execution of a statement fingerprint.
+
+        Args:
+            key: Fingerprint digest of the executed statement.
+
+        Returns:
+            int: Number of executions of this fingerprint so far.
+        """
+        count = self.statement_counts.get(key, 0) + 1
+        self.statement_counts[key] = count
+        return count
+
+    def add_db_statement(self, duration_ns: int) -> None:
+        """Record one executed database statement.
+
+        Args:
+            duration_ns: Time spent executing the statement in nanoseconds.
+        """
+        self.db_statements += 1
+        self.db_time_ns += duration_ns
+
+    def add_pool_wait(self, duration_ns: int) -> None:
+        """Record time spent waiting for a pooled connection.
+
+        Args:
+            duration_ns: Checkout wait in nanoseconds.
+        """
+        self.pool_wait_ns += duration_ns
+
+    def as_log_fields(self) -> dict[str, int | float]:
+        """Render the totals as structured log fields.
+
+        Returns:
+            dict[str, int | float]: Millisecond totals and counters. The
+                alloc_bytes field is only present for sampled requests.
+        """
+        fields: dict[str, int | float] = {
+            "cpu_ms": _to_ms(self.cpu_time_ns),
+            "db_statements": self.db_statements,
+            "db_time_ms": _to_ms(self.db_time_ns),
+            "pool_wait_ms": _to_ms(self.pool_wait_ns),
+        }
+        if self.track_allocations:
+            fields["alloc_bytes"] = self.alloc_bytes
+        return fields
+
+
+def _to_ms(duration_ns: int) -> float:
+    """Convert nanoseconds to milliseconds rounded for logging."""
+    return round(duration_ns / NANOSECONDS_PER_MILLISECOND, 2)
+
+
+@contextmanager
+def request_usage_scope(
+    *,
+    scope: Mapping[str, Any] | None = None,
+    track_allocations: bool = False,
+) -> Iterator[RequestUsage]:
+    """Install a fresh accumulator for the duration of a request.
+
+    Args:
+        scope: ASGI scope of the request.
+        track_allocations: Whether to measure allocation bytes. Ignored when
+            tracemalloc is not tracing.
+
+    Yields:
+        RequestUsage: The accumulator of the current request.
+    """
+    usage = RequestUsage(
+        scope=scope,
+        track_allocations=track_allocations and tracemalloc.is_tracing(),
+    )
+    token = _request_usage_var.set(usage)
+    try:
+        yield usage
+    finally:
+        _request_usage_var.reset(token)
+
+
+def get_request_usage() -> RequestUsage | None:
+    """Get the accumulator of the current request.
+
+    Returns:
+        RequestUsage | None: The accumulator if inside an accounted request,
+            None otherwise.
+    """
+    return _request_usage_var.get()
+
+
+class _UsageTrackingAwaitable:
+    """Drives an awaitable and charges each step's resources to a request.
+
+    Every time the event loop resumes the awaitable, the CPU time consumed by
+    the loop thread until it suspends again belongs to this request alone.
+    Work offloaded to other threads (sync endpoints, to_thread) and tasks
+    spawned by the request are not included.
+    """
+
+    __slots__ = ("_awaitable", "_usage")
+
+    def __init__(self, awaitable: Awaitable[Any], usage: RequestUsage) -> None:
+        self._awaitable = awaitable
+        self._usage = usage
+
+    def __await__(self) -> Generator[Any, Any, Any]:
+        steps = self._awaitable.__await__()
+        usage = self._usage
+        send_value: Any = None
+        throw_exc: BaseException | None = None
+
+        while True:
+            alloc_start = (
+                tracemalloc.get_traced_memory()[0] if usage.track_allocations else 0
+            )
+            cpu_start = time.thread_time_ns()
+            try:
+                if throw_exc is not None:
+                    yielded = steps.throw(throw_exc)
+                else:
+                    yielded = steps.send(send_value)
+            except StopIteration as stop:
+                self._charge(cpu_start, alloc_start)
+                return stop.value
+            except BaseException:
+                self._charge(cpu_start, alloc_start)
+                raise
+            self._charge(cpu_start, alloc_start)
+
+            try:
+                send_value = yield yielded
+                throw_exc = None
+            except GeneratorExit:
+                steps.close()
+                raise
+            except BaseException as exc:  # noqa: BLE001 - forwarded to the awaitable
+                send_value = None
+                throw_exc = exc
+
+    def _charge(self, cpu_start: int, alloc_start: int) -> None:
+        """Add the resources used by the last step to the accumulator."""
+        usage = self._usage
+        usage.cpu_time_ns += time.thread_time_ns() - cpu_start
+        if usage.track_allocations:
+            usage.alloc_bytes += max(
+                tracemalloc.get_traced_memory()[0] - alloc_start, 0
+            )
+
+
+def track_usage(awaitable: Awaitable[Any], usage: RequestUsage) -> Awaitable[Any]:
+    """Wrap an awaitable so its CPU time is charged to a request.
+
+    Args:
+        awaitable: The awaitable to drive, typically the downstream ASGI app.
+        usage: The accumulator receiving the measurements.
+
+    Returns:
+        Awaitable[Any]: An awaitable producing the wrapped awaitable's result.
+    """
+    return _UsageTrackingAwaitable(awaitable, usage)
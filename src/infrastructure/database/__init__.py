@@ -5,10 +5,25 @@ with async support, implementing the repository pattern for clean separation
 of concerns.
 
 Core components:
+- **aggregates**: Grouped and time-bucketed aggregation in the database
 - **base**: Declarative base and common model fields
+- **bulk_copy**: COPY-based bulk ingest with staging-table upserts
 - **session**: Async engine and session management
 - **repository**: Generic repository with CRUD operations
 - **dependencies**: FastAPI dependency injection helpers
+- **explain**: Background execution plan capture for slow queries
+- **liveness**: Idle-aware connection pre-ping and read retries
+- **filters**: Typed repository filters compiled once per query shape
+- **fingerprint**: SQL statement normalization for query analysis
+- **n_plus_one**: Per-request N+1 query detection
+- **partitions**: Range partitioning of tables by creation time
+- **pooler**: Compatibility with transaction poolers such as PgBouncer
+- **query_stats**: In-process statistics aggregated per statement fingerprint
+- **rollups**: Summary tables maintained by triggers on write
+- **row_estimate**: Row count estimates from planner statistics
+- **snapshot_export**: Parallel CSV exports reading one consistent snapshot
+- **sql_comment**: Stable sqlcommenter tags for executed statements
+- **statement_cache**: Prepared statement cache hit rate tracking
 
 The implementation emphasizes:
 - **Type safety**: Full typing with generics for repositories
@@ -21,25 +36,40 @@ async capabilities through the asyncpg driver.
 """
 
 from src.infrastructure.database.base import Base, BaseModel
-from src.infrastructure.database.dependencies import DatabaseSession, get_db
+from src.infrastructure.database.dependencies import (
+    AnalyticsDatabaseSession,
+    DatabaseSession,
+    ReadOnlyDatabaseSession,
+    get_db,
+    get_db_for,
+    get_read_only_db,
+)
+from src.infrastructure.database.n_plus_one import NPlusOneQueryError
 from src.infrastructure.database.repository import BaseRepository
 from src.infrastructure.database.session import (
     close_database,
     create_database_engine,
     get_async_session,
     get_engine,
+    get_read_only_session,
     get_session_factory,
 )
 
 __all__ = [
+    "AnalyticsDatabaseSession",
     "Base",
     "BaseModel",
     "BaseRepository",
     "DatabaseSession",
+    "NPlusOneQueryError",
+    "ReadOnlyDatabaseSession",
     "close_database",
     "create_database_engine",
     "get_async_session",
     "get_db",
+    "get_db_for",
     "get_engine",
+    "get_read_only_db",
+    "get_read_only_session",
     "get_session_factory",
 ]
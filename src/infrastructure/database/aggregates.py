@@ -0,0 +1,255 @@
+"""Server-side aggregation compiled once per query shape.
+
+Totals grouped by category and period are computed by one GROUP BY in the
+database, which returns a row per group instead of every matching row to
+be summed in Python.
+
+Key components:
+- **Metrics**: ``Sum``, ``Min``, ``Max``, ``Avg`` and ``Count`` over a
+  model field, computed per group
+- **TimeBucket**: Groups rows by period of a timestamp field. A single
+  unit such as ``"1 day"`` or ``"month"`` truncates with ``date_trunc``;
+  multiples of fixed-length units such as ``"15 minutes"`` use ``date_bin``
+- **AggregateQuery**: The shape of an aggregation: model, filters, grouping
+  fields, time bucket and named metrics. Filter values are not part of it
+- **aggregate_select**: Builds the GROUP BY statement of a shape, filtered
+  like repository finds and cached per shape
+
+Rows are ordered by time bucket, then by the grouping fields.
+"""
+
+import re
+from collections.abc import Callable, Mapping, Sequence
+from functools import lru_cache
+from typing import Any, Final, NamedTuple
+
+from sqlalchemy import ColumnElement, Select, cast, func, literal_column, select
+from sqlalchemy.orm import QueryableAttribute
+
+from src.infrastructure.database.base import BaseModel
+from src.infrastructure.database.filters import (
+    FILTER_STATEMENT_CACHE_SIZE,
+    filter_conditions,
+    filter_shape,
+    model_column,
+)
+
+BUCKET_COLUMN: Final[str] = "bucket"
+
+# Units date_trunc accepts, singular; date_bin only takes fixed lengths
+CALENDAR_UNITS: Final[frozenset[str]] = frozenset(
+    {"second", "minute", "hour", "day", "week", "month", "quarter", "year"}
+)
+FIXED_LENGTH_UNITS: Final[frozenset[str]] = frozenset(
+    {"second", "minute", "hour", "day", "week"}
+)
+# A Monday at midnight, so date_bin buckets align like date_trunc ones
+BUCKET_ORIGIN: Final[str] = "2000-01-03 00:00:00"
+INTERVAL_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"(?:(?P<count>\d+)\s+)?(?P<unit>[a-z]+?)s?"
+)
+
+
+class Sum(NamedTuple):
+    """Sum of a field's values."""
+
+    field: str
+
+
+class Min(NamedTuple):
+    """Smallest value of a field."""
+
+    field: str
+
+
+class Max(NamedTuple):
+    """Largest value of a field."""
+
+    field: str
+
+
+class Avg(NamedTuple):
+    """Average of a field's values."""
+
+    field: str
+
+
+class Count(NamedTuple):
+    """Number of rows, or of non-NULL values of a field."""
+
+    field: str | None = None
+
+
+type Metric = Sum | Min | Max | Avg | Count
+
+
+# Metrics are tuples of one field, so shapes name them to tell them apart
+METRIC_NAMES: Final[dict[type, str]] = {
+    Sum: "sum",
+    Min: "min",
+    Max: "max",
+    Avg: "avg",
+    Count: "count",
+}
+METRIC_FUNCTIONS: Final[
+    dict[str, Callable[[QueryableAttribute[Any]], ColumnElement[Any]]]
+] = {
+    "sum": func.sum,
+    "min": func.min,
+    "max": func.max,
+    "avg": func.avg,
+    "count": func.count,
+}
+
+
+class TimeBucket(NamedTuple):
+    """Period of a timestamp field that rows are grouped by.
+
+    Attributes:
+        field: The timestamp field.
+        interval: A unit such as ``"day"`` or ``"1 month"``, or a multiple
+            of a second, minute, hour, day or week such as ``"15 minutes"``.
+    """
+
+    field: str
+    interval: str
+
+
+class AggregateQuery(NamedTuple):
+    """Shape of an aggregation, independent of the filtered values.
+
+    Attributes:
+        model_class: The aggregated model.
+        metrics: Result column names, metric names and fields.
+        filters: Filtered fields and operator names, as in FilterQuery.
+        group_by: Fields rows are grouped by.
+        time_bucket: Period rows are grouped by, returned as the
+            ``bucket`` column.
+    """
+
+    model_class: type[BaseModel]
+    metrics: tuple[tuple[str, str, str | None], ...]
+    filters: tuple[tuple[str, str], ...] = ()
+    group_by: tuple[str, ...] = ()
+    time_bucket: TimeBucket | None = None
+
+
+def _bucket_expression(
+    column: QueryableAttribute[Any], interval: str
+) -> ColumnElement[Any]:
+    """Start of the time bucket containing the column's value.
+
+    Raises:
+        ValueError: If the interval is not a supported bucket size.
+    """
+    match = INTERVAL_PATTERN.fullmatch(interval.strip().lower())
+    if match is None or match["unit"] not in CALENDAR_UNITS:
+        msg = f"Invalid time bucket interval: {interval}"
+        raise ValueError(msg)
+    count = int(match["count"] or 1)
+    unit = match["unit"]
+    # Literals rather than bound parameters, as GROUP BY repeats the
+    # expression and must render it identically
+    if count == 1:
+        return func.date_trunc(literal_column(f"'{unit}'"), column, type_=column.type)
+    if count < 1 or unit not in FIXED_LENGTH_UNITS:
+        msg = f"Invalid time bucket interval: {interval}"
+        raise ValueError(msg)
+    return func.date_bin(
+        literal_column(f"INTERVAL '{count} {unit}'"),
+        column,
+        cast(literal_column(f"'{BUCKET_ORIGIN}'"), column.type),
+        type_=column.type,
+    )
+
+
+def _metric_expression(
+    model_class: type[BaseModel], metric: str, field: str | None
+) -> ColumnElement[Any]:
+    """Aggregate expression of a named metric over a field.
+
+    Raises:
+        ValueError: If the field is not a column of the model.
+    """
+    if field is None:
+        return func.count()
+    return METRIC_FUNCTIONS[metric](model_column(model_class, field))
+
+
+@lru_cache(maxsize=FILTER_STATEMENT_CACHE_SIZE)
+def aggregate_select(query: AggregateQuery) -> Select[Any]:
+    """Build the GROUP BY statement of an aggregation shape.
+
+    Values are bound parameters named as in filter_parameters.
+
+    Args:
+        query: The aggregation shape.
+
+    Returns:
+        Select[Any]: The statement, shared by all calls with this shape.
+
+    Raises:
+        ValueError: If there are no metrics, result column names collide, a
+            field is not a mapped column of the model or the time bucket
+            interval is not supported.
+    """
+    if not query.metrics:
+        msg = "Aggregations need at least one metric"
+        raise ValueError(msg)
+    names = [name for name, _, _ in query.metrics] + list(query.group_by)
+    if query.time_bucket is not None:
+        names.append(BUCKET_COLUMN)
+    if len(set(names)) < len(names):
+        msg = f"Duplicate result column names: {names}"
+        raise ValueError(msg)
+
+    # Labeled by attribute name, which may differ from the column name
+    groups: list[ColumnElement[Any]] = [
+        model_column(query.model_class, field).label(field) for field in query.group_by
+    ]
+    if query.time_bucket is not None:
+        field, interval = query.time_bucket
+        bucket = _bucket_expression(model_column(query.model_class, field), interval)
+        groups.insert(0, bucket.label(BUCKET_COLUMN))
+    metrics = [
+        _metric_expression(query.model_class, metric, field).label(name)
+        for name, metric, field in query.metrics
+    ]
+    return (
+        select(*groups, *metrics)
+        .where(*filter_conditions(query.model_class, query.filters))
+        .group_by(*groups)
+        .order_by(*groups)
+    )
+
+
+def aggregate_query(
+    model_class: type[BaseModel],
+    metrics: Mapping[str, Metric],
+    *,
+    filters: Mapping[str, object] | None = None,
+    group_by: Sequence[str] = (),
+    time_bucket: tuple[str, str] | None = None,
+) -> AggregateQuery:
+    """Describe the shape of an aggregation.
+
+    Args:
+        model_class: The aggregated model.
+        metrics: Result column names mapped to metrics.
+        filters: Field names mapped to plain values or operators.
+        group_by: Fields to group by.
+        time_bucket: Timestamp field and bucket interval to group by.
+
+    Returns:
+        AggregateQuery: The hashable shape, key of the statement cache.
+    """
+    return AggregateQuery(
+        model_class=model_class,
+        metrics=tuple(
+            (name, METRIC_NAMES[type(metric)], metric.field)
+            for name, metric in metrics.items()
+        ),
+        filters=filter_shape(filters or {}),
+        group_by=tuple(group_by),
+        time_bucket=None if time_bucket is None else TimeBucket(*time_bucket),
+    )
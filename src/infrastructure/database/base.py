@@ -4,7 +4,9 @@ This module establishes the foundation for all database models in the
 application, providing consistent structure and behavior across entities.
 
 Key components:
-- **Naming conventions**: Standardized constraint names for migrations
+- **Naming conventions**: Standardized constraint names for migrations.
+  Indexes of other methods than B-tree end in the method, like
+  ``ix_invoice_created_at_brin``
 - **Base class**: Configured declarative base with metadata
 - **BaseModel**: Abstract model with common fields (id, timestamps)
 - **Type mapping**: Modern SQLAlchemy 2.0+ mapped column syntax
@@ -14,18 +16,33 @@ The BaseModel provides:
 - **Timezone-aware timestamps**: UTC timestamps for global systems
 - **Automatic updates**: updated_at field updates on modifications
 - **Consistent repr**: Standard string representation for debugging
+- **BRIN timestamp indexes**: Opt-in ``brin_timestamps`` indexing of
+  ``created_at`` and ``updated_at`` for time window scans
 
 All domain models should inherit from BaseModel to ensure consistent
 field naming, behavior, and database constraints across the schema.
 """
 
+from collections.abc import Callable
 from datetime import datetime
+from typing import ClassVar, Final
 
-from sqlalchemy import BigInteger, DateTime, MetaData, func
+from sqlalchemy import BigInteger, DateTime, Index, MetaData, Table, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
-NAMING_CONVENTION = {
-    "ix": "ix_%(column_0_label)s",
+BRIN_TIMESTAMP_FIELDS: Final[frozenset[str]] = frozenset({"created_at", "updated_at"})
+
+
+def _index_method(index: Index, table: Table) -> str:
+    """Suffix naming the method of indexes that are not B-trees."""
+    _ = table
+    using = index.dialect_options["postgresql"]["using"]
+    return f"_{using}" if using and using != "btree" else ""
+
+
+NAMING_CONVENTION: Final[dict[str, str | Callable[[Index, Table], str]]] = {
+    "index_method": _index_method,
+    "ix": "ix_%(column_0_label)s%(index_method)s",
     "uq": "uq_%(table_name)s_%(column_0_name)s",
     "ck": "ck_%(table_name)s_%(constraint_name)s",
     "fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s",
@@ -53,10 +70,20 @@ class BaseModel(Base):
 
     All models in the application should inherit from this base model
     to ensure consistent field naming and behavior.
+
+    Attributes:
+        brin_timestamps: Timestamp fields to index with BRIN indexes,
+            ``created_at`` and/or ``updated_at``. A BRIN index stores the
+            range of values of each block range, so it stays tiny and
+            cheap to maintain on large append-only tables, where rows are
+            written in time order. Time window scans then read only the
+            blocks that can hold rows of the window.
     """
 
     __abstract__ = True
 
+    brin_timestamps: ClassVar[tuple[str, ...]] = ()
+
     id: Mapped[int] = mapped_column(
         BigInteger,
         primary_key=True,
@@ -79,6 +106,25 @@ class BaseModel(Base):
         doc="Timestamp when the record was last updated (UTC)",
     )
 
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        """Map the model, adding the BRIN indexes it declares.
+
+        Raises:
+            ValueError: If a BRIN indexed field is not a timestamp of
+                BaseModel.
+        """
+        unknown = set(cls.brin_timestamps) - BRIN_TIMESTAMP_FIELDS
+        if unknown:
+            msg = f"BRIN indexes are only declared on timestamps: {sorted(unknown)}"
+            raise ValueError(msg)
+        super().__init_subclass__(**kwargs)
+
+        # Subclasses sharing a parent's table declare no indexes of their own
+        table = cls.__dict__.get("__table__")
+        if isinstance(table, Table):
+            for field in cls.brin_timestamps:
+                Index(None, table.c[field], postgresql_using="brin")
+
     def __repr__(self) -> str:
         """Return a string representation of the model instance.
 
@@ -0,0 +1,432 @@
+"""Bulk ingest and export with PostgreSQL COPY.
+
+Multi-row INSERT statements are parsed, planned and executed per batch, and
+every value passes through SQLAlchemy's parameter processing. Binary COPY
+streams rows to the server in one command, which is an order of magnitude
+faster for large loads.
+
+Key components:
+- **copy_records**: Copies rows of a model's table through asyncpg's
+  ``copy_records_to_table`` on the session's own connection and transaction
+- **Column mapping**: Columns come from the model's table. Server-generated
+  columns (autoincrement keys, server defaults) are left out unless listed
+  explicitly, and model instances are converted using the mapped attribute
+  of each column
+- **Upserts**: With conflict columns, rows are copied into a temporary
+  staging table and merged with INSERT ... ON CONFLICT DO UPDATE
+- **Throughput**: The number of rows and rows per second are logged and
+  returned
+- **CopyOutStream**: Streams ``COPY (SELECT ...) TO STDOUT`` output as CSV
+  chunks straight from the server, with backpressure
+- **copy_query_csv**: CSV export of a query on a connection of an engine
+  profile
+
+An ingest runs inside a savepoint, so a failed copy does not abort the rest
+of the session's transaction. COPY bypasses SQLAlchemy's statement
+execution: copied rows are not visible to the session's identity map and
+the copy itself does not show up in query metrics.
+"""
+
+import asyncio
+import contextlib
+import time
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Mapping,
+    Sequence,
+)
+from typing import Any, Final, NamedTuple, cast
+from uuid import uuid4
+
+from loguru import logger
+from sqlalchemy import Column, MetaData, Select, Table, select
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.dialects.postgresql import Insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import Dialect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.schema import ColumnElementColumnDefault, ScalarElementColumnDefault
+
+from src.infrastructure.database.base import BaseModel
+from src.infrastructure.database.session import DEFAULT_ENGINE_PROFILE, get_engine
+
+# COPY of a large load can take far longer than the connection's command
+# timeout, which asyncpg would otherwise apply
+DEFAULT_COPY_TIMEOUT_SECONDS: Final[float] = 3600.0
+STAGING_TABLE_PREFIX: Final[str] = "_copy_"
+# Chunks buffered between the server and a slow consumer of an export
+COPY_OUT_BUFFER_CHUNKS: Final[int] = 16
+
+type CopyRecord = Sequence[Any]
+type CopyRows = Iterable[BaseModel | CopyRecord] | AsyncIterable[BaseModel | CopyRecord]
+
+
+class CopyResult(NamedTuple):
+    """Outcome of a bulk copy.
+
+    Attributes:
+        rows: Rows copied to the server.
+        elapsed_s: Wall time of the copy, including the merge of upserts.
+    """
+
+    rows: int
+    elapsed_s: float
+
+    @property
+    def rows_per_second(self) -> float:
+        """Copy throughput."""
+        return self.rows / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+
+def default_copy_columns(table: Table) -> list[Column[Any]]:
+    """Columns filled by a copy unless columns are given explicitly.
+
+    Args:
+        table: The target table.
+
+    Returns:
+        list[Column[Any]]: All columns except those generated by the server.
+    """
+    return [
+        column
+        for column in table.columns
+        if column.server_default is None
+        and column.computed is None
+        and column.identity is None
+        and not (column.primary_key and column.autoincrement is True)
+    ]
+
+
+def _resolve_columns(table: Table, names: Sequence[str] | None) -> list[Column[Any]]:
+    """Look up the copied columns by name.
+
+    Raises:
+        ValueError: If a column does not exist in the table.
+    """
+    if names is None:
+        return default_copy_columns(table)
+    unknown = [name for name in names if name not in table.columns]
+    if unknown:
+        msg = f"Unknown columns for {table.name}: {', '.join(unknown)}"
+        raise ValueError(msg)
+    return [table.columns[name] for name in names]
+
+
+def _record_converter(
+    model_class: type[BaseModel], columns: Sequence[Column[Any]]
+) -> Callable[[BaseModel | CopyRecord], CopyRecord]:
+    """Build the conversion of model instances to records in column order.
+
+    Scalar Python-side column defaults are applied to unset attributes, as
+    COPY only applies server defaults.
+    """
+    mapper = sa_inspect(model_class)
+    keys = [mapper.get_property_by_column(column).key for column in columns]
+    defaults = [
+        column.default.arg
+        if isinstance(column.default, ScalarElementColumnDefault)
+        else None
+        for column in columns
+    ]
+
+    def to_record(row: BaseModel | CopyRecord) -> CopyRecord:
+        if not isinstance(row, BaseModel):
+            return row
+        return tuple(
+            default if (value := getattr(row, key)) is None else value
+            for key, default in zip(keys, defaults, strict=True)
+        )
+
+    return to_record
+
+
+async def _convert_async(
+    rows: AsyncIterable[BaseModel | CopyRecord],
+    to_record: Callable[[BaseModel | CopyRecord], CopyRecord],
+) -> AsyncIterator[CopyRecord]:
+    """Convert rows of an async iterable as they are produced."""
+    async for row in rows:
+        yield to_record(row)
+
+
+def _copied_rows(status: str) -> int:
+    """Row count of a COPY command status such as ``COPY 42``."""
+    return int(status.rsplit(" ", 1)[-1])
+
+
+def _merge_statement(
+    table: Table,
+    staging: Table,
+    columns: Sequence[Column[Any]],
+    conflict_columns: Sequence[str],
+) -> Insert:
+    """INSERT ... SELECT from the staging table, updating conflicting rows."""
+    names = [column.name for column in columns]
+    insert = pg_insert(table).from_select(names, select(*staging.columns))
+    set_: dict[str, Any] = {
+        name: insert.excluded[name] for name in names if name not in conflict_columns
+    }
+    if not set_:
+        return insert.on_conflict_do_nothing(index_elements=list(conflict_columns))
+    # Columns maintained on update, such as updated_at
+    set_.update(
+        {
+            column.name: column.onupdate.arg
+            for column in table.columns
+            if column.name not in set_
+            and isinstance(column.onupdate, ColumnElementColumnDefault)
+        }
+    )
+    return insert.on_conflict_do_update(
+        index_elements=list(conflict_columns), set_=set_
+    )
+
+
+async def copy_records(
+    session: AsyncSession,
+    model_class: type[BaseModel],
+    rows: CopyRows,
+    *,
+    columns: Sequence[str] | None = None,
+    conflict_columns: Sequence[str] | None = None,
+    copy_timeout_s: float = DEFAULT_COPY_TIMEOUT_SECONDS,
+) -> CopyResult:
+    """Copy rows into a model's table with binary COPY.
+
+    Args:
+        session: Session whose connection and transaction are used.
+        model_class: Model of the target table.
+        rows: Model instances or tuples in column order, from a regular or
+            an async iterable. Rows are streamed, not collected first.
+        columns: Column names to copy. Defaults to all columns not
+            generated by the server.
+        conflict_columns: Columns of a unique constraint. When given, rows
+            are merged: existing rows are updated, new rows inserted. Rows
+            must be unique per conflict key within one copy.
+        copy_timeout_s: Seconds the COPY may take.
+
+    Returns:
+        CopyResult: Rows copied and the elapsed time.
+
+    Raises:
+        ValueError: If a column is unknown, or a conflict column is not copied.
+        asyncpg.PostgresError: If the server rejects the copied data.
+    """
+    table = cast("Table", model_class.__table__)
+    copy_columns = _resolve_columns(table, columns)
+    names = [column.name for column in copy_columns]
+    if conflict_columns is not None and not set(conflict_columns) <= set(names):
+        msg = f"Conflict columns must be copied: {', '.join(conflict_columns)}"
+        raise ValueError(msg)
+
+    to_record = _record_converter(model_class, copy_columns)
+    records: Iterable[CopyRecord] | AsyncIterable[CopyRecord] = (
+        _convert_async(rows, to_record)
+        if isinstance(rows, AsyncIterable)
+        else map(to_record, rows)
+    )
+
+    start = time.perf_counter()
+    # The savepoint also begins the session's transaction on the connection,
+    # so the copy is part of it
+    async with session.begin_nested():
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        # The asyncpg connection, checked out for the session's transaction
+        driver_connection: Any = raw_connection.driver_connection
+
+        if conflict_columns is None:
+            status = await driver_connection.copy_records_to_table(
+                table.name,
+                records=records,
+                columns=names,
+                schema_name=table.schema,
+                timeout=copy_timeout_s,
+            )
+        else:
+            staging = Table(
+                f"{STAGING_TABLE_PREFIX}{table.name}_{uuid4().hex[:8]}",
+                MetaData(),
+                *(Column(column.name, column.type) for column in copy_columns),
+                prefixes=["TEMPORARY"],
+                postgresql_on_commit="DROP",
+            )
+            await connection.run_sync(staging.create)
+            status = await driver_connection.copy_records_to_table(
+                staging.name, records=records, columns=names, timeout=copy_timeout_s
+            )
+            await session.execute(
+                _merge_statement(table, staging, copy_columns, conflict_columns)
+            )
+            await connection.run_sync(staging.drop)
+
+    result = CopyResult(
+        rows=_copied_rows(status), elapsed_s=time.perf_counter() - start
+    )
+    logger.info(
+        "Copied {} rows into {} in {:.2f}s ({:.0f} rows/s)",
+        result.rows,
+        table.name,
+        result.elapsed_s,
+        result.rows_per_second,
+        table=table.name,
+        rows=result.rows,
+        rows_per_second=round(result.rows_per_second, 1),
+        upsert=conflict_columns is not None,
+    )
+    return result
+
+
+def compile_driver_query(
+    statement: Select[Any],
+    dialect: Dialect,
+    parameters: Mapping[str, Any] | None = None,
+) -> tuple[str, list[Any]]:
+    """Compile a statement to SQL and positional arguments for asyncpg.
+
+    Expanding parameters such as IN lists are rendered, so the SQL can be
+    passed to driver methods SQLAlchemy does not wrap. Bind processors of
+    custom types are not applied.
+
+    Args:
+        statement: The SELECT to compile.
+        dialect: Dialect of the connection the query runs on.
+        parameters: Values of bound parameters, overriding those of the
+            statement.
+
+    Returns:
+        tuple[str, list[Any]]: The SQL with ``$n`` placeholders and its
+            arguments.
+    """
+    expanded = statement.compile(dialect=dialect).construct_expanded_state(parameters)
+    return expanded.statement, list(expanded.positional_parameters)
+
+
+class CopyOutStream:
+    """Chunks of a ``COPY ... TO STDOUT`` in CSV format, with backpressure.
+
+    The driver stops reading from the socket while a chunk waits in the
+    bounded buffer, so a slow consumer slows the server down instead of
+    filling memory. Closing the iterator before it is exhausted cancels the
+    COPY, so iterate it within ``contextlib.aclosing``.
+
+    Args:
+        driver_connection: The asyncpg connection the COPY runs on.
+        query: SELECT with ``$n`` placeholders, see compile_driver_query.
+        arguments: Arguments of the query.
+        header: Whether the first line holds the column names.
+        copy_timeout_s: Seconds the COPY may take.
+
+    Attributes:
+        rows: Rows exported, once the stream is exhausted.
+    """
+
+    def __init__(
+        self,
+        driver_connection: Any,  # noqa: ANN401 - asyncpg connection
+        query: str,
+        arguments: Sequence[Any],
+        *,
+        header: bool,
+        copy_timeout_s: float = DEFAULT_COPY_TIMEOUT_SECONDS,
+    ) -> None:
+        self.driver_connection = driver_connection
+        self.query = query
+        self.arguments = arguments
+        self.header = header
+        self.copy_timeout_s = copy_timeout_s
+        self.rows: int | None = None
+
+    async def __aiter__(self) -> AsyncGenerator[bytes]:
+        """Run the COPY and yield its chunks in the order the server sent them.
+
+        Yields:
+            bytes: CSV chunks.
+        """
+        chunks: asyncio.Queue[bytes | None] = asyncio.Queue(
+            maxsize=COPY_OUT_BUFFER_CHUNKS
+        )
+
+        async def copy_out() -> str:
+            try:
+                status: str = await self.driver_connection.copy_from_query(
+                    self.query,
+                    *self.arguments,
+                    output=chunks.put,
+                    format="csv",
+                    header=self.header,
+                    timeout=self.copy_timeout_s,
+                )
+                return status
+            finally:
+                await chunks.put(None)
+
+        copy_task = asyncio.ensure_future(copy_out())
+        try:
+            while (chunk := await chunks.get()) is not None:
+                yield chunk
+            self.rows = _copied_rows(await copy_task)
+        finally:
+            # The consumer went away, e.g. because the client disconnected
+            if not copy_task.done():
+                copy_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await copy_task
+
+
+async def copy_query_csv(
+    statement: Select[Any],
+    *,
+    profile: str = DEFAULT_ENGINE_PROFILE,
+    header: bool = True,
+    copy_timeout_s: float = DEFAULT_COPY_TIMEOUT_SECONDS,
+) -> AsyncGenerator[bytes]:
+    """Stream the result of a query as CSV formatted by the server.
+
+    Runs ``COPY (SELECT ...) TO STDOUT WITH (FORMAT csv)`` on a connection
+    of the profile's engine. Chunks are passed on as the server sends them
+    and no row is ever materialized in Python, see CopyOutStream.
+
+    Args:
+        statement: The SELECT whose rows are exported.
+        profile: Engine profile the export connection comes from.
+        header: Whether the first line holds the column names.
+        copy_timeout_s: Seconds the COPY may take.
+
+    Yields:
+        bytes: CSV chunks in the order the server sent them.
+
+    Example:
+        return CSVStreamingResponse(
+            copy_query_csv(select(Invoice), profile="analytics"),
+            filename="invoices.csv",
+        )
+    """
+    start = time.perf_counter()
+
+    async with get_engine(profile).connect() as connection:
+        query, arguments = compile_driver_query(statement, connection.dialect)
+        raw_connection = await connection.get_raw_connection()
+        stream = CopyOutStream(
+            raw_connection.driver_connection,
+            query,
+            arguments,
+            header=header,
+            copy_timeout_s=copy_timeout_s,
+        )
+        async with contextlib.aclosing(aiter(stream)) as chunks:
+            async for chunk in chunks:
+                yield chunk
+
+    elapsed_s = time.perf_counter() - start
+    logger.info(
+        "Exported {} rows as CSV in {:.2f}s",
+        stream.rows,
+        elapsed_s,
+        rows=stream.rows,
+        profile=profile,
+    )
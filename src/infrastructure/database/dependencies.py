@@ -7,6 +7,8 @@ management across HTTP requests.
 Key features:
 - **Automatic cleanup**: Sessions are properly closed after each request
 - **Transaction management**: Auto-commit on success, rollback on error
+- **Read-only sessions**: No commit round trip for handlers that only read
+- **Engine profiles**: Sessions on a named engine's pool, e.g. analytics
 - **Type safety**: Annotated type for clear dependency declaration
 - **Async support**: Full compatibility with async route handlers
 
@@ -15,14 +17,19 @@ sessions into route handlers without repeating the Depends() pattern,
 improving code readability and maintainability.
 """
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable
 from typing import Annotated
 
 from fastapi import Depends
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.infrastructure.database.session import get_async_session
+from src.infrastructure.database.session import (
+    get_async_session,
+    get_read_only_session,
+)
+
+ANALYTICS_ENGINE_PROFILE = "analytics"
 
 
 async def get_db() -> AsyncGenerator[AsyncSession]:
@@ -54,5 +61,56 @@ async def get_db() -> AsyncGenerator[AsyncSession]:
             logger.debug("Database session dependency completed")
 
 
-# Type alias for cleaner dependency injection
+def get_db_for(profile: str) -> Callable[[], AsyncGenerator[AsyncSession]]:
+    """Create a session dependency bound to an engine profile.
+
+    Args:
+        profile: Engine profile whose pool the sessions use.
+
+    Returns:
+        Callable[[], AsyncGenerator[AsyncSession]]: Dependency with the same
+            lifecycle as get_db.
+
+    Example:
+        ReportSession = Annotated[AsyncSession, Depends(get_db_for("analytics"))]
+    """
+
+    async def get_profile_db() -> AsyncGenerator[AsyncSession]:
+        async with get_async_session(profile) as session:
+            logger.debug("Providing {} database session for request", profile)
+            try:
+                yield session
+            finally:
+                logger.debug("{} database session dependency completed", profile)
+
+    return get_profile_db
+
+
+async def get_read_only_db() -> AsyncGenerator[AsyncSession]:
+    """Provide a read-only database session for FastAPI dependency injection.
+
+    The session is never committed and checks out a connection only if the
+    handler executes a statement. Changes made to it are discarded.
+
+    Yields:
+        AsyncGenerator[AsyncSession]: An async SQLAlchemy session for reads.
+
+    Example:
+        @app.get("/users/{user_id}")
+        async def get_user(user_id: int, db: ReadOnlyDatabaseSession):
+            return await db.get(User, user_id)
+    """
+    async with get_read_only_session() as session:
+        logger.debug("Providing read-only database session for request")
+        try:
+            yield session
+        finally:
+            logger.debug("Read-only database session dependency completed")
+
+
+# Type aliases for cleaner dependency injection
 DatabaseSession = Annotated[AsyncSession, Depends(get_db)]
+ReadOnlyDatabaseSession = Annotated[AsyncSession, Depends(get_read_only_db)]
+AnalyticsDatabaseSession = Annotated[
+    AsyncSession, Depends(get_db_for(ANALYTICS_ENGINE_PROFILE))
+]
@@ -0,0 +1,423 @@
+"""Execution plan capture for slow queries.
+
+A slow query log entry tells which statement was slow but not why. When
+enabled, slow SELECT statements are explained again in the background with
+the same parameters, so the plan that made them slow is available without
+reproducing the query by hand.
+
+Key components:
+- **PlanCapture**: Schedules EXPLAIN for slow statements and keeps the
+  captured plans in a bounded in-memory ring
+- **Plan shape hash**: Hash of node types, relations and indexes, ignoring
+  costs and timings, so repeated captures of the same plan are deduplicated
+  and plan changes for a fingerprint stand out
+- **Dedicated engine**: Plans run on a single-connection engine without
+  query instrumentation and with a short statement timeout, so capturing
+  never competes with the application pool or feeds back into the slow
+  query log
+
+Only plain SELECT statements are explained, at most one at a time and at
+most once per fingerprint within a cooldown window. With ANALYZE the query
+is executed a second time inside a transaction that is always rolled back.
+Rolling back does not undo everything a SELECT can do, so statements that
+lock rows or call functions with side effects (sequences, advisory locks,
+notifications) are explained without ANALYZE, which plans without executing.
+User-defined functions are not inspected: keep ANALYZE off if SELECT
+statements call functions that write.
+
+Plans can contain the literal parameter values of the explained statement,
+so log entries only carry the fingerprint, plan hash and timings. The plans
+themselves are only served by the token-protected debug endpoint.
+"""
+
+import asyncio
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import deque
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from typing import Any, Final
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.engine import URL
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.core.config import get_settings
+from src.infrastructure.database.fingerprint import fingerprint_statement
+from src.infrastructure.database.pooler import (
+    PoolerMode,
+    TransactionSettings,
+    pooler_connect_args,
+    split_server_settings,
+)
+
+EXPLAIN_COOLDOWN_SECONDS: Final[float] = 60.0
+EXPLAIN_APPLICATION_NAME: Final[str] = "tributum-explain"
+MAX_PLAN_QUERY_LENGTH: Final[int] = 1000
+
+# Plan node keys that describe the plan shape rather than its estimates
+_PLAN_SHAPE_KEYS: Final[tuple[str, ...]] = (
+    "Node Type",
+    "Join Type",
+    "Relation Name",
+    "Index Name",
+    "Strategy",
+    "Parent Relationship",
+)
+
+# Clauses and functions whose effects survive the rollback of an ANALYZE
+_LOCKING_CLAUSE: Final[re.Pattern[str]] = re.compile(
+    r"\bFOR\s+(?:NO\s+KEY\s+UPDATE|UPDATE|KEY\s+SHARE|SHARE)\b", re.IGNORECASE
+)
+_VOLATILE_CALL: Final[re.Pattern[str]] = re.compile(
+    r"\b(?:nextval|setval|pg_(?:try_)?advisory_\w+|pg_notify|pg_sleep\w*"
+    r"|pg_cancel_backend|pg_terminate_backend|set_config|dblink\w*|lo_\w+)\s*\(",
+    re.IGNORECASE,
+)
+
+type Parameters = Sequence[Any] | Mapping[str, Any] | None
+
+
+def is_explainable(statement: str) -> bool:
+    """Check whether a statement can be explained safely.
+
+    Args:
+        statement: The SQL statement as sent to the driver.
+
+    Returns:
+        bool: True for plain SELECT statements.
+    """
+    return statement.lstrip().upper().startswith("SELECT")
+
+
+def is_safe_to_analyze(statement: str) -> bool:
+    """Check whether a statement can be executed again under EXPLAIN ANALYZE.
+
+    Args:
+        statement: The SQL statement as sent to the driver.
+
+    Returns:
+        bool: False if the statement locks rows or calls a function whose
+            effects are not undone by rolling back.
+    """
+    return not (_LOCKING_CLAUSE.search(statement) or _VOLATILE_CALL.search(statement))
+
+
+def plan_shape_hash(plan: Mapping[str, Any]) -> str:
+    """Compute a stable hash of a plan's shape.
+
+    Args:
+        plan: The root "Plan" node of an EXPLAIN (FORMAT JSON) result.
+
+    Returns:
+        str: Short hex digest that changes only when the plan shape changes.
+    """
+    parts: list[str] = []
+    stack = [plan]
+    while stack:
+        node = stack.pop()
+        parts.append("|".join(str(node.get(key, "")) for key in _PLAN_SHAPE_KEYS))
+        stack.extend(reversed(node.get("Plans", [])))
+    return hashlib.blake2b("/".join(parts).encode(), digest_size=8).hexdigest()
+
+
+class PlanCapture:
+    """Background EXPLAIN capture with a bounded plan ring.
+
+    Args:
+        max_plans: Maximum number of distinct plans kept in memory.
+        analyze: Whether to use EXPLAIN (ANALYZE, BUFFERS).
+        timeout_ms: Statement timeout of the capture connection.
+        cooldown_s: Minimum seconds between captures of one fingerprint.
+        pooler_mode: Connection pooler in front of PostgreSQL.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_plans: int,
+        analyze: bool,
+        timeout_ms: int,
+        cooldown_s: float = EXPLAIN_COOLDOWN_SECONDS,
+        pooler_mode: PoolerMode = "none",
+    ) -> None:
+        self.max_plans = max_plans
+        self.analyze = analyze
+        self.timeout_ms = timeout_ms
+        self.cooldown_s = cooldown_s
+        self.pooler_mode = pooler_mode
+        self._plans: deque[dict[str, Any]] = deque(maxlen=max_plans)
+        self._last_attempt: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._busy = False
+        self._engine: AsyncEngine | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def latest_plan_hash(self, fingerprint: str) -> str | None:
+        """Get the hash of the most recent plan captured for a fingerprint.
+
+        Args:
+            fingerprint: Statement fingerprint digest.
+
+        Returns:
+            str | None: The plan hash, or None if no plan was captured.
+        """
+        with self._lock:
+            for entry in reversed(self._plans):
+                if entry["fingerprint"] == fingerprint:
+                    return str(entry["plan_hash"])
+        return None
+
+    def schedule(
+        self,
+        url: URL,
+        statement: str,
+        parameters: Parameters,
+        *,
+        duration_ms: float,
+        correlation_id: str | None,
+    ) -> bool:
+        """Schedule a background capture for a slow statement.
+
+        Must be called from the event loop thread, which is the case for
+        cursor hooks of async engines.
+
+        Args:
+            url: URL of the engine that executed the statement.
+            statement: The SQL statement as sent to the driver.
+            parameters: The driver-level parameters of the execution.
+            duration_ms: Observed duration of the slow execution.
+            correlation_id: Correlation ID of the request, if any.
+
+        Returns:
+            bool: True if a capture was scheduled.
+        """
+        if not is_explainable(statement):
+            return False
+
+        digest = fingerprint_statement(statement).digest
+        now = time.monotonic()
+        with self._lock:
+            last_attempt = self._last_attempt.get(digest)
+            if self._busy or (
+                last_attempt is not None and now - last_attempt < self.cooldown_s
+            ):
+                return False
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return False
+            self._busy = True
+            self._prune_attempts(now)
+            self._last_attempt[digest] = now
+
+        task = loop.create_task(
+            self._capture(url, statement, parameters, duration_ms, correlation_id),
+            name="explain-capture",
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+
+    def _prune_attempts(self, now: float) -> None:
+        """Forget attempts older than the cooldown. Caller holds the lock."""
+        if len(self._last_attempt) < self.max_plans * 4:
+            return
+        self._last_attempt = {
+            digest: attempt
+            for digest, attempt in self._last_attempt.items()
+            if now - attempt < self.cooldown_s
+        }
+
+    async def _capture(
+        self,
+        url: URL,
+        statement: str,
+        parameters: Parameters,
+        duration_ms: float,
+        correlation_id: str | None,
+    ) -> None:
+        """Run EXPLAIN and store the resulting plan."""
+        try:
+            result = await self._explain(url, statement, parameters)
+        except (SQLAlchemyError, OSError, TimeoutError) as e:
+            logger.warning(
+                "Failed to capture slow query plan: {}: {}",
+                type(e).__name__,
+                str(e),
+                correlation_id=correlation_id,
+            )
+            return
+        finally:
+            with self._lock:
+                self._busy = False
+
+        self._store(statement, result, duration_ms, correlation_id)
+
+    def _analyzes(self, statement: str) -> bool:
+        """Whether a statement is explained with ANALYZE."""
+        return self.analyze and is_safe_to_analyze(statement)
+
+    async def _explain(
+        self, url: URL, statement: str, parameters: Parameters
+    ) -> dict[str, Any]:
+        """Execute EXPLAIN on the dedicated engine.
+
+        Returns:
+            dict[str, Any]: The first element of the EXPLAIN JSON output.
+        """
+        options = (
+            "FORMAT JSON, ANALYZE, BUFFERS"
+            if self._analyzes(statement)
+            else "FORMAT JSON"
+        )
+        engine = self._get_engine(url)
+        async with engine.connect() as conn:
+            result = await conn.exec_driver_sql(
+                f"EXPLAIN ({options}) {statement}",
+                parameters or None,
+            )
+            raw = result.scalar_one()
+            await conn.rollback()
+
+        output = json.loads(raw) if isinstance(raw, str) else raw
+        return dict(output[0])
+
+    def _get_engine(self, url: URL) -> AsyncEngine:
+        """Create the single-connection capture engine on first use."""
+        if self._engine is None:
+            server_settings = {
+                "application_name": EXPLAIN_APPLICATION_NAME,
+                "statement_timeout": str(self.timeout_ms),
+                "jit": "off",
+            }
+            connect_args: dict[str, Any] = {}
+            transaction_settings: dict[str, str] = {}
+            if self.pooler_mode == "transaction":
+                server_settings, transaction_settings = split_server_settings(
+                    server_settings
+                )
+                connect_args.update(pooler_connect_args())
+            connect_args["server_settings"] = server_settings
+
+            self._engine = create_async_engine(
+                url,
+                pool_size=1,
+                max_overflow=0,
+                connect_args=connect_args,
+            )
+            if transaction_settings:
+                event.listen(
+                    self._engine.sync_engine,
+                    "begin",
+                    TransactionSettings(transaction_settings),
+                )
+        return self._engine
+
+    def _store(
+        self,
+        statement: str,
+        result: Mapping[str, Any],
+        duration_ms: float,
+        correlation_id: str | None,
+    ) -> None:
+        """Add a plan to the ring, deduplicated by fingerprint and plan hash."""
+        fingerprint = fingerprint_statement(statement)
+        plan_hash = plan_shape_hash(result["Plan"])
+        now = time.time()
+
+        with self._lock:
+            previous_hashes = {
+                entry["plan_hash"]
+                for entry in self._plans
+                if entry["fingerprint"] == fingerprint.digest
+            }
+            existing = next(
+                (
+                    entry
+                    for entry in self._plans
+                    if entry["fingerprint"] == fingerprint.digest
+                    and entry["plan_hash"] == plan_hash
+                ),
+                None,
+            )
+            if existing is not None:
+                existing["occurrences"] += 1
+                existing["last_seen"] = now
+                existing["last_duration_ms"] = round(duration_ms, 2)
+                return
+            self._plans.append(
+                {
+                    "fingerprint": fingerprint.digest,
+                    "plan_hash": plan_hash,
+                    "query": fingerprint.normalized[:MAX_PLAN_QUERY_LENGTH],
+                    "first_seen": now,
+                    "last_seen": now,
+                    "occurrences": 1,
+                    "last_duration_ms": round(duration_ms, 2),
+                    "analyze": self._analyzes(statement),
+                    "plan": result,
+                }
+            )
+
+        log = logger.warning if previous_hashes else logger.info
+        log(
+            "Slow query plan {} for fingerprint {}",
+            "changed" if previous_hashes else "captured",
+            fingerprint.digest,
+            fingerprint=fingerprint.digest,
+            plan_hash=plan_hash,
+            previous_plan_hashes=sorted(previous_hashes),
+            correlation_id=correlation_id,
+            duration_ms=round(duration_ms, 2),
+            # Plans may quote parameter values, so only their timings are
+            # logged; the plans themselves are served by /debug/slow-plans
+            planning_time_ms=result.get("Planning Time"),
+            execution_time_ms=result.get("Execution Time"),
+        )
+
+    def plans(self) -> list[dict[str, Any]]:
+        """Get the captured plans, most recent first.
+
+        Returns:
+            list[dict[str, Any]]: Captured plans with their metadata.
+        """
+        with self._lock:
+            return [dict(entry) for entry in reversed(self._plans)]
+
+    def clear(self) -> None:
+        """Discard all captured plans and cooldowns."""
+        with self._lock:
+            self._plans.clear()
+            self._last_attempt.clear()
+
+    async def close(self) -> None:
+        """Cancel pending captures and dispose of the capture engine."""
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._engine is not None:
+            await self._engine.dispose()
+            self._engine = None
+
+
+@lru_cache(maxsize=1)
+def get_plan_capture() -> PlanCapture:
+    """Get the process-wide slow query plan capture.
+
+    Returns:
+        PlanCapture: The shared capture configured from settings.
+    """
+    db_config = get_settings().database_config
+    return PlanCapture(
+        max_plans=db_config.explain_max_plans,
+        analyze=db_config.explain_analyze,
+        timeout_ms=db_config.explain_timeout_ms,
+        pooler_mode=db_config.pooler_mode,
+    )
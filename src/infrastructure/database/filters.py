@@ -0,0 +1,393 @@
+"""Typed filter specifications compiled once per query shape.
+
+Repository filters are keyword arguments mapping a field to a value. A
+plain value filters on equality; an operator filters on anything else, so
+ranges, IN lists and prefix searches run inside the database where they can
+use indexes, instead of in Python over fetched rows.
+
+Key components:
+- **Operators**: ``In``, ``Range``, ``Gte``, ``Lte``, ``ILikePrefix`` and
+  ``IsNull``
+- **FilterQuery**: The shape of a query: model, filtered fields with their
+  operators, projected columns, ordering, paging and whether the total
+  row count is selected, and the loader options applied to loaded
+  instances. Values are not part of the shape
+- **filtered_select**: Builds the SELECT of a shape with bound parameters
+  in place of values. Fields are validated against the model when a shape
+  is first seen, and the statement is cached per shape
+- **filtered_exists**: ``SELECT EXISTS (...)`` of a shape, also cached
+- **filter_parameters**: The bound parameter values of one call
+- **model_column** and **filter_conditions**: Field validation and WHERE
+  conditions of a shape, for statements built on the same filters
+- **projection_columns**: The columns selected for a projection dataclass,
+  named by its fields
+
+Reusing one statement object per shape skips rebuilding the SELECT and lets
+SQLAlchemy's compiled cache and the driver's prepared statements be reused
+for every call with the same shape. IN lists are expanding parameters, so
+their length does not change the shape.
+"""
+
+import dataclasses
+import operator
+from collections.abc import Callable, Collection, Mapping, Sequence
+from functools import lru_cache
+from typing import Any, Final, NamedTuple
+
+from sqlalchemy import ColumnElement, Integer, Select, bindparam, func, select
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import QueryableAttribute
+from sqlalchemy.sql.base import ExecutableOption
+
+from src.infrastructure.database.base import BaseModel
+
+FILTER_STATEMENT_CACHE_SIZE: Final[int] = 512
+LIMIT_PARAMETER: Final[str] = "filter_limit"
+OFFSET_PARAMETER: Final[str] = "filter_offset"
+TOTAL_COLUMN: Final[str] = "filter_total"
+LIKE_ESCAPE: Final[str] = "\\"
+
+
+class In(NamedTuple):
+    """Field value is one of the given values."""
+
+    values: Collection[object]
+
+
+class Range(NamedTuple):
+    """Field value lies in the half-open range ``[start, end)``."""
+
+    start: object
+    end: object
+
+
+class Gte(NamedTuple):
+    """Field value is greater than or equal to the given value."""
+
+    value: object
+
+
+class Lte(NamedTuple):
+    """Field value is less than or equal to the given value."""
+
+    value: object
+
+
+class ILikePrefix(NamedTuple):
+    """Field value starts with the given text, ignoring case.
+
+    Wildcards in the prefix match literally.
+    """
+
+    prefix: str
+
+
+class IsNull(NamedTuple):
+    """Field value is NULL, or is not NULL when ``is_null`` is False."""
+
+    is_null: bool = True
+
+
+type FilterOperator = In | Range | Gte | Lte | ILikePrefix | IsNull
+
+
+OPERATOR_NAMES: Final[dict[type, str]] = {
+    In: "in",
+    Range: "range",
+    Gte: "gte",
+    Lte: "lte",
+    ILikePrefix: "ilike_prefix",
+}
+
+# Operators comparing a column with one bound parameter
+COMPARISONS: Final[
+    dict[str, Callable[[QueryableAttribute[Any], Any], ColumnElement[bool]]]
+] = {
+    "eq": operator.eq,
+    "gte": operator.ge,
+    "lte": operator.le,
+    "ilike_prefix": lambda column, pattern: column.ilike(pattern, escape=LIKE_ESCAPE),
+}
+
+
+class FilterQuery(NamedTuple):
+    """Shape of a filtered query, independent of the filtered values.
+
+    Attributes:
+        model_class: The queried model.
+        filters: Filtered fields and operator names, in call order.
+        columns: Projected columns, or None to load model instances.
+        order_by: Fields to order by, descending when prefixed with ``-``.
+        limited: Whether the number of rows is bound by a parameter.
+        offset: Whether leading rows are skipped, bound by a parameter.
+        counted: Whether every row carries the number of rows matching the
+            filters, regardless of limit and offset.
+        options: Loader options, such as eager loads and column deferrals.
+    """
+
+    model_class: type[BaseModel]
+    filters: tuple[tuple[str, str], ...]
+    columns: tuple[str, ...] | None = None
+    order_by: tuple[str, ...] = ("id",)
+    limited: bool = False
+    offset: bool = False
+    counted: bool = False
+    options: tuple[ExecutableOption, ...] = ()
+
+
+def _operator_name(value: object) -> str:
+    """Shape name of a filter value; plain values filter on equality."""
+    if value is None:
+        return "is_null"
+    if isinstance(value, IsNull):
+        return "is_null" if value.is_null else "is_not_null"
+    return OPERATOR_NAMES.get(type(value), "eq")
+
+
+def filter_shape(filters: Mapping[str, object]) -> tuple[tuple[str, str], ...]:
+    """Filtered fields and their operator names.
+
+    Args:
+        filters: Field names mapped to plain values or operators.
+
+    Returns:
+        tuple[tuple[str, str], ...]: The filters part of a FilterQuery.
+    """
+    return tuple((field, _operator_name(value)) for field, value in filters.items())
+
+
+def filter_parameters(
+    filters: Mapping[str, object],
+    *,
+    limit: int | None = None,
+    offset: int | None = None,
+) -> dict[str, Any]:
+    """Bound parameter values of filters, named as in filtered_select.
+
+    Args:
+        filters: Field names mapped to plain values or operators.
+        limit: Maximum number of rows, for limited queries.
+        offset: Rows to skip, for queries with an offset.
+
+    Returns:
+        dict[str, Any]: Parameter values by name.
+    """
+    parameters: dict[str, Any] = {}
+    for index, value in enumerate(filters.values()):
+        name = f"filter_{index}"
+        match value:
+            case None | IsNull():
+                pass
+            case In(values):
+                parameters[name] = list(values)
+            case Range(start, end):
+                parameters[name] = start
+                parameters[f"{name}_end"] = end
+            case Gte(bound) | Lte(bound):
+                parameters[name] = bound
+            case ILikePrefix(prefix):
+                escaped = (
+                    prefix.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+                    .replace("%", f"{LIKE_ESCAPE}%")
+                    .replace("_", f"{LIKE_ESCAPE}_")
+                )
+                parameters[name] = f"{escaped}%"
+            case _:
+                parameters[name] = value
+    if limit is not None:
+        parameters[LIMIT_PARAMETER] = limit
+    if offset is not None:
+        parameters[OFFSET_PARAMETER] = offset
+    return parameters
+
+
+def _condition(
+    column: QueryableAttribute[Any], operator_name: str, name: str
+) -> ColumnElement[bool]:
+    """WHERE condition of one filter.
+
+    Raises:
+        ValueError: If the operator is unknown.
+    """
+    if operator_name == "is_null":
+        return column.is_(None)
+    if operator_name == "is_not_null":
+        return column.is_not(None)
+    if operator_name == "in":
+        return column.in_(bindparam(name, type_=column.type, expanding=True))
+    # Typed by the column, so values are processed like in an equality
+    parameter = bindparam(name, type_=column.type)
+    if operator_name == "range":
+        end = bindparam(f"{name}_end", type_=column.type)
+        return (column >= parameter) & (column < end)
+    try:
+        compare = COMPARISONS[operator_name]
+    except KeyError:
+        msg = f"Unknown filter operator: {operator_name}"
+        raise ValueError(msg) from None
+    return compare(column, parameter)
+
+
+def model_column(model_class: type[BaseModel], field: str) -> QueryableAttribute[Any]:
+    """Mapped column attribute of a model by attribute name.
+
+    Args:
+        model_class: The model.
+        field: Name of the column attribute.
+
+    Returns:
+        QueryableAttribute[Any]: The class attribute of the column.
+
+    Raises:
+        ValueError: If the field is not a mapped column of the model.
+    """
+    column_property = sa_inspect(model_class).column_attrs.get(field)
+    if column_property is None:
+        msg = f"Unknown field for {model_class.__name__}: {field}"
+        raise ValueError(msg)
+    column: QueryableAttribute[Any] = column_property.class_attribute
+    return column
+
+
+def filter_conditions(
+    model_class: type[BaseModel], filters: tuple[tuple[str, str], ...]
+) -> list[ColumnElement[bool]]:
+    """WHERE conditions of a filter shape, bound as in filter_parameters.
+
+    Args:
+        model_class: The filtered model.
+        filters: Filtered fields and operator names, as from filter_shape.
+
+    Returns:
+        list[ColumnElement[bool]]: One condition per filter.
+
+    Raises:
+        ValueError: If a field is not a mapped column of the model, or an
+            operator is unknown.
+    """
+    return [
+        _condition(model_column(model_class, field), operator_name, f"filter_{index}")
+        for index, (field, operator_name) in enumerate(filters)
+    ]
+
+
+@lru_cache(maxsize=FILTER_STATEMENT_CACHE_SIZE)
+def filtered_select(query: FilterQuery) -> Select[Any]:
+    """Build the SELECT of a query shape.
+
+    Values are bound parameters named ``filter_<n>`` after the position of
+    the filter, see filter_parameters.
+
+    Args:
+        query: The query shape.
+
+    Returns:
+        Select[Any]: The statement, shared by all calls with this shape.
+
+    Raises:
+        ValueError: If a field is not a mapped column of the model.
+    """
+
+    def column(field: str) -> QueryableAttribute[Any]:
+        return model_column(query.model_class, field)
+
+    statement: Select[Any] = (
+        select(query.model_class)
+        if query.columns is None
+        else select(*(column(field) for field in query.columns))
+    )
+    statement = statement.where(*filter_conditions(query.model_class, query.filters))
+    statement = statement.order_by(
+        *(
+            column(field[1:]).desc() if field.startswith("-") else column(field)
+            for field in query.order_by
+        )
+    )
+    if query.counted:
+        # Window aggregates are computed before LIMIT and OFFSET apply
+        statement = statement.add_columns(func.count().over().label(TOTAL_COLUMN))
+    if query.options:
+        statement = statement.options(*query.options)
+    if query.limited:
+        statement = statement.limit(bindparam(LIMIT_PARAMETER, type_=Integer))
+    if query.offset:
+        statement = statement.offset(bindparam(OFFSET_PARAMETER, type_=Integer))
+    return statement
+
+
+@lru_cache(maxsize=FILTER_STATEMENT_CACHE_SIZE)
+def filtered_exists(query: FilterQuery) -> Select[tuple[bool]]:
+    """Build a SELECT of whether a query shape matches any row.
+
+    The database stops at the first matching row. Projected columns and
+    ordering of the shape are dropped, so no matches are sorted.
+
+    Args:
+        query: The query shape.
+
+    Returns:
+        Select[tuple[bool]]: The statement, shared by all calls with this
+            shape.
+
+    Raises:
+        ValueError: If a field is not a mapped column of the model.
+    """
+    matches = filtered_select(query._replace(columns=("id",), order_by=()))
+    return select(matches.exists())
+
+
+def filter_query(
+    model_class: type[BaseModel],
+    filters: Mapping[str, object],
+    *,
+    columns: Sequence[str] | None = None,
+    order_by: Sequence[str] = ("id",),
+    limited: bool = False,
+    offset: bool = False,
+    counted: bool = False,
+    options: Sequence[ExecutableOption] = (),
+) -> FilterQuery:
+    """Describe the shape of a filtered query.
+
+    Args:
+        model_class: The queried model.
+        filters: Field names mapped to plain values or operators.
+        columns: Projected columns, or None to load model instances.
+        order_by: Fields to order by, descending when prefixed with ``-``.
+        limited: Whether the number of rows is bound by a parameter.
+        offset: Whether leading rows are skipped, bound by a parameter.
+        counted: Whether every row carries the total number of matches.
+        options: Loader options, such as eager loads and column deferrals.
+
+    Returns:
+        FilterQuery: The hashable shape, key of the statement cache.
+    """
+    return FilterQuery(
+        model_class=model_class,
+        filters=filter_shape(filters),
+        columns=None if columns is None else tuple(columns),
+        order_by=tuple(order_by),
+        limited=limited,
+        offset=offset,
+        counted=counted,
+        options=tuple(options),
+    )
+
+
+def projection_columns(projection: type[object]) -> tuple[str, ...]:
+    """Columns selected for a projection, named by its dataclass fields.
+
+    Args:
+        projection: A dataclass whose init fields are named after model
+            attributes, in the order they are passed to it.
+
+    Returns:
+        tuple[str, ...]: The field names.
+
+    Raises:
+        TypeError: If the projection is not a dataclass.
+    """
+    if not dataclasses.is_dataclass(projection):
+        msg = f"Projections must be dataclasses, got {projection.__name__}"
+        raise TypeError(msg)
+    return tuple(field.name for field in dataclasses.fields(projection) if field.init)
@@ -0,0 +1,85 @@
+"""SQL statement fingerprinting for query analysis.
+
+Statements that differ only in their literal values or bind parameters are
+the same query from a performance point of view. This module normalizes
+statements into a canonical form so they can be counted and aggregated
+together, the same way pg_stat_statements groups queries by query ID.
+
+Normalization rules:
+- **Comments**: Line and block comments are removed
+- **Literals**: String and numeric literals become ``?``
+- **Bind parameters**: ``$1``, ``%(name)s``, ``%s``, ``:name`` and ``?``
+  placeholders become ``?`` (``::type`` casts are preserved)
+- **Lists**: ``IN (...)`` lists and multi-row ``VALUES`` collapse to a
+  single ``(...)`` regardless of their length
+- **Whitespace**: Runs of whitespace collapse to a single space
+
+Results are cached per statement text. SQLAlchemy emits the same compiled
+text for every execution of a query, so the regular expressions run once per
+distinct statement rather than once per execution.
+"""
+
+import hashlib
+import re
+from functools import lru_cache
+from typing import Final, NamedTuple
+
+FINGERPRINT_CACHE_SIZE: Final[int] = 2048
+
+_COMMENT_RE = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_PARAM_RE = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<![:\w]):\w+|\?")
+_NUMBER_RE = re.compile(r"(?<![\w$.])-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?\b")
+_PLACEHOLDER_GROUP = r"\(\s*\?(?:\s*(?:::\w+)?\s*,\s*\?)*\s*(?:::\w+)?\s*\)"
+_IN_LIST_RE = re.compile(rf"\bIN\s*{_PLACEHOLDER_GROUP}", re.IGNORECASE)
+_VALUES_RE = re.compile(
+    rf"\bVALUES\s*{_PLACEHOLDER_GROUP}(?:\s*,\s*{_PLACEHOLDER_GROUP})*",
+    re.IGNORECASE,
+)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+class StatementFingerprint(NamedTuple):
+    """Normalized form of a SQL statement.
+
+    Attributes:
+        digest: Short stable hash of the normalized statement, usable as a key
+            in logs and metrics.
+        normalized: The normalized statement text.
+    """
+
+    digest: str
+    normalized: str
+
+
+def normalize_statement(statement: str) -> str:
+    """Normalize a SQL statement by stripping literals and parameters.
+
+    Args:
+        statement: The SQL statement as sent to the driver.
+
+    Returns:
+        str: The normalized statement.
+    """
+    normalized = _COMMENT_RE.sub(" ", statement)
+    normalized = _STRING_RE.sub("?", normalized)
+    normalized = _PARAM_RE.sub("?", normalized)
+    normalized = _NUMBER_RE.sub("?", normalized)
+    normalized = _IN_LIST_RE.sub("IN (...)", normalized)
+    normalized = _VALUES_RE.sub("VALUES (...)", normalized)
+    return _WHITESPACE_RE.sub(" ", normalized).strip()
+
+
+@lru_cache(maxsize=FINGERPRINT_CACHE_SIZE)
+def fingerprint_statement(statement: str) -> StatementFingerprint:
+    """Compute the fingerprint of a SQL statement.
+
+    Args:
+        statement: The SQL statement as sent to the driver.
+
+    Returns:
+        StatementFingerprint: The digest and normalized text.
+    """
+    normalized = normalize_statement(statement)
+    digest = hashlib.blake2b(normalized.encode(), digest_size=8).hexdigest()
+    return StatementFingerprint(digest=digest, normalized=normalized)
@@ -0,0 +1,136 @@
+"""Connection liveness checks without a round trip on every checkout.
+
+SQLAlchemy's ``pool_pre_ping`` pings every connection it hands out, which
+adds a round trip to each checkout and roughly doubles the latency of
+requests that run a single short query. Connections that were used moments
+ago are almost never dead, so only connections that sat idle in the pool
+for longer than a threshold are pinged.
+
+Key components:
+- **IdleConnectionPing**: Pool ``checkin``/``checkout`` listeners recording
+  when a connection was returned and pinging it on checkout only after it
+  was idle for too long. A failed ping makes the pool discard the connection
+  and hand out a fresh one
+- **execute_read**: Executes a read-only statement and retries it once when
+  it failed because the connection was found dead at use time, provided the
+  statement started the transaction and no changes were pending, so nothing
+  else is lost on rollback
+"""
+
+import time
+from collections.abc import Mapping
+from typing import Any, Final
+
+from loguru import logger
+from sqlalchemy.engine import Dialect, Result
+from sqlalchemy.engine.interfaces import DBAPIConnection
+from sqlalchemy.exc import DBAPIError, DisconnectionError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.pool import ConnectionPoolEntry, PoolProxiedConnection
+from sqlalchemy.sql import Executable
+
+IDLE_SINCE_KEY: Final[str] = "tributum_idle_since"
+
+
+class IdleConnectionPing:
+    """Ping pooled connections on checkout only after they were idle.
+
+    Freshly opened connections are never pinged. The ping runs inside the
+    pool's checkout, which for async engines already executes in the
+    greenlet bridging to the event loop.
+
+    Args:
+        dialect: Dialect of the engine, used to issue the ping.
+        idle_seconds: Minimum idle time before a connection is pinged.
+    """
+
+    def __init__(self, dialect: Dialect, idle_seconds: float) -> None:
+        self.dialect = dialect
+        self.idle_seconds = idle_seconds
+
+    def checkin(
+        self,
+        _dbapi_connection: DBAPIConnection | None,
+        connection_record: ConnectionPoolEntry,
+    ) -> None:
+        """Record when a connection was returned to the pool.
+
+        Args:
+            _dbapi_connection: The DBAPI connection (unused).
+            connection_record: Pool record of the connection.
+        """
+        connection_record.info[IDLE_SINCE_KEY] = time.monotonic()
+
+    def checkout(
+        self,
+        dbapi_connection: DBAPIConnection,
+        connection_record: ConnectionPoolEntry,
+        _connection_proxy: PoolProxiedConnection,
+    ) -> None:
+        """Ping a connection that was idle longer than the threshold.
+
+        Args:
+            dbapi_connection: The DBAPI connection being checked out.
+            connection_record: Pool record of the connection.
+            _connection_proxy: Pool proxy of the connection (unused).
+
+        Raises:
+            DisconnectionError: If the ping failed. The pool then discards
+                the connection and retries the checkout with a new one.
+        """
+        idle_since: float | None = connection_record.info.pop(IDLE_SINCE_KEY, None)
+        if idle_since is None or time.monotonic() - idle_since < self.idle_seconds:
+            return
+
+        try:
+            self.dialect.do_ping(dbapi_connection)
+        except self.dialect.loaded_dbapi.Error as e:
+            logger.info(
+                "Discarding idle database connection that failed ping: {}: {}",
+                type(e).__name__,
+                str(e),
+            )
+            raise DisconnectionError from e
+
+
+async def execute_read(
+    session: AsyncSession,
+    statement: Executable,
+    parameters: Mapping[str, Any] | None = None,
+) -> Result[Any]:
+    """Execute a read-only statement, retrying once on a dead connection.
+
+    The retry only happens when the statement began the session's
+    transaction and the session holds no pending changes, which autoflush
+    would write first and rollback would discard. Rolling back then loses
+    nothing, and SQLAlchemy has already invalidated the dead connection, so
+    the second attempt runs on a new one.
+
+    Args:
+        session: The session to execute on.
+        statement: An idempotent, read-only statement.
+        parameters: Values of the statement's bound parameters, if any.
+
+    Returns:
+        Result[Any]: The statement's result.
+
+    Raises:
+        DBAPIError: If the statement failed for another reason, failed
+            inside an ongoing transaction or with pending changes, or failed
+            again on retry.
+    """
+    retryable = not (
+        session.in_transaction() or session.new or session.dirty or session.deleted
+    )
+    try:
+        return await session.execute(statement, parameters)
+    except DBAPIError as e:
+        if not (retryable and e.connection_invalidated):
+            raise
+        logger.warning(
+            "Retrying read on a new connection after disconnect: {}: {}",
+            type(e.orig).__name__,
+            str(e.orig),
+        )
+        await session.rollback()
+        return await session.execute(statement, parameters)
@@ -0,0 +1,91 @@
+"""N+1 query detection based on per-request statement fingerprints.
+
+An N+1 pattern shows up as the same statement, differing only in its bind
+parameters, executed over and over within a single request - typically a
+lazy load inside a loop. Every executed statement is fingerprinted and
+counted on the request's usage accumulator; once a fingerprint reaches the
+configured threshold the request is reported.
+
+Modes:
+- **off**: No fingerprinting is done
+- **warn**: A warning with the route and the repeating statement is logged
+  once per fingerprint and request
+- **raise**: NPlusOneQueryError is raised from the executing statement, which
+  makes regressions fail tests instead of reaching production
+"""
+
+from typing import Literal
+
+from loguru import logger
+
+from src.core.context import RequestContext
+from src.core.exceptions import ErrorCode, Severity, TributumError
+from src.core.resource_usage import RequestUsage
+from src.core.types import ErrorContext
+from src.infrastructure.database.fingerprint import fingerprint_statement
+
+type NPlusOneMode = Literal["off", "warn", "raise"]
+
+MAX_LOGGED_STATEMENT_LENGTH = 500
+
+
+class NPlusOneQueryError(TributumError):
+    """Raised in strict mode when a request repeats the same statement.
+
+    Args:
+        message: Description of the detected pattern.
+        context: Route, fingerprint and execution count.
+    """
+
+    def __init__(self, message: str, context: ErrorContext | None = None) -> None:
+        super().__init__(ErrorCode.INTERNAL_ERROR, message, Severity.HIGH, context)
+
+
+def detect_n_plus_one(
+    usage: RequestUsage,
+    statement: str,
+    *,
+    mode: NPlusOneMode | None,
+    threshold: int,
+) -> None:
+    """Count a statement execution and report it if it forms an N+1 pattern.
+
+    Args:
+        usage: Accumulator of the current request.
+        statement: The executed SQL statement.
+        mode: Detection mode. None and "off" disable detection.
+        threshold: Executions of one fingerprint that trigger a report.
+
+    Raises:
+        NPlusOneQueryError: If mode is "raise" and the threshold is reached.
+    """
+    if mode is None or mode == "off":
+        return
+
+    fingerprint = fingerprint_statement(statement)
+    count = usage.count_statement(fingerprint.digest)
+    if count != threshold:
+        return
+
+    context: ErrorContext = {
+        "route": usage.route,
+        "fingerprint": fingerprint.digest,
+        "statement": fingerprint.normalized[:MAX_LOGGED_STATEMENT_LENGTH],
+        "executions": count,
+    }
+
+    if mode == "raise":
+        msg = (
+            f"N+1 query pattern on {usage.route}: statement executed "
+            f"{count} times in one request"
+        )
+        raise NPlusOneQueryError(msg, context=context)
+
+    logger.warning(
+        "Possible N+1 query on {}: statement executed {} times in one request",
+        usage.route,
+        count,
+        threshold=threshold,
+        correlation_id=RequestContext.get_correlation_id(),
+        **context,
+    )
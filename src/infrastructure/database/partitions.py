@@ -0,0 +1,418 @@
+"""Range partitioning of model tables by creation time.
+
+Append-heavy tables that grow to billions of rows are split into one
+partition per period of ``created_at``. Queries filtering on a time range
+only scan the partitions of that range, indexes stay the size of a
+period, and old periods are removed by detaching their partition instead
+of deleting rows.
+
+Key components:
+- **PartitionedByCreatedAt**: Model mixin declaring the table partitioned
+  by range of ``created_at``, one partition per day, week, month, quarter
+  or year
+- **partition_bounds** / **partition_name**: The period containing a
+  timestamp and the name of its partition
+- **create_partitioned_table** / **drop_partitioned_table**: Alembic
+  migration helpers creating the parent table, its indexes and the
+  partitions of the coming periods
+- **ensure_partitions**: Creates the partitions of the coming periods that
+  are missing, for a scheduled job
+- **detach_partitions**: Detaches the partitions of periods before a
+  cutoff without blocking queries, optionally moving them to an archive
+  schema
+- **is_partition_table**: Recognizes partitions by name, so that Alembic
+  autogenerate leaves them alone
+
+There is no default partition: rows of a period without a partition are
+rejected, so partitions must be created ahead of time. Primary keys and
+unique constraints of partitioned tables must include ``created_at``.
+Instances are still identified by ``id`` alone, which is unique as it is
+generated by one sequence, so ``get_by_id`` reads the ``id`` index of
+every partition. Filters on a ``created_at`` range prune partitions.
+"""
+
+from datetime import UTC, datetime, timedelta
+from typing import Any, ClassVar, Final
+
+from alembic.operations import Operations
+from loguru import logger
+from sqlalchemy import DateTime, MetaData, Table, func, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped, declared_attr, mapped_column
+from sqlalchemy.schema import CreateIndex, CreateTable, DropTable
+
+from src.infrastructure.database.base import BaseModel
+from src.infrastructure.database.session import DEFAULT_ENGINE_PROFILE, get_engine
+
+PARTITION_KEY: Final[str] = "created_at"
+PARTITION_INTERVAL_INFO: Final[str] = "partition_interval"
+DEFAULT_PARTITIONS_AHEAD: Final[int] = 3
+MAX_IDENTIFIER_LENGTH: Final[int] = 63
+
+# Partition names end in the start of their period
+PARTITION_NAME_FORMATS: Final[dict[str, str]] = {
+    "day": "%Y_%m_%d",
+    "week": "%Y_%m_%d",
+    "month": "%Y_%m",
+    "quarter": "%Y_%m",
+    "year": "%Y",
+}
+MONTHS_PER_PERIOD: Final[dict[str, int]] = {"month": 1, "quarter": 3, "year": 12}
+
+PARTITIONS_QUERY = text(
+    """
+    SELECT c.relname, i.inhdetachpending
+    FROM pg_inherits AS i
+    JOIN pg_class AS c ON c.oid = i.inhrelid
+    WHERE i.inhparent = to_regclass(:table_name)
+    """
+)
+
+
+class PartitionedByCreatedAt:
+    """Mixin partitioning a model's table by range of ``created_at``.
+
+    Listed before BaseModel in the bases. ``created_at`` becomes part of
+    the table's primary key, as PostgreSQL requires of partition keys.
+
+    Example:
+        class Invoice(PartitionedByCreatedAt, BaseModel):
+            __tablename__ = "invoice"
+            partition_interval = "month"
+
+    Attributes:
+        partition_interval: Period covered by one partition: ``"day"``,
+            ``"week"``, ``"month"``, ``"quarter"`` or ``"year"``.
+    """
+
+    partition_interval: ClassVar[str] = "month"
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        primary_key=True,
+        server_default=func.now(),
+        nullable=False,
+        doc="Timestamp when the record was created (UTC), the partition key",
+    )
+
+    # Instances keep being identified by id alone
+    __mapper_args__: ClassVar[dict[str, Any]] = {"primary_key": ["id"]}
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        """Validate the partition interval before the model is mapped.
+
+        Raises:
+            ValueError: If the partition interval is not supported.
+        """
+        if cls.partition_interval not in PARTITION_NAME_FORMATS:
+            msg = f"Invalid partition interval: {cls.partition_interval}"
+            raise ValueError(msg)
+        super().__init_subclass__(**kwargs)
+
+    @declared_attr.directive
+    @classmethod
+    def __table_args__(cls) -> dict[str, Any]:
+        """Partition the table, recording the interval in the table info."""
+        return {
+            "postgresql_partition_by": f"RANGE ({PARTITION_KEY})",
+            "info": {PARTITION_INTERVAL_INFO: cls.partition_interval},
+        }
+
+
+def _partitioned_table(model_class: type[BaseModel]) -> tuple[Table, str]:
+    """The table of a partitioned model and its partition interval.
+
+    Raises:
+        TypeError: If the model is not partitioned by PartitionedByCreatedAt.
+    """
+    table = model_class.__table__
+    if not isinstance(table, Table) or PARTITION_INTERVAL_INFO not in table.info:
+        msg = f"Model is not partitioned by created_at: {model_class.__name__}"
+        raise TypeError(msg)
+    return table, table.info[PARTITION_INTERVAL_INFO]
+
+
+def _quote(name: str) -> str:
+    """Quote an identifier for PostgreSQL."""
+    return '"{}"'.format(name.replace('"', '""'))
+
+
+def _qualified(table: Table, name: str) -> str:
+    """Quoted name of a table in the schema of another."""
+    if table.schema is None:
+        return _quote(name)
+    return f"{_quote(table.schema)}.{_quote(name)}"
+
+
+def partition_bounds(interval: str, moment: datetime) -> tuple[datetime, datetime]:
+    """Start and end of the period containing a timestamp, in UTC.
+
+    Args:
+        interval: The partition interval.
+        moment: A timezone-aware timestamp.
+
+    Returns:
+        tuple[datetime, datetime]: The half-open range ``[start, end)``.
+    """
+    day = moment.astimezone(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+    if interval == "day":
+        return day, day + timedelta(days=1)
+    if interval == "week":
+        start = day - timedelta(days=day.weekday())
+        return start, start + timedelta(weeks=1)
+    months = MONTHS_PER_PERIOD[interval]
+    first_month = (day.month - 1) // months * months
+    start = day.replace(month=first_month + 1, day=1)
+    end_month = first_month + months
+    end = start.replace(year=start.year + end_month // 12, month=end_month % 12 + 1)
+    return start, end
+
+
+def partition_name(table: Table, interval: str, start: datetime) -> str:
+    """Name of the partition of the period starting at a timestamp.
+
+    Args:
+        table: The partitioned table.
+        interval: The partition interval.
+        start: Start of the period.
+
+    Returns:
+        str: The table name followed by ``_p`` and the period start.
+
+    Raises:
+        ValueError: If the name is longer than PostgreSQL identifiers.
+    """
+    name = f"{table.name}_p{start.strftime(PARTITION_NAME_FORMATS[interval])}"
+    if len(name) > MAX_IDENTIFIER_LENGTH:
+        msg = f"Partition name too long: {name}"
+        raise ValueError(msg)
+    return name
+
+
+def _partition_start(table: Table, interval: str, name: str) -> datetime | None:
+    """Period start of a partition named by partition_name, if it is one."""
+    prefix = f"{table.name}_p"
+    if not name.startswith(prefix):
+        return None
+    try:
+        start = datetime.strptime(
+            name.removeprefix(prefix), PARTITION_NAME_FORMATS[interval]
+        ).replace(tzinfo=UTC)
+    except ValueError:
+        return None
+    # Names of other periods, such as a day of a monthly table, don't count
+    if partition_bounds(interval, start)[0] != start:
+        return None
+    return start
+
+
+def _period_starts(interval: str, now: datetime, ahead: int) -> list[datetime]:
+    """Starts of the current period and of the periods ahead of it."""
+    start = partition_bounds(interval, now)[0]
+    starts = [start]
+    for _ in range(ahead):
+        start = partition_bounds(interval, start)[1]
+        starts.append(start)
+    return starts
+
+
+def partition_ddl(model_class: type[BaseModel], start: datetime) -> str:
+    """CREATE TABLE statement of the partition of a period.
+
+    Args:
+        model_class: The partitioned model.
+        start: Start of the period.
+
+    Returns:
+        str: The statement, doing nothing if the partition exists.
+
+    Raises:
+        TypeError: If the model is not partitioned by PartitionedByCreatedAt.
+    """
+    table, interval = _partitioned_table(model_class)
+    start, end = partition_bounds(interval, start)
+    name = partition_name(table, interval, start)
+    return (
+        f"CREATE TABLE IF NOT EXISTS {_qualified(table, name)} "
+        f"PARTITION OF {_qualified(table, table.name)} "
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    )
+
+
+def create_partitioned_table(
+    operations: Operations,
+    model_class: type[BaseModel],
+    *,
+    ahead: int = DEFAULT_PARTITIONS_AHEAD,
+    now: datetime | None = None,
+) -> None:
+    """Create a partitioned model's table and first partitions in a migration.
+
+    Indexes are created on the parent table, and PostgreSQL creates them on
+    every partition, including partitions created later.
+
+    Args:
+        operations: Alembic operations, ``op`` in migration scripts.
+        model_class: The partitioned model.
+        ahead: Partitions to create after the current period's.
+        now: Time the current period is taken from, the current time by
+            default.
+
+    Raises:
+        TypeError: If the model is not partitioned by PartitionedByCreatedAt.
+
+    Example:
+        def upgrade() -> None:
+            create_partitioned_table(op, Invoice)
+
+        def downgrade() -> None:
+            drop_partitioned_table(op, Invoice)
+    """
+    table, interval = _partitioned_table(model_class)
+    operations.execute(CreateTable(table))
+    for index in table.indexes:
+        operations.execute(CreateIndex(index))
+    for start in _period_starts(interval, now or datetime.now(UTC), ahead):
+        operations.execute(partition_ddl(model_class, start))
+
+
+def drop_partitioned_table(
+    operations: Operations, model_class: type[BaseModel]
+) -> None:
+    """Drop a partitioned model's table and its attached partitions.
+
+    Args:
+        operations: Alembic operations, ``op`` in migration scripts.
+        model_class: The partitioned model.
+
+    Raises:
+        TypeError: If the model is not partitioned by PartitionedByCreatedAt.
+    """
+    table, _ = _partitioned_table(model_class)
+    operations.execute(DropTable(table))
+
+
+def _table_parameter(table: Table) -> str:
+    """Quoted table name, as to_regclass folds unquoted names to lower case."""
+    return _qualified(table, table.name)
+
+
+async def ensure_partitions(
+    session: AsyncSession,
+    model_class: type[BaseModel],
+    *,
+    ahead: int = DEFAULT_PARTITIONS_AHEAD,
+    now: datetime | None = None,
+) -> list[str]:
+    """Create the missing partitions of the current and coming periods.
+
+    Meant to run on a schedule more often than once per ``ahead`` periods,
+    so that partitions exist well before rows arrive for them. Creating a
+    partition briefly locks the parent table, which is cheap while it is
+    done ahead of time. Runs in the session's transaction; the caller
+    commits.
+
+    Args:
+        session: The session to create the partitions on.
+        model_class: The partitioned model.
+        ahead: Partitions to have after the current period's.
+        now: Time the current period is taken from, the current time by
+            default.
+
+    Returns:
+        list[str]: Names of the partitions created.
+
+    Raises:
+        TypeError: If the model is not partitioned by PartitionedByCreatedAt.
+    """
+    table, interval = _partitioned_table(model_class)
+    result = await session.execute(
+        PARTITIONS_QUERY, {"table_name": _table_parameter(table)}
+    )
+    existing = {name for name, _ in result.all()}
+
+    created = []
+    for start in _period_starts(interval, now or datetime.now(UTC), ahead):
+        name = partition_name(table, interval, start)
+        if name in existing:
+            continue
+        await session.execute(text(partition_ddl(model_class, start)))
+        created.append(name)
+    if created:
+        logger.info("Created partitions of {}: {}", table.name, created)
+    return created
+
+
+async def detach_partitions(
+    model_class: type[BaseModel],
+    *,
+    before: datetime,
+    archive_schema: str | None = None,
+    profile: str = DEFAULT_ENGINE_PROFILE,
+) -> list[str]:
+    """Detach the partitions of periods ending by a cutoff.
+
+    Partitions are detached CONCURRENTLY, so queries and writes on the
+    parent table go on meanwhile. This cannot run inside a transaction, so
+    an autocommit connection of the engine profile is used. A detach that
+    was interrupted is finalized. Detached partitions are ordinary tables,
+    which can be dumped and dropped, or kept in an archive schema.
+
+    Args:
+        model_class: The partitioned model.
+        before: Partitions whose period ends at or before it are detached.
+        archive_schema: Existing schema to move detached partitions to.
+        profile: Engine profile to connect with.
+
+    Returns:
+        list[str]: Names of the detached partitions, oldest first.
+
+    Raises:
+        TypeError: If the model is not partitioned by PartitionedByCreatedAt.
+    """
+    table, interval = _partitioned_table(model_class)
+    parent = _qualified(table, table.name)
+    async with get_engine(profile).connect() as connection:
+        await connection.execution_options(isolation_level="AUTOCOMMIT")
+        result = await connection.execute(
+            PARTITIONS_QUERY, {"table_name": _table_parameter(table)}
+        )
+        partitions = sorted(
+            (start, name, pending)
+            for name, pending in result.all()
+            if (start := _partition_start(table, interval, name)) is not None
+            and partition_bounds(interval, start)[1] <= before
+        )
+
+        detached = []
+        for _, name, pending in partitions:
+            mode = "FINALIZE" if pending else "CONCURRENTLY"
+            partition = _qualified(table, name)
+            await connection.exec_driver_sql(
+                f"ALTER TABLE {parent} DETACH PARTITION {partition} {mode}"
+            )
+            if archive_schema is not None:
+                await connection.exec_driver_sql(
+                    f"ALTER TABLE {partition} SET SCHEMA {_quote(archive_schema)}"
+                )
+            detached.append(name)
+    if detached:
+        logger.info("Detached partitions of {}: {}", table.name, detached)
+    return detached
+
+
+def is_partition_table(name: str, metadata: MetaData) -> bool:
+    """Whether a table is a partition of a partitioned table of the metadata.
+
+    Args:
+        name: Name of the table.
+        metadata: Metadata of the partitioned tables.
+
+    Returns:
+        bool: True if the name is a partition name of one of the tables.
+    """
+    return any(
+        _partition_start(table, table.info[PARTITION_INTERVAL_INFO], name) is not None
+        for table in metadata.tables.values()
+        if PARTITION_INTERVAL_INFO in table.info
+    )
@@ -0,0 +1,136 @@
+"""Compatibility with transaction poolers such as PgBouncer.
+
+A pooler in transaction mode hands each transaction whatever server
+connection is free, so nothing may rely on state living on a server
+connection between transactions. Two things in a default engine do:
+
+- **Prepared statements**: asyncpg prepares statements under names cached
+  per client connection. The next transaction may run on a server
+  connection that never saw the statement, or already has one with the
+  same name
+- **Startup parameters**: Settings sent when the connection is opened apply
+  to one server connection only, and PgBouncer rejects most of them
+- **Autocommit statements**: Outside of a transaction, asyncpg prepares and
+  executes a statement in two exchanges, each a server transaction of its
+  own, so the prepared statement may be missing on the server connection
+  that executes it. Read-only sessions use transactions behind a pooler,
+  and maintenance that needs autocommit (such as detaching partitions
+  concurrently) must connect to PostgreSQL directly
+
+Key components:
+- **pooler_connect_args**: asyncpg arguments disabling the statement caches
+  and giving every prepared statement a unique name
+- **split_server_settings**: Separates the parameters PgBouncer forwards at
+  connect time from those that must be applied per transaction
+- **TransactionSettings**: ``begin`` listener applying server settings with
+  ``set_config(..., true)``, the function form of SET LOCAL, at the start
+  of every transaction
+"""
+
+from typing import Any, Final, Literal
+from uuid import uuid4
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+type PoolerMode = Literal["none", "transaction"]
+
+# Startup parameters PgBouncer tracks and restores per client by default
+POOLER_STARTUP_PARAMETERS: Final[frozenset[str]] = frozenset(
+    {
+        "application_name",
+        "client_encoding",
+        "DateStyle",
+        "TimeZone",
+        "standard_conforming_strings",
+    }
+)
+
+
+def unique_statement_name() -> str:
+    """Generate a prepared statement name no other statement will reuse.
+
+    Returns:
+        str: The statement name.
+    """
+    return f"__asyncpg_{uuid4()}__"
+
+
+def pooler_connect_args() -> dict[str, Any]:
+    """Connect arguments for asyncpg connections through a transaction pooler.
+
+    Returns:
+        dict[str, Any]: Arguments to merge into the engine's connect_args.
+    """
+    return {
+        # SQLAlchemy's cache of prepared statements per connection
+        "prepared_statement_cache_size": 0,
+        # asyncpg's own cache, used for statements it prepares implicitly
+        "statement_cache_size": 0,
+        # Statements are still prepared for each execution; unique names
+        # avoid clashes on server connections shared by several clients
+        "prepared_statement_name_func": unique_statement_name,
+    }
+
+
+def split_server_settings(
+    server_settings: dict[str, str],
+) -> tuple[dict[str, str], dict[str, str]]:
+    """Split server settings by how they reach a pooled server connection.
+
+    Args:
+        server_settings: All PostgreSQL settings of the engine.
+
+    Returns:
+        tuple[dict[str, str], dict[str, str]]: Settings sent as startup
+            parameters, and settings to apply at the start of each
+            transaction.
+    """
+    startup = {
+        name: value
+        for name, value in server_settings.items()
+        if name in POOLER_STARTUP_PARAMETERS
+    }
+    per_transaction = {
+        name: value
+        for name, value in server_settings.items()
+        if name not in POOLER_STARTUP_PARAMETERS
+    }
+    return startup, per_transaction
+
+
+class TransactionSettings:
+    """Apply server settings at the start of every transaction.
+
+    The settings are local to the transaction, so they cannot leak to
+    other clients of the same server connection. Autocommit connections
+    are skipped, as transaction-local settings would not outlive the
+    statement applying them.
+
+    Args:
+        server_settings: PostgreSQL settings and their values.
+    """
+
+    def __init__(self, server_settings: dict[str, str]) -> None:
+        self.server_settings = dict(server_settings)
+        calls = ", ".join(
+            f"set_config(:name_{i}, :value_{i}, true)"
+            for i in range(len(self.server_settings))
+        )
+        self._statement = text(f"SELECT {calls}")
+        self._parameters: dict[str, str] = {}
+        for i, (name, value) in enumerate(self.server_settings.items()):
+            self._parameters[f"name_{i}"] = name
+            self._parameters[f"value_{i}"] = value
+
+    def __call__(self, conn: Connection) -> None:
+        """Apply the settings to the transaction that is beginning.
+
+        Args:
+            conn: The connection beginning a transaction.
+        """
+        if not self.server_settings:
+            return
+        if conn.get_execution_options().get("isolation_level") == "AUTOCOMMIT":
+            return
+        conn.execute(self._statement, self._parameters)
@@ -0,0 +1,248 @@
+"""In-process query statistics aggregated by statement fingerprint.
+
+The slow query log only shows individual statements above a threshold, so a
+cheap query executed thousands of times a minute never appears in it even
+when it dominates database time. This module keeps pg_stat_statements-style
+totals per normalized statement inside the application process.
+
+Key components:
+- **QueryStatsAggregator**: Thread-safe, bounded map from fingerprint to
+  call count, total/mean/max time, rows and a latency histogram
+- **Latency histogram**: Fixed log-scale buckets (about 9% wide) per
+  fingerprint, giving p95/p99 estimates in constant memory
+- **Periodic summary**: Background task logging the top statements by total
+  time at a fixed interval
+
+Memory is bounded by the number of fingerprints kept. When the aggregator is
+full, the least recently executed entry is evicted to make room, in constant
+time, so statements that keep running are kept while one-off statements age
+out. Recording a statement costs a cached fingerprint lookup, a lock and a
+bucket increment, so it can stay enabled in production.
+"""
+
+import asyncio
+import math
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Final, Literal
+
+from loguru import logger
+
+from src.core.config import get_settings
+from src.infrastructure.database.fingerprint import fingerprint_statement
+
+type QueryStatsOrder = Literal["total", "mean", "calls", "p99"]
+
+# Histogram buckets: 10us lower bound, each bucket 2^(1/4) times wider
+HISTOGRAM_MIN_NS: Final[int] = 10_000
+HISTOGRAM_BUCKETS: Final[int] = 96
+_BUCKET_GROWTH: Final[float] = 2**0.25
+_LOG_GROWTH: Final[float] = math.log(_BUCKET_GROWTH)
+
+NANOSECONDS_PER_MILLISECOND: Final[int] = 1_000_000
+MAX_QUERY_TEXT_LENGTH: Final[int] = 1000
+SUMMARY_TOP_STATEMENTS: Final[int] = 10
+
+
+def _bucket_index(duration_ns: int) -> int:
+    """Map a duration to its histogram bucket."""
+    if duration_ns <= HISTOGRAM_MIN_NS:
+        return 0
+    index = int(math.log(duration_ns / HISTOGRAM_MIN_NS) / _LOG_GROWTH) + 1
+    return min(index, HISTOGRAM_BUCKETS - 1)
+
+
+def _bucket_midpoint_ns(index: int) -> float:
+    """Representative duration of a bucket (geometric mean of its bounds)."""
+    if index == 0:
+        return HISTOGRAM_MIN_NS
+    lower = HISTOGRAM_MIN_NS * _BUCKET_GROWTH ** (index - 1)
+    return lower * math.sqrt(_BUCKET_GROWTH)
+
+
+class _StatementStats:
+    """Accumulated statistics of one statement fingerprint."""
+
+    __slots__ = (
+        "buckets",
+        "calls",
+        "max_ns",
+        "min_ns",
+        "query",
+        "rows",
+        "total_ns",
+    )
+
+    def __init__(self, query: str) -> None:
+        self.query = query
+        self.calls = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+        self.rows = 0
+        self.buckets = [0] * HISTOGRAM_BUCKETS
+
+    def record(self, duration_ns: int, rows: int) -> None:
+        """Add one execution."""
+        if self.calls == 0 or duration_ns < self.min_ns:
+            self.min_ns = duration_ns
+        self.max_ns = max(self.max_ns, duration_ns)
+        self.calls += 1
+        self.total_ns += duration_ns
+        if rows > 0:
+            self.rows += rows
+        self.buckets[_bucket_index(duration_ns)] += 1
+
+    def percentile_ns(self, quantile: float) -> float:
+        """Estimate a latency percentile from the histogram."""
+        target = max(math.ceil(self.calls * quantile), 1)
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= target:
+                return min(max(_bucket_midpoint_ns(index), self.min_ns), self.max_ns)
+        return float(self.max_ns)  # pragma: no cover - buckets always sum to calls
+
+    def as_dict(self, fingerprint: str) -> dict[str, object]:
+        """Render the statistics in milliseconds."""
+
+        def to_ms(value: float) -> float:
+            return round(value / NANOSECONDS_PER_MILLISECOND, 3)
+
+        return {
+            "fingerprint": fingerprint,
+            "query": self.query,
+            "calls": self.calls,
+            "total_ms": to_ms(self.total_ns),
+            "mean_ms": to_ms(self.total_ns / self.calls),
+            "min_ms": to_ms(self.min_ns),
+            "max_ms": to_ms(self.max_ns),
+            "p95_ms": to_ms(self.percentile_ns(0.95)),
+            "p99_ms": to_ms(self.percentile_ns(0.99)),
+            "rows": self.rows,
+        }
+
+
+_SORT_KEYS: Final[dict[str, Callable[[_StatementStats], float]]] = {
+    "total": lambda stats: stats.total_ns,
+    "mean": lambda stats: stats.total_ns / stats.calls,
+    "calls": lambda stats: stats.calls,
+    "p99": lambda stats: stats.percentile_ns(0.99),
+}
+
+
+class QueryStatsAggregator:
+    """Bounded, thread-safe statistics per statement fingerprint.
+
+    Args:
+        max_entries: Maximum number of fingerprints kept in memory.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        # Ordered from least to most recently executed
+        self._entries: OrderedDict[str, _StatementStats] = OrderedDict()
+        self._lock = threading.Lock()
+        self._evictions = 0
+        self._since = time.time()
+
+    def record(self, statement: str, duration_ns: int, rows: int = -1) -> None:
+        """Record one execution of a statement.
+
+        Args:
+            statement: The executed SQL statement.
+            duration_ns: Execution time in nanoseconds.
+            rows: Rows affected or returned, negative if unknown.
+        """
+        fingerprint = fingerprint_statement(statement)
+        with self._lock:
+            stats = self._entries.get(fingerprint.digest)
+            if stats is None:
+                if len(self._entries) >= self.max_entries:
+                    self._evict_least_recent()
+                stats = _StatementStats(fingerprint.normalized[:MAX_QUERY_TEXT_LENGTH])
+                self._entries[fingerprint.digest] = stats
+            else:
+                self._entries.move_to_end(fingerprint.digest)
+            stats.record(duration_ns, rows)
+
+    def _evict_least_recent(self) -> None:
+        """Drop the least recently executed entry. Caller holds the lock."""
+        self._entries.popitem(last=False)
+        self._evictions += 1
+
+    def snapshot(
+        self, limit: int = 50, order_by: QueryStatsOrder = "total"
+    ) -> dict[str, object]:
+        """Get the current statistics.
+
+        Args:
+            limit: Maximum number of statements to return.
+            order_by: Sort key - total time, mean time, calls or p99.
+
+        Returns:
+            dict[str, object]: Collection window, eviction count and the top
+                statements with their statistics.
+        """
+        sort_key = _SORT_KEYS[order_by]
+        with self._lock:
+            top = sorted(
+                self._entries.items(), key=lambda item: sort_key(item[1]), reverse=True
+            )[:limit]
+            statements = [stats.as_dict(digest) for digest, stats in top]
+            evictions = self._evictions
+            since = self._since
+            tracked = len(self._entries)
+
+        return {
+            "since": since,
+            "window_seconds": round(time.time() - since, 1),
+            "tracked_statements": tracked,
+            "max_entries": self.max_entries,
+            "evictions": evictions,
+            "statements": statements,
+        }
+
+    def reset(self) -> None:
+        """Discard all statistics and start a new collection window."""
+        with self._lock:
+            self._entries.clear()
+            self._evictions = 0
+            self._since = time.time()
+
+
+@lru_cache(maxsize=1)
+def get_query_stats() -> QueryStatsAggregator:
+    """Get the process-wide query statistics aggregator.
+
+    Returns:
+        QueryStatsAggregator: The shared aggregator sized from settings.
+    """
+    return QueryStatsAggregator(get_settings().database_config.query_stats_max_entries)
+
+
+async def log_query_stats_periodically(interval: float) -> None:
+    """Log a summary of the top statements by total time at a fixed interval.
+
+    Runs until cancelled. Intended to be started as a background task from
+    the application lifespan.
+
+    Args:
+        interval: Seconds between summaries.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        snapshot = get_query_stats().snapshot(limit=SUMMARY_TOP_STATEMENTS)
+        statements = snapshot["statements"]
+        if not statements:
+            continue
+        logger.info(
+            "Query statistics summary - {} statements tracked",
+            snapshot["tracked_statements"],
+            window_seconds=snapshot["window_seconds"],
+            evictions=snapshot["evictions"],
+            top_statements=statements,
+        )
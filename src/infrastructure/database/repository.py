@@ -9,7 +9,28 @@ Features:
 - **Async operations**: All methods are async for non-blocking I/O
 - **Comprehensive logging**: Detailed operation logging with context
 - **Flexible queries**: Support for filtering, pagination, and existence checks
+- **Cheap counts**: EXISTS checks that stop at the first match, counts
+  estimated from table statistics, and exact counts cached per model for a
+  time to live
+- **Projections**: Column-only reads into slotted dataclasses or rows,
+  without identity map or change tracking
+- **Paged listings**: A page and its total in one statement, or with an
+  estimated total for large tables
+- **Load profiles**: Named eager loading and column deferral policies, so
+  related data is read in a fixed number of queries instead of one lazy
+  load per instance
+- **Filter operators**: IN, range, comparison, case-insensitive prefix and
+  NULL filters, validated and compiled once per query shape, with ordering
+  and column-only projections
+- **Time windows**: Instances of a ``created_at`` or ``updated_at`` window
+  streamed in time order from a server-side cursor, reading only the
+  relevant blocks through BRIN indexes
+- **Aggregation**: Grouped sums, counts, extremes and averages, optionally
+  per time bucket, computed by a single GROUP BY in the database
 - **Partial updates**: Update specific fields without full object replacement
+- **Read retries**: Reads are retried once on a new connection when the
+  connection turns out to be dead at use time
+- **Bulk ingest**: COPY-based loading with optional upsert semantics
 
 The BaseRepository class is designed to be extended for domain-specific
 repositories, allowing additional custom queries while inheriting all
@@ -17,23 +38,68 @@ standard operations. This promotes code reuse and consistency across
 the data access layer.
 """
 
-from collections.abc import Mapping
-from typing import TypeVar
+import contextlib
+from collections.abc import AsyncGenerator, Callable, Mapping, Sequence
+from datetime import datetime
+from typing import Any, ClassVar, Literal, NamedTuple, TypeVar, cast
 
 from loguru import logger
+from sqlalchemy import Result, Row, Table, func, select
 from sqlalchemy import delete as sql_delete
-from sqlalchemy import func, select
-from sqlalchemy.ext.asyncio import AsyncSession
-
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.sql.base import ExecutableOption
+
+from src.infrastructure.database.aggregates import (
+    Metric,
+    aggregate_query,
+    aggregate_select,
+)
 from src.infrastructure.database.base import BaseModel
+from src.infrastructure.database.bulk_copy import CopyResult, CopyRows, copy_records
+from src.infrastructure.database.filters import (
+    TOTAL_COLUMN,
+    Range,
+    filter_parameters,
+    filter_query,
+    filtered_exists,
+    filtered_select,
+    projection_columns,
+)
+from src.infrastructure.database.liveness import execute_read
+from src.infrastructure.database.row_estimate import (
+    estimate_query_rows,
+    estimate_table_rows,
+    get_count_cache,
+    has_count_change,
+    record_count_change,
+)
+from src.infrastructure.database.session import DEFAULT_ENGINE_PROFILE
 
 DEFAULT_PAGINATION_LIMIT = 100
+DEFAULT_WINDOW_BATCH_SIZE = 1000
+
+type CountMode = Literal["exact", "estimated"]
+type LoadProfiles = Mapping[str, Sequence[ExecutableOption]]
 
 
 # Type variable for generic model type
 T = TypeVar("T", bound=BaseModel)
 
 
+class Page[T: BaseModel](NamedTuple):
+    """One page of a paged listing.
+
+    Attributes:
+        items: The instances on the page.
+        total: Number of instances matching the listing's filters.
+        estimated: Whether the total is an estimate.
+    """
+
+    items: list[T]
+    total: int
+    estimated: bool
+
+
 class BaseRepository[T: BaseModel]:
     """Base repository class providing common CRUD operations.
 
@@ -46,31 +112,84 @@ class BaseRepository[T: BaseModel]:
         session: The async SQLAlchemy session to use for operations.
         model_class: The SQLAlchemy model class this repository manages.
 
+    Repositories of slow workloads declare the engine profile their
+    sessions should come from, e.g. ``get_db_for(ReportRepository.engine_profile)``.
+
+    Repositories of models with relationships declare load profiles: named
+    loader options, such as eager loads and column deferrals, applied by
+    reads called with ``load=<name>``. The options are created once with
+    the class, so statements using them keep hitting the compiled cache.
+
+    Repositories of large, frequently counted tables set
+    ``count_cache_ttl_s`` to reuse an exact count for that many seconds.
+
     Example:
         class UserRepository(BaseRepository[User]):
             def __init__(self, session: AsyncSession) -> None:
                 super().__init__(session, User)
+
+        class InvoiceRepository(BaseRepository[Invoice]):
+            load_profiles: ClassVar[LoadProfiles] = {
+                "list": (selectinload(Invoice.customer), defer(Invoice.notes)),
+                "detail": (
+                    joinedload(Invoice.customer),
+                    selectinload(Invoice.lines),
+                    raiseload("*"),
+                ),
+            }
     """
 
+    engine_profile: ClassVar[str] = DEFAULT_ENGINE_PROFILE
+    load_profiles: ClassVar[LoadProfiles] = {}
+    count_cache_ttl_s: ClassVar[float | None] = None
+
     def __init__(self, session: AsyncSession, model_class: type[T]) -> None:
         self.session = session
         self.model_class = model_class
         logger.debug("Initialized repository for {}", model_class.__name__)
 
-    async def get_by_id(self, entity_id: int) -> T | None:
+    def _load_options(self, load: str | None) -> tuple[ExecutableOption, ...]:
+        """Loader options of a load profile, none without a profile.
+
+        Raises:
+            ValueError: If the repository declares no such load profile.
+        """
+        if load is None:
+            return ()
+        try:
+            return tuple(self.load_profiles[load])
+        except KeyError:
+            msg = f"Unknown load profile for {type(self).__name__}: {load}"
+            raise ValueError(msg) from None
+
+    @staticmethod
+    def _loaded[R: Result[Any]](result: R, options: Sequence[ExecutableOption]) -> R:
+        """Deduplicate rows repeated by joined eager loads of collections."""
+        return result.unique() if options else result
+
+    async def get_by_id(self, entity_id: int, *, load: str | None = None) -> T | None:
         """Retrieve a model instance by its ID.
 
         Args:
             entity_id: The primary key ID of the model to retrieve.
+            load: Name of the load profile to apply.
 
         Returns:
             T | None: The model instance if found, None otherwise.
+
+        Raises:
+            ValueError: If the load profile is unknown.
         """
         logger.debug("Fetching {} by ID: {}", self.model_class.__name__, entity_id)
 
-        stmt = select(self.model_class).where(self.model_class.id == entity_id)
-        result = await self.session.execute(stmt)
-        instance = result.scalar_one_or_none()
+        options = self._load_options(load)
+        stmt = (
+            select(self.model_class)
+            .where(self.model_class.id == entity_id)
+            .options(*options)
+        )
+        result = await execute_read(self.session, stmt)
+        instance = self._loaded(result, options).scalar_one_or_none()
 
         if instance:
             logger.debug(
@@ -86,16 +205,24 @@ class BaseRepository[T: BaseModel]:
         return instance
 
     async def get_all(
-        self, skip: int = 0, limit: int = DEFAULT_PAGINATION_LIMIT
+        self,
+        skip: int = 0,
+        limit: int = DEFAULT_PAGINATION_LIMIT,
+        *,
+        load: str | None = None,
     ) -> list[T]:
         """Retrieve all model instances with pagination.
 
         Args:
             skip: Number of records to skip (for pagination).
             limit: Maximum number of records to return.
+            load: Name of the load profile to apply.
 
         Returns:
             list[T]: List of model instances.
+
+        Raises:
+            ValueError: If the load profile is unknown.
         """
         logger.debug(
             "Fetching all {} with pagination - skip: {}, limit: {}",
@@ -104,14 +231,16 @@ class BaseRepository[T: BaseModel]:
             limit,
         )
 
+        options = self._load_options(load)
         stmt = (
             select(self.model_class)
             .offset(skip)
             .limit(limit)
             .order_by(self.model_class.id)
+            .options(*options)
         )
-        result = await self.session.execute(stmt)
-        instances = list(result.scalars().all())
+        result = await execute_read(self.session, stmt)
+        instances = list(self._loaded(result, options).scalars().all())
 
         logger.debug(
             "Retrieved {} {} instances", len(instances), self.model_class.__name__
@@ -132,6 +261,7 @@ class BaseRepository[T: BaseModel]:
 
         self.session.add(obj)
         await self.session.flush()  # Flush to get the ID without committing
+        record_count_change(self.session, self.model_class)
 
         # Refresh to get server-generated values (ID, timestamps)
         await self.session.refresh(obj)
@@ -142,6 +272,45 @@ class BaseRepository[T: BaseModel]:
 
         return obj
 
+    async def copy_in(
+        self,
+        rows: CopyRows,
+        *,
+        columns: Sequence[str] | None = None,
+        conflict_columns: Sequence[str] | None = None,
+    ) -> CopyResult:
+        """Bulk load rows with PostgreSQL COPY.
+
+        Much faster than adding instances for large loads. The rows are part
+        of the session's transaction but not of its identity map.
+
+        Args:
+            rows: Model instances or tuples in column order, from a regular
+                or an async iterable.
+            columns: Column names to copy. Defaults to all columns not
+                generated by the server.
+            conflict_columns: Columns of a unique constraint. When given,
+                existing rows are updated instead of causing a conflict.
+
+        Returns:
+            CopyResult: Rows copied, elapsed time and rows per second.
+        """
+        logger.debug(
+            "Copying rows into {} - upsert: {}",
+            self.model_class.__name__,
+            conflict_columns is not None,
+        )
+
+        result = await copy_records(
+            self.session,
+            self.model_class,
+            rows,
+            columns=columns,
+            conflict_columns=conflict_columns,
+        )
+        record_count_change(self.session, self.model_class)
+        return result
+
     async def update(self, entity_id: int, data: Mapping[str, object]) -> T | None:
         """Update a model instance by its ID with partial data.
 
@@ -214,6 +383,7 @@ class BaseRepository[T: BaseModel]:
         deleted = result.rowcount > 0
 
         if deleted:
+            record_count_change(self.session, self.model_class)
             logger.info(
                 "Deleted {} instance with ID: {}", self.model_class.__name__, entity_id
             )
@@ -226,17 +396,54 @@ class BaseRepository[T: BaseModel]:
 
         return deleted
 
-    async def count(self) -> int:
+    async def count(self, *, estimate: bool = False) -> int:
         """Count all instances of the model.
 
+        An exact count scans the whole table. When the repository sets
+        ``count_cache_ttl_s``, an exact count is reused until it is that
+        old, or until a transaction that added or deleted instances through
+        a repository of this process commits or rolls back. Until then,
+        that transaction counts its own changes exactly.
+
+        Args:
+            estimate: Whether to estimate the count from table statistics
+                instead, without scanning. Tables that were never vacuumed
+                or analyzed have no statistics and are counted exactly.
+
         Returns:
             int: The total number of instances.
         """
-        logger.debug("Counting {} instances", self.model_class.__name__)
+        logger.debug(
+            "Counting {} instances - estimate: {}", self.model_class.__name__, estimate
+        )
+
+        if estimate:
+            table = cast("Table", self.model_class.__table__)
+            estimated = await estimate_table_rows(self.session, table)
+            if estimated is not None:
+                logger.debug(
+                    "Estimated {} {} instances", estimated, self.model_class.__name__
+                )
+                return estimated
+
+        ttl_s = self.count_cache_ttl_s
+        if has_count_change(self.session, self.model_class):
+            ttl_s = None
+        if ttl_s is not None:
+            cached = get_count_cache().get(self.model_class, ttl_s)
+            if cached is not None:
+                logger.debug(
+                    "Using cached count of {} {} instances",
+                    cached,
+                    self.model_class.__name__,
+                )
+                return cached
 
         stmt = select(func.count()).select_from(self.model_class)
-        result = await self.session.execute(stmt)
+        result = await execute_read(self.session, stmt)
         count_value = result.scalar() or 0
+        if ttl_s is not None:
+            get_count_cache().put(self.model_class, count_value)
 
         logger.debug("Counted {} {} instances", count_value, self.model_class.__name__)
 
@@ -255,13 +462,13 @@ class BaseRepository[T: BaseModel]:
             "Checking existence of {} with ID: {}", self.model_class.__name__, entity_id
         )
 
-        stmt = (
-            select(func.count())
-            .select_from(self.model_class)
-            .where(self.model_class.id == entity_id)
+        filters = {"id": entity_id}
+        result = await execute_read(
+            self.session,
+            filtered_exists(filter_query(self.model_class, filters)),
+            filter_parameters(filters),
         )
-        result = await self.session.execute(stmt)
-        exists_value = (result.scalar() or 0) > 0
+        exists_value = bool(result.scalar())
 
         logger.debug(
             "Existence check result for {} with ID {}: {}",
@@ -272,93 +479,535 @@ class BaseRepository[T: BaseModel]:
 
         return exists_value
 
-    async def filter_by(self, **kwargs: object) -> list[T]:
-        """Filter model instances by multiple conditions.
+    async def exists_by(self, **filters: object) -> bool:
+        """Check if any model instance matches the given conditions.
+
+        Unlike counting the matches, the check stops at the first one.
 
         Args:
-            **kwargs: Field-value pairs to filter by.
+            **filters: Field names mapped to values or operators, as for
+                find.
 
         Returns:
-            list[T]: List of model instances matching all conditions.
+            bool: True if at least one instance matches, False otherwise.
+
+        Raises:
+            ValueError: If a field is not a column of the model.
         """
         logger.debug(
-            "Filtering {} instances with filters: {}",
+            "Checking existence of {} with filters: {}",
             self.model_class.__name__,
-            kwargs,
+            filters,
         )
 
-        # Build query with all filter conditions
-        stmt = select(self.model_class)
-        for field, value in kwargs.items():
-            if hasattr(self.model_class, field):
-                stmt = stmt.where(getattr(self.model_class, field) == value)
-            else:
-                logger.warning(
-                    "Attempted to filter by non-existent field '{}' on {}",
-                    field,
-                    self.model_class.__name__,
-                )
+        result = await execute_read(
+            self.session,
+            filtered_exists(filter_query(self.model_class, filters)),
+            filter_parameters(filters),
+        )
+        exists_value = bool(result.scalar())
+
+        logger.debug(
+            "Existence check result for {} with filters {}: {}",
+            self.model_class.__name__,
+            filters,
+            exists_value,
+        )
 
-        # Order by ID for consistent results
-        stmt = stmt.order_by(self.model_class.id)
+        return exists_value
 
-        result = await self.session.execute(stmt)
-        instances = list(result.scalars().all())
+    async def find(
+        self,
+        filters: Mapping[str, object] | None = None,
+        *,
+        order_by: Sequence[str] = ("id",),
+        limit: int | None = None,
+        load: str | None = None,
+    ) -> list[T]:
+        """Find model instances matching a filter specification.
 
+        Args:
+            filters: Field names mapped to a value to compare for equality,
+                or to an operator such as ``In``, ``Range`` or
+                ``ILikePrefix`` from the filters module.
+            order_by: Fields to order by, descending when prefixed with
+                ``-``.
+            limit: Maximum number of instances to return.
+            load: Name of the load profile to apply.
+
+        Returns:
+            list[T]: Matching model instances.
+
+        Raises:
+            ValueError: If a field is not a column of the model, or the load
+                profile is unknown.
+        """
+        filters = filters or {}
         logger.debug(
-            "Filtered {} - found {} instances with filters: {}",
-            self.model_class.__name__,
+            "Finding {} instances with filters: {}", self.model_class.__name__, filters
+        )
+
+        query = filter_query(
+            self.model_class,
+            filters,
+            order_by=order_by,
+            limited=limit is not None,
+            options=self._load_options(load),
+        )
+        result = await execute_read(
+            self.session,
+            filtered_select(query),
+            filter_parameters(filters, limit=limit),
+        )
+        instances: list[T] = list(self._loaded(result, query.options).scalars().all())
+
+        logger.debug(
+            "Found {} {} instances with filters: {}",
             len(instances),
-            kwargs,
+            self.model_class.__name__,
+            filters,
         )
 
         return instances
 
-    async def find_one_by(self, **kwargs: object) -> T | None:
-        """Find the first model instance matching the given conditions.
+    async def in_window(
+        self,
+        start: datetime,
+        end: datetime,
+        filters: Mapping[str, object] | None = None,
+        *,
+        field: str = "created_at",
+        descending: bool = False,
+        batch_size: int = DEFAULT_WINDOW_BATCH_SIZE,
+        load: str | None = None,
+    ) -> AsyncGenerator[T]:
+        """Stream the model instances of a time window, in time order.
+
+        Rows are read from a server-side cursor a batch at a time, so memory
+        use does not grow with the window. With a BRIN index on the field,
+        see ``BaseModel.brin_timestamps``, only the block ranges that can
+        hold rows of the window are read, and partitioned tables only scan
+        the partitions of the window. BRIN indexes have no order, so the
+        database sorts the rows of the window.
+
+        Cursors need a transaction. Sessions in autocommit mode stream in a
+        read-only transaction on a connection of their own from the
+        session's engine, so the session's connection is free as soon as the
+        stream is left. Those instances are not added to the
+        session. Unlike other reads, streams are not retried when the
+        connection is dead.
+
+        Breaking out of the loop leaves the cursor open until the generator
+        is garbage collected. Wrap the stream in ``contextlib.aclosing`` to
+        close it at once.
 
         Args:
-            **kwargs: Field-value pairs to filter by.
+            start: Start of the window, included.
+            end: End of the window, excluded.
+            filters: Further field names mapped to values or operators, as
+                for find.
+            field: The timestamp field the window is on.
+            descending: Whether the newest instances come first.
+            batch_size: Rows fetched from the cursor at a time.
+            load: Name of the load profile to apply. Joined eager loads of
+                collections cannot be streamed.
+
+        Yields:
+            T: Instances in the window, ordered by the field, then by id.
+
+        Raises:
+            ValueError: If the window field is also filtered, a field is not
+                a column of the model, or the load profile is unknown.
+
+        Example:
+            async with contextlib.aclosing(
+                repository.in_window(start, end, batch_size=500)
+            ) as invoices:
+                async for invoice in invoices:
+                    if invoice.total > limit:
+                        break
+        """
+        filters = filters or {}
+        if field in filters:
+            msg = f"Window field is also filtered: {field}"
+            raise ValueError(msg)
+        logger.debug(
+            "Streaming {} instances by {} from {} to {} with filters: {}",
+            self.model_class.__name__,
+            field,
+            start,
+            end,
+            filters,
+        )
+
+        window = {field: Range(start, end), **filters}
+        direction = "-" if descending else ""
+        query = filter_query(
+            self.model_class,
+            window,
+            order_by=(f"{direction}{field}", f"{direction}id"),
+            options=self._load_options(load),
+        )
+        statement = filtered_select(query)
+        # The session's engine or connection, without checking one out
+        bind = self.session.get_bind(self.model_class)
+        autocommit = bind.get_execution_options().get("isolation_level") == "AUTOCOMMIT"
+        async with contextlib.AsyncExitStack() as stack:
+            session = self.session
+            if autocommit:
+                stream_connection = await stack.enter_async_context(
+                    AsyncEngine(bind.engine).connect()
+                )
+                await stream_connection.execution_options(
+                    isolation_level=stream_connection.default_isolation_level,
+                    postgresql_readonly=True,
+                )
+                await stack.enter_async_context(stream_connection.begin())
+                session = await stack.enter_async_context(
+                    AsyncSession(stream_connection, expire_on_commit=False)
+                )
+            result = await session.stream_scalars(
+                statement,
+                filter_parameters(window),
+                execution_options={"yield_per": batch_size},
+            )
+            stack.push_async_callback(result.close)
+            async for instance in result:
+                yield instance
+
+    async def find_columns(
+        self,
+        columns: Sequence[str],
+        filters: Mapping[str, object] | None = None,
+        *,
+        order_by: Sequence[str] = ("id",),
+        limit: int | None = None,
+    ) -> list[Row[Any]]:
+        """Find column values of rows matching a filter specification.
+
+        Only the given columns are selected, so no model instances are
+        built and indexes covering the columns can satisfy the query.
+
+        Args:
+            columns: Fields to return, in this order.
+            filters: Field names mapped to values or operators, as for find.
+            order_by: Fields to order by, descending when prefixed with
+                ``-``.
+            limit: Maximum number of rows to return.
 
         Returns:
-            T | None: The first matching instance if found, None otherwise.
+            list[Row[Any]]: Rows whose values are accessible by field name.
+
+        Raises:
+            ValueError: If a field is not a column of the model.
         """
+        filters = filters or {}
         logger.debug(
-            "Finding one {} instance with filters: {}",
+            "Finding {} columns {} with filters: {}",
             self.model_class.__name__,
-            kwargs,
+            list(columns),
+            filters,
+        )
+
+        query = filter_query(
+            self.model_class,
+            filters,
+            columns=columns,
+            order_by=order_by,
+            limited=limit is not None,
+        )
+        result = await execute_read(
+            self.session,
+            filtered_select(query),
+            filter_parameters(filters, limit=limit),
         )
+        return list(result.all())
+
+    async def project[P](
+        self,
+        projection: type[P],
+        filters: Mapping[str, object] | None = None,
+        *,
+        order_by: Sequence[str] = ("id",),
+        limit: int | None = None,
+    ) -> list[P]:
+        """Find matching rows as instances of a projection dataclass.
+
+        Only the projection's fields are selected, and no model instance is
+        built or tracked by the session. Fields are passed by name, so
+        ``kw_only`` dataclasses work too. A dataclass with ``slots=True`` is
+        a compact read model that orjson serializes directly.
 
-        # Build query with all filter conditions
-        stmt = select(self.model_class)
-        for field, value in kwargs.items():
-            if hasattr(self.model_class, field):
-                stmt = stmt.where(getattr(self.model_class, field) == value)
+        Args:
+            projection: Dataclass whose fields are named after model
+                attributes.
+            filters: Field names mapped to values or operators, as for find.
+            order_by: Fields to order by, descending when prefixed with
+                ``-``.
+            limit: Maximum number of rows to return.
+
+        Returns:
+            list[P]: One projection instance per matching row.
+
+        Raises:
+            TypeError: If the projection is not a dataclass.
+            ValueError: If a field is not a column of the model.
+
+        Example:
+            @dataclass(slots=True, frozen=True)
+            class InvoiceSummary:
+                id: int
+                number: str
+
+            summaries = await repository.project(InvoiceSummary, limit=50)
+        """
+        rows = await self.find_columns(
+            projection_columns(projection), filters, order_by=order_by, limit=limit
+        )
+        build: Callable[..., P] = projection
+        return [build(**row._mapping) for row in rows]
+
+    async def page(
+        self,
+        filters: Mapping[str, object] | None = None,
+        *,
+        skip: int = 0,
+        limit: int = DEFAULT_PAGINATION_LIMIT,
+        order_by: Sequence[str] = ("id",),
+        count: CountMode = "exact",
+        load: str | None = None,
+    ) -> Page[T]:
+        """Retrieve one page of matching instances and the total number.
+
+        With an exact count, the total comes from ``count(*) OVER ()`` in
+        the same statement as the page, so the filter is evaluated once.
+        An estimated count skips counting altogether: the total comes from
+        table statistics or the query plan, which is much cheaper on large
+        tables. It is exact when the page shows where the results end.
+
+        Args:
+            filters: Field names mapped to values or operators, as for find.
+            skip: Number of matching instances to skip.
+            limit: Maximum number of instances on the page.
+            order_by: Fields to order by, descending when prefixed with
+                ``-``.
+            count: Whether the total is counted exactly or estimated.
+            load: Name of the load profile to apply.
+
+        Returns:
+            Page[T]: The page's instances and the total.
+
+        Raises:
+            ValueError: If a field is not a column of the model, or the load
+                profile is unknown.
+        """
+        filters = filters or {}
+        logger.debug(
+            "Fetching page of {} - skip: {}, limit: {}, count: {}, filters: {}",
+            self.model_class.__name__,
+            skip,
+            limit,
+            count,
+            filters,
+        )
+
+        query = filter_query(
+            self.model_class,
+            filters,
+            order_by=order_by,
+            limited=True,
+            offset=True,
+            counted=count == "exact",
+            options=self._load_options(load),
+        )
+        result = self._loaded(
+            await execute_read(
+                self.session,
+                filtered_select(query),
+                filter_parameters(filters, limit=limit, offset=skip),
+            ),
+            query.options,
+        )
+
+        if count == "exact":
+            rows = result.all()
+            items: list[T] = [row[0] for row in rows]
+            if rows:
+                total = int(rows[0]._mapping[TOTAL_COLUMN])
+            elif skip == 0:
+                total = 0
             else:
-                logger.warning(
-                    "Attempted to filter by non-existent field '{}' on {}",
-                    field,
-                    self.model_class.__name__,
-                )
+                # Past the last match, no row carries the total
+                total = await self._count_matches(filters)
+            page = Page(items=items, total=total, estimated=False)
+        else:
+            items = list(result.scalars().all())
+            page = await self._estimated_page(filters, items, skip=skip, limit=limit)
+
+        logger.debug(
+            "Retrieved {} {} instances of {} total (estimated: {})",
+            len(page.items),
+            self.model_class.__name__,
+            page.total,
+            page.estimated,
+        )
 
-        # Order by ID and limit to 1 for consistent results
-        stmt = stmt.order_by(self.model_class.id).limit(1)
+        return page
+
+    async def _count_matches(self, filters: Mapping[str, object]) -> int:
+        """Count the instances matching filters exactly."""
+        matches = filtered_select(filter_query(self.model_class, filters))
+        stmt = select(func.count()).select_from(matches.order_by(None).subquery())
+        result = await execute_read(self.session, stmt, filter_parameters(filters))
+        return int(result.scalar() or 0)
+
+    async def _estimated_page(
+        self, filters: Mapping[str, object], items: list[T], *, skip: int, limit: int
+    ) -> Page[T]:
+        """Complete a page with an estimated total."""
+        if (items and len(items) < limit) or (not items and skip == 0):
+            # The page ends before the limit, so this is the last one
+            return Page(items=items, total=skip + len(items), estimated=False)
+
+        table = cast("Table", self.model_class.__table__)
+        estimate = None if filters else await estimate_table_rows(self.session, table)
+        if estimate is None:
+            matches = filtered_select(filter_query(self.model_class, filters))
+            estimate = await estimate_query_rows(
+                self.session, matches.order_by(None), filter_parameters(filters)
+            )
+        # The rows seen so far are a lower bound
+        return Page(items=items, total=max(estimate, skip + len(items)), estimated=True)
+
+    async def aggregate(
+        self,
+        metrics: Mapping[str, Metric],
+        *,
+        group_by: Sequence[str] = (),
+        filters: Mapping[str, object] | None = None,
+        time_bucket: tuple[str, str] | None = None,
+    ) -> list[Row[Any]]:
+        """Aggregate matching instances in the database, per group.
 
-        result = await self.session.execute(stmt)
-        instance = result.scalar_one_or_none()
+        Args:
+            metrics: Result column names mapped to metrics such as ``Sum``
+                or ``Count`` from the aggregates module.
+            group_by: Fields to group by.
+            filters: Field names mapped to values or operators, as for find.
+            time_bucket: Timestamp field and bucket interval, such as
+                ``("created_at", "1 day")``, to group by. The start of each
+                bucket is returned as the ``bucket`` column.
+
+        Returns:
+            list[Row[Any]]: One row per group with the grouping values and
+                metrics by name, ordered by bucket and grouping fields.
+
+        Raises:
+            ValueError: If a field is not a column of the model, result
+                column names collide or the bucket interval is unsupported.
+
+        Example:
+            totals = await repository.aggregate(
+                {"total": Sum("amount"), "invoices": Count()},
+                group_by=["category"],
+                time_bucket=("issued_at", "1 month"),
+            )
+        """
+        filters = filters or {}
+        logger.debug(
+            "Aggregating {} - metrics: {}, group by: {}, bucket: {}, filters: {}",
+            self.model_class.__name__,
+            list(metrics),
+            list(group_by),
+            time_bucket,
+            filters,
+        )
+
+        query = aggregate_query(
+            self.model_class,
+            metrics,
+            filters=filters,
+            group_by=group_by,
+            time_bucket=time_bucket,
+        )
+        result = await execute_read(
+            self.session, aggregate_select(query), filter_parameters(filters)
+        )
+        rows = list(result.all())
+
+        logger.debug(
+            "Aggregated {} into {} groups", self.model_class.__name__, len(rows)
+        )
+
+        return rows
+
+    async def filter_by(self, *, load: str | None = None, **filters: object) -> list[T]:
+        """Filter model instances by multiple conditions.
+
+        Args:
+            load: Name of the load profile to apply. Use find to filter on
+                a column named ``load``.
+            **filters: Field names mapped to values or operators, as for
+                find.
+
+        Returns:
+            list[T]: List of model instances matching all conditions,
+                ordered by ID.
+
+        Raises:
+            ValueError: If a field is not a column of the model, or the load
+                profile is unknown.
+        """
+        return await self.find(filters, load=load)
+
+    async def find_one_by(
+        self, *, load: str | None = None, **filters: object
+    ) -> T | None:
+        """Find the first model instance matching the given conditions.
+
+        Args:
+            load: Name of the load profile to apply.
+            **filters: Field names mapped to values or operators, as for
+                find.
+
+        Returns:
+            T | None: The matching instance with the lowest ID, None if
+                there is none.
+
+        Raises:
+            ValueError: If a field is not a column of the model, or the load
+                profile is unknown.
+        """
+        logger.debug(
+            "Finding one {} instance with filters: {}",
+            self.model_class.__name__,
+            filters,
+        )
+
+        # Ordered by ID and limited to 1 for consistent results
+        query = filter_query(
+            self.model_class,
+            filters,
+            limited=True,
+            options=self._load_options(load),
+        )
+        result = await execute_read(
+            self.session, filtered_select(query), filter_parameters(filters, limit=1)
+        )
+        instance = self._loaded(result, query.options).scalar_one_or_none()
 
         if instance:
             logger.debug(
                 "Found {} instance ID {} with filters: {}",
                 self.model_class.__name__,
                 instance.id,
-                kwargs,
+                filters,
             )
         else:
             logger.debug(
                 "{} instance not found with filters: {}",
                 self.model_class.__name__,
-                kwargs,
+                filters,
             )
 
         return instance
@@ -0,0 +1,528 @@
+"""Summary tables of models, maintained incrementally on write.
+
+Aggregating years of rows for every summary request scans them all, even
+in the database. A rollup keeps the row count and sums of a model per time
+bucket and grouping fields in a small table. Summaries then read one row
+per bucket instead of every source row.
+
+Key components:
+- **Rollup**: Declares the summary table of a model: its time bucket unit,
+  grouping fields and summed fields. The table is part of the model's
+  metadata
+- **create_rollup** / **drop_rollup**: Alembic migration helpers creating
+  the table and its triggers, and backfilling it from existing rows
+- **rollup_rows**: Reads the summary rows of a time window
+- **reconcile_rollup** / **reconcile_rollups**: Compare summaries with the
+  source rows, and optionally rebuild them, for a periodic verification job
+
+Rollups are maintained by statement-level triggers with transition tables,
+in the transaction that writes the source rows. So every write path is
+covered, including ORM flushes, core DELETE statements, COPY and the
+staging-table upserts of bulk ingest, and a bulk write costs one upsert per
+touched bucket. Only counts and sums can be maintained this way, as
+minimums and maximums cannot be updated when rows are deleted. TRUNCATE
+does not fire the triggers and needs a reconciliation with repair.
+
+Concurrent writes to the same bucket wait for each other on its summary
+row until the first commits, which is the price of summaries that are
+always current. Each statement upserts its summary rows in bucket and group
+order, so statements touching several of the same buckets lock them in the
+same order instead of deadlocking. Transactions of several statements can
+still deadlock on summary rows, as on any rows they both write.
+"""
+
+import re
+from collections.abc import Iterable, Sequence
+from typing import Any, Final, NamedTuple, cast
+
+from alembic.operations import Operations
+from loguru import logger
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    DateTime,
+    Float,
+    Identity,
+    Numeric,
+    Row,
+    Table,
+    UniqueConstraint,
+    select,
+    text,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.schema import CreateTable, DropTable
+from sqlalchemy.types import TypeEngine
+
+from src.infrastructure.database.aggregates import BUCKET_COLUMN, CALENDAR_UNITS
+from src.infrastructure.database.base import BaseModel
+from src.infrastructure.database.filters import model_column
+from src.infrastructure.database.liveness import execute_read
+
+ROW_COUNT_COLUMN: Final[str] = "row_count"
+# Leaves room for the suffixes of trigger names within 63 characters
+ROLLUP_NAME_PATTERN: Final[re.Pattern[str]] = re.compile(r"[a-z_][a-z0-9_]{0,53}")
+RESERVED_COLUMNS: Final[frozenset[str]] = frozenset(
+    {"id", BUCKET_COLUMN, ROW_COUNT_COLUMN}
+)
+# Transition tables and the sign of their rows' contribution, per operation
+TRANSITIONS: Final[dict[str, tuple[tuple[str, int], ...]]] = {
+    "INSERT": (("new_rows", 1),),
+    "UPDATE": (("old_rows", -1), ("new_rows", 1)),
+    "DELETE": (("old_rows", -1),),
+}
+TRIGGER_REFERENCING: Final[dict[str, str]] = {
+    "INSERT": "NEW TABLE AS new_rows",
+    "UPDATE": "OLD TABLE AS old_rows NEW TABLE AS new_rows",
+    "DELETE": "OLD TABLE AS old_rows",
+}
+
+_rollups: dict[str, "Rollup"] = {}
+
+
+class Rollup:
+    """Summary table of a model with a row count and sums per group.
+
+    Declared next to the model, at import time. The summary table has a
+    ``bucket`` column with the start of the time bucket, one column per
+    grouping and summed field named after the field, and ``row_count``.
+
+    Args:
+        name: Name of the summary table.
+        model_class: The summarized model.
+        time_field: Timestamp field the time buckets are taken from.
+        interval: Time bucket unit, such as ``"day"`` or ``"month"``.
+            Buckets of timezone-aware timestamps start at UTC midnight.
+        group_by: Fields rows are grouped by within a bucket.
+        sums: Numeric fields whose values are summed.
+
+    Raises:
+        ValueError: If the name is invalid or taken, a field is not a
+            column of the model or a summary column name is reserved.
+        TypeError: If the time field is not a timestamp.
+
+    Example:
+        INVOICE_DAILY_TOTALS = Rollup(
+            "invoice_daily_totals",
+            Invoice,
+            time_field="issued_at",
+            group_by=["category"],
+            sums=["amount"],
+        )
+    """
+
+    __slots__ = (
+        "group_by",
+        "interval",
+        "model_class",
+        "name",
+        "sums",
+        "table",
+        "time_field",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        model_class: type[BaseModel],
+        *,
+        time_field: str,
+        interval: str = "day",
+        group_by: Sequence[str] = (),
+        sums: Sequence[str] = (),
+    ) -> None:
+        if ROLLUP_NAME_PATTERN.fullmatch(name) is None:
+            msg = f"Invalid rollup name: {name}"
+            raise ValueError(msg)
+        if name in _rollups:
+            msg = f"Rollup already declared: {name}"
+            raise ValueError(msg)
+        if interval not in CALENDAR_UNITS:
+            msg = f"Invalid rollup interval: {interval}"
+            raise ValueError(msg)
+        fields = [*group_by, *sums]
+        reserved = RESERVED_COLUMNS.intersection(fields)
+        if reserved or len(set(fields)) < len(fields):
+            msg = f"Rollup columns must be unique and not reserved: {fields}"
+            raise ValueError(msg)
+
+        self.name = name
+        self.model_class = model_class
+        self.time_field = time_field
+        self.interval = interval
+        self.group_by = tuple(group_by)
+        self.sums = tuple(sums)
+        self.table = self._build_table()
+        _rollups[name] = self
+
+    def _build_table(self) -> Table:
+        """Summary table in the model's metadata."""
+        time_type = model_column(self.model_class, self.time_field).type
+        if not isinstance(time_type, DateTime):
+            msg = f"Rollup time field must be a timestamp: {self.time_field}"
+            raise TypeError(msg)
+        group_columns = [
+            Column(field, model_column(self.model_class, field).type)
+            for field in self.group_by
+        ]
+        sum_columns = [
+            Column(
+                field,
+                _sum_type(model_column(self.model_class, field).type),
+                nullable=False,
+                server_default=text("0"),
+            )
+            for field in self.sums
+        ]
+        return Table(
+            self.name,
+            self.model_class.metadata,
+            Column("id", BigInteger, Identity(), primary_key=True),
+            Column(BUCKET_COLUMN, time_type, nullable=False),
+            *group_columns,
+            Column(
+                ROW_COUNT_COLUMN, BigInteger, nullable=False, server_default=text("0")
+            ),
+            *sum_columns,
+            # NULL groups are one group, so upserts find their summary row
+            UniqueConstraint(
+                BUCKET_COLUMN, *self.group_by, postgresql_nulls_not_distinct=True
+            ),
+        )
+
+    @property
+    def source_table(self) -> Table:
+        """Table of the summarized model."""
+        return cast("Table", self.model_class.__table__)
+
+    def __repr__(self) -> str:
+        """Return the rollup's name and model."""
+        return f"<Rollup({self.name!r}, {self.model_class.__name__})>"
+
+
+def _quote(name: str) -> str:
+    """Quote an identifier, preserving its case."""
+    return '"{}"'.format(name.replace('"', '""'))
+
+
+def _table_name(table: Table) -> str:
+    """Quoted, schema-qualified name of a table."""
+    return ".".join(_quote(part) for part in (table.schema, table.name) if part)
+
+
+def _sum_type(source_type: TypeEngine[Any]) -> TypeEngine[Any]:
+    """Column type of a sum, which may exceed the range of the summed type."""
+    return source_type if isinstance(source_type, Float) else Numeric()
+
+
+def _source_column(rollup: Rollup, field: str) -> str:
+    """Quoted source column name of a model field."""
+    return _quote(model_column(rollup.model_class, field).expression.name)
+
+
+def _bucket_sql(rollup: Rollup) -> str:
+    """Bucket expression over source rows, independent of the session time zone."""
+    time_column = _source_column(rollup, rollup.time_field)
+    time_type = model_column(rollup.model_class, rollup.time_field).type
+    if cast("DateTime", time_type).timezone:
+        return f"date_trunc('{rollup.interval}', {time_column}, 'UTC')"
+    return f"date_trunc('{rollup.interval}', {time_column})"
+
+
+def _summary_columns(rollup: Rollup) -> list[str]:
+    """Quoted summary table columns, in insert order."""
+    return [
+        _quote(name)
+        for name in (BUCKET_COLUMN, *rollup.group_by, ROW_COUNT_COLUMN, *rollup.sums)
+    ]
+
+
+def _summary_select(rollup: Rollup, source: str) -> str:
+    """SELECT of summary rows computed from all rows of a source."""
+    groups = [_source_column(rollup, field) for field in rollup.group_by]
+    sums = [
+        f"coalesce(sum({_source_column(rollup, field)}), 0)" for field in rollup.sums
+    ]
+    positions = ", ".join(str(index) for index in range(1, len(groups) + 2))
+    selected = ", ".join([_bucket_sql(rollup), *groups, "count(*)", *sums])
+    return f"SELECT {selected} FROM {source} GROUP BY {positions}"  # noqa: S608 - quoted identifiers
+
+
+def _delta_select(rollup: Rollup, transition: str, sign: int) -> str:
+    """SELECT of the signed contribution of each row of a transition table."""
+    selected = [f"{_bucket_sql(rollup)} AS {_quote(BUCKET_COLUMN)}"]
+    selected.extend(
+        f"{_source_column(rollup, field)} AS {_quote(field)}"
+        for field in rollup.group_by
+    )
+    selected.append(f"{sign} AS {_quote(ROW_COUNT_COLUMN)}")
+    selected.extend(
+        f"{sign} * coalesce({_source_column(rollup, field)}, 0) AS {_quote(field)}"
+        for field in rollup.sums
+    )
+    return f"SELECT {', '.join(selected)} FROM {transition}"  # noqa: S608 - quoted identifiers
+
+
+def _delta_upsert(rollup: Rollup, operation: str) -> str:
+    """Upsert adding the changes of one statement's transition tables."""
+    summary = _table_name(rollup.table)
+    keys = [_quote(name) for name in (BUCKET_COLUMN, *rollup.group_by)]
+    values = [_quote(name) for name in (ROW_COUNT_COLUMN, *rollup.sums)]
+    deltas = " UNION ALL ".join(
+        _delta_select(rollup, transition, sign)
+        for transition, sign in TRANSITIONS[operation]
+    )
+    totals = ", ".join(f"sum({value})" for value in values)
+    # Updates leaving a group's values unchanged don't touch its summary row
+    changed = " OR ".join(f"sum({value}) <> 0" for value in values)
+    updates = ", ".join(f"{value} = r.{value} + excluded.{value}" for value in values)
+    return (
+        f"INSERT INTO {summary} AS r ({', '.join(_summary_columns(rollup))}) "  # noqa: S608 - quoted identifiers
+        f"SELECT {', '.join(keys)}, {totals} FROM ({deltas}) AS delta "
+        f"GROUP BY {', '.join(keys)} HAVING {changed} "
+        # Summary rows are locked in key order, the same in every statement
+        f"ORDER BY {', '.join(keys)} "
+        f"ON CONFLICT ({', '.join(keys)}) DO UPDATE SET {updates}"
+    )
+
+
+def _function_name(rollup: Rollup) -> str:
+    """Quoted name of the rollup's trigger function."""
+    schema = rollup.table.schema
+    function = _quote(f"{rollup.name}_maintain")
+    return function if schema is None else f"{_quote(schema)}.{function}"
+
+
+def rollup_trigger_ddl(rollup: Rollup) -> list[str]:
+    """DDL of the function and triggers maintaining a rollup.
+
+    The statements replace existing definitions, so they can be run again
+    after changing the trigger logic.
+
+    Args:
+        rollup: The rollup.
+
+    Returns:
+        list[str]: The function, then one trigger per operation.
+    """
+    source = _table_name(rollup.source_table)
+    function = _function_name(rollup)
+    branches = "".join(
+        f"    {'IF' if index == 0 else 'ELSIF'} TG_OP = '{operation}' THEN\n"
+        f"        {_delta_upsert(rollup, operation)};\n"
+        for index, operation in enumerate(TRANSITIONS)
+    )
+    statements = [
+        (
+            f"CREATE OR REPLACE FUNCTION {function}() RETURNS trigger "
+            f"LANGUAGE plpgsql AS $$\nBEGIN\n{branches}    END IF;\n"
+            "    RETURN NULL;\nEND;\n$$"
+        )
+    ]
+    # Transition tables require one trigger per operation
+    statements.extend(
+        f"CREATE OR REPLACE TRIGGER "
+        f"{_quote(f'{rollup.name}_{operation.lower()}')} "
+        f"AFTER {operation} ON {source} REFERENCING {referencing} "
+        f"FOR EACH STATEMENT EXECUTE FUNCTION {function}()"
+        for operation, referencing in TRIGGER_REFERENCING.items()
+    )
+    return statements
+
+
+def rollup_backfill_sql(rollup: Rollup) -> str:
+    """INSERT computing all summary rows from the existing source rows.
+
+    Args:
+        rollup: The rollup, with an empty summary table.
+
+    Returns:
+        str: The statement.
+    """
+    return (
+        f"INSERT INTO {_table_name(rollup.table)} "
+        f"({', '.join(_summary_columns(rollup))}) "
+        f"{_summary_select(rollup, _table_name(rollup.source_table))}"
+    )
+
+
+def create_rollup(
+    operations: Operations, rollup: Rollup, *, backfill: bool = True
+) -> None:
+    """Create a rollup's table and triggers in a migration.
+
+    The triggers are created first. Creating them locks out writes to the
+    source table until the migration commits, so the backfill sees every
+    row that the triggers will not.
+
+    Args:
+        operations: Alembic operations, ``op`` in migration scripts.
+        rollup: The rollup.
+        backfill: Whether to compute summaries of existing rows.
+
+    Example:
+        def upgrade() -> None:
+            create_rollup(op, INVOICE_DAILY_TOTALS)
+
+        def downgrade() -> None:
+            drop_rollup(op, INVOICE_DAILY_TOTALS)
+    """
+    operations.execute(CreateTable(rollup.table))
+    for statement in rollup_trigger_ddl(rollup):
+        operations.execute(statement)
+    if backfill:
+        operations.execute(rollup_backfill_sql(rollup))
+
+
+def drop_rollup(operations: Operations, rollup: Rollup) -> None:
+    """Drop a rollup's triggers and table in a migration.
+
+    Args:
+        operations: Alembic operations, ``op`` in migration scripts.
+        rollup: The rollup.
+    """
+    source = _table_name(rollup.source_table)
+    for operation in TRIGGER_REFERENCING:
+        trigger = _quote(f"{rollup.name}_{operation.lower()}")
+        operations.execute(f"DROP TRIGGER IF EXISTS {trigger} ON {source}")
+    operations.execute(f"DROP FUNCTION IF EXISTS {_function_name(rollup)}()")
+    operations.execute(DropTable(rollup.table))
+
+
+async def rollup_rows(
+    session: AsyncSession,
+    rollup: Rollup,
+    *,
+    start: object | None = None,
+    end: object | None = None,
+) -> list[Row[Any]]:
+    """Read the summary rows of a time window.
+
+    Args:
+        session: The session to read on.
+        rollup: The rollup.
+        start: Earliest bucket start to include.
+        end: Bucket start to stop before.
+
+    Returns:
+        list[Row[Any]]: Summary rows by bucket and grouping values, with
+            ``row_count`` and the sums by field name. Groups whose rows were
+            all deleted are left out.
+    """
+    columns = rollup.table.c
+    stmt = (
+        select(
+            columns[BUCKET_COLUMN],
+            *(columns[field] for field in rollup.group_by),
+            columns[ROW_COUNT_COLUMN],
+            *(columns[field] for field in rollup.sums),
+        )
+        .where(columns[ROW_COUNT_COLUMN] != 0)
+        .order_by(
+            columns[BUCKET_COLUMN], *(columns[field] for field in rollup.group_by)
+        )
+    )
+    if start is not None:
+        stmt = stmt.where(columns[BUCKET_COLUMN] >= start)
+    if end is not None:
+        stmt = stmt.where(columns[BUCKET_COLUMN] < end)
+    result = await execute_read(session, stmt)
+    return list(result.all())
+
+
+class RollupCheck(NamedTuple):
+    """Outcome of reconciling a rollup with its source rows.
+
+    Attributes:
+        name: Name of the rollup.
+        mismatches: Summary rows that are missing, extra or different from
+            the source rows. A different row counts twice.
+        repaired: Whether the summaries were rebuilt.
+    """
+
+    name: str
+    mismatches: int
+    repaired: bool
+
+
+async def reconcile_rollup(
+    session: AsyncSession, rollup: Rollup, *, repair: bool = False
+) -> RollupCheck:
+    """Compare a rollup's summaries with summaries of its source rows.
+
+    Both sides are read by one statement, so they come from one snapshot
+    and writes in progress do not show up as mismatches. Runs in the
+    session's transaction; the caller commits a repair.
+
+    Args:
+        session: The session to check on.
+        rollup: The rollup.
+        repair: Whether to rebuild the summaries if they don't match. The
+            source table is locked against writes while rebuilding.
+
+    Returns:
+        RollupCheck: The number of mismatched rows and whether they were
+            repaired.
+    """
+    summary = _table_name(rollup.table)
+    columns = ", ".join(_summary_columns(rollup))
+    expected = _summary_select(rollup, _table_name(rollup.source_table))
+    actual = (
+        f"SELECT {columns} FROM {summary} "  # noqa: S608 - quoted identifiers
+        f"WHERE {_quote(ROW_COUNT_COLUMN)} <> 0"
+    )
+    # EXCEPT treats NULL groups as equal, unlike a join on the group keys
+    result = await session.execute(
+        text(
+            f"SELECT count(*) FROM (({expected} EXCEPT ALL {actual}) "  # noqa: S608 - quoted identifiers
+            f"UNION ALL ({actual} EXCEPT ALL {expected})) AS mismatched"
+        )
+    )
+    mismatches = int(result.scalar_one())
+    if mismatches == 0:
+        logger.debug("Rollup {} matches its source rows", rollup.name)
+        return RollupCheck(name=rollup.name, mismatches=0, repaired=False)
+
+    logger.warning(
+        "Rollup {} has {} mismatched summary rows - repair: {}",
+        rollup.name,
+        mismatches,
+        repair,
+    )
+    if repair:
+        source = _table_name(rollup.source_table)
+        await session.execute(text(f"LOCK TABLE {source} IN SHARE MODE"))
+        await session.execute(text(f"DELETE FROM {summary}"))  # noqa: S608 - quoted identifier
+        await session.execute(text(rollup_backfill_sql(rollup)))
+    return RollupCheck(name=rollup.name, mismatches=mismatches, repaired=repair)
+
+
+def registered_rollups() -> list[Rollup]:
+    """Rollups declared so far, in declaration order.
+
+    Returns:
+        list[Rollup]: The rollups.
+    """
+    return list(_rollups.values())
+
+
+async def reconcile_rollups(
+    session: AsyncSession,
+    rollups: Iterable[Rollup] | None = None,
+    *,
+    repair: bool = False,
+) -> list[RollupCheck]:
+    """Reconcile rollups one after another, for a periodic job.
+
+    Args:
+        session: The session to check on.
+        rollups: The rollups to check. Defaults to all declared rollups.
+        repair: Whether to rebuild summaries that don't match.
+
+    Returns:
+        list[RollupCheck]: One outcome per rollup.
+    """
+    return [
+        await reconcile_rollup(session, rollup, repair=repair)
+        for rollup in (registered_rollups() if rollups is None else rollups)
+    ]
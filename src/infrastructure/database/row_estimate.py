@@ -0,0 +1,214 @@
+"""Row count estimates from planner statistics.
+
+An exact ``count(*)`` reads every matching row. For large tables a total
+that is close enough is available without scanning anything, from the
+statistics the planner uses, or from an exact count taken a moment ago.
+
+Key components:
+- **estimate_table_rows**: Rows of a whole table, from ``pg_class``. Like
+  the planner, ``reltuples`` is scaled by the table's current size, so the
+  estimate follows growth since the last VACUUM or ANALYZE. Partitioned
+  tables add up the estimates of their partitions
+- **estimate_query_rows**: Rows a SELECT returns according to the root
+  node of its plan, from ``EXPLAIN (FORMAT JSON)``
+- **CountCache**: Exact counts per model, reused while younger than a time
+  to live, so frequently polled totals do not scan the table on every call.
+  Counts of models whose rows a transaction added or deleted are forgotten
+  when it commits or rolls back, not when it flushes, so that uncommitted
+  rows are never cached nor counted by other sessions
+
+Estimates are only as good as the table statistics, and can be far off for
+filters on correlated columns.
+"""
+
+import json
+import threading
+import time
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any, Final
+
+from sqlalchemy import Select, Table, event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+from src.infrastructure.database.bulk_copy import compile_driver_query
+from src.infrastructure.database.liveness import execute_read
+
+# Session info key of the models whose rows the current transaction changed
+COUNT_CHANGES_INFO: Final[str] = "count_cache_changes"
+
+# reltuples extrapolated to the current number of pages, as the planner does,
+# and added up over the partitions of partitioned tables. Partitions that
+# have no statistics yet count as empty; a table without any has no estimate
+TABLE_ROWS_QUERY = text(
+    """
+    SELECT CASE WHEN bool_or(c.reltuples >= 0) THEN sum(
+        CASE
+            WHEN c.reltuples < 0 THEN 0
+            WHEN c.relpages > 0 THEN
+                c.reltuples / c.relpages
+                * (pg_relation_size(c.oid) / current_setting('block_size')::int)
+            ELSE c.reltuples
+        END
+    ) END
+    FROM pg_partition_tree(to_regclass(:table_name)) AS t
+    JOIN pg_class AS c ON c.oid = t.relid
+    WHERE t.isleaf
+    """
+)
+
+
+async def estimate_table_rows(session: AsyncSession, table: Table) -> int | None:
+    """Estimate the number of rows in a table.
+
+    Args:
+        session: The session to query on.
+        table: The table.
+
+    Returns:
+        int | None: The estimate, or None if the table has never been
+            vacuumed or analyzed and has no statistics. Partitioned tables
+            have none until one of their partitions has.
+    """
+    # Quoted, as to_regclass folds unquoted names to lower case
+    table_name = ".".join(
+        '"{}"'.format(part.replace('"', '""'))
+        for part in (table.schema, table.name)
+        if part is not None
+    )
+    result = await execute_read(session, TABLE_ROWS_QUERY, {"table_name": table_name})
+    estimate = result.scalar()
+    # NULL without statistics, as reltuples is -1 before the first VACUUM or
+    # ANALYZE
+    if estimate is None or estimate < 0:
+        return None
+    return round(float(estimate))
+
+
+async def estimate_query_rows(
+    session: AsyncSession,
+    statement: Select[Any],
+    parameters: Mapping[str, Any] | None = None,
+) -> int:
+    """Estimate the number of rows a query returns from its plan.
+
+    Args:
+        session: The session to plan on.
+        statement: The SELECT, without LIMIT or OFFSET.
+        parameters: Values of the statement's bound parameters.
+
+    Returns:
+        int: The planner's row estimate.
+    """
+    connection = await session.connection()
+    query, arguments = compile_driver_query(statement, connection.dialect, parameters)
+    result = await connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {query}", tuple(arguments)
+    )
+    raw = result.scalar_one()
+    output = json.loads(raw) if isinstance(raw, str) else raw
+    return int(output[0]["Plan"]["Plan Rows"])
+
+
+class CountCache:
+    """Exact row counts per model with the time they were taken.
+
+    Shared by the repositories of all sessions and event loops, so access
+    is synchronized.
+    """
+
+    def __init__(self) -> None:
+        self._counts: dict[type, tuple[int, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, model_class: type, max_age_s: float) -> int | None:
+        """Return the cached count of a model if it is recent enough.
+
+        Args:
+            model_class: The counted model.
+            max_age_s: Maximum age of the count in seconds.
+
+        Returns:
+            int | None: The count, or None if there is no recent count.
+        """
+        with self._lock:
+            entry = self._counts.get(model_class)
+        if entry is None:
+            return None
+        count, counted_at = entry
+        if time.monotonic() - counted_at >= max_age_s:
+            return None
+        return count
+
+    def put(self, model_class: type, count: int) -> None:
+        """Store the count of a model, taken now.
+
+        Args:
+            model_class: The counted model.
+            count: The exact number of rows.
+        """
+        with self._lock:
+            self._counts[model_class] = (count, time.monotonic())
+
+    def invalidate(self, model_class: type) -> None:
+        """Forget the count of a model, after adding or deleting rows.
+
+        Args:
+            model_class: The model whose rows changed.
+        """
+        with self._lock:
+            self._counts.pop(model_class, None)
+
+
+@lru_cache(maxsize=1)
+def get_count_cache() -> CountCache:
+    """Get the process-wide count cache.
+
+    Returns:
+        CountCache: The count cache.
+    """
+    return CountCache()
+
+
+def record_count_change(session: AsyncSession, model_class: type) -> None:
+    """Note that the transaction of a session added or deleted model rows.
+
+    The cached count of the model is forgotten when the transaction ends.
+
+    Args:
+        session: The session whose transaction changed the rows.
+        model_class: The model whose rows changed.
+    """
+    session.info.setdefault(COUNT_CHANGES_INFO, set()).add(model_class)
+
+
+def has_count_change(session: AsyncSession, model_class: type) -> bool:
+    """Check whether the transaction of a session changed model rows.
+
+    Such a transaction counts its own uncommitted rows, so its counts must
+    neither come from nor go into the cache.
+
+    Args:
+        session: The session to check.
+        model_class: The counted model.
+
+    Returns:
+        bool: True if rows were added or deleted since the last commit or
+            rollback.
+    """
+    return model_class in session.info.get(COUNT_CHANGES_INFO, ())
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _forget_changed_counts(session: Session, transaction: SessionTransaction) -> None:
+    """Invalidate the counts of models changed by a finished transaction.
+
+    Commits, rollbacks and closing the session end a transaction; the end of
+    one of its savepoints does not.
+    """
+    if transaction.parent is not None:
+        return
+    cache = get_count_cache()
+    for model_class in session.info.pop(COUNT_CHANGES_INFO, ()):
+        cache.invalidate(model_class)
@@ -6,16 +6,37 @@ session lifecycle handling, and observability features.
 
 Core functionality:
 - **Connection pooling**: Configurable pool with overflow and recycling
+- **Engine profiles**: Separate named engines and pools (e.g. analytics) so
+  slow workloads cannot starve latency-sensitive ones
 - **Session factory**: Async session creation with proper cleanup
+- **Read-only sessions**: Sessions without a commit round trip, running in
+  READ ONLY transactions or in autocommit
 - **Health checks**: Database connectivity validation for monitoring
 - **Query monitoring**: Performance tracking and slow query detection
-- **Event listeners**: Custom hooks for query execution metrics
+- **Event listeners**: Custom hooks for query execution metrics, with a
+  query duration histogram feeding all other consumers
+- **Resource accounting**: Statement count, database time and pool checkout
+  wait are charged to the current request
+- **N+1 detection**: Repeated statement fingerprints within a request are
+  reported (or raised in strict mode)
+- **Query statistics**: Per-fingerprint totals and latency percentiles
+- **Plan capture**: Optional background EXPLAIN of slow SELECT statements
+- **SQL comments**: Stable route/controller tags that keep statements
+  cacheable as prepared statements
+- **Statement cache metrics**: Prepared statement cache hit rate
 
 Advanced features:
-- **Pool pre-ping**: Validates connections before use
+- **Idle-aware pre-ping**: Validates connections that sat idle in the pool
+  before use, and retries reads once when a connection dies at use time
+- **Transaction pooler mode**: Small or no client-side pool, unique
+  prepared statement names and per-transaction server settings for
+  PgBouncer in transaction mode
 - **Connection recycling**: Prevents stale connections (1-hour default)
 - **Command timeout**: Prevents hanging queries (60-second default)
-- **Weak references**: Memory-efficient query timing storage
+- **Deadline timeouts**: Transactions started within a request get a
+  statement timeout bounded by the request's remaining deadline
+- **Low-overhead timing**: Monotonic timestamps stored on the execution
+  context and settings snapshotted at engine creation
 - **Sanitized logging**: Secure parameter logging for debugging
 
 The module uses a singleton pattern through _DatabaseManager to ensure
@@ -27,10 +48,11 @@ import threading
 import time
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
-from typing import Any
-from weakref import WeakKeyDictionary
+from functools import lru_cache
+from typing import Any, Final, Literal
 
 from loguru import logger
+from opentelemetry.metrics import Histogram
 from sqlalchemy import event, text
 from sqlalchemy.engine import Connection
 from sqlalchemy.engine.interfaces import DBAPICursor, ExecutionContext
@@ -41,87 +63,340 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, NullPool, Pool
 
-from src.core.config import get_settings
+from src.core.config import (
+    DatabaseConfig,
+    EngineProfileConfig,
+    Settings,
+    get_settings,
+)
 from src.core.context import RequestContext
 from src.core.error_context import sanitize_sql_params
+from src.core.observability import get_meter
+from src.core.resource_usage import NANOSECONDS_PER_MILLISECOND, get_request_usage
+from src.infrastructure.database.explain import get_plan_capture
+from src.infrastructure.database.fingerprint import fingerprint_statement
+from src.infrastructure.database.liveness import IdleConnectionPing
+from src.infrastructure.database.n_plus_one import detect_n_plus_one
+from src.infrastructure.database.pooler import (
+    TransactionSettings,
+    pooler_connect_args,
+    split_server_settings,
+)
+from src.infrastructure.database.query_stats import get_query_stats
+from src.infrastructure.database.sql_comment import add_stable_sql_comment
+from src.infrastructure.database.statement_cache import (
+    install_statement_cache_metrics,
+)
+
+type ReadOnlySessionMode = Literal["autocommit", "transaction"]
 
 POOL_RECYCLE_SECONDS = 3600  # 1 hour
 COMMAND_TIMEOUT_SECONDS = 60
+DEFAULT_ENGINE_PROFILE: Final[str] = "default"
+MILLISECONDS_PER_SECOND: Final[int] = 1000
 
-# Store query start times for execution contexts
-_query_start_times: WeakKeyDictionary[ExecutionContext, float] = WeakKeyDictionary()
+QUERY_DURATION_METRIC_NAME: Final[str] = "db.client.query.duration"
+QUERY_START_ATTRIBUTE: Final[str] = "_tributum_query_start_ns"
+OPERATION_NAME_CACHE_SIZE: Final[int] = 1024
+MAX_OPERATION_NAME_LENGTH: Final[int] = 32
 
+# set_config(..., true) is the function form of SET LOCAL
+DEADLINE_TIMEOUT_STATEMENT: Final = text(
+    "SELECT set_config('statement_timeout', :timeout, true)"
+)
+# Deadlines within this margin of the default request deadline are left to
+# handler cancellation
+DEADLINE_TIMEOUT_SLACK_MS: Final[int] = 1000
+# Execution option marking statements issued by the data layer itself, which
+# are not charged to the request or counted in query statistics
+INTERNAL_STATEMENT_OPTION: Final[str] = "tributum_internal"
+
+# Connection characteristics of read-only sessions. Both are applied by the
+# asyncpg adapter without a round trip: autocommit skips BEGIN/COMMIT, and
+# postgresql_readonly turns the transaction's BEGIN into BEGIN READ ONLY.
+READ_ONLY_EXECUTION_OPTIONS: Final[dict[ReadOnlySessionMode, dict[str, Any]]] = {
+    "autocommit": {"isolation_level": "AUTOCOMMIT"},
+    "transaction": {"postgresql_readonly": True},
+}
+
+
+def _read_only_session_mode(db_config: DatabaseConfig) -> ReadOnlySessionMode:
+    """Read-only session mode usable with the configured pooler.
+
+    Outside of a transaction, asyncpg prepares and executes a statement in
+    separate exchanges, each ending a server transaction. A transaction
+    pooler may run them on different server connections, so read-only
+    sessions always use transactions behind one.
 
-def _before_cursor_execute(
-    _conn: Connection,
-    _cursor: DBAPICursor,
-    _statement: str,
-    _parameters: dict[str, Any] | list[Any] | tuple[Any, ...] | None,
-    context: ExecutionContext,
-    _executemany: bool,
-) -> None:
-    """Track query start time for performance monitoring.
+    Args:
+        db_config: Database configuration.
+
+    Returns:
+        ReadOnlySessionMode: The configured mode, or ``"transaction"``
+            behind a transaction pooler.
+    """
+    if db_config.pooler_mode == "transaction":
+        return "transaction"
+    return db_config.read_only_session_mode
+
+
+class _PoolWaitAccounting(Pool):
+    """Pool mixin that charges connection checkout wait to the current request.
+
+    The measured time covers waiting for a free connection and, when the pool
+    has spare capacity, opening a new one. Both are latency the request paid
+    before it could run its first statement.
+    """
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        usage = get_request_usage()
+        if usage is None:
+            return super()._do_get()
+
+        start_ns = time.perf_counter_ns()
+        try:
+            return super()._do_get()
+        finally:
+            usage.add_pool_wait(time.perf_counter_ns() - start_ns)
+
+
+class _UsageAccountingPool(_PoolWaitAccounting, AsyncAdaptedQueuePool):
+    """Queue pool that charges connection checkout wait to the current request."""
+
+
+class _UsageAccountingNullPool(_PoolWaitAccounting, NullPool):
+    """Pool opening a connection per checkout, charged to the current request."""
+
+
+class _DeadlineStatementTimeout:
+    """Bound the statement timeout of each transaction by the request deadline.
+
+    Registered as an engine ``begin`` listener. Every request is already
+    bounded by its default deadline, at which the handler is cancelled along
+    with its statement in flight, and every statement by the engine's own
+    timeout. The extra statement is only issued when the remaining deadline
+    is tighter than both, as for deadlines shortened by the client or the
+    route, so requests running within the defaults pay no round trip.
+
+    The timeout is passed as a parameter of one constant statement, so it is
+    prepared once per connection like any other statement. Autocommit
+    connections are skipped, as transaction-local settings only apply within
+    a transaction.
 
     Args:
-        _conn: Database connection (unused).
-        _cursor: Database cursor (unused).
-        _statement: SQL statement being executed (unused).
-        _parameters: Query parameters (unused).
-        context: SQLAlchemy execution context.
-        _executemany: Whether this is an executemany operation (unused).
+        ceiling_ms: Timeout the engine's statements already have.
+        default_deadline_ms: Default request deadline, enforced by handler
+            cancellation.
     """
-    # Store start time in the weak dictionary
-    _query_start_times[context] = time.time()
+
+    def __init__(self, ceiling_ms: int, default_deadline_ms: int) -> None:
+        self.ceiling_ms = ceiling_ms
+        self.threshold_ms = min(
+            ceiling_ms, default_deadline_ms - DEADLINE_TIMEOUT_SLACK_MS
+        )
+
+    def __call__(self, conn: Connection) -> None:
+        """Shorten the timeout of the transaction that is beginning.
+
+        Args:
+            conn: The connection beginning a transaction.
+        """
+        deadline = RequestContext.get_deadline()
+        if deadline is None:
+            return
+        if conn.get_execution_options().get("isolation_level") == "AUTOCOMMIT":
+            return
+
+        timeout_ms = max(1, int(deadline.remaining() * MILLISECONDS_PER_SECOND))
+        if timeout_ms >= self.threshold_ms:
+            return
+        conn.execute(
+            DEADLINE_TIMEOUT_STATEMENT,
+            {"timeout": str(timeout_ms)},
+            execution_options={INTERNAL_STATEMENT_OPTION: True},
+        )
+
+
+@lru_cache(maxsize=OPERATION_NAME_CACHE_SIZE)
+def _operation_attributes(statement: str) -> dict[str, str]:
+    """Histogram attributes for a statement, keyed by its leading keyword."""
+    keyword = statement.lstrip()[:MAX_OPERATION_NAME_LENGTH].split(None, 1)
+    return {"db.operation.name": keyword[0].upper() if keyword else "UNKNOWN"}
 
 
-def _after_cursor_execute(
-    _conn: Connection,
-    _cursor: DBAPICursor,
-    statement: str,
-    parameters: dict[str, Any] | list[Any] | tuple[Any, ...] | None,
-    context: ExecutionContext,
-    executemany: bool,
-) -> None:
-    """Log slow queries and track query metrics.
+class _QueryInstrumentation:
+    """Cursor execution hooks with configuration snapshotted at engine creation.
+
+    The start timestamp is stored on the execution context itself, so no
+    shared mapping has to be maintained, and everything the hooks need from
+    the settings is read once when the engine is created. Every statement
+    feeds the query duration histogram; slow query logging, request
+    accounting, query statistics and N+1 detection consume the same
+    measurement.
 
     Args:
-        _conn: Database connection (unused).
-        _cursor: Database cursor (unused).
-        statement: SQL statement that was executed.
-        parameters: Query parameters.
-        context: SQLAlchemy execution context.
-        executemany: Whether this was an executemany operation.
+        settings: Application settings at engine creation.
+        histogram: Histogram receiving durations in milliseconds. Created
+            from the module meter if not provided.
     """
-    settings = get_settings()
 
-    # Calculate query duration
-    duration_ms = 0.0
-    start_time = _query_start_times.get(context)
-    if start_time is not None:
-        duration_ms = (time.time() - start_time) * 1000
-        # Clean up the entry
-        _query_start_times.pop(context, None)
-
-    # Get rows affected
-    rows_affected: int | None = getattr(_cursor, "rowcount", -1)
-    if rows_affected is None:
-        rows_affected = -1
-
-    # Get current correlation ID for request tracking
-    correlation_id = RequestContext.get_correlation_id()
-
-    # Log slow queries
-    if (
-        settings.log_config.enable_sql_logging
-        and duration_ms >= settings.log_config.slow_query_threshold_ms
-    ):
+    def __init__(self, settings: Settings, histogram: Histogram | None = None) -> None:
+        log_config = settings.log_config
+        db_config = settings.database_config
+        self.record_metrics = db_config.enable_query_metrics
+        self.log_slow_queries = log_config.enable_sql_logging
+        self.slow_query_threshold_ms = log_config.slow_query_threshold_ms
+        self.slow_query_threshold_ns = int(
+            log_config.slow_query_threshold_ms * NANOSECONDS_PER_MILLISECOND
+        )
+        self.charge_requests = log_config.enable_request_accounting
+        self.record_query_stats = db_config.enable_query_stats
+        self.explain_slow_queries = db_config.explain_slow_queries
+        self.n_plus_one_mode = db_config.n_plus_one_detection
+        self.n_plus_one_threshold = db_config.n_plus_one_threshold
+        self._histogram = histogram or get_meter(__name__).create_histogram(
+            QUERY_DURATION_METRIC_NAME,
+            unit="ms",
+            description="Duration of database statements",
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any consumer of the query timings is enabled."""
+        return (
+            self.record_metrics
+            or self.log_slow_queries
+            or self.charge_requests
+            or self.record_query_stats
+        )
+
+    def before_cursor_execute(
+        self,
+        _conn: Connection,
+        _cursor: DBAPICursor,
+        _statement: str,
+        _parameters: dict[str, Any] | list[Any] | tuple[Any, ...] | None,
+        context: ExecutionContext,
+        _executemany: bool,
+    ) -> None:
+        """Store the query start time on the execution context.
+
+        Args:
+            _conn: Database connection (unused).
+            _cursor: Database cursor (unused).
+            _statement: SQL statement being executed (unused).
+            _parameters: Query parameters (unused).
+            context: SQLAlchemy execution context.
+            _executemany: Whether this is an executemany operation (unused).
+        """
+        setattr(context, QUERY_START_ATTRIBUTE, time.perf_counter_ns())
+
+    def after_cursor_execute(  # noqa: PLR0917 - SQLAlchemy event signature
+        self,
+        conn: Connection,
+        cursor: DBAPICursor,
+        statement: str,
+        parameters: dict[str, Any] | list[Any] | tuple[Any, ...] | None,
+        context: ExecutionContext,
+        executemany: bool,
+    ) -> None:
+        """Record the query duration and feed it to the enabled consumers.
+
+        Args:
+            conn: Database connection.
+            cursor: Database cursor.
+            statement: SQL statement that was executed.
+            parameters: Query parameters.
+            context: SQLAlchemy execution context.
+            executemany: Whether this was an executemany operation.
+
+        Raises:
+            NPlusOneQueryError: If N+1 detection runs in strict mode and the
+                statement crossed the repetition threshold.
+        """
+        start_ns: int | None = getattr(context, QUERY_START_ATTRIBUTE, None)
+        duration_ns = 0 if start_ns is None else time.perf_counter_ns() - start_ns
+
+        if self.record_metrics:
+            self._histogram.record(
+                duration_ns / NANOSECONDS_PER_MILLISECOND,
+                _operation_attributes(statement),
+            )
+
+        # Charge the statement to the current request, unless the data layer
+        # issued it on its own
+        internal = context.execution_options.get(INTERNAL_STATEMENT_OPTION, False)
+        usage = None if internal else get_request_usage()
+        if usage is not None:
+            usage.add_db_statement(duration_ns)
+
+        # Get rows affected
+        rows_affected: int | None = getattr(cursor, "rowcount", -1)
+        if rows_affected is None:
+            rows_affected = -1
+
+        # Aggregate per-fingerprint statistics
+        if self.record_query_stats and not internal:
+            get_query_stats().record(statement, duration_ns, rows_affected)
+
+        if self.log_slow_queries and duration_ns >= self.slow_query_threshold_ns:
+            self._log_slow_query(
+                conn,
+                statement,
+                parameters,
+                duration_ms=duration_ns / NANOSECONDS_PER_MILLISECOND,
+                rows_affected=rows_affected,
+                executemany=executemany,
+            )
+
+        # Detect statements repeated within the request (N+1 patterns)
+        if usage is not None:
+            detect_n_plus_one(
+                usage,
+                statement,
+                mode=self.n_plus_one_mode,
+                threshold=self.n_plus_one_threshold,
+            )
+
+    def _log_slow_query(
+        self,
+        conn: Connection,
+        statement: str,
+        parameters: dict[str, Any] | list[Any] | tuple[Any, ...] | None,
+        *,
+        duration_ms: float,
+        rows_affected: int,
+        executemany: bool,
+    ) -> None:
+        """Log a statement that exceeded the slow query threshold."""
+        correlation_id = RequestContext.get_correlation_id()
+
         # Parameters logging - now sanitized
         sanitized_params = sanitize_sql_params(parameters)
 
         # Clean up the SQL statement for logging
         clean_statement = " ".join(statement.split())[:500]  # Limit length
 
+        # Capture the execution plan in the background and reference the
+        # last known plan of this statement in the log entry
+        plan_fields: dict[str, Any] = {}
+        if self.explain_slow_queries and not executemany:
+            plan_capture = get_plan_capture()
+            fingerprint = fingerprint_statement(statement).digest
+            plan_fields = {
+                "fingerprint": fingerprint,
+                "plan_hash": plan_capture.latest_plan_hash(fingerprint),
+                "plan_capture_scheduled": plan_capture.schedule(
+                    conn.engine.url,
+                    statement,
+                    parameters,
+                    duration_ms=duration_ms,
+                    correlation_id=correlation_id,
+                ),
+            }
+
         logger.warning(
             "Slow query detected: {}... Duration: {:.2f}ms Rows: {}",
             clean_statement[:100],
@@ -133,54 +408,211 @@ def _after_cursor_execute(
             parameters=sanitized_params,
             correlation_id=correlation_id,
             executemany=executemany,
-            threshold_ms=settings.log_config.slow_query_threshold_ms,
+            threshold_ms=self.slow_query_threshold_ms,
+            **plan_fields,
         )
 
 
-def create_database_engine(database_url: str | None = None) -> AsyncEngine:
+def _get_engine_profile(db_config: DatabaseConfig, profile: str) -> EngineProfileConfig:
+    """Resolve the pool and server settings of an engine profile.
+
+    Args:
+        db_config: Database configuration.
+        profile: Profile name. The default profile uses the top-level pool
+            settings.
+
+    Returns:
+        EngineProfileConfig: The profile's settings.
+
+    Raises:
+        ValueError: If the profile is not configured.
+    """
+    if profile == DEFAULT_ENGINE_PROFILE:
+        # Values were validated by DatabaseConfig already
+        return EngineProfileConfig.model_construct(
+            pool_size=db_config.pool_size,
+            max_overflow=db_config.max_overflow,
+            pool_timeout=db_config.pool_timeout,
+        )
+    try:
+        return db_config.engine_profiles[profile]
+    except KeyError:
+        msg = f"Unknown database engine profile: {profile}"
+        raise ValueError(msg) from None
+
+
+def _server_settings(profile_config: EngineProfileConfig) -> dict[str, str]:
+    """PostgreSQL settings applied when a profile's connections are opened."""
+    # JIT is off unless enabled, for more predictable OLTP latency
+    server_settings = {"jit": "on" if profile_config.jit else "off"}
+    if profile_config.work_mem is not None:
+        server_settings["work_mem"] = profile_config.work_mem
+    if profile_config.statement_timeout_ms is not None:
+        server_settings["statement_timeout"] = str(profile_config.statement_timeout_ms)
+    server_settings.update(profile_config.server_settings)
+    return server_settings
+
+
+def _pool_arguments(
+    db_config: DatabaseConfig, profile_config: EngineProfileConfig
+) -> dict[str, Any]:
+    """Pool class and sizing of an engine.
+
+    Behind a transaction pooler the client-side pool is kept small or
+    disabled, as the pooler already keeps server connections open.
+    """
+    if db_config.pooler_mode == "transaction":
+        if db_config.pooler_pool_size == 0:
+            return {"poolclass": _UsageAccountingNullPool}
+        return {
+            "poolclass": _UsageAccountingPool,
+            "pool_size": min(profile_config.pool_size, db_config.pooler_pool_size),
+            "max_overflow": 0,
+            "pool_timeout": profile_config.pool_timeout,
+            "pool_recycle": POOL_RECYCLE_SECONDS,
+        }
+    return {
+        "poolclass": _UsageAccountingPool,
+        "pool_size": profile_config.pool_size,
+        "max_overflow": profile_config.max_overflow,
+        "pool_timeout": profile_config.pool_timeout,
+        "pool_recycle": POOL_RECYCLE_SECONDS,
+    }
+
+
+def create_database_engine(
+    database_url: str | None = None, profile: str = DEFAULT_ENGINE_PROFILE
+) -> AsyncEngine:
     """Create an async SQLAlchemy engine with connection pooling.
 
     Args:
         database_url: Optional database URL. If not provided, uses the
                      configured database URL from settings.
+        profile: Engine profile providing the pool and server settings.
 
     Returns:
         AsyncEngine: Configured async engine instance.
     """
     settings = get_settings()
     db_config = settings.database_config
+    profile_config = _get_engine_profile(db_config, profile)
 
     # Use provided URL or fall back to configuration
     url = database_url or db_config.database_url
+    behind_pooler = db_config.pooler_mode == "transaction"
+    pool_arguments = _pool_arguments(db_config, profile_config)
+    # Connections opened for a single checkout are never stale
+    pre_ping = db_config.pool_pre_ping and "pool_size" in pool_arguments
+    ping_every_checkout = pre_ping and db_config.pool_pre_ping_idle_seconds == 0
+
+    # Server-side timeout of the profile, or the client-side one without it
+    statement_timeout_ms = (
+        profile_config.statement_timeout_ms
+        or COMMAND_TIMEOUT_SECONDS * MILLISECONDS_PER_SECOND
+    )
+    connect_args: dict[str, Any] = {
+        # Client-side timeout, never shorter than the server-side one
+        "command_timeout": max(
+            COMMAND_TIMEOUT_SECONDS, statement_timeout_ms / MILLISECONDS_PER_SECOND
+        ),
+    }
+    server_settings = _server_settings(profile_config)
+    transaction_settings: dict[str, str] = {}
+    if behind_pooler:
+        # Consecutive transactions may run on different server connections
+        server_settings, transaction_settings = split_server_settings(server_settings)
+        connect_args.update(pooler_connect_args())
+    else:
+        connect_args.update(
+            {
+                # SQLAlchemy's cache of prepared statements per connection
+                "prepared_statement_cache_size": db_config.statement_cache_size,
+                # asyncpg's own cache, used for statements it prepares implicitly
+                "statement_cache_size": db_config.statement_cache_size,
+                "max_cached_statement_lifetime": (
+                    db_config.max_cached_statement_lifetime
+                ),
+            }
+        )
+    connect_args["server_settings"] = server_settings
 
     # Create engine with configuration from settings
     engine = create_async_engine(
         url,
-        pool_size=db_config.pool_size,
-        max_overflow=db_config.max_overflow,
-        pool_timeout=db_config.pool_timeout,
-        pool_pre_ping=db_config.pool_pre_ping,
+        # Ping on every checkout only when no idle threshold is configured
+        pool_pre_ping=ping_every_checkout,
         echo=db_config.echo,
-        # Additional performance and reliability settings
-        pool_recycle=POOL_RECYCLE_SECONDS,
-        connect_args={
-            "server_settings": {
-                "jit": "off"
-            },  # Disable JIT for more predictable performance
-            "command_timeout": COMMAND_TIMEOUT_SECONDS,
-        },
+        connect_args=connect_args,
+        **pool_arguments,
     )
 
-    # Add custom event listeners for detailed query logging if SQL logging is enabled
-    if settings.log_config.enable_sql_logging:
+    try:
+        # Ping only connections that were idle long enough to have been
+        # dropped by the server or a firewall
+        if pre_ping and not ping_every_checkout:
+            idle_ping = IdleConnectionPing(
+                engine.sync_engine.dialect, db_config.pool_pre_ping_idle_seconds
+            )
+            event.listen(engine.sync_engine.pool, "checkin", idle_ping.checkin)
+            event.listen(engine.sync_engine.pool, "checkout", idle_ping.checkout)
+
+        # Profile settings behind a pooler, applied before the deadline
+        # timeout so that a deadline can still shorten statement_timeout
+        if transaction_settings:
+            event.listen(
+                engine.sync_engine, "begin", TransactionSettings(transaction_settings)
+            )
+
+        # Statements of a request must not outlive its deadline
+        if db_config.deadline_statement_timeout:
+            event.listen(
+                engine.sync_engine,
+                "begin",
+                _DeadlineStatementTimeout(
+                    statement_timeout_ms,
+                    int(settings.request_timeout_s * MILLISECONDS_PER_SECOND),
+                ),
+            )
+
+        # Tag statements with their route and controller. The tags are
+        # constant per endpoint, so statements stay cacheable as prepared
+        # statements.
+        if db_config.sql_commenter_mode == "stable":
+            event.listen(
+                engine.sync_engine,
+                "before_cursor_execute",
+                add_stable_sql_comment,
+                retval=True,
+            )
+
+        # Count prepared statement cache hits and misses
+        if db_config.statement_cache_size > 0 and not behind_pooler:
+            event.listen(
+                engine.sync_engine.pool, "connect", install_statement_cache_metrics
+            )
+    except (InvalidRequestError, ArgumentError, AttributeError, TypeError) as e:
+        logger.warning(
+            "Failed to register connection and statement listeners: {}: {}",
+            type(e).__name__,
+            str(e),
+        )
+
+    # Time every statement once and feed the enabled consumers (metrics,
+    # slow query log, request accounting, query statistics)
+    instrumentation = _QueryInstrumentation(settings)
+    if instrumentation.enabled:
         try:
             # Add custom event listeners for detailed query logging
             # Use the sync_engine for event listeners as they work with sync events
             event.listen(
-                engine.sync_engine, "before_cursor_execute", _before_cursor_execute
+                engine.sync_engine,
+                "before_cursor_execute",
+                instrumentation.before_cursor_execute,
             )
             event.listen(
-                engine.sync_engine, "after_cursor_execute", _after_cursor_execute
+                engine.sync_engine,
+                "after_cursor_execute",
+                instrumentation.after_cursor_execute,
             )
             logger.info("Registered custom query performance event listeners")
         except (InvalidRequestError, ArgumentError, AttributeError, TypeError) as e:
@@ -195,9 +627,12 @@ def create_database_engine(database_url: str | None = None) -> AsyncEngine:
             )
 
     logger.info(
-        "Created database engine - pool_size: {}, max_overflow: {}, sql_logging: {}",
-        db_config.pool_size,
-        db_config.max_overflow,
+        "Created database engine - profile: {}, pooler_mode: {}, pool_size: {}, "
+        "max_overflow: {}, sql_logging: {}",
+        profile,
+        db_config.pooler_mode,
+        pool_arguments.get("pool_size", 0),
+        pool_arguments.get("max_overflow", 0),
         settings.log_config.enable_sql_logging,
     )
 
@@ -208,20 +643,31 @@ class _DatabaseManager:
     """Internal class to manage database engine and session factory instances.
 
     This class provides a singleton pattern without using global statements,
-    which is preferred by our linting rules.
+    which is preferred by our linting rules. Engines of non-default profiles
+    are created on first use and kept per profile name.
     """
 
     def __init__(self) -> None:
         self._engine: AsyncEngine | None = None
         self._async_session_factory: async_sessionmaker[AsyncSession] | None = None
+        self._read_only_session_factory: async_sessionmaker[AsyncSession] | None = None
+        self._profile_engines: dict[str, AsyncEngine] = {}
+        self._profile_session_factories: dict[
+            str, async_sessionmaker[AsyncSession]
+        ] = {}
         self._lock = threading.Lock()
 
-    def get_engine(self) -> AsyncEngine:
-        """Get or create the async engine instance.
+    def get_engine(self, profile: str = DEFAULT_ENGINE_PROFILE) -> AsyncEngine:
+        """Get or create the async engine instance of a profile.
+
+        Args:
+            profile: Engine profile name.
 
         Returns:
             AsyncEngine: The engine instance.
         """
+        if profile != DEFAULT_ENGINE_PROFILE:
+            return self._get_profile_engine(profile)
         if self._engine is None:
             with self._lock:
                 # Double-checked locking pattern
@@ -229,12 +675,30 @@ class _DatabaseManager:
                     self._engine = create_database_engine()
         return self._engine
 
-    def get_session_factory(self) -> async_sessionmaker[AsyncSession]:
-        """Get or create the async session factory.
+    def _get_profile_engine(self, profile: str) -> AsyncEngine:
+        """Get or create the engine of a non-default profile."""
+        engine = self._profile_engines.get(profile)
+        if engine is None:
+            with self._lock:
+                engine = self._profile_engines.get(profile)
+                if engine is None:
+                    engine = create_database_engine(profile=profile)
+                    self._profile_engines[profile] = engine
+        return engine
+
+    def get_session_factory(
+        self, profile: str = DEFAULT_ENGINE_PROFILE
+    ) -> async_sessionmaker[AsyncSession]:
+        """Get or create the async session factory of a profile.
+
+        Args:
+            profile: Engine profile name.
 
         Returns:
             async_sessionmaker[AsyncSession]: The session factory.
         """
+        if profile != DEFAULT_ENGINE_PROFILE:
+            return self._get_profile_session_factory(profile)
         if self._async_session_factory is None:
             # Get engine first (it has its own locking)
             engine = self.get_engine()
@@ -250,57 +714,146 @@ class _DatabaseManager:
                     logger.info("Created async session factory")
         return self._async_session_factory
 
+    def _get_profile_session_factory(
+        self, profile: str
+    ) -> async_sessionmaker[AsyncSession]:
+        """Get or create the session factory of a non-default profile."""
+        factory = self._profile_session_factories.get(profile)
+        if factory is None:
+            engine = self._get_profile_engine(profile)
+            with self._lock:
+                factory = self._profile_session_factories.get(profile)
+                if factory is None:
+                    factory = async_sessionmaker(
+                        engine, class_=AsyncSession, expire_on_commit=False
+                    )
+                    self._profile_session_factories[profile] = factory
+                    logger.info("Created async session factory ({})", profile)
+        return factory
+
+    def get_read_only_session_factory(self) -> async_sessionmaker[AsyncSession]:
+        """Get or create the read-only async session factory.
+
+        Sessions are bound to a variant of the engine sharing its pool, with
+        the connection characteristics of the configured read-only mode.
+        Behind a transaction pooler, sessions always run in READ ONLY
+        transactions.
+
+        Returns:
+            async_sessionmaker[AsyncSession]: The read-only session factory.
+        """
+        if self._read_only_session_factory is None:
+            engine = self.get_engine()
+
+            with self._lock:
+                if self._read_only_session_factory is None:
+                    db_config = get_settings().database_config
+                    mode = _read_only_session_mode(db_config)
+                    if mode != db_config.read_only_session_mode:
+                        logger.warning(
+                            "Read-only sessions use transactions behind a "
+                            "transaction pooler, ignoring {} mode",
+                            db_config.read_only_session_mode,
+                        )
+                    self._read_only_session_factory = async_sessionmaker(
+                        engine.execution_options(**READ_ONLY_EXECUTION_OPTIONS[mode]),
+                        class_=AsyncSession,
+                        expire_on_commit=False,
+                        autoflush=False,  # Nothing is ever written
+                    )
+                    logger.info("Created read-only session factory ({})", mode)
+        return self._read_only_session_factory
+
     async def close(self) -> None:
-        """Close the database engine and cleanup connections."""
+        """Close the database engines and cleanup connections."""
         if self._engine is not None:
             await self._engine.dispose()
             logger.info("Database engine disposed")
             self._engine = None
             self._async_session_factory = None
+            self._read_only_session_factory = None
+        for profile, engine in list(self._profile_engines.items()):
+            await engine.dispose()
+            logger.info("Database engine disposed ({})", profile)
+        self._profile_engines.clear()
+        self._profile_session_factories.clear()
 
     def reset(self) -> None:
         """Reset the manager state. Used primarily for testing."""
         with self._lock:
             self._engine = None
             self._async_session_factory = None
+            self._read_only_session_factory = None
+            self._profile_engines.clear()
+            self._profile_session_factories.clear()
 
 
 # Singleton instance
 _db_manager = _DatabaseManager()
 
 
-def get_engine() -> AsyncEngine:
+def get_engine(profile: str = DEFAULT_ENGINE_PROFILE) -> AsyncEngine:
     """Get or create the global async engine instance.
 
-    This function ensures a single engine instance is used throughout
-    the application lifecycle for proper connection pooling.
+    This function ensures a single engine instance per profile is used
+    throughout the application lifecycle for proper connection pooling.
+
+    Args:
+        profile: Engine profile name.
 
     Returns:
         AsyncEngine: The global engine instance.
     """
-    return _db_manager.get_engine()
+    return _db_manager.get_engine(profile)
+
+
+def get_pool_capacity(profile: str = DEFAULT_ENGINE_PROFILE) -> int | None:
+    """Get the number of connections a profile's engine can hand out at once.
+
+    Args:
+        profile: Engine profile name.
+
+    Returns:
+        int | None: Pool size plus overflow, or None when connections are
+            not pooled on the client side.
+    """
+    db_config = get_settings().database_config
+    pool_arguments = _pool_arguments(db_config, _get_engine_profile(db_config, profile))
+    if "pool_size" not in pool_arguments:
+        return None
+    return int(pool_arguments["pool_size"]) + int(pool_arguments["max_overflow"])
 
 
-def get_session_factory() -> async_sessionmaker[AsyncSession]:
+def get_session_factory(
+    profile: str = DEFAULT_ENGINE_PROFILE,
+) -> async_sessionmaker[AsyncSession]:
     """Get or create the global async session factory.
 
-    This function ensures a single session factory is used throughout
-    the application lifecycle.
+    This function ensures a single session factory per profile is used
+    throughout the application lifecycle.
+
+    Args:
+        profile: Engine profile name.
 
     Returns:
         async_sessionmaker[AsyncSession]: The global session factory.
     """
-    return _db_manager.get_session_factory()
+    return _db_manager.get_session_factory(profile)
 
 
 @asynccontextmanager
-async def get_async_session() -> AsyncGenerator[AsyncSession]:
+async def get_async_session(
+    profile: str = DEFAULT_ENGINE_PROFILE,
+) -> AsyncGenerator[AsyncSession]:
     """Get an async database session with automatic cleanup.
 
     This async generator provides a database session that is automatically
     cleaned up after use. The session is committed on success or rolled back
     on error.
 
+    Args:
+        profile: Engine profile whose pool the session uses.
+
     Yields:
         AsyncGenerator[AsyncSession]: Database session for performing operations.
 
@@ -313,7 +866,7 @@ async def get_async_session() -> AsyncGenerator[AsyncSession]:
             result = await session.execute(select(User))
             users = result.scalars().all()
     """
-    async_session_factory = get_session_factory()
+    async_session_factory = get_session_factory(profile)
     async with async_session_factory() as session:
         logger.debug("Created new database session")
         try:
@@ -329,6 +882,50 @@ async def get_async_session() -> AsyncGenerator[AsyncSession]:
             logger.debug("Database session closed")
 
 
+def get_read_only_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Get or create the global read-only async session factory.
+
+    Returns:
+        async_sessionmaker[AsyncSession]: The global read-only session factory.
+    """
+    return _db_manager.get_read_only_session_factory()
+
+
+@asynccontextmanager
+async def get_read_only_session() -> AsyncGenerator[AsyncSession]:
+    """Get an async database session for reads only.
+
+    The session is never committed. Like any session, it only checks out a
+    connection when the first statement is executed, so a request that
+    never queries costs no database round trip at all. In transaction mode
+    (the default) statements share a READ ONLY transaction that PostgreSQL
+    enforces and that is rolled back on close. In autocommit mode each
+    statement runs on its own and closing the session is free, but nothing
+    prevents writes: a flush or an UPDATE executed on the session is
+    committed immediately.
+
+    Yields:
+        AsyncGenerator[AsyncSession]: Database session for read operations.
+
+    Example:
+        async with get_read_only_session() as session:
+            result = await session.execute(select(User))
+            users = result.scalars().all()
+    """
+    read_only_session_factory = get_read_only_session_factory()
+    async with read_only_session_factory() as session:
+        logger.debug("Created new read-only database session")
+        try:
+            yield session
+        finally:
+            if session.new or session.dirty or session.deleted:
+                logger.warning(
+                    "Discarding unflushed changes made in a read-only database session"
+                )
+            await session.close()
+            logger.debug("Read-only database session closed")
+
+
 async def close_database() -> None:
     """Close the database engine and cleanup connections.
 
@@ -336,6 +933,8 @@ async def close_database() -> None:
     all database connections are properly closed.
     """
     await _db_manager.close()
+    if get_settings().database_config.explain_slow_queries:
+        await get_plan_capture().close()
 
 
 async def check_database_connection() -> tuple[bool, str | None]:
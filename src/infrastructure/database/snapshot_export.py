@@ -0,0 +1,287 @@
+"""Parallel CSV exports reading one consistent snapshot.
+
+A COPY runs on one server backend, so a large export uses a single CPU core
+of the database server. This module splits an export by key range across
+several connections instead. All of them read the same snapshot: the
+coordinating connection opens a REPEATABLE READ transaction and exports its
+snapshot with ``pg_export_snapshot()``, and every worker imports it with
+``SET TRANSACTION SNAPSHOT`` before reading. Rows committed while the export
+runs are therefore seen by none of the ranges, or by all of them.
+
+Key components:
+- **export_snapshot_csv**: Streams a query as CSV, ordered by an integer
+  key, scanning disjoint key ranges in parallel
+- **split_key_range**: Splits a key range into contiguous parts of equal
+  size
+- **Ordered merge**: The coordinator streams the first range itself while
+  workers spool theirs to temporary files, which are streamed in key order
+  once the preceding ranges are done
+
+Statements are split by adding key bounds to their WHERE clause, so they
+must select plain rows: LIMIT, OFFSET, DISTINCT, GROUP BY and HAVING would
+apply to each range separately and are rejected.
+
+Snapshot transactions are opened on the driver connections directly, as the
+snapshot import has to be the first statement of a transaction. SQLAlchemy
+``begin`` listeners, such as deadline statement timeouts, do not run for
+them.
+"""
+
+import asyncio
+import contextlib
+import re
+import tempfile
+import time
+from collections.abc import AsyncGenerator
+from typing import IO, Any, Final
+
+from loguru import logger
+from sqlalchemy import ColumnElement, Select, func
+from sqlalchemy.engine import Dialect
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import QueryableAttribute
+
+from src.infrastructure.database.bulk_copy import (
+    DEFAULT_COPY_TIMEOUT_SECONDS,
+    CopyOutStream,
+    compile_driver_query,
+)
+from src.infrastructure.database.session import (
+    DEFAULT_ENGINE_PROFILE,
+    get_engine,
+    get_pool_capacity,
+)
+
+DEFAULT_EXPORT_WORKERS: Final[int] = 4
+# Spooled ranges stay in memory up to this size, then move to a file
+SPOOL_MAX_MEMORY_BYTES: Final[int] = 8 * 1024 * 1024
+SPOOL_READ_BYTES: Final[int] = 256 * 1024
+# Snapshot identifiers as returned by pg_export_snapshot(), e.g. 00000003-0000001B-1
+SNAPSHOT_ID_PATTERN: Final[re.Pattern[str]] = re.compile(r"[0-9A-F]+(-[0-9A-F]+)+")
+
+type ExportKey = ColumnElement[int] | QueryableAttribute[int]
+type KeyRange = tuple[int, int]
+
+
+def split_key_range(low: int, high: int, parts: int) -> list[KeyRange]:
+    """Split an inclusive key range into contiguous half-open ranges.
+
+    Args:
+        low: Smallest key.
+        high: Largest key.
+        parts: Number of ranges wanted. Fewer are returned when the range
+            holds fewer keys.
+
+    Returns:
+        list[KeyRange]: ``(start, end)`` pairs with ``start <= key < end``,
+            in ascending order.
+    """
+    span = high - low + 1
+    parts = max(1, min(parts, span))
+    size, remainder = divmod(span, parts)
+    ranges: list[KeyRange] = []
+    start = low
+    for index in range(parts):
+        end = start + size + (1 if index < remainder else 0)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def _check_splittable(statement: Select[Any]) -> None:
+    """Reject statements whose rows change when split into key ranges.
+
+    Raises:
+        ValueError: If the statement limits, deduplicates or groups rows.
+    """
+    # Select has no public accessors for these clauses
+    clauses = {
+        "LIMIT": statement._limit_clause is not None,
+        "OFFSET": statement._offset_clause is not None,
+        "FETCH": statement._fetch_clause is not None,
+        "DISTINCT": statement._distinct,
+        "GROUP BY": bool(statement._group_by_clauses),
+        "HAVING": bool(statement._having_criteria),
+    }
+    found = [clause for clause, present in clauses.items() if present]
+    if found:
+        msg = f"Cannot split an export by key range with {', '.join(found)}"
+        raise ValueError(msg)
+
+
+def _range_queries(
+    statement: Select[Any],
+    key: ExportKey,
+    bounds: tuple[int | None, int | None],
+    parts: int,
+    dialect: Dialect,
+) -> list[tuple[str, list[Any]]]:
+    """Compile the statement once per key range, ordered by the key."""
+    ordered = statement.order_by(None).order_by(key)
+    low, high = bounds
+    if low is None or high is None:
+        # No rows to split; one query still produces the header
+        return [compile_driver_query(ordered, dialect)]
+    return [
+        compile_driver_query(ordered.where(key >= start, key < end), dialect)
+        for start, end in split_key_range(low, high, parts)
+    ]
+
+
+async def _export_range(
+    engine: AsyncEngine,
+    snapshot_id: str,
+    query: tuple[str, list[Any]],
+    output: IO[bytes],
+    copy_timeout_s: float,
+) -> int:
+    """Copy one key range, read in the exported snapshot, into a spool."""
+    async with engine.connect() as connection:
+        raw_connection = await connection.get_raw_connection()
+        driver_connection: Any = raw_connection.driver_connection
+        async with driver_connection.transaction(
+            isolation="repeatable_read", readonly=True
+        ):
+            await driver_connection.execute(f"SET TRANSACTION SNAPSHOT '{snapshot_id}'")
+            stream = CopyOutStream(
+                driver_connection,
+                *query,
+                header=False,
+                copy_timeout_s=copy_timeout_s,
+            )
+            async with contextlib.aclosing(aiter(stream)) as chunks:
+                async for chunk in chunks:
+                    await asyncio.to_thread(output.write, chunk)
+    return stream.rows or 0
+
+
+async def _read_spool(spool: IO[bytes]) -> AsyncGenerator[bytes]:
+    """Read a spooled range back from the start."""
+    spool.seek(0)
+    while chunk := await asyncio.to_thread(spool.read, SPOOL_READ_BYTES):
+        yield chunk
+
+
+async def export_snapshot_csv(
+    statement: Select[Any],
+    key: ExportKey,
+    *,
+    workers: int = DEFAULT_EXPORT_WORKERS,
+    profile: str = DEFAULT_ENGINE_PROFILE,
+    header: bool = True,
+    copy_timeout_s: float = DEFAULT_COPY_TIMEOUT_SECONDS,
+) -> AsyncGenerator[bytes]:
+    """Stream a query as CSV, scanning key ranges on several connections.
+
+    The key's range is split into one part per worker. The coordinating
+    connection exports its snapshot and streams the first part itself; the
+    other parts are copied on their own connections at the same time and
+    spooled until it is their turn. The output is ordered by the key, and
+    any ordering of the statement is replaced.
+
+    Workers are limited to the connections the profile's pool can hand
+    out, so an export never waits on itself for a connection.
+
+    Args:
+        statement: The SELECT whose rows are exported.
+        key: Integer column the ranges are split on, ideally indexed, e.g.
+            the primary key.
+        workers: Connections reading in parallel, including the
+            coordinating one.
+        profile: Engine profile the connections come from.
+        header: Whether the first line holds the column names.
+        copy_timeout_s: Seconds each range's COPY may take.
+
+    Yields:
+        bytes: CSV chunks, in key order.
+
+    Raises:
+        ValueError: If fewer than one worker is requested, or the statement
+            uses LIMIT, OFFSET, DISTINCT, GROUP BY or HAVING.
+
+    Example:
+        return CSVStreamingResponse(
+            export_snapshot_csv(select(Invoice), Invoice.id, profile="analytics"),
+            filename="invoices.csv",
+        )
+    """
+    if workers < 1:
+        msg = f"An export needs at least one worker, got {workers}"
+        raise ValueError(msg)
+    _check_splittable(statement)
+    capacity = get_pool_capacity(profile)
+    if capacity is not None:
+        workers = min(workers, capacity)
+
+    engine = get_engine(profile)
+    start = time.perf_counter()
+    async with engine.connect() as connection:
+        raw_connection = await connection.get_raw_connection()
+        driver_connection: Any = raw_connection.driver_connection
+        # The exported snapshot stays importable while this transaction is
+        # open, so it lasts until every range has been read
+        async with driver_connection.transaction(
+            isolation="repeatable_read", readonly=True
+        ):
+            snapshot_id = await driver_connection.fetchval(
+                "SELECT pg_export_snapshot()"
+            )
+            if not SNAPSHOT_ID_PATTERN.fullmatch(snapshot_id):
+                msg = f"Unexpected snapshot identifier: {snapshot_id!r}"
+                raise ValueError(msg)
+            bounds_query, bounds_arguments = compile_driver_query(
+                statement.with_only_columns(func.min(key), func.max(key)).order_by(
+                    None
+                ),
+                connection.dialect,
+            )
+            bounds = await driver_connection.fetchrow(bounds_query, *bounds_arguments)
+            first_query, *worker_queries = _range_queries(
+                statement, key, (bounds[0], bounds[1]), workers, connection.dialect
+            )
+
+            spools = [
+                tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY_BYTES)  # noqa: SIM115 - closed below
+                for _ in worker_queries
+            ]
+            tasks = [
+                asyncio.ensure_future(
+                    _export_range(engine, snapshot_id, query, spool, copy_timeout_s)
+                )
+                for query, spool in zip(worker_queries, spools, strict=True)
+            ]
+            try:
+                stream = CopyOutStream(
+                    driver_connection,
+                    *first_query,
+                    header=header,
+                    copy_timeout_s=copy_timeout_s,
+                )
+                async with contextlib.aclosing(aiter(stream)) as chunks:
+                    async for chunk in chunks:
+                        yield chunk
+                rows = stream.rows or 0
+                for task, spool in zip(tasks, spools, strict=True):
+                    rows += await task
+                    async with contextlib.aclosing(_read_spool(spool)) as chunks:
+                        async for chunk in chunks:
+                            yield chunk
+            finally:
+                for task in tasks:
+                    if not task.done():
+                        task.cancel()
+                # Worker connections go back to the pool before this one
+                await asyncio.gather(*tasks, return_exceptions=True)
+                for spool in spools:
+                    spool.close()
+
+    elapsed_s = time.perf_counter() - start
+    logger.info(
+        "Exported {} rows as CSV from {} ranges in {:.2f}s",
+        rows,
+        len(tasks) + 1,
+        elapsed_s,
+        rows=rows,
+        ranges=len(tasks) + 1,
+        profile=profile,
+    )
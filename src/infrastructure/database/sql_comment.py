@@ -0,0 +1,90 @@
+"""SQL comments tagging statements with the request that issued them.
+
+sqlcommenter-style comments let a statement seen in pg_stat_activity or the
+PostgreSQL logs be traced back to the code that sent it. Comments that carry
+per-request values such as a traceparent make almost every statement text
+unique, which defeats the asyncpg prepared statement cache (keyed by the
+statement text) and floods pg_stat_statements with distinct entries.
+
+Modes:
+- **off**: Statements are sent unchanged
+- **stable**: Only the route template and controller are appended, so each
+  statement has at most one text per endpoint and stays cacheable
+- **full**: The OpenTelemetry instrumentor appends trace context to every
+  statement. Useful for short debugging sessions, not for production
+"""
+
+from functools import lru_cache
+from typing import Any, Final, Literal
+from urllib.parse import quote
+
+from sqlalchemy.engine import Connection
+from sqlalchemy.engine.interfaces import DBAPICursor, ExecutionContext
+
+from src.core.resource_usage import get_request_usage
+
+type SQLCommenterMode = Literal["off", "stable", "full"]
+type SQLParameters = dict[str, Any] | list[Any] | tuple[Any, ...] | None
+
+COMMENT_CACHE_SIZE: Final[int] = 512
+
+
+def format_sql_comment(tags: dict[str, str]) -> str:
+    """Format tags as a sqlcommenter comment.
+
+    Keys are sorted and values URL-encoded and quoted as the sqlcommenter
+    specification requires.
+
+    Args:
+        tags: Tag names and values. Empty values are skipped.
+
+    Returns:
+        str: The comment, or an empty string if there are no tags.
+    """
+    pairs = [
+        f"{quote(key, safe='')}='{quote(value, safe='')}'"
+        for key, value in sorted(tags.items())
+        if value
+    ]
+    return f"/*{','.join(pairs)}*/" if pairs else ""
+
+
+@lru_cache(maxsize=COMMENT_CACHE_SIZE)
+def _stable_comment(route: str | None, controller: str | None) -> str:
+    """Comment for a route and controller, cached per endpoint."""
+    return format_sql_comment({"route": route or "", "controller": controller or ""})
+
+
+def add_stable_sql_comment(
+    _conn: Connection,
+    _cursor: DBAPICursor,
+    statement: str,
+    parameters: SQLParameters,
+    _context: ExecutionContext,
+    _executemany: bool,
+) -> tuple[str, SQLParameters]:
+    """Append the stable request tags to a statement.
+
+    Registered as a ``before_cursor_execute`` listener with ``retval=True``.
+    Statements executed outside of a request are left unchanged.
+
+    Args:
+        _conn: Database connection (unused).
+        _cursor: Database cursor (unused).
+        statement: SQL statement about to be executed.
+        parameters: Query parameters.
+        _context: SQLAlchemy execution context (unused).
+        _executemany: Whether this is an executemany operation (unused).
+
+    Returns:
+        tuple[str, SQLParameters]: The statement with the comment and the unchanged
+            parameters.
+    """
+    usage = get_request_usage()
+    if usage is None:
+        return statement, parameters
+
+    comment = _stable_comment(usage.route, usage.controller)
+    if not comment or statement.rstrip().endswith("*/"):
+        return statement, parameters
+    return f"{statement} {comment}", parameters
@@ -0,0 +1,129 @@
+"""Prepared statement cache hit rate tracking.
+
+The asyncpg dialect prepares every statement and keeps the prepared
+statements in a per-connection LRU cache keyed by the statement text. A low
+hit rate means statements are re-prepared (an extra round trip each time),
+usually because their text varies per execution or the cache is too small
+for the number of distinct statements.
+
+Key components:
+- **StatementCacheStats**: Process-wide hit and miss counters, also
+  exported as an OpenTelemetry counter
+- **install_statement_cache_metrics**: Pool ``connect`` listener replacing
+  the dialect's cache on each new connection with a counting one of the
+  same capacity
+"""
+
+from functools import lru_cache
+from typing import Any, Final
+
+from loguru import logger
+from sqlalchemy.engine.interfaces import DBAPIConnection
+from sqlalchemy.pool import ConnectionPoolEntry
+from sqlalchemy.util import LRUCache
+
+from src.core.observability import get_meter
+
+STATEMENT_CACHE_METRIC_NAME: Final[str] = "db.client.prepared_statement_cache.lookups"
+_CACHE_ATTRIBUTE: Final[str] = "_prepared_statement_cache"
+_HIT_ATTRIBUTES: Final[dict[str, str]] = {"result": "hit"}
+_MISS_ATTRIBUTES: Final[dict[str, str]] = {"result": "miss"}
+
+
+class StatementCacheStats:
+    """Hit and miss counters of the prepared statement caches."""
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._counter = get_meter(__name__).create_counter(
+            STATEMENT_CACHE_METRIC_NAME,
+            unit="{lookup}",
+            description="Prepared statement cache lookups by result",
+        )
+
+    def record(self, *, hit: bool) -> None:
+        """Count one cache lookup.
+
+        Args:
+            hit: Whether the statement was found in the cache.
+        """
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        self._counter.add(1, _HIT_ATTRIBUTES if hit else _MISS_ATTRIBUTES)
+
+    def as_dict(self) -> dict[str, int | float | None]:
+        """Render the counters with the resulting hit rate.
+
+        Returns:
+            dict[str, int | float | None]: Hits, misses and the hit rate, which
+                is None before the first lookup.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+    def reset(self) -> None:
+        """Reset the in-process counters."""
+        self.hits = 0
+        self.misses = 0
+
+
+@lru_cache(maxsize=1)
+def get_statement_cache_stats() -> StatementCacheStats:
+    """Get the process-wide prepared statement cache counters.
+
+    Returns:
+        StatementCacheStats: The shared counters.
+    """
+    return StatementCacheStats()
+
+
+class _CountingStatementCache(LRUCache[str, Any]):
+    """LRU cache counting membership checks as hits and misses.
+
+    The dialect looks statements up with ``in`` before using them, so each
+    membership check corresponds to one execution.
+    """
+
+    __slots__ = ("_stats",)
+
+    def __init__(self, capacity: int, stats: StatementCacheStats) -> None:
+        super().__init__(capacity)
+        self._stats = stats
+
+    def __contains__(self, key: object) -> bool:
+        found = super().__contains__(key)
+        self._stats.record(hit=found)
+        return found
+
+
+def install_statement_cache_metrics(
+    dbapi_connection: DBAPIConnection,
+    _connection_record: ConnectionPoolEntry,
+) -> None:
+    """Replace a new connection's statement cache with a counting one.
+
+    Registered as a pool ``connect`` listener. Connections without a
+    statement cache (cache size 0, other drivers) are left unchanged.
+
+    Args:
+        dbapi_connection: The DBAPI connection adapter.
+        _connection_record: Pool record of the connection (unused).
+    """
+    cache = getattr(dbapi_connection, _CACHE_ATTRIBUTE, None)
+    if not isinstance(cache, LRUCache) or isinstance(cache, _CountingStatementCache):
+        return
+    try:
+        setattr(
+            dbapi_connection,
+            _CACHE_ATTRIBUTE,
+            _CountingStatementCache(cache.capacity, get_statement_cache_stats()),
+        )
+    except AttributeError:  # pragma: no cover - adapter layout changed
+        logger.debug("Prepared statement cache of the driver cannot be replaced")
@@ -0,0 +1,16 @@
+"""Type stubs for opentelemetry.exporter.otlp.proto.grpc.metric_exporter."""
+
+from opentelemetry.sdk.metrics.export import MetricExporter
+
+class OTLPMetricExporter(MetricExporter):
+    """Type stub for OTLPMetricExporter."""
+
+    def __init__(
+        self,
+        endpoint: str | None = None,
+        insecure: bool | None = None,
+        credentials: object | None = None,
+        headers: tuple[tuple[str, str], ...] | None = None,
+        timeout: int | None = None,
+        compression: str | None = None,
+    ) -> None: ...
@@ -0,0 +1,95 @@
+"""Type stubs for opentelemetry.metrics."""
+
+from collections.abc import Callable, Iterable, Mapping, Sequence
+
+type Attributes = Mapping[str, str | bool | int | float] | None
+
+class Observation:
+    """Type stub for Observation."""
+
+    def __init__(self, value: float, attributes: Attributes = None) -> None: ...
+    @property
+    def value(self) -> float: ...
+    @property
+    def attributes(self) -> Attributes: ...
+
+class CallbackOptions:
+    """Type stub for CallbackOptions."""
+
+type CallbackT = Callable[[CallbackOptions], Iterable[Observation]]
+
+class Histogram:
+    """Type stub for Histogram."""
+
+    def record(
+        self,
+        amount: float,
+        attributes: Attributes = None,
+        context: object | None = None,
+    ) -> None: ...
+
+class Counter:
+    """Type stub for Counter."""
+
+    def add(
+        self,
+        amount: float,
+        attributes: Attributes = None,
+        context: object | None = None,
+    ) -> None: ...
+
+class UpDownCounter:
+    """Type stub for UpDownCounter."""
+
+    def add(
+        self,
+        amount: float,
+        attributes: Attributes = None,
+        context: object | None = None,
+    ) -> None: ...
+
+class ObservableGauge:
+    """Type stub for ObservableGauge."""
+
+class Meter:
+    """Type stub for Meter."""
+
+    def create_histogram(
+        self,
+        name: str,
+        unit: str = "",
+        description: str = "",
+        explicit_bucket_boundaries_advisory: Sequence[float] | None = None,
+    ) -> Histogram: ...
+    def create_counter(
+        self, name: str, unit: str = "", description: str = ""
+    ) -> Counter: ...
+    def create_up_down_counter(
+        self, name: str, unit: str = "", description: str = ""
+    ) -> UpDownCounter: ...
+    def create_observable_gauge(
+        self,
+        name: str,
+        callbacks: Sequence[CallbackT] | None = None,
+        unit: str = "",
+        description: str = "",
+    ) -> ObservableGauge: ...
+
+class MeterProvider:
+    """Type stub for MeterProvider."""
+
+    def get_meter(
+        self,
+        name: str,
+        version: str | None = None,
+        schema_url: str | None = None,
+    ) -> Meter: ...
+
+def get_meter(
+    name: str,
+    version: str = "",
+    meter_provider: MeterProvider | None = None,
+    schema_url: str | None = None,
+) -> Meter: ...
+def set_meter_provider(meter_provider: MeterProvider) -> None: ...
+def get_meter_provider() -> MeterProvider: ...
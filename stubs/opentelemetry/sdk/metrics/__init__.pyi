@@ -0,0 +1,19 @@
+"""Type stubs for opentelemetry.sdk.metrics."""
+
+from collections.abc import Sequence
+
+from opentelemetry.metrics import MeterProvider as APIMeterProvider
+from opentelemetry.sdk.metrics.export import MetricReader
+from opentelemetry.sdk.resources import Resource
+
+class MeterProvider(APIMeterProvider):
+    """Type stub for MeterProvider."""
+
+    def __init__(
+        self,
+        metric_readers: Sequence[MetricReader] = (),
+        resource: Resource | None = None,
+        shutdown_on_exit: bool = True,
+    ) -> None: ...
+    def force_flush(self, timeout_millis: float = 10000) -> bool: ...
+    def shutdown(self, timeout_millis: float = 30000) -> None: ...
@@ -0,0 +1,21 @@
+"""Type stubs for opentelemetry.sdk.metrics.export."""
+
+class MetricExporter:
+    """Type stub for MetricExporter."""
+
+    def shutdown(self, timeout_millis: float = 30000) -> None: ...
+
+class MetricReader:
+    """Type stub for MetricReader."""
+
+    def shutdown(self, timeout_millis: float = 30000) -> None: ...
+
+class PeriodicExportingMetricReader(MetricReader):
+    """Type stub for PeriodicExportingMetricReader."""
+
+    def __init__(
+        self,
+        exporter: MetricExporter,
+        export_interval_millis: float | None = None,
+        export_timeout_millis: float | None = None,
+    ) -> None: ...
@@ -192,6 +192,17 @@ def clear_settings_cache() -> Generator[None]:
     get_settings.cache_clear()
 
 
+@pytest.fixture(autouse=True)
+def strict_n_plus_one_detection(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make repeated statements within a request fail integration tests.
+
+    N+1 detection raises NPlusOneQueryError instead of logging a warning, so
+    regressions surface as test failures. Tests exercising the warning mode
+    can override the environment variable again.
+    """
+    monkeypatch.setenv("DATABASE_CONFIG__N_PLUS_ONE_DETECTION", "raise")
+
+
 @pytest.fixture(autouse=True)
 def clean_request_context() -> Generator[None]:
     """Automatically clear RequestContext before and after each test.
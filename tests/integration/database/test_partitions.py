@@ -0,0 +1,104 @@
+"""Integration tests for tables partitioned by creation time.
+
+This module creates a partitioned table and its partitions in PostgreSQL,
+writes and reads it through the repository, and checks that time range
+filters only scan the partitions of the range.
+"""
+
+from datetime import UTC, datetime
+from typing import cast
+
+import pytest
+from sqlalchemy import String, Table, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.database.base import BaseModel
+from src.infrastructure.database.filters import Range
+from src.infrastructure.database.partitions import (
+    PartitionedByCreatedAt,
+    ensure_partitions,
+    partition_bounds,
+    partition_name,
+)
+from src.infrastructure.database.repository import BaseRepository
+
+
+class PartitionTestLedgerEntry(PartitionedByCreatedAt, BaseModel):
+    """Test model partitioned by month."""
+
+    __tablename__ = "test_partition_ledger_isolated"
+
+    account: Mapped[str] = mapped_column(String(20), nullable=False)
+
+
+@pytest.fixture
+async def ledger(
+    db_session: AsyncSession,
+    db_engine: AsyncEngine,
+) -> BaseRepository[PartitionTestLedgerEntry]:
+    """Create the partitioned table and the partitions of coming months."""
+    async with db_engine.begin() as conn:
+        await conn.run_sync(PartitionTestLedgerEntry.metadata.create_all)
+    await ensure_partitions(db_session, PartitionTestLedgerEntry, ahead=1)
+
+    return BaseRepository(db_session, PartitionTestLedgerEntry)
+
+
+@pytest.mark.integration
+class TestPartitionedRepository:
+    """Test repository operations on a partitioned table."""
+
+    async def test_rows_routed_and_read_by_id(
+        self,
+        ledger: BaseRepository[PartitionTestLedgerEntry],
+        db_session: AsyncSession,
+    ) -> None:
+        """Test rows land in the current partition and are found by id."""
+        # Arrange
+        table = cast("Table", PartitionTestLedgerEntry.__table__)
+        start, end = partition_bounds("month", datetime.now(UTC))
+        next_start = partition_bounds("month", end)[0]
+
+        # Act
+        created = await ledger.create(PartitionTestLedgerEntry(account="cash"))
+        found = await ledger.get_by_id(created.id)
+        in_month = await ledger.find({"created_at": Range(start, end)})
+
+        # Assert
+        assert found is created
+        assert [entry.id for entry in in_month] == [created.id]
+        assert (
+            await ensure_partitions(db_session, PartitionTestLedgerEntry, ahead=1) == []
+        )
+        result = await db_session.execute(
+            text("SELECT tableoid::regclass::text FROM test_partition_ledger_isolated")
+        )
+        assert result.scalar_one() == partition_name(table, "month", start)
+        plan = await db_session.execute(
+            text(
+                "EXPLAIN SELECT * FROM test_partition_ledger_isolated "
+                "WHERE created_at >= :start AND created_at < :end"
+            ),
+            {"start": start, "end": end},
+        )
+        plan_text = "\n".join(row[0] for row in plan)
+        assert partition_name(table, "month", start) in plan_text
+        assert partition_name(table, "month", next_start) not in plan_text
+
+    async def test_estimated_count_adds_up_partitions(
+        self,
+        ledger: BaseRepository[PartitionTestLedgerEntry],
+        db_session: AsyncSession,
+    ) -> None:
+        """Test estimates of a partitioned table come from its partitions."""
+        # Arrange
+        for account in ("cash", "bank", "card"):
+            await ledger.create(PartitionTestLedgerEntry(account=account))
+        await db_session.execute(text("ANALYZE test_partition_ledger_isolated"))
+
+        # Act
+        estimated = await ledger.count(estimate=True)
+
+        # Assert
+        assert estimated == 3
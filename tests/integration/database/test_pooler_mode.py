@@ -0,0 +1,140 @@
+"""Integration tests for the transaction pooler mode.
+
+These tests connect through the PgBouncer container of docker-compose.test.yml,
+which runs in transaction pooling mode, and verify that prepared statements
+and server settings survive transactions being moved between server
+connections. They are skipped when PgBouncer is not reachable.
+"""
+
+import asyncio
+import socket
+from collections.abc import AsyncGenerator
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.core.config import get_settings
+from src.infrastructure.database.session import (
+    READ_ONLY_EXECUTION_OPTIONS,
+    _read_only_session_mode,
+    create_database_engine,
+)
+
+PGBOUNCER_HOST = "localhost"
+PGBOUNCER_PORT = 6432
+
+
+def is_pgbouncer_available() -> bool:
+    """Check whether the PgBouncer container accepts connections.
+
+    Returns:
+        bool: True if a TCP connection to PgBouncer succeeds.
+    """
+    try:
+        with socket.create_connection((PGBOUNCER_HOST, PGBOUNCER_PORT), timeout=1):
+            return True
+    except OSError:
+        return False
+
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.skipif(
+        not is_pgbouncer_available(), reason="PgBouncer container not running"
+    ),
+]
+
+
+@pytest.fixture
+def pgbouncer_url(database_url: str) -> str:
+    """Get the worker database URL routed through PgBouncer."""
+    url = make_url(database_url).set(host=PGBOUNCER_HOST, port=PGBOUNCER_PORT)
+    return url.render_as_string(hide_password=False)
+
+
+@pytest.fixture
+def transaction_pooler_mode(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Configure engines for a transaction pooler without a client-side pool."""
+    monkeypatch.setenv("DATABASE_CONFIG__POOLER_MODE", "transaction")
+
+
+@pytest.fixture
+async def pooled_engine(
+    pgbouncer_url: str, transaction_pooler_mode: None
+) -> AsyncGenerator[AsyncEngine]:
+    """Create the default engine connecting through PgBouncer."""
+    _ = transaction_pooler_mode
+    engine = create_database_engine(pgbouncer_url)
+    yield engine
+    await engine.dispose()
+
+
+async def test_prepared_statements_across_server_connections(
+    pooled_engine: AsyncEngine,
+) -> None:
+    """Verify concurrent transactions reuse statements without name clashes."""
+
+    async def run_transactions(worker: int) -> list[int]:
+        values = []
+        for i in range(5):
+            async with pooled_engine.begin() as conn:
+                result = await conn.execute(
+                    text("SELECT CAST(:value AS integer)"), {"value": worker * 10 + i}
+                )
+                values.append(result.scalar_one())
+        return values
+
+    results = await asyncio.gather(*(run_transactions(w) for w in range(20)))
+
+    assert results == [[w * 10 + i for i in range(5)] for w in range(20)]
+
+
+async def test_profile_settings_apply_per_transaction(
+    pgbouncer_url: str, pooled_engine: AsyncEngine, transaction_pooler_mode: None
+) -> None:
+    """Verify profile settings reach every transaction and do not leak."""
+    _ = transaction_pooler_mode
+    analytics_engine = create_database_engine(pgbouncer_url, profile="analytics")
+    try:
+        for _ in range(3):
+            async with analytics_engine.begin() as conn:
+                work_mem = await conn.scalar(text("SHOW work_mem"))
+                assert work_mem == "64MB"
+            async with pooled_engine.begin() as conn:
+                work_mem = await conn.scalar(text("SHOW work_mem"))
+                assert work_mem != "64MB"
+    finally:
+        await analytics_engine.dispose()
+
+
+async def test_read_only_sessions_configured_for_autocommit(
+    pooled_engine: AsyncEngine, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Verify concurrent read-only sessions work and stay read-only."""
+    monkeypatch.setenv("DATABASE_CONFIG__READ_ONLY_SESSION_MODE", "autocommit")
+    get_settings.cache_clear()
+    mode = _read_only_session_mode(get_settings().database_config)
+    read_only_engine = pooled_engine.execution_options(
+        **READ_ONLY_EXECUTION_OPTIONS[mode]
+    )
+
+    async def run_reads(worker: int) -> list[int]:
+        values = []
+        for i in range(5):
+            async with AsyncSession(read_only_engine) as session:
+                result = await session.execute(
+                    text("SELECT CAST(:value AS integer)"), {"value": worker * 10 + i}
+                )
+                values.append(result.scalar_one())
+        return values
+
+    results = await asyncio.gather(*(run_reads(w) for w in range(20)))
+
+    assert mode == "transaction"
+    assert results == [[w * 10 + i for i in range(5)] for w in range(20)]
+    async with AsyncSession(read_only_engine) as session:
+        with pytest.raises(DBAPIError, match="read-only transaction"):
+            await session.execute(text("CREATE TEMPORARY TABLE pooler_write (id int)"))
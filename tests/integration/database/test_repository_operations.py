@@ -10,27 +10,87 @@ creation, we use SQLAlchemy's metadata system instead of raw SQL to
 respect transaction boundaries.
 """
 
-from typing import Any
+import contextlib
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, ClassVar
 
 import pytest
-from sqlalchemy import String, select
+from sqlalchemy import ForeignKey, String, func, select, text
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
-from sqlalchemy.orm import Mapped, mapped_column
-
+from sqlalchemy.orm import (
+    Mapped,
+    joinedload,
+    mapped_column,
+    raiseload,
+    relationship,
+    selectinload,
+)
+
+from src.infrastructure.database.aggregates import Count, Max, Sum
 from src.infrastructure.database.base import BaseModel
-from src.infrastructure.database.repository import BaseRepository
+from src.infrastructure.database.filters import (
+    Gte,
+    ILikePrefix,
+    In,
+    IsNull,
+    Lte,
+    Range,
+)
+from src.infrastructure.database.repository import BaseRepository, LoadProfiles
 
 
 class RepositoryTestModel(BaseModel):
     """Test model for repository integration tests."""
 
     __tablename__ = "test_repository_model_isolated"
+    brin_timestamps = ("created_at",)
 
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     description: Mapped[str | None] = mapped_column(String(500), nullable=True)
     value: Mapped[int] = mapped_column(nullable=False, default=0)
 
 
+class RepositoryTestOwner(BaseModel):
+    """Test model owning a collection of parts."""
+
+    __tablename__ = "test_repository_owner_isolated"
+
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
+    parts: Mapped[list["RepositoryTestPart"]] = relationship()
+
+
+class RepositoryTestPart(BaseModel):
+    """Test model of a part belonging to an owner."""
+
+    __tablename__ = "test_repository_part_isolated"
+
+    owner_id: Mapped[int] = mapped_column(
+        ForeignKey("test_repository_owner_isolated.id"), nullable=False
+    )
+    label: Mapped[str] = mapped_column(String(100), nullable=False)
+
+
+class OwnerRepository(BaseRepository[RepositoryTestOwner]):
+    """Repository loading owners with their parts."""
+
+    load_profiles: ClassVar[LoadProfiles] = {
+        "list": (joinedload(RepositoryTestOwner.parts),),
+        "detail": (selectinload(RepositoryTestOwner.parts), raiseload("*")),
+    }
+
+    def __init__(self, session: AsyncSession) -> None:
+        super().__init__(session, RepositoryTestOwner)
+
+
+@dataclass(slots=True, frozen=True)
+class ItemSummary:
+    """Read projection of a test model's name and value."""
+
+    name: str
+    value: int
+
+
 @pytest.fixture
 async def test_repository(
     db_session: AsyncSession,
@@ -254,6 +314,77 @@ class TestRepositoryRead:
         assert filtered[0].name == "Item A"
         assert filtered[0].value == 100
 
+    async def test_filter_operators_and_projection(
+        self,
+        test_repository: BaseRepository[RepositoryTestModel],
+        sample_data: list[dict[str, Any]],
+    ) -> None:
+        """Test operator filters, ordering and column projections."""
+        # Arrange
+        for data in sample_data:
+            await test_repository.create(RepositoryTestModel(**data))
+
+        # Act
+        in_range = await test_repository.filter_by(
+            value=Range(200, 500), description=IsNull(is_null=False)
+        )
+        rows = await test_repository.find_columns(
+            ["name", "value"],
+            {"name": ILikePrefix("test item"), "value": In([100, 300, 500])},
+            order_by=["-value"],
+            limit=2,
+        )
+
+        # Assert
+        assert [item.value for item in in_range] == [200, 400]
+        assert [(row.name, row.value) for row in rows] == [
+            ("Test Item 5", 500),
+            ("Test Item 3", 300),
+        ]
+
+    async def test_project_into_dataclass(
+        self,
+        test_repository: BaseRepository[RepositoryTestModel],
+        sample_data: list[dict[str, Any]],
+    ) -> None:
+        """Test projections return dataclasses, not tracked instances."""
+        # Arrange
+        for data in sample_data:
+            await test_repository.create(RepositoryTestModel(**data))
+
+        # Act
+        summaries = await test_repository.project(
+            ItemSummary, {"value": Lte(200)}, order_by=["-value"]
+        )
+
+        # Assert
+        assert summaries == [
+            ItemSummary(name="Test Item 2", value=200),
+            ItemSummary(name="Test Item 1", value=100),
+        ]
+
+    async def test_page_with_total(
+        self,
+        test_repository: BaseRepository[RepositoryTestModel],
+        sample_data: list[dict[str, Any]],
+    ) -> None:
+        """Test pages carry the total of all matches."""
+        # Arrange
+        for data in sample_data:
+            await test_repository.create(RepositoryTestModel(**data))
+
+        # Act
+        first = await test_repository.page({"value": Gte(200)}, limit=2)
+        past_end = await test_repository.page({"value": Gte(200)}, skip=10)
+        last = await test_repository.page(skip=4, limit=2, count="estimated")
+
+        # Assert
+        assert [item.value for item in first.items] == [200, 300]
+        assert (first.total, first.estimated) == (4, False)
+        assert (past_end.items, past_end.total) == ([], 4)
+        assert [item.value for item in last.items] == [500]
+        assert (last.total, last.estimated) == (5, False)
+
     async def test_find_one_by(
         self, test_repository: BaseRepository[RepositoryTestModel]
     ) -> None:
@@ -281,6 +412,38 @@ class TestRepositoryRead:
         assert result is None
 
 
+@pytest.mark.integration
+class TestRepositoryLoadProfiles:
+    """Test eager loading with repository load profiles."""
+
+    async def test_related_data_loaded_eagerly(
+        self,
+        test_repository: BaseRepository[RepositoryTestModel],
+        db_session: AsyncSession,
+    ) -> None:
+        """Test profiles load collections without lazy loads or duplicates."""
+        # Arrange - the fixture has created the tables of all test models
+        assert test_repository.model_class is RepositoryTestModel
+        owner = RepositoryTestOwner(
+            name="Owner",
+            parts=[RepositoryTestPart(label="a"), RepositoryTestPart(label="b")],
+        )
+        db_session.add(owner)
+        await db_session.flush()
+        db_session.expunge_all()
+        repository = OwnerRepository(db_session)
+
+        # Act
+        detail = await repository.get_by_id(owner.id, load="detail")
+        listed = await repository.filter_by(load="list", name="Owner")
+
+        # Assert - accessing an unloaded relationship would raise
+        assert detail is not None
+        assert sorted(part.label for part in detail.parts) == ["a", "b"]
+        assert listed == [detail]
+        assert len(listed[0].parts) == 2
+
+
 @pytest.mark.integration
 class TestRepositoryUpdate:
     """Test repository update operations."""
@@ -461,6 +624,196 @@ class TestRepositoryUtilityMethods:
         not_exists_300 = await test_repository.filter_by(name="Test", value=300)
         assert len(not_exists_300) == 0
 
+        # Act & Assert using exists_by
+        assert await test_repository.exists_by(name="Test", value=Gte(200)) is True
+        assert await test_repository.exists_by(name="Test", value=300) is False
+
+    async def test_aggregate(
+        self,
+        test_repository: BaseRepository[RepositoryTestModel],
+        sample_data: list[dict[str, Any]],
+    ) -> None:
+        """Test grouped and bucketed aggregation in the database."""
+        # Arrange
+        for data in sample_data:
+            await test_repository.create(RepositoryTestModel(**data))
+
+        # Act
+        rows = await test_repository.aggregate(
+            {
+                "total": Sum("value"),
+                "items": Count(),
+                "described": Count("description"),
+            },
+            filters={"value": Gte(200)},
+            time_bucket=("created_at", "1 day"),
+        )
+        by_name = await test_repository.aggregate(
+            {"highest": Max("value")}, group_by=["name"], filters={"value": Gte(400)}
+        )
+
+        # Assert - all items were created in the same transaction, on one day
+        assert len(rows) == 1
+        assert rows[0].total == 1400
+        assert rows[0].items == 4
+        assert rows[0].described == 3
+        assert rows[0].bucket is not None
+        assert [(row.name, row.highest) for row in by_name] == [
+            ("Test Item 4", 400),
+            ("Test Item 5", 500),
+        ]
+
+    async def test_estimated_count(
+        self,
+        test_repository: BaseRepository[RepositoryTestModel],
+        sample_data: list[dict[str, Any]],
+    ) -> None:
+        """Test estimated counts are non-negative, never failing."""
+        # Arrange
+        for data in sample_data:
+            await test_repository.create(RepositoryTestModel(**data))
+
+        # Act - a table never analyzed is counted exactly
+        estimated = await test_repository.count(estimate=True)
+
+        # Assert
+        assert estimated >= 0
+
+    async def test_in_window(
+        self,
+        test_repository: BaseRepository[RepositoryTestModel],
+        sample_data: list[dict[str, Any]],
+        db_session: AsyncSession,
+    ) -> None:
+        """Test time windows are streamed in order through the BRIN index."""
+        # Arrange
+        for data in sample_data:
+            await test_repository.create(RepositoryTestModel(**data))
+        now = await db_session.scalar(select(func.now()))
+        assert now is not None
+
+        # Act - rows created in one transaction share created_at, then id orders
+        streamed = [
+            entity.value
+            async for entity in test_repository.in_window(
+                now - timedelta(hours=1),
+                now + timedelta(hours=1),
+                {"value": Gte(200)},
+                descending=True,
+                batch_size=2,
+            )
+        ]
+        before = [
+            entity
+            async for entity in test_repository.in_window(
+                now - timedelta(days=2), now - timedelta(days=1)
+            )
+        ]
+        await db_session.execute(text("SET LOCAL enable_seqscan = off"))
+        plan = await db_session.execute(
+            text(
+                "EXPLAIN SELECT * FROM test_repository_model_isolated "
+                "WHERE created_at >= now() - interval '1 hour'"
+            )
+        )
+
+        # Assert
+        assert streamed == [500, 400, 300, 200]
+        assert before == []
+        assert "ix_test_repository_model_isolated_created_at_brin" in "\n".join(
+            row[0] for row in plan
+        )
+
+    async def test_in_window_on_autocommit_session(
+        self,
+        test_repository: BaseRepository[RepositoryTestModel],
+        db_engine: AsyncEngine,
+    ) -> None:
+        """Test autocommit sessions stream on a connection of their own."""
+        # Arrange - autocommit writes are committed, so they are removed below
+        _ = test_repository
+        autocommit_engine = db_engine.execution_options(isolation_level="AUTOCOMMIT")
+        try:
+            async with AsyncSession(autocommit_engine) as session:
+                repository = BaseRepository(session, RepositoryTestModel)
+                for value in (1, 2, 3):
+                    await repository.create(
+                        RepositoryTestModel(name=f"autocommit-{value}", value=value)
+                    )
+                now = await session.scalar(select(func.now()))
+                assert now is not None
+                window = (now - timedelta(hours=1), now + timedelta(hours=1))
+
+                # Act
+                streamed = [
+                    entity.value
+                    async for entity in repository.in_window(
+                        *window, {"name": ILikePrefix("autocommit-")}, batch_size=2
+                    )
+                ]
+                async with contextlib.aclosing(repository.in_window(*window)) as stream:
+                    first = await anext(stream)
+                # The session's connection was never in the stream's transaction
+                await session.execute(
+                    text(
+                        "CREATE TEMPORARY TABLE autocommit_probe (id int) "
+                        "ON COMMIT DROP"
+                    )
+                )
+                streamed_into_session = first in session
+
+            # Assert
+            assert streamed == [1, 2, 3]
+            assert not streamed_into_session
+        finally:
+            async with db_engine.begin() as conn:
+                await conn.execute(
+                    text(
+                        "DELETE FROM test_repository_model_isolated "
+                        "WHERE name LIKE 'autocommit-%'"
+                    )
+                )
+
+
+@pytest.mark.integration
+class TestRepositoryBulkCopy:
+    """Test COPY-based bulk ingest."""
+
+    async def test_copy_in_models(
+        self, test_repository: BaseRepository[RepositoryTestModel]
+    ) -> None:
+        """Test copying model instances with column defaults."""
+        rows = [RepositoryTestModel(name=f"Copied {i}") for i in range(3)]
+
+        result = await test_repository.copy_in(rows)
+
+        assert result.rows == 3
+        copied = await test_repository.filter_by(value=0)
+        assert [entity.name for entity in copied] == [
+            "Copied 0",
+            "Copied 1",
+            "Copied 2",
+        ]
+
+    async def test_copy_in_upsert(
+        self, test_repository: BaseRepository[RepositoryTestModel]
+    ) -> None:
+        """Test upserting through the staging table."""
+        existing = await test_repository.create(
+            RepositoryTestModel(name="Original", value=1)
+        )
+
+        await test_repository.copy_in(
+            [(existing.id, "Renamed", 2)],
+            columns=["id", "name", "value"],
+            conflict_columns=["id"],
+        )
+
+        await test_repository.session.refresh(existing)
+        assert existing.name == "Renamed"
+        assert existing.value == 2
+        assert await test_repository.count() == 1
+
 
 @pytest.mark.integration
 class TestRepositoryTransactions:
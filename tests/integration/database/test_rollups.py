@@ -0,0 +1,172 @@
+"""Integration tests for trigger-maintained rollup tables.
+
+This module writes source rows through the repository and core statements
+and checks the summary rows the triggers maintain against PostgreSQL, as
+well as reconciliation and repair of drifted summaries.
+"""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import DateTime, Numeric, String, delete, insert, text, update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.database.base import BaseModel
+from src.infrastructure.database.repository import BaseRepository
+from src.infrastructure.database.rollups import (
+    Rollup,
+    RollupCheck,
+    reconcile_rollup,
+    rollup_rows,
+    rollup_trigger_ddl,
+)
+
+
+class RollupTestPayment(BaseModel):
+    """Test model summarized by a daily rollup."""
+
+    __tablename__ = "test_rollup_payment_isolated"
+
+    category: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    amount: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
+    paid_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
+DAILY_PAYMENTS = Rollup(
+    "test_rollup_daily_payments",
+    RollupTestPayment,
+    time_field="paid_at",
+    group_by=["category"],
+    sums=["amount"],
+)
+
+FIRST_DAY = datetime(2025, 3, 1, tzinfo=UTC)
+SECOND_DAY = datetime(2025, 3, 2, tzinfo=UTC)
+
+
+@pytest.fixture
+async def payments(
+    db_session: AsyncSession,
+    db_engine: AsyncEngine,
+) -> BaseRepository[RollupTestPayment]:
+    """Create the payment and summary tables with the rollup triggers."""
+    async with db_engine.begin() as conn:
+        await conn.run_sync(RollupTestPayment.metadata.create_all)
+        for statement in rollup_trigger_ddl(DAILY_PAYMENTS):
+            await conn.exec_driver_sql(statement)
+
+    return BaseRepository(db_session, RollupTestPayment)
+
+
+@pytest.mark.integration
+class TestRollupMaintenance:
+    """Test summaries follow inserts, updates and deletes."""
+
+    async def test_summaries_follow_writes(
+        self,
+        payments: BaseRepository[RollupTestPayment],
+        db_session: AsyncSession,
+    ) -> None:
+        """Test every write path updates the summary rows it touches."""
+        # Arrange
+        for category, amount, paid_at in [
+            ("card", "10.50", FIRST_DAY.replace(hour=9)),
+            ("card", "4.50", FIRST_DAY.replace(hour=17)),
+            (None, "7.00", FIRST_DAY.replace(hour=12)),
+            ("cash", "3.00", SECOND_DAY),
+        ]:
+            await payments.create(
+                RollupTestPayment(
+                    category=category, amount=Decimal(amount), paid_at=paid_at
+                )
+            )
+
+        # Act
+        await db_session.execute(
+            update(RollupTestPayment)
+            .where(RollupTestPayment.category == "cash")
+            .values(category="card", amount=Decimal("5.00"))
+        )
+        await db_session.execute(
+            delete(RollupTestPayment).where(RollupTestPayment.category.is_(None))
+        )
+        rows = await rollup_rows(db_session, DAILY_PAYMENTS, start=FIRST_DAY)
+
+        # Assert
+        assert [tuple(row) for row in rows] == [
+            (FIRST_DAY, "card", 2, Decimal("15.00")),
+            (SECOND_DAY, "card", 1, Decimal("5.00")),
+        ]
+        assert await reconcile_rollup(db_session, DAILY_PAYMENTS) == RollupCheck(
+            "test_rollup_daily_payments", 0, repaired=False
+        )
+
+    async def test_concurrent_writes_to_shared_buckets(
+        self,
+        payments: BaseRepository[RollupTestPayment],
+        db_engine: AsyncEngine,
+    ) -> None:
+        """Test concurrent statements touching the same buckets don't deadlock."""
+        # Arrange
+        _ = payments
+        days = [FIRST_DAY + timedelta(days=offset) for offset in range(6)]
+
+        async def write_rounds(writer: int) -> None:
+            # Every writer touches all buckets, each starting at another one
+            rotated = days[writer:] + days[:writer]
+            for _round in range(10):
+                async with db_engine.begin() as conn:
+                    await conn.execute(
+                        insert(RollupTestPayment),
+                        [
+                            {"category": "card", "amount": Decimal(1), "paid_at": day}
+                            for day in (*rotated, *reversed(rotated))
+                        ],
+                    )
+
+        # Act
+        try:
+            await asyncio.gather(*(write_rounds(writer) for writer in range(4)))
+            async with AsyncSession(db_engine) as session:
+                rows = await rollup_rows(session, DAILY_PAYMENTS)
+                check = await reconcile_rollup(session, DAILY_PAYMENTS)
+        finally:
+            async with db_engine.begin() as conn:
+                await conn.execute(
+                    text(
+                        "TRUNCATE test_rollup_payment_isolated, "
+                        "test_rollup_daily_payments"
+                    )
+                )
+
+        # Assert
+        assert [tuple(row) for row in rows] == [
+            (day, "card", 80, Decimal("80.00")) for day in days
+        ]
+        assert check.mismatches == 0
+
+    async def test_drifted_summaries_repaired(
+        self,
+        payments: BaseRepository[RollupTestPayment],
+        db_session: AsyncSession,
+    ) -> None:
+        """Test reconciliation finds drifted summaries and rebuilds them."""
+        # Arrange
+        await payments.create(
+            RollupTestPayment(category="card", amount=Decimal(2), paid_at=FIRST_DAY)
+        )
+        await db_session.execute(
+            text("UPDATE test_rollup_daily_payments SET row_count = 5")
+        )
+
+        # Act
+        check = await reconcile_rollup(db_session, DAILY_PAYMENTS, repair=True)
+
+        # Assert
+        assert check == RollupCheck("test_rollup_daily_payments", 2, repaired=True)
+        rows = await rollup_rows(db_session, DAILY_PAYMENTS)
+        assert [tuple(row) for row in rows] == [(FIRST_DAY, "card", 1, Decimal("2.00"))]
+        assert (await reconcile_rollup(db_session, DAILY_PAYMENTS)).mismatches == 0
@@ -20,6 +20,9 @@ def mock_api_main_dependencies(mocker: MockerFixture) -> None:
     mocker.patch("src.api.main.close_database", new_callable=mocker.AsyncMock)
     mocker.patch("src.api.main.setup_logging")
     mocker.patch("src.api.main.setup_tracing")
+    mocker.patch("src.api.main.setup_metrics")
+    mocker.patch("src.api.main.configure_gc")
+    mocker.patch("src.api.main.freeze_gc")
     mocker.patch("src.api.main.register_exception_handlers")
     mocker.patch("src.api.main.instrument_app")
     mocker.patch("src.api.main.SecurityHeadersMiddleware")
@@ -500,6 +500,8 @@ def mock_log_config(mocker: MockerFixture) -> MockType:
     config = mocker.Mock(spec=LogConfig)
     config.excluded_paths = ["/health", "/metrics"]
     config.slow_request_threshold_ms = 1000
+    config.enable_request_accounting = False
+    config.request_alloc_sample_rate = 0.0
     return cast("MockType", config)
 
 
@@ -0,0 +1,234 @@
+"""Unit tests for src/api/middleware/request_deadline.py module.
+
+This module tests deadline computation, cancellation at the deadline and on
+client disconnect, and the route-level request_timeout dependency.
+"""
+
+import asyncio
+import json
+
+import pytest
+from starlette.types import Message, Receive, Scope, Send
+
+from src.api.middleware.request_deadline import (
+    RequestDeadlineMiddleware,
+    parse_timeout_header,
+    request_timeout,
+)
+from src.core.context import Deadline, RequestContext
+
+
+def make_scope(headers: list[tuple[bytes, bytes]] | None = None) -> Scope:
+    """Build a minimal HTTP scope."""
+    return {
+        "type": "http",
+        "method": "GET",
+        "path": "/items",
+        "headers": headers or [],
+    }
+
+
+class ASGIRecorder:
+    """Client side of an ASGI call recording sent messages."""
+
+    def __init__(self, *, disconnect: bool = False) -> None:
+        self.sent: list[Message] = []
+        self._disconnect = disconnect
+        self._requested = False
+
+    async def receive(self) -> Message:
+        """Deliver the empty request body, then wait for or signal disconnect."""
+        if not self._requested:
+            self._requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        if self._disconnect:
+            return {"type": "http.disconnect"}
+        await asyncio.Event().wait()  # Client keeps the connection open
+        return {"type": "http.disconnect"}  # pragma: no cover
+
+    async def send(self, message: Message) -> None:
+        """Record a message sent by the application."""
+        self.sent.append(message)
+
+
+async def ok_app(_scope: Scope, _receive: Receive, send: Send) -> None:
+    """Application responding immediately."""
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+@pytest.mark.unit
+class TestParseTimeoutHeader:
+    """Tests for parse_timeout_header."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (None, None),
+            ("", None),
+            ("2.5", 2.5),
+            ("0", None),
+            ("-1", None),
+            ("inf", None),
+            ("soon", None),
+        ],
+    )
+    def test_parse_timeout_header(
+        self, value: str | None, expected: float | None
+    ) -> None:
+        """Verify only positive finite numbers are accepted."""
+        assert parse_timeout_header(value) == expected
+
+
+@pytest.mark.unit
+class TestRequestDeadlineMiddleware:
+    """Tests for RequestDeadlineMiddleware."""
+
+    async def test_completed_request_passes_through(self) -> None:
+        """Verify a fast request is forwarded unchanged and the deadline cleared."""
+        client = ASGIRecorder()
+        middleware = RequestDeadlineMiddleware(ok_app, timeout_s=5.0)
+
+        await middleware(make_scope(), client.receive, client.send)
+
+        assert [message["type"] for message in client.sent] == [
+            "http.response.start",
+            "http.response.body",
+        ]
+        assert RequestContext.get_deadline() is None
+
+    @pytest.mark.parametrize(
+        ("header", "expected_timeout"),
+        [(b"2", 2.0), (b"60", 10.0), (b"invalid", 10.0)],
+    )
+    async def test_deadline_visible_to_handler(
+        self, header: bytes, expected_timeout: float
+    ) -> None:
+        """Verify the header can only shorten the default deadline."""
+        remaining: list[float] = []
+
+        async def app(scope: Scope, receive: Receive, send: Send) -> None:
+            deadline = RequestContext.get_deadline()
+            assert deadline is not None
+            remaining.append(deadline.remaining())
+            await ok_app(scope, receive, send)
+
+        client = ASGIRecorder()
+        middleware = RequestDeadlineMiddleware(app, timeout_s=10.0)
+
+        await middleware(
+            make_scope([(b"x-request-timeout", header)]), client.receive, client.send
+        )
+
+        assert expected_timeout - 1 < remaining[0] <= expected_timeout
+
+    async def test_deadline_cancels_handler_with_504(self) -> None:
+        """Verify an overdue handler is cancelled and answered with a 504."""
+        cancelled = asyncio.Event()
+
+        async def slow_app(_scope: Scope, _receive: Receive, _send: Send) -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        client = ASGIRecorder()
+        middleware = RequestDeadlineMiddleware(slow_app, timeout_s=0.05)
+
+        await middleware(make_scope(), client.receive, client.send)
+
+        assert cancelled.is_set()
+        assert client.sent[0]["status"] == 504
+        body = json.loads(client.sent[1]["body"])
+        assert body["error_code"] == "DEADLINE_EXCEEDED"
+
+    async def test_disconnect_cancels_handler(self) -> None:
+        """Verify a client disconnect cancels the handler without a response."""
+        cancelled = asyncio.Event()
+
+        async def slow_app(_scope: Scope, _receive: Receive, _send: Send) -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        client = ASGIRecorder(disconnect=True)
+        middleware = RequestDeadlineMiddleware(slow_app, timeout_s=10.0)
+
+        await asyncio.wait_for(
+            middleware(make_scope(), client.receive, client.send), timeout=1.0
+        )
+
+        assert cancelled.is_set()
+        assert client.sent == []
+
+    async def test_handler_reads_body_before_disconnect_watch(self) -> None:
+        """Verify requests with a body deliver it to the handler unchanged."""
+        received: list[Message] = []
+
+        async def echo_app(scope: Scope, receive: Receive, send: Send) -> None:
+            received.append(await receive())
+            await ok_app(scope, receive, send)
+
+        client = ASGIRecorder()
+        middleware = RequestDeadlineMiddleware(echo_app, timeout_s=5.0)
+
+        await middleware(
+            make_scope([(b"content-length", b"0")]), client.receive, client.send
+        )
+
+        assert received == [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def test_handler_errors_propagate(self) -> None:
+        """Verify exceptions of the handler reach the outer middleware."""
+
+        async def failing_app(_scope: Scope, _receive: Receive, _send: Send) -> None:
+            raise RuntimeError("boom")
+
+        client = ASGIRecorder()
+        middleware = RequestDeadlineMiddleware(failing_app, timeout_s=5.0)
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await middleware(make_scope(), client.receive, client.send)
+
+    async def test_non_http_scope_passes_through(self) -> None:
+        """Verify lifespan and websocket scopes are not wrapped."""
+        seen: list[Scope] = []
+
+        async def app(scope: Scope, _receive: Receive, _send: Send) -> None:
+            seen.append(scope)
+
+        client = ASGIRecorder()
+        scope: Scope = {"type": "lifespan"}
+
+        await RequestDeadlineMiddleware(app, timeout_s=5.0)(
+            scope, client.receive, client.send
+        )
+
+        assert seen == [scope]
+
+
+@pytest.mark.unit
+class TestRequestTimeoutDependency:
+    """Tests for request_timeout."""
+
+    @pytest.mark.usefixtures("clean_context")
+    def test_route_timeout_tightens_deadline(self) -> None:
+        """Verify the route default shortens but never extends the deadline."""
+        deadline = Deadline.after(30.0)
+        RequestContext.set_deadline(deadline)
+
+        request_timeout(5.0)()
+        assert deadline.remaining() <= 5.0
+
+        request_timeout(60.0)()
+        assert deadline.remaining() <= 5.0
+
+    @pytest.mark.usefixtures("clean_context")
+    def test_route_timeout_without_deadline(self) -> None:
+        """Verify the dependency is a no-op outside of the middleware."""
+        request_timeout(5.0)()
+
+        assert RequestContext.get_deadline() is None
@@ -6,9 +6,12 @@ from typing import cast
 
 import pytest
 from pytest_mock import MockerFixture, MockType
+from starlette.requests import Request
+from starlette.responses import Response
 
 from src.api.middleware.request_logging import RequestLoggingMiddleware
 from src.core.config import Settings
+from src.core.resource_usage import get_request_usage, request_usage_scope
 
 
 @pytest.mark.unit
@@ -744,3 +747,95 @@ class TestRequestLoggingMiddleware:
             "request_size",
         }
         assert set(context_args.keys()) == expected_fields
+
+    async def test_request_accounting_fields_logged(
+        self,
+        mocker: MockerFixture,
+        mock_log_config: MockType,
+        mock_settings: Settings,
+        mock_request_factory: Callable[..., MockType],
+        mock_response_factory: Callable[..., MockType],
+    ) -> None:
+        """Test resource usage collected downstream is added to the log."""
+        mock_log_config.enable_request_accounting = True
+        mocker.patch(
+            "src.api.middleware.request_logging.get_settings",
+            return_value=mock_settings,
+        )
+        mock_app = mocker.Mock()
+        middleware = RequestLoggingMiddleware(mock_app, log_config=mock_log_config)
+        response = mock_response_factory()
+
+        async def call_next(_request: Request) -> Response:
+            usage = get_request_usage()
+            assert usage is not None
+            usage.add_db_statement(2_000_000)
+            usage.add_pool_wait(500_000)
+            return cast("Response", response)
+
+        mock_logger = mocker.patch("src.api.middleware.request_logging.logger")
+        mock_logger.contextualize.return_value = mocker.MagicMock()
+
+        request = mock_request_factory()
+        request.scope = {"type": "http", "path": "/api/test"}
+
+        await middleware.dispatch(request, call_next)
+
+        completed = next(
+            call
+            for call in mock_logger.info.call_args_list
+            if call.args[0] == "Request completed"
+        )
+        assert completed.kwargs["db_statements"] == 1
+        assert completed.kwargs["db_time_ms"] == 2.0
+        assert completed.kwargs["pool_wait_ms"] == 0.5
+        assert "cpu_ms" in completed.kwargs
+        assert "alloc_bytes" not in completed.kwargs
+        assert get_request_usage() is None
+
+    async def test_request_accounting_wraps_downstream_app(
+        self,
+        mocker: MockerFixture,
+        mock_log_config: MockType,
+        mock_settings: Settings,
+    ) -> None:
+        """Test the downstream app is driven through the CPU usage tracker."""
+        mock_log_config.enable_request_accounting = True
+        mocker.patch(
+            "src.api.middleware.request_logging.get_settings",
+            return_value=mock_settings,
+        )
+        mocker.patch(
+            "src.core.resource_usage.time.thread_time_ns", side_effect=[0, 5_000]
+        )
+        downstream = mocker.AsyncMock()
+        middleware = RequestLoggingMiddleware(downstream, log_config=mock_log_config)
+        scope = {"type": "http"}
+
+        with request_usage_scope() as usage:
+            await middleware.app(scope, mocker.Mock(), mocker.Mock())
+
+        downstream.assert_awaited_once()
+        assert usage.cpu_time_ns == 5_000
+
+    def test_alloc_sampling_starts_tracemalloc(
+        self,
+        mocker: MockerFixture,
+        mock_log_config: MockType,
+        mock_settings: Settings,
+    ) -> None:
+        """Test a positive sample rate starts tracemalloc once."""
+        mock_log_config.enable_request_accounting = True
+        mock_log_config.request_alloc_sample_rate = 0.1
+        mocker.patch(
+            "src.api.middleware.request_logging.get_settings",
+            return_value=mock_settings,
+        )
+        mock_tracemalloc = mocker.patch(
+            "src.api.middleware.request_logging.tracemalloc"
+        )
+        mock_tracemalloc.is_tracing.return_value = False
+
+        RequestLoggingMiddleware(mocker.Mock(), log_config=mock_log_config)
+
+        mock_tracemalloc.start.assert_called_once()
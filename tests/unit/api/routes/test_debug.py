@@ -0,0 +1,157 @@
+"""Unit tests for src/api/routes/debug.py module.
+
+This module tests the access control and mounting rules of the debug
+router, the task stack endpoint, the query statistics endpoints and the
+slow query plan endpoints.
+"""
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.api.routes.debug import (
+    clear_slow_plans,
+    query_stats,
+    require_debug_access,
+    reset_query_stats,
+    should_mount_debug_router,
+    slow_plans,
+    task_stacks,
+)
+from src.core.config import Settings
+from src.core.exceptions import UnauthorizedError
+
+
+@pytest.mark.unit
+class TestDebugAccess:
+    """Tests for debug endpoint protection."""
+
+    async def test_access_allowed_without_configured_token(
+        self, mock_settings: Settings
+    ) -> None:
+        """Verify access is open when no token is configured."""
+        mock_settings.observability_config.debug_token = None
+
+        await require_debug_access(mock_settings, None)
+
+    async def test_access_allowed_with_matching_token(
+        self, mock_settings: Settings
+    ) -> None:
+        """Verify the configured token grants access."""
+        mock_settings.observability_config.debug_token = "s3cr3t"
+
+        await require_debug_access(mock_settings, "s3cr3t")
+
+    @pytest.mark.parametrize("provided", [None, "", "wrong"])
+    async def test_access_denied_with_bad_token(
+        self, mock_settings: Settings, provided: str | None
+    ) -> None:
+        """Verify missing or wrong tokens are rejected."""
+        mock_settings.observability_config.debug_token = "s3cr3t"
+
+        with pytest.raises(UnauthorizedError):
+            await require_debug_access(mock_settings, provided)
+
+    @pytest.mark.parametrize(
+        ("enabled", "environment", "token", "expected"),
+        [
+            (False, "development", None, False),
+            (True, "development", None, True),
+            (True, "staging", None, True),
+            (True, "production", None, False),
+            (True, "production", "s3cr3t", True),
+        ],
+    )
+    def test_should_mount_debug_router(
+        self,
+        mock_settings: Settings,
+        enabled: bool,
+        environment: str,
+        token: str | None,
+        expected: bool,
+    ) -> None:
+        """Verify the router is only mounted when enabled and protected."""
+        mock_settings.observability_config.enable_debug_endpoints = enabled
+        mock_settings.observability_config.debug_token = token
+        mock_settings.environment = environment  # type: ignore[assignment]
+
+        assert should_mount_debug_router(mock_settings) is expected
+
+
+@pytest.mark.unit
+class TestTaskStacksEndpoint:
+    """Tests for the /debug/tasks endpoint."""
+
+    async def test_task_stacks_returns_dump(self, mocker: MockerFixture) -> None:
+        """Verify the endpoint wraps the task dump with a count."""
+        dump = [{"name": "Task-1"}, {"name": "Task-2"}]
+        mocker.patch("src.api.routes.debug.dump_task_stacks", return_value=dump)
+
+        result = await task_stacks()
+
+        assert result == {"task_count": 2, "tasks": dump}
+
+
+@pytest.mark.unit
+class TestQueryStatsEndpoints:
+    """Tests for the /debug/query-stats endpoints."""
+
+    async def test_query_stats_returns_snapshot(self, mocker: MockerFixture) -> None:
+        """Verify the endpoint forwards limit and ordering to the aggregator."""
+        aggregator = mocker.Mock()
+        aggregator.snapshot.return_value = {"statements": []}
+        mocker.patch("src.api.routes.debug.get_query_stats", return_value=aggregator)
+        cache_stats = mocker.patch("src.api.routes.debug.get_statement_cache_stats")
+        cache_stats.return_value.as_dict.return_value = {"hit_rate": 0.9}
+
+        result = await query_stats(limit=5, order_by="p99")
+
+        aggregator.snapshot.assert_called_once_with(limit=5, order_by="p99")
+        assert result == {"statements": [], "statement_cache": {"hit_rate": 0.9}}
+
+    async def test_reset_query_stats(self, mocker: MockerFixture) -> None:
+        """Verify the delete endpoint resets the aggregator."""
+        aggregator = mocker.Mock()
+        mocker.patch("src.api.routes.debug.get_query_stats", return_value=aggregator)
+        cache_stats = mocker.patch("src.api.routes.debug.get_statement_cache_stats")
+
+        await reset_query_stats()
+
+        aggregator.reset.assert_called_once()
+        cache_stats.return_value.reset.assert_called_once()
+
+
+@pytest.mark.unit
+class TestSlowPlansEndpoints:
+    """Tests for the /debug/slow-plans endpoints."""
+
+    async def test_slow_plans_returns_captured_plans(
+        self, mocker: MockerFixture, mock_settings: Settings
+    ) -> None:
+        """Verify captured plans are returned when capture is enabled."""
+        mock_settings.database_config.explain_slow_queries = True
+        captured = [{"fingerprint": "abcd", "plan_hash": "1234"}]
+        mock_capture = mocker.patch("src.api.routes.debug.get_plan_capture")
+        mock_capture.return_value.plans.return_value = captured
+
+        result = await slow_plans(mock_settings)
+
+        assert result == {"enabled": True, "plan_count": 1, "plans": captured}
+
+    async def test_slow_plans_when_disabled(
+        self, mocker: MockerFixture, mock_settings: Settings
+    ) -> None:
+        """Verify the capture is not created when disabled."""
+        mock_capture = mocker.patch("src.api.routes.debug.get_plan_capture")
+
+        result = await slow_plans(mock_settings)
+
+        assert result == {"enabled": False, "plan_count": 0, "plans": []}
+        mock_capture.assert_not_called()
+
+    async def test_clear_slow_plans(self, mocker: MockerFixture) -> None:
+        """Verify the clear endpoint discards captured plans."""
+        mock_capture = mocker.patch("src.api.routes.debug.get_plan_capture")
+
+        await clear_slow_plans()
+
+        mock_capture.return_value.clear.assert_called_once_with()
@@ -13,8 +13,10 @@ import types
 import pytest
 from fastapi import FastAPI
 from pytest_mock import MockerFixture, MockType
+from sqlalchemy.pool import QueuePool
 
 from src.core.config import Settings
+from src.infrastructure.database.session import create_database_engine
 
 
 def get_main_module() -> types.ModuleType:
@@ -150,6 +152,94 @@ class TestLifespan:
         mock_logger.info.assert_any_call("Application shutdown initiated")
         mock_logger.info.assert_any_call("Application shutdown complete")
 
+    @pytest.mark.timeout(1)
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("freeze_enabled", [True, False])
+    async def test_lifespan_freezes_gc_after_startup(
+        self,
+        mocker: MockerFixture,
+        mock_settings: Settings,
+        freeze_enabled: bool,
+    ) -> None:
+        """Test GC is frozen after startup only when enabled in settings."""
+        mock_settings.runtime_config.gc_freeze_on_startup = freeze_enabled
+        mocker.patch("src.api.main.get_settings", return_value=mock_settings)
+        mocker.patch(
+            "src.api.main.check_database_connection",
+            new_callable=mocker.AsyncMock,
+            return_value=(True, None),
+        )
+        mock_freeze_gc = mocker.patch("src.api.main.freeze_gc")
+
+        main = get_main_module()
+
+        async with main.lifespan(mocker.Mock()):
+            assert mock_freeze_gc.called is freeze_enabled
+
+    @pytest.mark.timeout(1)
+    @pytest.mark.asyncio
+    async def test_lifespan_runs_loop_monitor_when_enabled(
+        self,
+        mocker: MockerFixture,
+        mock_settings: Settings,
+    ) -> None:
+        """Test the event loop monitor is started and stopped with the app."""
+        mock_settings.runtime_config.enable_loop_monitor = True
+        mocker.patch("src.api.main.get_settings", return_value=mock_settings)
+        mocker.patch(
+            "src.api.main.check_database_connection",
+            new_callable=mocker.AsyncMock,
+            return_value=(True, None),
+        )
+        mock_monitor = mocker.Mock()
+        mock_monitor.stop = mocker.AsyncMock()
+        mock_monitor_class = mocker.patch("src.api.main.EventLoopMonitor")
+        mock_monitor_class.from_settings.return_value = mock_monitor
+
+        main = get_main_module()
+
+        async with main.lifespan(mocker.Mock()):
+            mock_monitor.start.assert_called_once()
+            mock_monitor.stop.assert_not_called()
+
+        mock_monitor.stop.assert_awaited_once()
+
+    @pytest.mark.timeout(1)
+    @pytest.mark.asyncio
+    async def test_lifespan_runs_query_stats_summary_task(
+        self,
+        mocker: MockerFixture,
+        mock_settings: Settings,
+    ) -> None:
+        """Test the periodic query statistics summary is started and cancelled."""
+        mock_settings.database_config.query_stats_log_interval_s = 60
+        mocker.patch("src.api.main.get_settings", return_value=mock_settings)
+        mocker.patch(
+            "src.api.main.check_database_connection",
+            new_callable=mocker.AsyncMock,
+            return_value=(True, None),
+        )
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def fake_summary(interval: float) -> None:
+            assert interval == 60
+            started.set()
+            try:
+                await asyncio.sleep(3600)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        mocker.patch("src.api.main.log_query_stats_periodically", fake_summary)
+
+        main = get_main_module()
+
+        async with main.lifespan(mocker.Mock()):
+            await started.wait()
+
+        assert cancelled.is_set()
+
 
 @pytest.mark.unit
 class TestCreateApp:
@@ -187,6 +277,8 @@ class TestCreateApp:
         # Verify setup functions were called
         mock_setup_logging.assert_called_once_with(mock_settings)
         mock_setup_tracing.assert_called_once_with(mock_settings)
+        main.setup_metrics.assert_called_once_with(mock_settings)
+        main.configure_gc.assert_called_once_with(mock_settings)
 
         # Verify FastAPI was initialized with correct parameters
         mock_fastapi.assert_called_once()
@@ -203,7 +295,7 @@ class TestCreateApp:
         mock_register_exception_handlers.assert_called_once_with(mock_app)
 
         # Verify middleware added in correct order
-        assert mock_app.add_middleware.call_count == 3
+        assert mock_app.add_middleware.call_count == 4
 
         # Verify instrumentation
         mock_instrument_app.assert_called_once_with(mock_app, mock_settings)
@@ -261,6 +353,7 @@ class TestCreateApp:
         """Test middleware are registered in correct order."""
         # Configure mocks
         mocker.patch("src.api.main.get_settings", return_value=mock_settings)
+        mock_req_deadline = mocker.patch("src.api.main.RequestDeadlineMiddleware")
         mock_req_logging = mocker.patch("src.api.main.RequestLoggingMiddleware")
         mock_req_context = mocker.patch("src.api.main.RequestContextMiddleware")
         mock_security = mocker.patch("src.api.main.SecurityHeadersMiddleware")
@@ -277,12 +370,14 @@ class TestCreateApp:
 
         # Verify middleware added in correct order
         calls = mock_app.add_middleware.call_args_list
-        assert len(calls) == 3
+        assert len(calls) == 4
 
         # Order of middleware registration (reverse execution order)
-        assert calls[0][0][0] == mock_req_logging
-        assert calls[1][0][0] == mock_req_context
-        assert calls[2][0][0] == mock_security
+        assert calls[0][0][0] == mock_req_deadline
+        assert calls[0][1] == {"timeout_s": mock_settings.request_timeout_s}
+        assert calls[1][0][0] == mock_req_logging
+        assert calls[2][0][0] == mock_req_context
+        assert calls[3][0][0] == mock_security
 
     @pytest.mark.timeout(1)
     def test_create_app_exception_handlers_before_middleware(
@@ -772,7 +867,7 @@ class TestEdgeCases:
         )
 
         # Mock the engine and pool
-        mock_pool = mocker.Mock()
+        mock_pool = mocker.Mock(spec=QueuePool)
         mock_pool.checkedout.return_value = 3
         mock_pool.size.return_value = 10
         mock_pool.overflow.return_value = 2
@@ -805,3 +900,48 @@ class TestEdgeCases:
         mock_logger.bind.return_value.info.assert_called_once_with(
             "Database pool health check"
         )
+
+    @pytest.mark.timeout(1)
+    @pytest.mark.asyncio
+    async def test_health_endpoint_behind_transaction_pooler(
+        self,
+        mocker: MockerFixture,
+        monkeypatch: pytest.MonkeyPatch,
+        mock_settings: Settings,
+        mock_app_with_route_capture: MockType,
+    ) -> None:
+        """Test health endpoint logs the status of engines without a pool."""
+        # Configure mocks
+        _ = mock_settings
+        monkeypatch.setenv("DATABASE_CONFIG__POOLER_MODE", "transaction")
+        pooler_settings = Settings()
+        mocker.patch(
+            "src.infrastructure.database.session.get_settings",
+            return_value=pooler_settings,
+        )
+        engine = create_database_engine("postgresql+asyncpg://test@localhost/test")
+        mocker.patch(
+            "src.api.main.check_database_connection",
+            new_callable=mocker.AsyncMock,
+            return_value=(True, None),
+        )
+        mocker.patch("src.api.main.get_engine", return_value=engine)
+        mock_logger = mocker.patch("src.api.main.logger")
+        mocker.patch("src.api.main.get_settings", return_value=pooler_settings)
+        mocker.patch("src.api.main.FastAPI", return_value=mock_app_with_route_capture)
+
+        # Get create_app function
+        main = get_main_module()
+        main.create_app()
+
+        # Get and call the health handler
+        health_handler = mock_app_with_route_capture._captured_routes["/health"]
+        result = await health_handler()
+        await engine.dispose()
+
+        # Verify result
+        assert result == {"status": "healthy", "database": True}
+        assert not isinstance(engine.pool, QueuePool)
+        mock_logger.bind.assert_called_once_with(
+            metric_type="db.pool.health", status=engine.pool.status()
+        )
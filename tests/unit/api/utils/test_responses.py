@@ -1,17 +1,25 @@
 """Unit tests for API response utilities.
 
 This module tests the ORJSONResponse class which provides high-performance
-JSON serialization using orjson for FastAPI applications.
+JSON serialization using orjson for FastAPI applications, and the streaming
+CSV export response.
 """
 
-from typing import Any
+import gzip
+from collections.abc import AsyncIterator
+from typing import Any, cast
 
 import pytest
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from pytest_mock import MockerFixture
 
-from src.api.utils.responses import ORJSONResponse
+from src.api.utils.responses import (
+    CSVStreamingResponse,
+    ORJSONResponse,
+    accepts_gzip,
+    gzip_chunks,
+)
 
 
 @pytest.mark.unit
@@ -345,3 +353,72 @@ class TestORJSONResponse:
 
         # Verify all calls were made
         assert mock_orjson.dumps.call_count == 3
+
+
+async def csv_chunks() -> AsyncIterator[bytes]:
+    """Produce a small CSV export in chunks."""
+    for chunk in (b"id,name\n", b"1,alpha\n", b"2,beta\n"):
+        yield chunk
+
+
+@pytest.mark.unit
+class TestAcceptsGzip:
+    """Test suite for accepts_gzip."""
+
+    @pytest.mark.parametrize(
+        ("accept_encoding", "expected"),
+        [
+            (None, False),
+            ("", False),
+            ("br", False),
+            ("gzip", True),
+            ("br, GZIP;q=0.8", True),
+            ("gzip;q=0", False),
+            ("*", True),
+        ],
+    )
+    def test_accepts_gzip(self, accept_encoding: str | None, expected: bool) -> None:
+        """Test gzip negotiation from the Accept-Encoding header."""
+        assert accepts_gzip(accept_encoding) is expected
+
+
+@pytest.mark.unit
+class TestCSVStreamingResponse:
+    """Test suite for CSVStreamingResponse and gzip_chunks."""
+
+    async def test_streams_chunks_with_download_headers(self) -> None:
+        """Test chunks are sent unchanged with CSV and attachment headers."""
+        response = CSVStreamingResponse(csv_chunks(), filename='in"voices.csv')
+
+        body = [chunk async for chunk in response.body_iterator]
+
+        assert body == [b"id,name\n", b"1,alpha\n", b"2,beta\n"]
+        assert response.headers["content-type"] == "text/csv; charset=utf-8"
+        assert (
+            response.headers["content-disposition"]
+            == 'attachment; filename="invoices.csv"'
+        )
+        assert "content-encoding" not in response.headers
+
+    async def test_gzip_compression(self) -> None:
+        """Test the compressed body decompresses to the original CSV."""
+        response = CSVStreamingResponse(csv_chunks(), compress=True)
+
+        body = b"".join(
+            [cast("bytes", chunk) async for chunk in response.body_iterator]
+        )
+
+        assert gzip.decompress(body) == b"id,name\n1,alpha\n2,beta\n"
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+
+    async def test_gzip_chunks_empty_stream(self) -> None:
+        """Test an empty stream still produces a valid gzip member."""
+
+        async def empty() -> AsyncIterator[bytes]:
+            return
+            yield  # pragma: no cover
+
+        body = b"".join([chunk async for chunk in gzip_chunks(empty())])
+
+        assert gzip.decompress(body) == b""
@@ -617,6 +617,8 @@ def mock_observability_settings(
     mock_obs_config.exporter_endpoint = None
     mock_obs_config.gcp_project_id = None
     mock_obs_config.trace_sample_rate = 1.0
+    mock_obs_config.enable_metrics = True
+    mock_obs_config.metrics_export_interval_ms = 60000
 
     # Replace the observability_config with our mock
     settings.observability_config = mock_obs_config
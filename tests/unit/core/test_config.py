@@ -18,6 +18,7 @@ from src.core.config import (
     DatabaseConfig,
     LogConfig,
     ObservabilityConfig,
+    RuntimeConfig,
     Settings,
     get_config_defaults,
     get_settings,
@@ -38,6 +39,8 @@ class TestLogConfig:
         assert config.slow_request_threshold_ms == 1000
         assert config.enable_sql_logging is False
         assert config.slow_query_threshold_ms == 100
+        assert config.enable_request_accounting is True
+        assert config.request_alloc_sample_rate == 0.0
         assert config.sensitive_fields == [
             "password",
             "token",
@@ -53,10 +56,12 @@ class TestLogConfig:
             ("slow_request_threshold_ms", -1, "greater than 0"),
             ("slow_query_threshold_ms", 0, "greater than 0"),
             ("slow_query_threshold_ms", -100, "greater than 0"),
+            ("request_alloc_sample_rate", -0.1, "greater than or equal to 0"),
+            ("request_alloc_sample_rate", 1.5, "less than or equal to 1"),
         ],
     )
     def test_field_validation(
-        self, field: str, value: int, expected_error: str
+        self, field: str, value: float, expected_error: str
     ) -> None:
         """Verify field constraints are enforced."""
         with pytest.raises(ValidationError) as exc_info:
@@ -147,6 +152,10 @@ class TestObservabilityConfig:
         assert config.exporter_endpoint is None
         assert config.gcp_project_id is None
         assert config.trace_sample_rate == 1.0
+        assert config.enable_metrics is True
+        assert config.metrics_export_interval_ms == 60000
+        assert config.enable_debug_endpoints is False
+        assert config.debug_token is None
 
     @pytest.mark.parametrize(
         ("field", "input_value", "expected_value"),
@@ -237,7 +246,47 @@ class TestDatabaseConfig:
         assert config.max_overflow == 5
         assert config.pool_timeout == 30.0
         assert config.pool_pre_ping is True
+        assert config.pool_pre_ping_idle_seconds == 30.0
         assert config.echo is False
+        assert config.read_only_session_mode == "transaction"
+        assert config.deadline_statement_timeout is True
+        analytics = config.engine_profiles["analytics"]
+        assert analytics.pool_size == 2
+        assert analytics.jit is True
+        assert analytics.statement_timeout_ms == 300_000
+        assert config.n_plus_one_detection is None
+        assert config.n_plus_one_threshold == 10
+        assert config.statement_cache_size == 100
+        assert config.max_cached_statement_lifetime == 300
+        assert config.sql_commenter_mode == "stable"
+        assert config.pooler_mode == "none"
+        assert config.pooler_pool_size == 0
+        assert config.enable_query_metrics is True
+        assert config.enable_query_stats is True
+        assert config.query_stats_max_entries == 500
+        assert config.query_stats_log_interval_s == 300
+        assert config.explain_slow_queries is False
+        assert config.explain_analyze is False
+        assert config.explain_max_plans == 100
+        assert config.explain_timeout_ms == 5000
+
+    def test_engine_profile_overrides_keep_defaults(self) -> None:
+        """Verify partial profile overrides merge into the built-in defaults."""
+        config = DatabaseConfig.model_validate(
+            {
+                "engine_profiles": {
+                    "analytics": {"pool_size": 4},
+                    "batch": {"work_mem": "256MB"},
+                }
+            }
+        )
+
+        analytics = config.engine_profiles["analytics"]
+        assert analytics.pool_size == 4
+        assert analytics.jit is True
+        assert analytics.work_mem == "64MB"
+        assert config.engine_profiles["batch"].work_mem == "256MB"
+        assert config.engine_profiles["batch"].jit is False
 
     @pytest.mark.parametrize(
         ("url", "is_valid"),
@@ -346,6 +395,44 @@ class TestDatabaseConfig:
         assert config.get_test_database_url() == expected_url
 
 
+@pytest.mark.unit
+class TestRuntimeConfig:
+    """Tests for the RuntimeConfig model."""
+
+    def test_default_values(self) -> None:
+        """Verify RuntimeConfig defaults are correct."""
+        config = RuntimeConfig()
+
+        assert config.gc_freeze_on_startup is True
+        assert config.gc_thresholds is None
+        assert config.enable_gc_metrics is True
+        assert config.enable_loop_monitor is False
+        assert config.loop_monitor_interval_ms == 100
+        assert config.loop_lag_threshold_ms == 250
+
+    def test_gc_thresholds_accepts_valid_values(self) -> None:
+        """Verify valid GC thresholds are accepted."""
+        config = RuntimeConfig(gc_thresholds=(50000, 20, 100))
+        assert config.gc_thresholds == (50000, 20, 100)
+
+    def test_gc_thresholds_rejects_negative_values(self) -> None:
+        """Verify negative GC thresholds are rejected."""
+        with pytest.raises(ValidationError) as exc_info:
+            RuntimeConfig(gc_thresholds=(700, -1, 10))
+        error = exc_info.value.errors()[0]
+        assert error["loc"] == ("gc_thresholds",)
+
+    def test_gc_thresholds_from_environment(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify GC thresholds can be set via nested environment variables."""
+        monkeypatch.setenv("RUNTIME_CONFIG__GC_THRESHOLDS", "[10000, 50, 50]")
+
+        settings = Settings()
+
+        assert settings.runtime_config.gc_thresholds == (10000, 50, 50)
+
+
 @pytest.mark.unit
 class TestSettings:
     """Tests for the main Settings class."""
@@ -369,6 +456,7 @@ class TestSettings:
         assert settings.docs_url == "/docs"
         assert settings.redoc_url == "/redoc"
         assert settings.openapi_url == "/openapi.json"
+        assert settings.request_timeout_s == 30.0
 
         # Nested configs should have their defaults
         assert isinstance(settings.log_config, LogConfig)
@@ -506,6 +594,8 @@ class TestSettings:
         assert settings.observability_config.exporter_type == "console"
         # Sample rate should remain 1.0
         assert settings.observability_config.trace_sample_rate == 1.0
+        # N+1 detection warns outside of production
+        assert settings.database_config.n_plus_one_detection == "warn"
 
     def test_model_post_init_production(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Verify post-init logic for production environment."""
@@ -514,6 +604,8 @@ class TestSettings:
 
         # In production, trace sample rate should be adjusted
         assert settings.observability_config.trace_sample_rate == 0.1
+        # N+1 detection is off in production unless configured
+        assert settings.database_config.n_plus_one_detection == "off"
 
         # Test detection methods work correctly
         assert settings._detect_formatter() == "json"  # No cloud env
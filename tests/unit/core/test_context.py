@@ -5,6 +5,7 @@ including correlation ID propagation and request ID generation.
 """
 
 import asyncio
+import contextvars
 import threading
 import uuid
 from typing import Any
@@ -12,6 +13,7 @@ from typing import Any
 import pytest
 
 from src.core.context import (
+    Deadline,
     RequestContext,
     generate_correlation_id,
     generate_request_id,
@@ -74,6 +76,19 @@ class TestCoreContext:
         result = RequestContext.get_correlation_id()
         assert result is None, "Should return None after clearing context"
 
+    def test_get_correlation_id_from_reads_other_context(self) -> None:
+        """Test reading the correlation ID from a captured context."""
+        RequestContext.set_correlation_id("captured-id")
+        captured = contextvars.copy_context()
+        RequestContext.set_correlation_id("current-id")
+
+        assert RequestContext.get_correlation_id_from(captured) == "captured-id"
+        assert RequestContext.get_correlation_id() == "current-id"
+
+    def test_get_correlation_id_from_empty_context(self) -> None:
+        """Test reading from a context without a correlation ID returns None."""
+        assert RequestContext.get_correlation_id_from(contextvars.Context()) is None
+
     # RequestContext.clear() Tests
 
     def test_clear_removes_correlation_id(self) -> None:
@@ -102,6 +117,28 @@ class TestCoreContext:
 
         assert RequestContext.get_correlation_id() is None
 
+    # Deadline Tests
+
+    def test_deadline_remaining_and_tighten(self) -> None:
+        """Test that a deadline counts down and can only be moved earlier."""
+        deadline = Deadline.after(30.0)
+        assert 29.0 < deadline.remaining() <= 30.0
+
+        deadline.tighten(5.0)
+        assert deadline.remaining() <= 5.0
+
+        deadline.tighten(60.0)
+        assert deadline.remaining() <= 5.0
+
+    def test_clear_removes_deadline(self) -> None:
+        """Test that the deadline is stored in and cleared from the context."""
+        deadline = Deadline.after(1.0)
+        RequestContext.set_deadline(deadline)
+        assert RequestContext.get_deadline() is deadline
+
+        RequestContext.clear()
+        assert RequestContext.get_deadline() is None
+
     # Thread Safety Tests
 
     def test_context_isolation_between_threads(
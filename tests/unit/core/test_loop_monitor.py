@@ -0,0 +1,123 @@
+"""Unit tests for src/core/loop_monitor.py module.
+
+This module tests the event loop lag probe, the watchdog thread that
+captures stacks of blocking calls and the asyncio task stack dump.
+"""
+
+import asyncio
+import time
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.core.config import RuntimeConfig, Settings
+from src.core.context import RequestContext
+from src.core.loop_monitor import EventLoopMonitor, dump_task_stacks
+
+
+def _block_event_loop(seconds: float) -> None:
+    """Simulate a blocking call on the event loop thread."""
+    time.sleep(seconds)
+
+
+@pytest.mark.unit
+class TestEventLoopMonitor:
+    """Tests for the EventLoopMonitor class."""
+
+    def test_from_settings_converts_milliseconds(self, mock_settings: Settings) -> None:
+        """Verify interval and threshold are taken from the runtime config."""
+        mock_settings.runtime_config = RuntimeConfig(
+            loop_monitor_interval_ms=50, loop_lag_threshold_ms=200
+        )
+
+        monitor = EventLoopMonitor.from_settings(mock_settings)
+
+        assert monitor.interval == 0.05
+        assert monitor.threshold == 0.2
+
+    @pytest.mark.timeout(5)
+    async def test_probe_records_lag(self, mocker: MockerFixture) -> None:
+        """Verify the probe records lag samples while running."""
+        histogram = mocker.Mock()
+        monitor = EventLoopMonitor(interval=0.01, threshold=1.0, histogram=histogram)
+
+        monitor.start()
+        await asyncio.sleep(0.1)
+        await monitor.stop()
+
+        assert histogram.record.call_count > 0
+        assert all(call.args[0] >= 0 for call in histogram.record.call_args_list)
+        assert monitor.running is False
+
+    @pytest.mark.timeout(5)
+    async def test_start_is_idempotent(self, mocker: MockerFixture) -> None:
+        """Verify starting twice does not spawn a second probe."""
+        monitor = EventLoopMonitor(
+            interval=0.01, threshold=1.0, histogram=mocker.Mock()
+        )
+
+        monitor.start()
+        probe_task = monitor._probe_task
+        monitor.start()
+
+        assert monitor._probe_task is probe_task
+        await monitor.stop()
+
+    async def test_stop_without_start_is_noop(self, mocker: MockerFixture) -> None:
+        """Verify stopping an idle monitor does nothing."""
+        monitor = EventLoopMonitor(
+            interval=0.01, threshold=1.0, histogram=mocker.Mock()
+        )
+
+        await monitor.stop()
+
+        assert monitor.running is False
+
+    @pytest.mark.timeout(5)
+    async def test_blocking_call_is_reported_with_stack(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Verify a blocked loop is reported once with stack and correlation ID."""
+        mock_logger = mocker.patch("src.core.loop_monitor.logger")
+        monitor = EventLoopMonitor(
+            interval=0.02, threshold=0.05, histogram=mocker.Mock()
+        )
+        RequestContext.set_correlation_id("blocked-request")
+
+        monitor.start()
+        await asyncio.sleep(0.05)
+        _block_event_loop(0.4)
+        await asyncio.sleep(0.05)
+        await monitor.stop()
+
+        assert mock_logger.warning.call_count == 1
+        kwargs = mock_logger.warning.call_args.kwargs
+        assert kwargs["correlation_id"] == "blocked-request"
+        assert "_block_event_loop" in kwargs["stack"]
+        assert kwargs["blocked_ms"] >= 50
+
+
+@pytest.mark.unit
+class TestDumpTaskStacks:
+    """Tests for the asyncio task stack dump."""
+
+    async def test_dump_includes_running_tasks(self) -> None:
+        """Verify all tasks are listed with their correlation IDs."""
+        release = asyncio.Event()
+
+        async def waiter() -> None:
+            RequestContext.set_correlation_id("waiting-request")
+            await release.wait()
+
+        task = asyncio.create_task(waiter(), name="test-waiter")
+        await asyncio.sleep(0)
+
+        tasks = dump_task_stacks()
+        release.set()
+        await task
+
+        entry = next(t for t in tasks if t["name"] == "test-waiter")
+        assert entry["correlation_id"] == "waiting-request"
+        assert entry["done"] is False
+        assert "waiter" in str(entry["coroutine"])
+        assert "release.wait()" in str(entry["stack"])
@@ -7,11 +7,12 @@ with support for multiple backends (Console/Loguru, GCP, AWS, OTLP).
 from __future__ import annotations
 
 import threading
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, Literal, cast
 
 import pytest
 from opentelemetry.sdk.trace.export import SpanExportResult
 
+from src.core.config import DatabaseConfig
 from src.core.context import RequestContext
 from src.core.observability import (
     LoguruSpanExporter,
@@ -19,9 +20,11 @@ from src.core.observability import (
     _get_otlp_exporter,
     add_correlation_id_to_span,
     add_span_attributes,
+    get_meter,
     get_span_exporter,
     get_tracer,
     instrument_app,
+    setup_metrics,
     setup_tracing,
     trace_operation,
 )
@@ -633,6 +636,82 @@ class TestObservability:
         # Should only be called once despite concurrent access
         mock_get_tracer.assert_called_once_with("concurrent_component")
 
+    # setup_metrics Tests
+
+    def test_get_meter_is_cached(self) -> None:
+        """Test get_meter returns the same meter for the same name."""
+        assert get_meter("test.component") is get_meter("test.component")
+
+    def test_setup_metrics_disabled(
+        self,
+        mocker: MockerFixture,
+        mock_observability_settings: Settings,
+    ) -> None:
+        """Test setup exits early when metrics are disabled."""
+        mock_logger = mocker.patch("src.core.observability.logger")
+        mock_set_meter_provider = mocker.patch(
+            "src.core.observability.metrics.set_meter_provider"
+        )
+        mock_observability_settings.observability_config.enable_metrics = False
+
+        setup_metrics(mock_observability_settings)
+
+        mock_logger.info.assert_called_with("Metrics disabled by configuration")
+        mock_set_meter_provider.assert_not_called()
+
+    @pytest.mark.parametrize("exporter_type", ["console", "gcp", "none"])
+    def test_setup_metrics_skips_non_otlp_exporters(
+        self,
+        mocker: MockerFixture,
+        mock_observability_settings: Settings,
+        exporter_type: Literal["console", "gcp", "none"],
+    ) -> None:
+        """Test metrics keep the no-op provider for non-OTLP exporters."""
+        mock_set_meter_provider = mocker.patch(
+            "src.core.observability.metrics.set_meter_provider"
+        )
+        mock_observability_settings.observability_config.exporter_type = exporter_type
+
+        setup_metrics(mock_observability_settings)
+
+        mock_set_meter_provider.assert_not_called()
+
+    @pytest.mark.parametrize("exporter_type", ["otlp", "aws"])
+    def test_setup_metrics_configures_otlp_reader(
+        self,
+        mocker: MockerFixture,
+        mock_observability_settings: Settings,
+        exporter_type: Literal["otlp", "aws"],
+    ) -> None:
+        """Test OTLP metric exporter and periodic reader are configured."""
+        mock_exporter_class = mocker.patch("src.core.observability.OTLPMetricExporter")
+        mock_reader_class = mocker.patch(
+            "src.core.observability.PeriodicExportingMetricReader"
+        )
+        mock_provider_class = mocker.patch("src.core.observability.MeterProvider")
+        mock_set_meter_provider = mocker.patch(
+            "src.core.observability.metrics.set_meter_provider"
+        )
+        obs_config = mock_observability_settings.observability_config
+        obs_config.exporter_type = exporter_type
+        obs_config.exporter_endpoint = "http://collector:4317"
+        obs_config.metrics_export_interval_ms = 15000
+
+        setup_metrics(mock_observability_settings)
+
+        mock_exporter_class.assert_called_once_with(
+            endpoint="http://collector:4317", insecure=True
+        )
+        mock_reader_class.assert_called_once_with(
+            mock_exporter_class.return_value, export_interval_millis=15000
+        )
+        assert mock_provider_class.call_args.kwargs["metric_readers"] == [
+            mock_reader_class.return_value
+        ]
+        mock_set_meter_provider.assert_called_once_with(
+            mock_provider_class.return_value
+        )
+
     # setup_tracing Tests
 
     def test_setup_tracing_disabled(
@@ -900,7 +979,9 @@ class TestObservability:
         mock_sqlalchemy_instrumentor.return_value = mock_instance
 
         # Ensure database_config exists
-        mock_observability_settings.database_config = mocker.Mock()
+        mock_observability_settings.database_config = DatabaseConfig(
+            sql_commenter_mode="full"
+        )
 
         # Instrument app
         instrument_app(mock_fastapi_app, mock_observability_settings)
@@ -913,6 +994,29 @@ class TestObservability:
             },
         )
 
+    @pytest.mark.parametrize("mode", ["stable", "off"])
+    def test_instrument_app_sqlalchemy_without_trace_comments(
+        self,
+        mocker: MockerFixture,
+        mock_observability_settings: Settings,
+        mock_fastapi_app: MockType,
+        mode: Literal["stable", "off"],
+    ) -> None:
+        """Test trace context comments are only added in full commenter mode."""
+        mocker.patch("src.core.observability.FastAPIInstrumentor")
+        mock_sqlalchemy_instrumentor = mocker.patch(
+            "src.core.observability.SQLAlchemyInstrumentor"
+        )
+        mock_observability_settings.database_config = DatabaseConfig(
+            sql_commenter_mode=mode
+        )
+
+        instrument_app(mock_fastapi_app, mock_observability_settings)
+
+        mock_sqlalchemy_instrumentor.return_value.instrument.assert_called_once_with(
+            enable_commenter=False
+        )
+
     def test_instrument_app_no_sqlalchemy_without_database(
         self,
         mocker: MockerFixture,
@@ -0,0 +1,216 @@
+"""Unit tests for src/core/resource_usage.py module.
+
+This module tests the request-scoped usage accumulator and the awaitable
+wrapper charging per-step CPU time and allocations to a request.
+"""
+
+import asyncio
+import contextlib
+import tracemalloc
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.core.resource_usage import (
+    RequestUsage,
+    get_request_usage,
+    request_usage_scope,
+    track_usage,
+)
+
+
+@pytest.mark.unit
+class TestRequestUsage:
+    """Tests for the RequestUsage accumulator."""
+
+    def test_accumulates_statements_and_waits(self) -> None:
+        """Verify database and pool measurements are summed."""
+        usage = RequestUsage()
+
+        usage.add_db_statement(1_500_000)
+        usage.add_db_statement(500_000)
+        usage.add_pool_wait(250_000)
+
+        assert usage.db_statements == 2
+        assert usage.db_time_ns == 2_000_000
+        assert usage.pool_wait_ns == 250_000
+
+    def test_log_fields_in_milliseconds(self) -> None:
+        """Verify log fields are rounded milliseconds without alloc bytes."""
+        usage = RequestUsage()
+        usage.cpu_time_ns = 12_345_678
+        usage.add_db_statement(3_000_000)
+
+        assert usage.as_log_fields() == {
+            "cpu_ms": 12.35,
+            "db_statements": 1,
+            "db_time_ms": 3.0,
+            "pool_wait_ms": 0.0,
+        }
+
+    def test_log_fields_include_alloc_bytes_when_tracked(self) -> None:
+        """Verify alloc_bytes is only reported for sampled requests."""
+        usage = RequestUsage(track_allocations=True)
+        usage.alloc_bytes = 4096
+
+        assert usage.as_log_fields()["alloc_bytes"] == 4096
+
+    def test_count_statement(self) -> None:
+        """Verify executions are counted per fingerprint."""
+        usage = RequestUsage()
+
+        assert usage.count_statement("a") == 1
+        assert usage.count_statement("a") == 2
+        assert usage.count_statement("b") == 1
+
+    def test_route_prefers_matched_route_template(self) -> None:
+        """Verify the route template is used once the router matched."""
+        scope: dict[str, object] = {"path": "/users/42"}
+        usage = RequestUsage(scope=scope)
+
+        assert usage.route == "/users/42"
+
+        scope["route"] = type("Route", (), {"path": "/users/{user_id}"})()
+
+        assert usage.route == "/users/{user_id}"
+
+    def test_route_without_scope(self) -> None:
+        """Verify no route is reported outside of an ASGI request."""
+        assert RequestUsage().route is None
+
+    def test_controller_from_matched_route(self) -> None:
+        """Verify the controller is the endpoint function of the route."""
+
+        def get_user() -> None:
+            """Endpoint stand-in."""
+
+        scope: dict[str, object] = {"path": "/users/42"}
+        usage = RequestUsage(scope=scope)
+        before_routing = usage.controller
+
+        # The router sets the route after the usage is created
+        scope["route"] = type("Route", (), {"endpoint": get_user})()
+
+        assert before_routing is None
+        assert usage.controller == "get_user"
+        assert RequestUsage().controller is None
+
+
+@pytest.mark.unit
+class TestRequestUsageScope:
+    """Tests for the context variable helpers."""
+
+    def test_scope_installs_and_restores_usage(self) -> None:
+        """Verify the accumulator is only visible inside the scope."""
+        assert get_request_usage() is None
+
+        with request_usage_scope() as usage:
+            assert get_request_usage() is usage
+
+        assert get_request_usage() is None
+
+    def test_allocation_tracking_requires_tracemalloc(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Verify allocations are not tracked when tracemalloc is off."""
+        mocker.patch(
+            "src.core.resource_usage.tracemalloc.is_tracing", return_value=False
+        )
+
+        with request_usage_scope(track_allocations=True) as usage:
+            assert usage.track_allocations is False
+
+    async def test_scope_is_isolated_between_tasks(self) -> None:
+        """Verify concurrent requests get their own accumulator."""
+
+        async def handle() -> RequestUsage | None:
+            with request_usage_scope() as usage:
+                await asyncio.sleep(0)
+                assert get_request_usage() is usage
+                return usage
+
+        first, second = await asyncio.gather(handle(), handle())
+
+        assert first is not second
+
+
+@pytest.mark.unit
+class TestTrackUsage:
+    """Tests for the per-step usage tracking wrapper."""
+
+    async def test_returns_result_and_charges_each_step(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Verify CPU time is summed over every resumption of the coroutine."""
+        mocker.patch(
+            "src.core.resource_usage.time.thread_time_ns",
+            side_effect=[0, 1_000, 10_000, 12_000, 20_000, 23_000],
+        )
+        usage = RequestUsage()
+
+        async def endpoint() -> str:
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            return "done"
+
+        result = await track_usage(endpoint(), usage)
+
+        assert result == "done"
+        assert usage.cpu_time_ns == 6_000
+
+    async def test_propagates_exceptions(self) -> None:
+        """Verify exceptions raised by the coroutine reach the caller."""
+        usage = RequestUsage()
+
+        async def failing() -> None:
+            await asyncio.sleep(0)
+            msg = "boom"
+            raise ValueError(msg)
+
+        with pytest.raises(ValueError, match="boom"):
+            await track_usage(failing(), usage)
+
+        assert usage.cpu_time_ns >= 0
+
+    async def test_forwards_cancellation(self) -> None:
+        """Verify cancellation is delivered to the wrapped coroutine."""
+        usage = RequestUsage()
+        cleaned_up = asyncio.Event()
+
+        async def slow() -> None:
+            try:
+                await asyncio.sleep(10)
+            finally:
+                cleaned_up.set()
+
+        async def request() -> None:
+            await track_usage(slow(), usage)
+
+        task = asyncio.create_task(request())
+        await asyncio.sleep(0)
+        task.cancel()
+
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+        assert cleaned_up.is_set()
+
+    async def test_tracks_allocations_when_tracing(self) -> None:
+        """Verify traced memory growth is charged to sampled requests."""
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        try:
+            usage = RequestUsage(track_allocations=True)
+            retained: list[bytes] = []
+
+            async def allocate() -> None:
+                await asyncio.sleep(0)
+                retained.append(bytes(64 * 1024))
+
+            await track_usage(allocate(), usage)
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
+
+        assert usage.alloc_bytes >= 64 * 1024
@@ -0,0 +1,146 @@
+"""Unit tests for src/core/runtime.py module.
+
+This module tests garbage collector tuning, the startup freeze and the
+gc.callbacks based pause telemetry.
+"""
+
+import gc
+from collections.abc import Generator
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.core.config import RuntimeConfig, Settings
+from src.core.runtime import (
+    GC_PAUSE_METRIC_NAME,
+    _GCPauseRecorder,
+    _state,
+    configure_gc,
+    freeze_gc,
+    install_gc_pause_metrics,
+    uninstall_gc_pause_metrics,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_gc_state() -> Generator[None]:
+    """Ensure no recorder leaks between tests."""
+    uninstall_gc_pause_metrics()
+    thresholds = gc.get_threshold()
+    yield
+    uninstall_gc_pause_metrics()
+    gc.set_threshold(*thresholds)
+
+
+@pytest.mark.unit
+class TestGCPauseRecorder:
+    """Tests for the gc.callbacks pause recorder."""
+
+    def test_records_pause_with_generation(self, mocker: MockerFixture) -> None:
+        """Verify a start/stop pair records one measurement."""
+        histogram = mocker.Mock()
+        mocker.patch(
+            "src.core.runtime.time.perf_counter_ns",
+            side_effect=[1_000_000, 3_500_000],
+        )
+        recorder = _GCPauseRecorder(histogram)
+
+        recorder("start", {"generation": 2})
+        recorder("stop", {"generation": 2, "collected": 10})
+
+        histogram.record.assert_called_once_with(2.5, {"generation": 2})
+
+    def test_stop_without_start_is_ignored(self, mocker: MockerFixture) -> None:
+        """Verify a stray stop event does not record anything."""
+        histogram = mocker.Mock()
+        recorder = _GCPauseRecorder(histogram)
+
+        recorder("stop", {"generation": 0})
+
+        histogram.record.assert_not_called()
+
+    def test_reentrant_collection_is_not_recorded(self, mocker: MockerFixture) -> None:
+        """Verify a collection triggered while recording does not recurse."""
+        histogram = mocker.Mock()
+        recorder = _GCPauseRecorder(histogram)
+
+        def nested_collection(*_args: object) -> None:
+            recorder("start", {"generation": 0})
+            recorder("stop", {"generation": 0})
+
+        histogram.record.side_effect = nested_collection
+
+        recorder("start", {"generation": 1})
+        recorder("stop", {"generation": 1})
+
+        assert histogram.record.call_count == 1
+
+
+@pytest.mark.unit
+class TestConfigureGC:
+    """Tests for GC configuration helpers."""
+
+    def test_install_is_idempotent(self) -> None:
+        """Verify repeated installs register a single callback."""
+        install_gc_pause_metrics()
+        install_gc_pause_metrics()
+
+        assert _state.recorder is not None
+        assert gc.callbacks.count(_state.recorder) == 1
+
+    def test_uninstall_removes_callback(self) -> None:
+        """Verify the recorder is removed from gc.callbacks."""
+        install_gc_pause_metrics()
+        recorder = _state.recorder
+
+        uninstall_gc_pause_metrics()
+
+        assert _state.recorder is None
+        assert recorder not in gc.callbacks
+
+    def test_install_creates_histogram(self, mocker: MockerFixture) -> None:
+        """Verify the pause histogram is created with the expected name."""
+        mock_meter = mocker.Mock()
+        mocker.patch("src.core.runtime.get_meter", return_value=mock_meter)
+
+        install_gc_pause_metrics()
+
+        assert mock_meter.create_histogram.call_args.args[0] == GC_PAUSE_METRIC_NAME
+        assert mock_meter.create_histogram.call_args.kwargs["unit"] == "ms"
+
+    def test_configure_gc_sets_thresholds(self, mock_settings: Settings) -> None:
+        """Verify thresholds from settings are applied."""
+        mock_settings.runtime_config = RuntimeConfig(gc_thresholds=(12345, 15, 25))
+
+        configure_gc(mock_settings)
+
+        assert gc.get_threshold() == (12345, 15, 25)
+        assert _state.recorder is not None
+
+    def test_configure_gc_keeps_default_thresholds(
+        self, mock_settings: Settings
+    ) -> None:
+        """Verify interpreter thresholds are untouched when not configured."""
+        before = gc.get_threshold()
+
+        configure_gc(mock_settings)
+
+        assert gc.get_threshold() == before
+
+    def test_configure_gc_metrics_disabled(self, mock_settings: Settings) -> None:
+        """Verify disabling metrics removes an installed recorder."""
+        install_gc_pause_metrics()
+        mock_settings.runtime_config = RuntimeConfig(enable_gc_metrics=False)
+
+        configure_gc(mock_settings)
+
+        assert _state.recorder is None
+
+    def test_freeze_gc_collects_then_freezes(self, mocker: MockerFixture) -> None:
+        """Verify freeze runs a full collection before freezing."""
+        mock_gc = mocker.patch("src.core.runtime.gc")
+        mock_gc.get_freeze_count.return_value = 42
+
+        freeze_gc()
+
+        assert mock_gc.method_calls[:2] == [mocker.call.collect(), mocker.call.freeze()]
@@ -0,0 +1,140 @@
+"""Unit tests for src/infrastructure/database/aggregates.py module.
+
+This module tests the GROUP BY statements built for aggregation shapes:
+metrics, grouping, time buckets, validation and the per-shape cache.
+"""
+
+import pytest
+
+from src.infrastructure.database.aggregates import (
+    AggregateQuery,
+    Avg,
+    Count,
+    Max,
+    Min,
+    Sum,
+    aggregate_query,
+    aggregate_select,
+)
+from src.infrastructure.database.filters import In
+from tests.unit.infrastructure.database.test_bulk_copy import (
+    CopyTestModel,
+    postgresql_dialect,
+)
+
+
+def compiled(query: AggregateQuery) -> str:
+    """Compile the statement of an aggregation shape for PostgreSQL."""
+    statement = aggregate_select(query)
+    return str(statement.compile(dialect=postgresql_dialect()))
+
+
+@pytest.mark.unit
+class TestAggregateSelect:
+    """Tests for aggregate_select."""
+
+    def test_metrics_of_one_field_cached_apart(self) -> None:
+        """Verify metrics over the same field are distinct shapes."""
+        total = aggregate_select(aggregate_query(CopyTestModel, {"v": Sum("id")}))
+        highest = aggregate_select(aggregate_query(CopyTestModel, {"v": Max("id")}))
+
+        assert highest is not total
+        assert "sum(bulk_copy_test_model.id) AS v" in str(total)
+        assert "max(bulk_copy_test_model.id) AS v" in str(highest)
+
+    def test_grouped_metrics(self) -> None:
+        """Verify metrics are computed per group, named as requested."""
+        query = aggregate_query(
+            CopyTestModel,
+            {
+                "total": Sum("id"),
+                "lowest": Min("id"),
+                "highest": Max("id"),
+                "mean": Avg("id"),
+                "rows": Count(),
+                "labeled": Count("label"),
+            },
+            filters={"code": In(["a"])},
+            group_by=["label"],
+        )
+
+        statement = aggregate_select(query)
+
+        assert statement is aggregate_select(query)
+        assert list(statement.selected_columns.keys()) == [
+            "label",
+            "total",
+            "lowest",
+            "highest",
+            "mean",
+            "rows",
+            "labeled",
+        ]
+        sql = compiled(query)
+        assert "count(*) AS rows, count(bulk_copy_test_model.label_text)" in sql
+        assert "WHERE bulk_copy_test_model.code IN" in sql
+        assert sql.endswith("GROUP BY bulk_copy_test_model.label_text ORDER BY label")
+
+    @pytest.mark.parametrize(
+        ("interval", "expected"),
+        [
+            ("1 day", "date_trunc('day', bulk_copy_test_model.created_at)"),
+            ("months", "date_trunc('month', bulk_copy_test_model.created_at)"),
+            (
+                "15 Minutes",
+                (
+                    "date_bin(INTERVAL '15 minute', bulk_copy_test_model.created_at, "
+                    "CAST('2000-01-03 00:00:00' AS TIMESTAMP WITH TIME ZONE))"
+                ),
+            ),
+        ],
+    )
+    def test_time_buckets(self, interval: str, expected: str) -> None:
+        """Verify single units truncate and multiples are binned."""
+        query = aggregate_query(
+            CopyTestModel,
+            {"rows": Count()},
+            group_by=["code"],
+            time_bucket=("created_at", interval),
+        )
+
+        sql = compiled(query)
+
+        assert sql.startswith(f"SELECT {expected} AS bucket, ")
+        assert f"GROUP BY {expected}, bulk_copy_test_model.code" in sql
+        assert sql.endswith("ORDER BY bucket, code")
+
+    @pytest.mark.parametrize(
+        ("query", "message"),
+        [
+            (aggregate_query(CopyTestModel, {}), "at least one metric"),
+            (
+                aggregate_query(CopyTestModel, {"code": Count()}, group_by=["code"]),
+                "Duplicate result column names",
+            ),
+            (
+                aggregate_query(CopyTestModel, {"total": Sum("missing")}),
+                "Unknown field for CopyTestModel: missing",
+            ),
+            (
+                aggregate_query(
+                    CopyTestModel,
+                    {"rows": Count()},
+                    time_bucket=("created_at", "2 months"),
+                ),
+                "Invalid time bucket interval: 2 months",
+            ),
+            (
+                aggregate_query(
+                    CopyTestModel,
+                    {"rows": Count()},
+                    time_bucket=("created_at", "1 fortnight"),
+                ),
+                "Invalid time bucket interval: 1 fortnight",
+            ),
+        ],
+    )
+    def test_invalid_shapes_rejected(self, query: AggregateQuery, message: str) -> None:
+        """Verify shapes are validated when first built."""
+        with pytest.raises(ValueError, match=message):
+            aggregate_select(query)
@@ -5,10 +5,12 @@ including the naming convention, Base declarative class, and BaseModel abstract
 class with common fields.
 """
 
+from typing import cast
+
 import pytest
 from pytest_mock import MockType
-from sqlalchemy import BigInteger, DateTime, MetaData
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy import BigInteger, Column, DateTime, Index, Integer, MetaData, Table
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 from src.infrastructure.database.base import (
     NAMING_CONVENTION,
@@ -23,7 +25,7 @@ class TestNamingConvention:
 
     def test_naming_convention_structure(self) -> None:
         """Verify that NAMING_CONVENTION contains all required keys."""
-        required_keys = {"ix", "uq", "ck", "fk", "pk"}
+        required_keys = {"index_method", "ix", "uq", "ck", "fk", "pk"}
         actual_keys = set(NAMING_CONVENTION.keys())
 
         assert actual_keys == required_keys, (
@@ -33,7 +35,7 @@ class TestNamingConvention:
     @pytest.mark.parametrize(
         ("key", "expected_pattern"),
         [
-            ("ix", "ix_%(column_0_label)s"),
+            ("ix", "ix_%(column_0_label)s%(index_method)s"),
             ("uq", "uq_%(table_name)s_%(column_0_name)s"),
             ("ck", "ck_%(table_name)s_%(constraint_name)s"),
             ("fk", "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s"),
@@ -51,6 +53,23 @@ class TestNamingConvention:
             f"NAMING_CONVENTION['{key}'] has unexpected pattern"
         )
 
+    def test_index_names_end_in_non_btree_method(self) -> None:
+        """Verify B-tree index names are unchanged and others name the method."""
+        table = Table(
+            "naming_test",
+            MetaData(naming_convention=NAMING_CONVENTION),
+            Column("id", Integer, primary_key=True),
+            Column("created_at", DateTime, index=True),
+        )
+        Index(None, table.c.id, postgresql_using="btree")
+        Index(None, table.c.created_at, postgresql_using="brin")
+
+        assert {index.name for index in table.indexes} == {
+            "ix_naming_test_created_at",
+            "ix_naming_test_id",
+            "ix_naming_test_created_at_brin",
+        }
+
 
 @pytest.mark.unit
 class TestBaseDeclarativeBase:
@@ -271,3 +290,46 @@ class TestBaseModel:
             assert "Mapped[" in annotation, (
                 f"{field} should have Mapped type annotation"
             )
+
+
+class BrinIndexedModel(BaseModel):
+    """Test model declaring BRIN indexes on both timestamps."""
+
+    __tablename__ = "base_test_brin_indexed"
+
+    brin_timestamps = ("created_at", "updated_at")
+
+
+class BrinIndexedChild(BrinIndexedModel):
+    """Test model sharing its parent's table."""
+
+    kind: Mapped[str | None] = mapped_column(nullable=True)
+
+
+@pytest.mark.unit
+class TestBrinTimestamps:
+    """Tests for BRIN indexes declared with brin_timestamps."""
+
+    def test_brin_indexes_declared(self) -> None:
+        """Verify declared timestamps get one BRIN index each."""
+        indexes = {
+            index.name: index.dialect_options["postgresql"]["using"]
+            for index in cast("Table", BrinIndexedModel.__table__).indexes
+        }
+
+        assert indexes == {
+            "ix_base_test_brin_indexed_created_at_brin": "brin",
+            "ix_base_test_brin_indexed_updated_at_brin": "brin",
+        }
+        assert BrinIndexedChild.__table__ is BrinIndexedModel.__table__
+
+    def test_only_timestamps_brin_indexed(self) -> None:
+        """Verify BRIN indexes are rejected on other fields before mapping."""
+        with pytest.raises(ValueError, match=r"only declared on timestamps: \['id'\]"):
+
+            class BrinIndexedId(BaseModel):
+                __tablename__ = "base_test_brin_id"
+
+                brin_timestamps = ("id", "created_at")
+
+        assert "base_test_brin_id" not in BaseModel.metadata.tables
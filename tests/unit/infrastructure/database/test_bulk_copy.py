@@ -0,0 +1,308 @@
+"""Unit tests for src/infrastructure/database/bulk_copy.py module.
+
+This module tests column mapping, record conversion, the staging-table
+upsert and throughput reporting of COPY-based bulk ingest, and streaming
+CSV exports.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any, cast
+
+import pytest
+from pytest_mock import MockerFixture, MockType
+from sqlalchemy import String, Table, select
+from sqlalchemy.engine import Dialect, make_url
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.database.base import BaseModel
+from src.infrastructure.database.bulk_copy import (
+    CopyResult,
+    copy_query_csv,
+    copy_records,
+    default_copy_columns,
+)
+
+
+class CopyTestModel(BaseModel):
+    """Model with a unique key and a Python-side default."""
+
+    __tablename__ = "bulk_copy_test_model"
+
+    code: Mapped[str] = mapped_column(String(20), unique=True)
+    label: Mapped[str] = mapped_column("label_text", String, default="unnamed")
+
+
+COPY_TABLE = cast("Table", CopyTestModel.__table__)
+
+
+def postgresql_dialect(driver: str | None = None) -> Dialect:
+    """PostgreSQL dialect of a driver, typed unlike the dialect classes.
+
+    Without a driver, this is the default dialect, like postgresql.dialect().
+    """
+    name = "postgresql" if driver is None else f"postgresql+{driver}"
+    return make_url(f"{name}://").get_dialect()()
+
+
+type CopySink = Callable[[bytes], Awaitable[None]]
+
+
+@pytest.fixture
+def mock_driver_connection(mocker: MockerFixture) -> MockType:
+    """Driver connection mock reporting a copy of three rows."""
+    driver_connection = mocker.Mock()
+    driver_connection.copy_records_to_table = mocker.AsyncMock(return_value="COPY 3")
+    return cast("MockType", driver_connection)
+
+
+@pytest.fixture
+def copy_session(
+    mocker: MockerFixture,
+    mock_async_session: MockType,
+    mock_driver_connection: MockType,
+) -> MockType:
+    """Session mock exposing the driver connection inside a savepoint."""
+    savepoint = mocker.Mock()
+    savepoint.__aenter__ = mocker.AsyncMock(return_value=savepoint)
+    savepoint.__aexit__ = mocker.AsyncMock(return_value=None)
+    mock_async_session.begin_nested.return_value = savepoint
+
+    connection = mocker.Mock()
+    connection.get_raw_connection = mocker.AsyncMock(
+        return_value=mocker.Mock(driver_connection=mock_driver_connection)
+    )
+    connection.run_sync = mocker.AsyncMock()
+    mock_async_session.connection = mocker.AsyncMock(return_value=connection)
+    return mock_async_session
+
+
+async def copied_records(driver_connection: MockType) -> list[Any]:
+    """Consume the records passed to copy_records_to_table."""
+    records = driver_connection.copy_records_to_table.call_args.kwargs["records"]
+    if hasattr(records, "__aiter__"):
+        return [record async for record in records]
+    return list(records)
+
+
+@pytest.mark.unit
+class TestCopyColumns:
+    """Tests for default_copy_columns."""
+
+    def test_server_generated_columns_excluded(self) -> None:
+        """Verify ids and server defaults are left to the server."""
+        columns = default_copy_columns(COPY_TABLE)
+
+        assert [column.name for column in columns] == ["code", "label_text"]
+
+
+@pytest.mark.unit
+class TestCopyRecords:
+    """Tests for copy_records."""
+
+    async def test_copies_models_and_tuples(
+        self,
+        mocker: MockerFixture,
+        copy_session: MockType,
+        mock_driver_connection: MockType,
+    ) -> None:
+        """Verify models are converted in column order with scalar defaults."""
+        mocker.patch("src.infrastructure.database.bulk_copy.logger")
+        rows: list[CopyTestModel | tuple[str, str]] = [
+            CopyTestModel(code="a"),
+            ("b", "second"),
+            CopyTestModel(code="c"),
+        ]
+
+        result = await copy_records(copy_session, CopyTestModel, rows)
+
+        kwargs = mock_driver_connection.copy_records_to_table.call_args.kwargs
+        assert mock_driver_connection.copy_records_to_table.call_args.args == (
+            "bulk_copy_test_model",
+        )
+        assert kwargs["columns"] == ["code", "label_text"]
+        assert await copied_records(mock_driver_connection) == [
+            ("a", "unnamed"),
+            ("b", "second"),
+            ("c", "unnamed"),
+        ]
+        assert result.rows == 3
+        copy_session.begin_nested.assert_called_once()
+        copy_session.execute.assert_not_awaited()
+
+    async def test_streams_async_iterables(
+        self,
+        mocker: MockerFixture,
+        copy_session: MockType,
+        mock_driver_connection: MockType,
+    ) -> None:
+        """Verify async iterables are passed through as async iterables."""
+        mocker.patch("src.infrastructure.database.bulk_copy.logger")
+
+        async def produce() -> AsyncIterator[tuple[str]]:
+            for code in ("a", "b"):
+                yield (code,)
+
+        await copy_records(copy_session, CopyTestModel, produce(), columns=["code"])
+
+        records = mock_driver_connection.copy_records_to_table.call_args.kwargs[
+            "records"
+        ]
+        assert hasattr(records, "__aiter__")
+        assert await copied_records(mock_driver_connection) == [("a",), ("b",)]
+
+    async def test_upsert_merges_from_staging_table(
+        self,
+        mocker: MockerFixture,
+        copy_session: MockType,
+        mock_driver_connection: MockType,
+    ) -> None:
+        """Verify upserts copy into a temporary table and merge on conflict."""
+        mocker.patch("src.infrastructure.database.bulk_copy.logger")
+
+        await copy_records(
+            copy_session, CopyTestModel, [("a", "x")], conflict_columns=["code"]
+        )
+
+        staging_name = mock_driver_connection.copy_records_to_table.call_args.args[0]
+        assert staging_name.startswith("_copy_bulk_copy_test_model_")
+        merge = copy_session.execute.call_args.args[0]
+        sql = str(merge.compile(dialect=postgresql_dialect()))
+        assert f"FROM {staging_name}" in sql
+        assert "ON CONFLICT (code) DO UPDATE SET label_text = excluded.label_text" in (
+            sql
+        )
+        assert "updated_at = now()" in sql
+        connection = await copy_session.connection()
+        assert connection.run_sync.await_count == 2  # Create and drop staging
+
+    @pytest.mark.parametrize(
+        ("columns", "conflict_columns", "match"),
+        [
+            (["code", "missing"], None, "Unknown columns"),
+            (["label_text"], ["code"], "Conflict columns must be copied"),
+        ],
+    )
+    async def test_invalid_columns_rejected(
+        self,
+        copy_session: MockType,
+        columns: list[str],
+        conflict_columns: list[str] | None,
+        match: str,
+    ) -> None:
+        """Verify invalid column selections fail before anything is copied."""
+        with pytest.raises(ValueError, match=match):
+            await copy_records(
+                copy_session,
+                CopyTestModel,
+                [],
+                columns=columns,
+                conflict_columns=conflict_columns,
+            )
+
+        copy_session.begin_nested.assert_not_called()
+
+    def test_rows_per_second(self) -> None:
+        """Verify throughput is derived from rows and elapsed time."""
+        assert CopyResult(rows=1000, elapsed_s=0.5).rows_per_second == 2000.0
+        assert CopyResult(rows=0, elapsed_s=0.0).rows_per_second == 0.0
+
+
+@pytest.fixture
+def export_connection(
+    mocker: MockerFixture, mock_driver_connection: MockType
+) -> MockType:
+    """Engine connection mock used by copy_query_csv."""
+    connection = mocker.Mock()
+    connection.dialect = postgresql_dialect("asyncpg")
+    connection.get_raw_connection = mocker.AsyncMock(
+        return_value=mocker.Mock(driver_connection=mock_driver_connection)
+    )
+    engine = mocker.Mock()
+    engine.connect.return_value.__aenter__ = mocker.AsyncMock(return_value=connection)
+    engine.connect.return_value.__aexit__ = mocker.AsyncMock(return_value=None)
+    mocker.patch(
+        "src.infrastructure.database.bulk_copy.get_engine", return_value=engine
+    )
+    return cast("MockType", connection)
+
+
+@pytest.mark.unit
+class TestCopyQueryCSV:
+    """Tests for copy_query_csv."""
+
+    async def test_streams_server_chunks(
+        self,
+        mocker: MockerFixture,
+        export_connection: MockType,
+        mock_driver_connection: MockType,
+    ) -> None:
+        """Verify chunks are yielded in order and the query is parameterized."""
+        _ = export_connection
+        mocker.patch("src.infrastructure.database.bulk_copy.logger")
+
+        async def copy_from_query(
+            _query: str, *_args: object, output: CopySink, **_options: object
+        ) -> str:
+            for chunk in (b"code\n", b"a\n", b"b\n"):
+                await output(chunk)
+            return "COPY 2"
+
+        mock_driver_connection.copy_from_query = mocker.AsyncMock(
+            side_effect=copy_from_query
+        )
+        statement = select(CopyTestModel.code).where(CopyTestModel.code.in_(["a", "b"]))
+
+        chunks = [chunk async for chunk in copy_query_csv(statement)]
+
+        assert chunks == [b"code\n", b"a\n", b"b\n"]
+        call = mock_driver_connection.copy_from_query.call_args
+        assert "IN ($1::VARCHAR, $2::VARCHAR)" in call.args[0]
+        assert call.args[1:] == ("a", "b")
+        assert call.kwargs["format"] == "csv"
+        assert call.kwargs["header"] is True
+
+    async def test_copy_errors_propagate(
+        self,
+        mocker: MockerFixture,
+        export_connection: MockType,
+        mock_driver_connection: MockType,
+    ) -> None:
+        """Verify a failing COPY raises from the consuming iteration."""
+        _ = export_connection
+        mock_driver_connection.copy_from_query = mocker.AsyncMock(
+            side_effect=RuntimeError("copy failed")
+        )
+
+        with pytest.raises(RuntimeError, match="copy failed"):
+            _ = [chunk async for chunk in copy_query_csv(select(CopyTestModel.code))]
+
+    async def test_abandoned_export_cancels_copy(
+        self,
+        mocker: MockerFixture,
+        export_connection: MockType,
+        mock_driver_connection: MockType,
+    ) -> None:
+        """Verify closing the stream early cancels the COPY."""
+        _ = export_connection
+        cancelled = asyncio.Event()
+
+        async def endless_copy(
+            _query: str, *_args: object, output: CopySink, **_options: object
+        ) -> str:
+            try:
+                while True:
+                    await output(b"row\n")
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        mock_driver_connection.copy_from_query = mocker.AsyncMock(
+            side_effect=endless_copy
+        )
+        stream = copy_query_csv(select(CopyTestModel.code))
+
+        assert await anext(stream) == b"row\n"
+        await stream.aclose()
+
+        assert cancelled.is_set()
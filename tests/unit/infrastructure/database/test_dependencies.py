@@ -15,7 +15,15 @@ from pytest_mock import MockerFixture, MockType
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.infrastructure.database.dependencies import DatabaseSession, get_db
+from src.infrastructure.database.dependencies import (
+    ANALYTICS_ENGINE_PROFILE,
+    AnalyticsDatabaseSession,
+    DatabaseSession,
+    ReadOnlyDatabaseSession,
+    get_db,
+    get_db_for,
+    get_read_only_db,
+)
 
 
 @pytest.mark.unit
@@ -94,6 +102,72 @@ class TestDatabaseDependencies:
         # Verify cleanup log was called
         mock_logger.debug.assert_any_call("Database session dependency completed")
 
+    async def test_get_read_only_db_yields_read_only_session(
+        self,
+        mock_async_session_for_dependencies: MockType,
+        mock_get_async_session_for_tests: MockType,
+        mocker: MockerFixture,
+    ) -> None:
+        """Verify get_read_only_db provides the read-only session."""
+        mock_logger = mocker.patch("src.infrastructure.database.dependencies.logger")
+        mocker.patch(
+            "src.infrastructure.database.dependencies.get_read_only_session",
+            new=mock_get_async_session_for_tests,
+        )
+
+        gen = get_read_only_db()
+        session = await gen.__anext__()
+        assert session is mock_async_session_for_dependencies
+        await gen.aclose()
+
+        mock_logger.debug.assert_any_call(
+            "Providing read-only database session for request"
+        )
+        mock_logger.debug.assert_any_call(
+            "Read-only database session dependency completed"
+        )
+
+    async def test_get_db_for_uses_profile_session(
+        self,
+        mock_async_session_for_dependencies: MockType,
+        mocker: MockerFixture,
+    ) -> None:
+        """Verify profile dependencies open sessions on the profile's engine."""
+        mocker.patch("src.infrastructure.database.dependencies.logger")
+        profiles: list[str] = []
+
+        @contextlib.asynccontextmanager
+        async def fake_get_async_session(profile: str) -> AsyncGenerator[AsyncSession]:
+            profiles.append(profile)
+            yield mock_async_session_for_dependencies
+
+        mocker.patch(
+            "src.infrastructure.database.dependencies.get_async_session",
+            new=fake_get_async_session,
+        )
+
+        gen = get_db_for("analytics")()
+        session = await gen.__anext__()
+        await gen.aclose()
+
+        assert session is mock_async_session_for_dependencies
+        assert profiles == ["analytics"]
+
+    def test_analytics_database_session_type_alias(self) -> None:
+        """Verify AnalyticsDatabaseSession injects an analytics session."""
+        args = get_args(AnalyticsDatabaseSession)
+
+        assert args[0] is AsyncSession
+        assert args[1].dependency.__name__ == "get_profile_db"
+        assert ANALYTICS_ENGINE_PROFILE == "analytics"
+
+    def test_read_only_database_session_type_alias(self) -> None:
+        """Verify ReadOnlyDatabaseSession injects get_read_only_db."""
+        args = get_args(ReadOnlyDatabaseSession)
+
+        assert args[0] is AsyncSession
+        assert args[1].dependency is get_read_only_db
+
     async def test_database_session_type_alias_integration(self) -> None:
         """Verify that DatabaseSession type alias integrates with FastAPI's Depends."""
         # Get the type information
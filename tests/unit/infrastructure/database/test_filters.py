@@ -0,0 +1,172 @@
+"""Unit tests for src/infrastructure/database/filters.py module.
+
+This module tests query shapes, bound parameter values, statement building
+and the per-shape statement cache of the repository filter DSL.
+"""
+
+import dataclasses
+
+import pytest
+
+from src.infrastructure.database.filters import (
+    FilterQuery,
+    Gte,
+    ILikePrefix,
+    In,
+    IsNull,
+    Lte,
+    Range,
+    filter_parameters,
+    filter_query,
+    filter_shape,
+    filtered_exists,
+    filtered_select,
+    projection_columns,
+)
+from tests.unit.infrastructure.database.test_bulk_copy import (
+    CopyTestModel,
+    postgresql_dialect,
+)
+
+
+@pytest.mark.unit
+class TestFilterShape:
+    """Tests for filter_shape and filter_parameters."""
+
+    def test_operators_named_by_shape(self) -> None:
+        """Verify plain values compare for equality and None tests for NULL."""
+        shape = filter_shape(
+            {
+                "code": "a",
+                "label": None,
+                "id": In([1, 2]),
+                "created_at": IsNull(is_null=False),
+                "updated_at": Gte(1),
+            }
+        )
+
+        assert shape == (
+            ("code", "eq"),
+            ("label", "is_null"),
+            ("id", "in"),
+            ("created_at", "is_not_null"),
+            ("updated_at", "gte"),
+        )
+
+    def test_parameters_named_by_position(self) -> None:
+        """Verify values are bound by filter position, NULL tests bind none."""
+        parameters = filter_parameters(
+            {
+                "code": ILikePrefix("50%_off\\"),
+                "label": None,
+                "id": Range(1, 10),
+                "updated_at": Lte(5),
+            },
+            limit=3,
+        )
+
+        assert parameters == {
+            "filter_0": "50\\%\\_off\\\\%",
+            "filter_2": 1,
+            "filter_2_end": 10,
+            "filter_3": 5,
+            "filter_limit": 3,
+        }
+
+
+@pytest.mark.unit
+class TestFilteredSelect:
+    """Tests for filtered_select."""
+
+    def test_statement_cached_per_shape(self) -> None:
+        """Verify equal shapes return the same statement object."""
+        first = filtered_select(filter_query(CopyTestModel, {"code": In(["a"])}))
+        second = filtered_select(filter_query(CopyTestModel, {"code": In(["b", "c"])}))
+
+        assert first is second
+
+    def test_projection_uses_attribute_names(self) -> None:
+        """Verify projected columns are keyed by attribute, not column name."""
+        statement = filtered_select(
+            filter_query(
+                CopyTestModel,
+                {"code": Gte("m")},
+                columns=["label", "code"],
+                order_by=["-code", "id"],
+                limited=True,
+            )
+        )
+
+        assert list(statement.selected_columns.keys()) == ["label", "code"]
+        sql = str(statement.compile(dialect=postgresql_dialect()))
+        assert "WHERE bulk_copy_test_model.code >= %(filter_0)s::VARCHAR" in sql
+        assert "ORDER BY bulk_copy_test_model.code DESC, bulk_copy_test_model.id" in sql
+        assert "LIMIT %(filter_limit)s::INTEGER" in sql
+
+    def test_page_counts_matches_before_paging(self) -> None:
+        """Verify the window count is computed over all matching rows."""
+        statement = filtered_select(
+            filter_query(CopyTestModel, {}, limited=True, offset=True, counted=True)
+        )
+
+        sql = str(statement.compile(dialect=postgresql_dialect()))
+        assert "count(*) OVER () AS filter_total" in sql
+        assert sql.endswith(
+            "LIMIT %(filter_limit)s::INTEGER OFFSET %(filter_offset)s::INTEGER"
+        )
+        assert filter_parameters({}, limit=10, offset=30) == {
+            "filter_limit": 10,
+            "filter_offset": 30,
+        }
+
+    def test_exists_drops_columns_and_ordering(self) -> None:
+        """Verify existence checks select no columns of matches, unsorted."""
+        query = filter_query(CopyTestModel, {"code": "a"}, order_by=["-code"])
+
+        statement = filtered_exists(query)
+
+        assert statement is filtered_exists(query)
+        sql = str(statement.compile(dialect=postgresql_dialect()))
+        assert sql.startswith("SELECT EXISTS (SELECT bulk_copy_test_model.id \n")
+        assert "ORDER BY" not in sql
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            filter_query(CopyTestModel, {"missing": 1}),
+            filter_query(CopyTestModel, {}, columns=["missing"]),
+            filter_query(CopyTestModel, {}, order_by=["-missing"]),
+        ],
+    )
+    def test_unknown_fields_rejected(self, query: FilterQuery) -> None:
+        """Verify fields are validated against the model's columns."""
+        with pytest.raises(ValueError, match="Unknown field for CopyTestModel"):
+            filtered_select(query)
+
+    def test_unknown_operator_rejected(self) -> None:
+        """Verify hand-built shapes with unknown operators fail."""
+        with pytest.raises(ValueError, match="Unknown filter operator: like"):
+            filtered_select(FilterQuery(CopyTestModel, (("code", "like"),)))
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class CodeSummary:
+    """Projection of a model's code and label."""
+
+    code: str
+    label: str
+    rank: int = dataclasses.field(init=False, default=0)
+
+
+@pytest.mark.unit
+class TestProjectionColumns:
+    """Tests for projection_columns."""
+
+    def test_init_fields_selected(self) -> None:
+        """Verify columns are the init fields, in declaration order."""
+        assert projection_columns(CodeSummary) == ("code", "label")
+
+    def test_non_dataclass_rejected(self) -> None:
+        """Verify projections must be dataclasses."""
+        with pytest.raises(TypeError, match="must be dataclasses, got dict"):
+            projection_columns(dict)
@@ -0,0 +1,99 @@
+"""Unit tests for src/infrastructure/database/fingerprint.py module.
+
+This module tests SQL statement normalization and fingerprint caching.
+"""
+
+import pytest
+
+from src.infrastructure.database.fingerprint import (
+    fingerprint_statement,
+    normalize_statement,
+)
+
+
+@pytest.mark.unit
+class TestNormalizeStatement:
+    """Tests for statement normalization."""
+
+    @pytest.mark.parametrize(
+        ("statement", "expected"),
+        [
+            (
+                "SELECT users.id FROM users WHERE users.id = $1::BIGINT",
+                "SELECT users.id FROM users WHERE users.id = ?::BIGINT",
+            ),
+            (
+                "SELECT * FROM t WHERE name = 'it''s' AND age > 42",
+                "SELECT * FROM t WHERE name = ? AND age > ?",
+            ),
+            (
+                "SELECT * FROM t WHERE x = :x AND y = %(y)s AND z = %s AND w = ?",
+                "SELECT * FROM t WHERE x = ? AND y = ? AND z = ? AND w = ?",
+            ),
+            (
+                "SELECT * FROM t WHERE v = -3.5 AND w < 1e10",
+                "SELECT * FROM t WHERE v = ? AND w < ?",
+            ),
+            (
+                "SELECT ts::date FROM t1 LIMIT 10 OFFSET 20",
+                "SELECT ts::date FROM t1 LIMIT ? OFFSET ?",
+            ),
+            (
+                "SELECT 1 -- trailing comment\nFROM t /* block\ncomment */",
+                "SELECT ? FROM t",
+            ),
+        ],
+    )
+    def test_literals_and_parameters(self, statement: str, expected: str) -> None:
+        """Verify literals, parameters and comments are normalized."""
+        assert normalize_statement(statement) == expected
+
+    def test_in_lists_collapse_regardless_of_length(self) -> None:
+        """Verify IN lists of any length produce the same normalized text."""
+        short = "SELECT * FROM t WHERE id IN ($1::INTEGER, $2::INTEGER)"
+        long = "SELECT * FROM t WHERE id in ($1, $2, $3, $4, $5)"
+
+        assert normalize_statement(short) == "SELECT * FROM t WHERE id IN (...)"
+        assert normalize_statement(long) == "SELECT * FROM t WHERE id IN (...)"
+
+    def test_multi_row_values_collapse(self) -> None:
+        """Verify multi-row VALUES clauses collapse to a single group."""
+        statement = "INSERT INTO t (a, b) VALUES ($1, $2), ($3, $4), ($5, $6)"
+
+        assert normalize_statement(statement) == "INSERT INTO t (a, b) VALUES (...)"
+
+    def test_whitespace_is_collapsed(self) -> None:
+        """Verify formatting differences do not change the result."""
+        assert normalize_statement("SELECT\n  a,\n\tb\nFROM   t") == (
+            "SELECT a, b FROM t"
+        )
+
+
+@pytest.mark.unit
+class TestFingerprintStatement:
+    """Tests for fingerprint computation."""
+
+    def test_same_query_with_different_values_shares_digest(self) -> None:
+        """Verify statements differing only in values share a fingerprint."""
+        first = fingerprint_statement("SELECT * FROM t WHERE id = 1")
+        second = fingerprint_statement("SELECT * FROM t WHERE id = 2")
+
+        assert first.digest == second.digest
+        assert first.normalized == "SELECT * FROM t WHERE id = ?"
+
+    def test_different_queries_have_different_digests(self) -> None:
+        """Verify structurally different statements are distinguished."""
+        first = fingerprint_statement("SELECT * FROM t WHERE id = 1")
+        second = fingerprint_statement("SELECT * FROM t WHERE name = 'x'")
+
+        assert first.digest != second.digest
+        assert len(first.digest) == 16
+
+    def test_results_are_cached(self) -> None:
+        """Verify repeated statements are served from the cache."""
+        fingerprint_statement.cache_clear()
+
+        fingerprint_statement("SELECT 1")
+        fingerprint_statement("SELECT 1")
+
+        assert fingerprint_statement.cache_info().hits == 1
@@ -0,0 +1,173 @@
+"""Unit tests for src/infrastructure/database/liveness.py module.
+
+This module tests the idle-aware connection ping and the single retry of
+reads that hit a dead connection.
+"""
+
+from typing import cast
+
+import pytest
+from pytest_mock import MockerFixture, MockType
+from sqlalchemy import select, true
+from sqlalchemy.exc import DBAPIError, DisconnectionError
+
+from src.infrastructure.database.liveness import (
+    IDLE_SINCE_KEY,
+    IdleConnectionPing,
+    execute_read,
+)
+
+
+class FakeDBAPIError(Exception):
+    """Stand-in for the driver's base error class."""
+
+
+@pytest.fixture
+def mock_dialect(mocker: MockerFixture) -> MockType:
+    """Dialect mock with a driver error class."""
+    dialect = mocker.Mock()
+    dialect.loaded_dbapi.Error = FakeDBAPIError
+    return cast("MockType", dialect)
+
+
+@pytest.fixture
+def mock_record(mocker: MockerFixture) -> MockType:
+    """Pool record mock with an info dictionary."""
+    record = mocker.Mock()
+    record.info = {}
+    return cast("MockType", record)
+
+
+def disconnect_error(*, invalidated: bool) -> DBAPIError:
+    """Build the error SQLAlchemy raises for a failed statement."""
+    return DBAPIError(
+        "SELECT 1",
+        None,
+        FakeDBAPIError("connection closed"),
+        connection_invalidated=invalidated,
+    )
+
+
+@pytest.mark.unit
+class TestIdleConnectionPing:
+    """Tests for IdleConnectionPing."""
+
+    def test_checkin_records_idle_start(
+        self, mocker: MockerFixture, mock_dialect: MockType, mock_record: MockType
+    ) -> None:
+        """Verify returning a connection stores the time it became idle."""
+        mock_time = mocker.patch("src.infrastructure.database.liveness.time")
+        mock_time.monotonic.return_value = 42.0
+        ping = IdleConnectionPing(mock_dialect, idle_seconds=30.0)
+
+        ping.checkin(mocker.Mock(), mock_record)
+
+        assert mock_record.info[IDLE_SINCE_KEY] == 42.0
+
+    @pytest.mark.parametrize(
+        ("idle_since", "expect_ping"),
+        [(None, False), (90.0, False), (60.0, True)],
+    )
+    def test_checkout_pings_only_idle_connections(
+        self,
+        mocker: MockerFixture,
+        mock_dialect: MockType,
+        mock_record: MockType,
+        idle_since: float | None,
+        expect_ping: bool,
+    ) -> None:
+        """Verify new and recently used connections are not pinged."""
+        mock_time = mocker.patch("src.infrastructure.database.liveness.time")
+        mock_time.monotonic.return_value = 100.0
+        if idle_since is not None:
+            mock_record.info[IDLE_SINCE_KEY] = idle_since
+        dbapi_connection = mocker.Mock()
+        ping = IdleConnectionPing(mock_dialect, idle_seconds=30.0)
+
+        ping.checkout(dbapi_connection, mock_record, mocker.Mock())
+
+        assert mock_dialect.do_ping.called is expect_ping
+        assert IDLE_SINCE_KEY not in mock_record.info
+
+    def test_failed_ping_discards_connection(
+        self, mocker: MockerFixture, mock_dialect: MockType, mock_record: MockType
+    ) -> None:
+        """Verify a failed ping makes the pool retry with a new connection."""
+        mocker.patch("src.infrastructure.database.liveness.logger")
+        mock_dialect.do_ping.side_effect = FakeDBAPIError("connection reset")
+        mock_record.info[IDLE_SINCE_KEY] = 0.0
+        ping = IdleConnectionPing(mock_dialect, idle_seconds=0.0)
+
+        with pytest.raises(DisconnectionError):
+            ping.checkout(mocker.Mock(), mock_record, mocker.Mock())
+
+
+@pytest.fixture
+def read_session(mock_async_session: MockType) -> MockType:
+    """Session mock outside of a transaction and without pending changes."""
+    mock_async_session.in_transaction.return_value = False
+    mock_async_session.new = set()
+    mock_async_session.dirty = set()
+    mock_async_session.deleted = set()
+    return mock_async_session
+
+
+@pytest.mark.unit
+class TestExecuteRead:
+    """Tests for execute_read."""
+
+    async def test_success_executes_once(self, read_session: MockType) -> None:
+        """Verify a successful read is executed once."""
+        statement = select(true())
+
+        result = await execute_read(read_session, statement)
+
+        assert result is read_session.execute.return_value
+        read_session.execute.assert_awaited_once_with(statement, None)
+
+    async def test_retries_once_on_invalidated_connection(
+        self, mocker: MockerFixture, read_session: MockType
+    ) -> None:
+        """Verify a read that started the transaction is retried after rollback."""
+        mocker.patch("src.infrastructure.database.liveness.logger")
+        retried = mocker.Mock()
+        read_session.execute.side_effect = [
+            disconnect_error(invalidated=True),
+            retried,
+        ]
+
+        result = await execute_read(read_session, select(true()))
+
+        assert result is retried
+        assert read_session.execute.await_count == 2
+        read_session.rollback.assert_awaited_once()
+
+    @pytest.mark.parametrize(
+        ("in_transaction", "invalidated"),
+        [(True, True), (False, False)],
+    )
+    async def test_no_retry_when_unsafe_or_not_disconnect(
+        self, read_session: MockType, in_transaction: bool, invalidated: bool
+    ) -> None:
+        """Verify reads inside a transaction and other errors are not retried."""
+        read_session.in_transaction.return_value = in_transaction
+        read_session.execute.side_effect = disconnect_error(invalidated=invalidated)
+
+        with pytest.raises(DBAPIError):
+            await execute_read(read_session, select(true()))
+
+        read_session.execute.assert_awaited_once()
+        read_session.rollback.assert_not_awaited()
+
+    async def test_no_retry_with_pending_changes(
+        self, mocker: MockerFixture, read_session: MockType
+    ) -> None:
+        """Verify autoflushed changes are not silently discarded by a retry."""
+        read_session.new = {mocker.Mock()}
+        read_session.execute.side_effect = disconnect_error(invalidated=True)
+
+        with pytest.raises(DBAPIError):
+            await execute_read(read_session, select(true()))
+
+        read_session.execute.assert_awaited_once()
+        read_session.rollback.assert_not_awaited()
@@ -0,0 +1,84 @@
+"""Unit tests for src/infrastructure/database/n_plus_one.py module.
+
+This module tests per-request N+1 detection in warn and raise modes.
+"""
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.core.resource_usage import RequestUsage
+from src.infrastructure.database.n_plus_one import (
+    NPlusOneMode,
+    NPlusOneQueryError,
+    detect_n_plus_one,
+)
+
+STATEMENT = "SELECT * FROM items WHERE items.order_id = $1::BIGINT"
+
+
+@pytest.fixture
+def usage() -> RequestUsage:
+    """Create a usage accumulator for a matched route."""
+    route = type("Route", (), {"path": "/orders/{order_id}"})()
+    return RequestUsage(scope={"path": "/orders/7", "route": route})
+
+
+@pytest.mark.unit
+class TestDetectNPlusOne:
+    """Tests for detect_n_plus_one."""
+
+    def test_warns_once_when_threshold_reached(
+        self, mocker: MockerFixture, usage: RequestUsage
+    ) -> None:
+        """Verify a single warning with route and fingerprint is logged."""
+        mock_logger = mocker.patch("src.infrastructure.database.n_plus_one.logger")
+
+        for _ in range(5):
+            detect_n_plus_one(usage, STATEMENT, mode="warn", threshold=3)
+
+        mock_logger.warning.assert_called_once()
+        kwargs = mock_logger.warning.call_args.kwargs
+        assert kwargs["route"] == "/orders/{order_id}"
+        assert kwargs["executions"] == 3
+        assert kwargs["statement"] == (
+            "SELECT * FROM items WHERE items.order_id = ?::BIGINT"
+        )
+        assert kwargs["fingerprint"]
+
+    def test_below_threshold_is_silent(
+        self, mocker: MockerFixture, usage: RequestUsage
+    ) -> None:
+        """Verify repeats under the threshold are not reported."""
+        mock_logger = mocker.patch("src.infrastructure.database.n_plus_one.logger")
+
+        detect_n_plus_one(usage, STATEMENT, mode="warn", threshold=3)
+        detect_n_plus_one(usage, STATEMENT, mode="warn", threshold=3)
+
+        mock_logger.warning.assert_not_called()
+
+    def test_distinct_statements_counted_separately(self, usage: RequestUsage) -> None:
+        """Verify each fingerprint has its own counter."""
+        detect_n_plus_one(usage, "SELECT 1", mode="warn", threshold=3)
+        detect_n_plus_one(usage, STATEMENT, mode="warn", threshold=3)
+        detect_n_plus_one(usage, STATEMENT, mode="warn", threshold=3)
+
+        assert sorted(usage.statement_counts.values()) == [1, 2]
+
+    def test_raise_mode_raises(self, usage: RequestUsage) -> None:
+        """Verify strict mode raises once the threshold is reached."""
+        detect_n_plus_one(usage, STATEMENT, mode="raise", threshold=2)
+
+        with pytest.raises(NPlusOneQueryError) as exc_info:
+            detect_n_plus_one(usage, STATEMENT, mode="raise", threshold=2)
+
+        assert exc_info.value.context["route"] == "/orders/{order_id}"
+        assert exc_info.value.context["executions"] == 2
+
+    @pytest.mark.parametrize("mode", ["off", None])
+    def test_disabled_does_not_count(
+        self, usage: RequestUsage, mode: NPlusOneMode | None
+    ) -> None:
+        """Verify disabled detection skips fingerprinting entirely."""
+        detect_n_plus_one(usage, STATEMENT, mode=mode, threshold=2)
+
+        assert usage.statement_counts == {}
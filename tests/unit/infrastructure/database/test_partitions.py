@@ -0,0 +1,272 @@
+"""Unit tests for src/infrastructure/database/partitions.py module.
+
+This module tests the partitioned model mixin, period bounds and partition
+names, the migration helpers, partition maintenance and the autogenerate
+filter.
+"""
+
+from datetime import UTC, datetime, timedelta, timezone
+from typing import cast
+
+import pytest
+from pytest_mock import MockerFixture, MockType
+from sqlalchemy import MetaData, String, Table
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.schema import CreateIndex, CreateTable, DropTable
+
+from src.infrastructure.database.base import BaseModel
+from src.infrastructure.database.partitions import (
+    PartitionedByCreatedAt,
+    create_partitioned_table,
+    detach_partitions,
+    drop_partitioned_table,
+    ensure_partitions,
+    is_partition_table,
+    partition_bounds,
+    partition_ddl,
+    partition_name,
+)
+from tests.unit.infrastructure.database.test_bulk_copy import (
+    CopyTestModel,
+    postgresql_dialect,
+)
+
+
+class PartitionTestEvent(PartitionedByCreatedAt, BaseModel):
+    """Test model partitioned by month."""
+
+    __tablename__ = "partition_test_event"
+
+    code: Mapped[str] = mapped_column(String(20), index=True)
+
+
+class PartitionTestReading(PartitionedByCreatedAt, BaseModel):
+    """Test model partitioned by week."""
+
+    __tablename__ = "partition_test_reading"
+    partition_interval = "week"
+
+
+EVENT_TABLE = cast("Table", PartitionTestEvent.__table__)
+READING_TABLE = cast("Table", PartitionTestReading.__table__)
+MARCH = datetime(2025, 3, 1, tzinfo=UTC)
+
+
+@pytest.mark.unit
+class TestPartitionedByCreatedAt:
+    """Tests for PartitionedByCreatedAt."""
+
+    def test_table_partitioned_by_created_at(self) -> None:
+        """Verify the partition key is part of the table's primary key."""
+        sql = str(CreateTable(EVENT_TABLE).compile(dialect=postgresql_dialect()))
+
+        assert "PRIMARY KEY (id, created_at)" in sql
+        assert sql.rstrip().endswith("PARTITION BY RANGE (created_at)")
+        assert EVENT_TABLE.info == {"partition_interval": "month"}
+        assert READING_TABLE.info == {"partition_interval": "week"}
+
+    def test_instances_identified_by_id(self) -> None:
+        """Verify instances are still looked up by id alone."""
+        assert [
+            column.name for column in PartitionTestEvent.__mapper__.primary_key
+        ] == ["id"]
+
+    def test_invalid_interval_rejected(self) -> None:
+        """Verify partition intervals are validated when models are declared."""
+        with pytest.raises(ValueError, match="Invalid partition interval: hour"):
+
+            class HourlyEvent(PartitionedByCreatedAt, BaseModel):
+                __tablename__ = "partition_test_hourly"
+                partition_interval = "hour"
+
+
+@pytest.mark.unit
+class TestPartitionPeriods:
+    """Tests for partition_bounds and partition_name."""
+
+    @pytest.mark.parametrize(
+        ("interval", "moment", "start", "end"),
+        [
+            (
+                "day",
+                datetime(2025, 3, 5, 23, 59, tzinfo=UTC),
+                (2025, 3, 5),
+                (2025, 3, 6),
+            ),
+            ("week", datetime(2025, 3, 5, 12, tzinfo=UTC), (2025, 3, 3), (2025, 3, 10)),
+            ("month", datetime(2025, 12, 31, tzinfo=UTC), (2025, 12, 1), (2026, 1, 1)),
+            ("quarter", datetime(2025, 8, 20, tzinfo=UTC), (2025, 7, 1), (2025, 10, 1)),
+            ("year", datetime(2025, 8, 20, tzinfo=UTC), (2025, 1, 1), (2026, 1, 1)),
+            (
+                "month",
+                datetime(2025, 4, 1, 1, tzinfo=timezone(timedelta(hours=2))),
+                (2025, 3, 1),
+                (2025, 4, 1),
+            ),
+        ],
+    )
+    def test_bounds_in_utc(
+        self,
+        interval: str,
+        moment: datetime,
+        start: tuple[int, int, int],
+        end: tuple[int, int, int],
+    ) -> None:
+        """Verify periods are half-open ranges of UTC calendar periods."""
+        assert partition_bounds(interval, moment) == (
+            datetime(*start, tzinfo=UTC),
+            datetime(*end, tzinfo=UTC),
+        )
+
+    def test_names_end_in_period_start(self) -> None:
+        """Verify partitions are named by table and period start."""
+        table = EVENT_TABLE
+
+        assert partition_name(table, "month", MARCH) == "partition_test_event_p2025_03"
+        assert partition_name(table, "day", MARCH) == "partition_test_event_p2025_03_01"
+        assert partition_name(table, "year", MARCH) == "partition_test_event_p2025"
+
+    def test_long_names_rejected(self) -> None:
+        """Verify names PostgreSQL would truncate are rejected."""
+        table = EVENT_TABLE.to_metadata(MetaData(), name="x" * 55)
+
+        with pytest.raises(ValueError, match="Partition name too long"):
+            partition_name(table, "day", MARCH)
+
+
+@pytest.mark.unit
+class TestPartitionMigrations:
+    """Tests for the migration helpers."""
+
+    def test_partition_ddl(self) -> None:
+        """Verify partitions cover the period of the given time."""
+        assert partition_ddl(PartitionTestEvent, MARCH + timedelta(days=3)) == (
+            'CREATE TABLE IF NOT EXISTS "partition_test_event_p2025_03" '
+            'PARTITION OF "partition_test_event" '
+            "FOR VALUES FROM ('2025-03-01T00:00:00+00:00') "
+            "TO ('2025-04-01T00:00:00+00:00')"
+        )
+
+    def test_create_partitioned_table(self, mocker: MockerFixture) -> None:
+        """Verify the parent table, its indexes and coming partitions are made."""
+        operations = mocker.Mock()
+
+        create_partitioned_table(operations, PartitionTestEvent, ahead=2, now=MARCH)
+
+        executed = [call.args[0] for call in operations.execute.call_args_list]
+        assert isinstance(executed[0], CreateTable)
+        assert isinstance(executed[1], CreateIndex)
+        assert executed[2:] == [
+            partition_ddl(PartitionTestEvent, datetime(2025, month, 1, tzinfo=UTC))
+            for month in (3, 4, 5)
+        ]
+
+    def test_drop_partitioned_table(self, mocker: MockerFixture) -> None:
+        """Verify dropping the parent table drops its partitions."""
+        operations = mocker.Mock()
+
+        drop_partitioned_table(operations, PartitionTestReading)
+
+        operations.execute.assert_called_once()
+        assert isinstance(operations.execute.call_args.args[0], DropTable)
+
+    def test_unpartitioned_model_rejected(self, mocker: MockerFixture) -> None:
+        """Verify helpers only accept partitioned models."""
+        with pytest.raises(TypeError, match="not partitioned by created_at"):
+            drop_partitioned_table(mocker.Mock(), CopyTestModel)
+
+
+@pytest.mark.unit
+class TestPartitionMaintenance:
+    """Tests for ensure_partitions and detach_partitions."""
+
+    async def test_missing_partitions_created(
+        self, mocker: MockerFixture, mock_async_session: MockType
+    ) -> None:
+        """Verify only partitions that don't exist yet are created."""
+        mocker.patch("src.infrastructure.database.partitions.logger")
+        mock_async_session.execute.return_value.all = mocker.Mock(
+            return_value=[("partition_test_reading_p2025_03_03", False)]
+        )
+
+        created = await ensure_partitions(
+            mock_async_session, PartitionTestReading, ahead=2, now=MARCH
+        )
+
+        assert created == [
+            "partition_test_reading_p2025_02_24",
+            "partition_test_reading_p2025_03_10",
+        ]
+        calls = mock_async_session.execute.call_args_list
+        assert calls[0].args[1] == {"table_name": '"partition_test_reading"'}
+        assert [str(call.args[0]) for call in calls[1:]] == [
+            partition_ddl(PartitionTestReading, datetime(2025, 2, 24, tzinfo=UTC)),
+            partition_ddl(PartitionTestReading, datetime(2025, 3, 10, tzinfo=UTC)),
+        ]
+
+    async def test_old_partitions_detached(self, mocker: MockerFixture) -> None:
+        """Verify partitions ending by the cutoff are detached concurrently."""
+        mocker.patch("src.infrastructure.database.partitions.logger")
+        connection = mocker.AsyncMock()
+        connection.execute.return_value.all = mocker.Mock(
+            return_value=[
+                ("partition_test_event_p2025_03", False),
+                ("partition_test_event_p2025_01", True),
+                ("partition_test_event_p2025_02", False),
+                ("partition_test_event_legacy", False),
+            ]
+        )
+        engine = mocker.MagicMock()
+        engine.connect.return_value.__aenter__.return_value = connection
+        get_engine = mocker.patch(
+            "src.infrastructure.database.partitions.get_engine", return_value=engine
+        )
+
+        detached = await detach_partitions(
+            PartitionTestEvent, before=MARCH, archive_schema="archive"
+        )
+
+        assert detached == [
+            "partition_test_event_p2025_01",
+            "partition_test_event_p2025_02",
+        ]
+        get_engine.assert_called_once_with("default")
+        connection.execution_options.assert_awaited_once_with(
+            isolation_level="AUTOCOMMIT"
+        )
+        statements = [
+            call.args[0] for call in connection.exec_driver_sql.call_args_list
+        ]
+        assert statements == [
+            (
+                'ALTER TABLE "partition_test_event" DETACH PARTITION '
+                '"partition_test_event_p2025_01" FINALIZE'
+            ),
+            'ALTER TABLE "partition_test_event_p2025_01" SET SCHEMA "archive"',
+            (
+                'ALTER TABLE "partition_test_event" DETACH PARTITION '
+                '"partition_test_event_p2025_02" CONCURRENTLY'
+            ),
+            'ALTER TABLE "partition_test_event_p2025_02" SET SCHEMA "archive"',
+        ]
+
+
+@pytest.mark.unit
+class TestIsPartitionTable:
+    """Tests for is_partition_table."""
+
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            ("partition_test_event_p2025_03", True),
+            ("partition_test_reading_p2025_03_03", True),
+            # Not the start of a week
+            ("partition_test_reading_p2025_03_04", False),
+            ("partition_test_event_p2025_03_01", False),
+            ("partition_test_event", False),
+            ("bulk_copy_test_model_p2025_03", False),
+        ],
+    )
+    def test_partitions_recognized(self, name: str, expected: bool) -> None:
+        """Verify only partition names of partitioned tables are recognized."""
+        assert is_partition_table(name, BaseModel.metadata) is expected
@@ -0,0 +1,95 @@
+"""Unit tests for src/infrastructure/database/pooler.py module.
+
+This module tests the connection arguments and per-transaction settings
+used behind a transaction pooler.
+"""
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.infrastructure.database.pooler import (
+    TransactionSettings,
+    pooler_connect_args,
+    split_server_settings,
+    unique_statement_name,
+)
+
+
+@pytest.mark.unit
+class TestPoolerConnectArgs:
+    """Tests for pooler_connect_args and unique_statement_name."""
+
+    def test_statement_caches_disabled(self) -> None:
+        """Verify both prepared statement caches are disabled."""
+        connect_args = pooler_connect_args()
+
+        assert connect_args["statement_cache_size"] == 0
+        assert connect_args["prepared_statement_cache_size"] == 0
+        assert connect_args["prepared_statement_name_func"] is unique_statement_name
+
+    def test_statement_names_are_unique(self) -> None:
+        """Verify generated statement names never repeat."""
+        names = {unique_statement_name() for _ in range(100)}
+
+        assert len(names) == 100
+        assert all(name.startswith("__asyncpg_") for name in names)
+
+
+@pytest.mark.unit
+class TestSplitServerSettings:
+    """Tests for split_server_settings."""
+
+    def test_split_by_pooler_support(self) -> None:
+        """Verify only parameters the pooler forwards stay startup parameters."""
+        startup, per_transaction = split_server_settings(
+            {"application_name": "tributum", "jit": "off", "work_mem": "64MB"}
+        )
+
+        assert startup == {"application_name": "tributum"}
+        assert per_transaction == {"jit": "off", "work_mem": "64MB"}
+
+
+@pytest.mark.unit
+class TestTransactionSettings:
+    """Tests for TransactionSettings."""
+
+    def test_applies_settings_locally(self, mocker: MockerFixture) -> None:
+        """Verify all settings are applied with one transaction-local call."""
+        conn = mocker.Mock()
+        conn.get_execution_options.return_value = {}
+        listener = TransactionSettings({"jit": "off", "work_mem": "64MB"})
+
+        listener(conn)
+
+        statement, parameters = conn.execute.call_args.args
+        assert str(statement) == (
+            "SELECT set_config(:name_0, :value_0, true), "
+            "set_config(:name_1, :value_1, true)"
+        )
+        assert parameters == {
+            "name_0": "jit",
+            "value_0": "off",
+            "name_1": "work_mem",
+            "value_1": "64MB",
+        }
+
+    @pytest.mark.parametrize(
+        ("server_settings", "execution_options"),
+        [
+            ({}, {}),
+            ({"jit": "off"}, {"isolation_level": "AUTOCOMMIT"}),
+        ],
+    )
+    def test_skipped_without_settings_or_transaction(
+        self,
+        mocker: MockerFixture,
+        server_settings: dict[str, str],
+        execution_options: dict[str, str],
+    ) -> None:
+        """Verify nothing is executed without settings or in autocommit."""
+        conn = mocker.Mock()
+        conn.get_execution_options.return_value = execution_options
+
+        TransactionSettings(server_settings)(conn)
+
+        conn.execute.assert_not_called()
@@ -0,0 +1,202 @@
+"""Unit tests for src/infrastructure/database/query_stats.py module.
+
+This module tests the bounded per-fingerprint aggregator, its histogram
+percentile estimates and the periodic log summary.
+"""
+
+import asyncio
+import contextlib
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.core.config import Settings
+from src.infrastructure.database.query_stats import (
+    QueryStatsAggregator,
+    QueryStatsOrder,
+    _bucket_index,
+    _bucket_midpoint_ns,
+    get_query_stats,
+    log_query_stats_periodically,
+)
+
+MS = 1_000_000
+
+
+@pytest.mark.unit
+class TestHistogramBuckets:
+    """Tests for the log-scale latency buckets."""
+
+    @pytest.mark.parametrize("duration_ns", [20_000, 1 * MS, 37 * MS, 2_500 * MS])
+    def test_midpoint_within_bucket_error(self, duration_ns: int) -> None:
+        """Verify bucket midpoints stay within about 10% of the duration."""
+        midpoint = _bucket_midpoint_ns(_bucket_index(duration_ns))
+
+        assert midpoint == pytest.approx(duration_ns, rel=0.1)
+
+    def test_extremes_are_clamped(self) -> None:
+        """Verify tiny and huge durations land in the first and last bucket."""
+        assert _bucket_index(0) == 0
+        assert _bucket_index(10**15) == 95
+
+
+@pytest.mark.unit
+class TestQueryStatsAggregator:
+    """Tests for QueryStatsAggregator."""
+
+    def test_groups_statements_by_fingerprint(self) -> None:
+        """Verify executions differing only in literals are aggregated."""
+        aggregator = QueryStatsAggregator(max_entries=10)
+
+        aggregator.record("SELECT * FROM t WHERE id = 1", 2 * MS, rows=1)
+        aggregator.record("SELECT * FROM t WHERE id = 2", 4 * MS, rows=1)
+
+        snapshot = aggregator.snapshot()
+        statements = snapshot["statements"]
+        assert isinstance(statements, list)
+        assert len(statements) == 1
+        entry = statements[0]
+        assert entry["query"] == "SELECT * FROM t WHERE id = ?"
+        assert entry["calls"] == 2
+        assert entry["total_ms"] == 6.0
+        assert entry["mean_ms"] == 3.0
+        assert entry["min_ms"] == 2.0
+        assert entry["max_ms"] == 4.0
+        assert entry["rows"] == 2
+
+    def test_percentiles_from_histogram(self) -> None:
+        """Verify p95/p99 reflect the slow tail of the distribution."""
+        aggregator = QueryStatsAggregator(max_entries=10)
+        for _ in range(98):
+            aggregator.record("SELECT 1", 1 * MS)
+        aggregator.record("SELECT 1", 50 * MS)
+        aggregator.record("SELECT 1", 100 * MS)
+
+        statements = aggregator.snapshot()["statements"]
+        assert isinstance(statements, list)
+        entry = statements[0]
+        assert entry["p95_ms"] == pytest.approx(1.0, rel=0.1)
+        assert entry["p99_ms"] == pytest.approx(50.0, rel=0.1)
+
+    def test_unknown_rows_are_not_counted(self) -> None:
+        """Verify negative row counts do not reduce the total."""
+        aggregator = QueryStatsAggregator(max_entries=10)
+
+        aggregator.record("SELECT 1", MS, rows=-1)
+
+        statements = aggregator.snapshot()["statements"]
+        assert isinstance(statements, list)
+        assert statements[0]["rows"] == 0
+
+    def test_evicts_least_recent_when_full(self) -> None:
+        """Verify the least recently executed entry makes room for new ones."""
+        aggregator = QueryStatsAggregator(max_entries=2)
+        aggregator.record("SELECT a FROM t", MS)
+        aggregator.record("SELECT b FROM t", MS)
+        aggregator.record("SELECT b FROM t", MS)
+        aggregator.record("SELECT a FROM t", MS)
+
+        aggregator.record("SELECT c FROM t", MS)
+
+        snapshot = aggregator.snapshot()
+        statements = snapshot["statements"]
+        assert isinstance(statements, list)
+        assert {entry["query"] for entry in statements} == {
+            "SELECT a FROM t",
+            "SELECT c FROM t",
+        }
+        assert snapshot["evictions"] == 1
+
+    @pytest.mark.parametrize(
+        ("order_by", "expected_first"),
+        [
+            ("total", "SELECT many FROM t"),
+            ("calls", "SELECT many FROM t"),
+            ("mean", "SELECT slow FROM t"),
+            ("p99", "SELECT slow FROM t"),
+        ],
+    )
+    def test_snapshot_ordering(
+        self, order_by: QueryStatsOrder, expected_first: str
+    ) -> None:
+        """Verify the snapshot is sorted by the requested key."""
+        aggregator = QueryStatsAggregator(max_entries=10)
+        for _ in range(100):
+            aggregator.record("SELECT many FROM t", MS)
+        aggregator.record("SELECT slow FROM t", 20 * MS)
+
+        statements = aggregator.snapshot(order_by=order_by)["statements"]
+
+        assert isinstance(statements, list)
+        assert statements[0]["query"] == expected_first
+
+    def test_snapshot_limit(self) -> None:
+        """Verify the number of returned statements is limited."""
+        aggregator = QueryStatsAggregator(max_entries=10)
+        for statement in ("SELECT * FROM a", "SELECT * FROM b", "SELECT * FROM c"):
+            aggregator.record(statement, MS)
+
+        snapshot = aggregator.snapshot(limit=2)
+
+        assert snapshot["tracked_statements"] == 3
+        statements = snapshot["statements"]
+        assert isinstance(statements, list)
+        assert len(statements) == 2
+
+    def test_reset_clears_statistics(self) -> None:
+        """Verify reset starts an empty collection window."""
+        aggregator = QueryStatsAggregator(max_entries=10)
+        aggregator.record("SELECT 1", MS)
+
+        aggregator.reset()
+
+        snapshot = aggregator.snapshot()
+        assert snapshot["statements"] == []
+        assert snapshot["evictions"] == 0
+
+
+@pytest.mark.unit
+class TestGetQueryStats:
+    """Tests for the shared aggregator and the periodic summary."""
+
+    def test_shared_instance_sized_from_settings(
+        self, mocker: MockerFixture, mock_settings: Settings
+    ) -> None:
+        """Verify the aggregator is created once with the configured size."""
+        mock_settings.database_config.query_stats_max_entries = 42
+        mocker.patch(
+            "src.infrastructure.database.query_stats.get_settings",
+            return_value=mock_settings,
+        )
+        get_query_stats.cache_clear()
+
+        try:
+            aggregator = get_query_stats()
+            assert aggregator.max_entries == 42
+            assert get_query_stats() is aggregator
+        finally:
+            get_query_stats.cache_clear()
+
+    @pytest.mark.timeout(1)
+    async def test_periodic_summary_logs_top_statements(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Verify a summary is logged after each interval."""
+        aggregator = QueryStatsAggregator(max_entries=10)
+        aggregator.record("SELECT 1", MS)
+        mocker.patch(
+            "src.infrastructure.database.query_stats.get_query_stats",
+            return_value=aggregator,
+        )
+        mock_logger = mocker.patch("src.infrastructure.database.query_stats.logger")
+        logged = asyncio.Event()
+        mock_logger.info.side_effect = lambda *_args, **_kwargs: logged.set()
+
+        task = asyncio.create_task(log_query_stats_periodically(0.01))
+        await logged.wait()
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+        kwargs = mock_logger.info.call_args.kwargs
+        assert kwargs["top_statements"][0]["query"] == "SELECT ?"
@@ -6,19 +6,38 @@ including CRUD operations, edge cases, error handling, logging, and thread safet
 
 import asyncio
 import collections
+import contextlib
+import dataclasses
 import threading
 import types
-from typing import Any, cast
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+from typing import Any, ClassVar, NamedTuple, cast
 
 import pytest
 from pytest_mock import MockerFixture, MockType
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer, raiseload
 
+from src.infrastructure.database.aggregates import Count, Sum
 from src.infrastructure.database.base import BaseModel
+from src.infrastructure.database.bulk_copy import CopyResult
+from src.infrastructure.database.filters import (
+    TOTAL_COLUMN,
+    ILikePrefix,
+    In,
+    IsNull,
+    Range,
+)
 from src.infrastructure.database.repository import (
     DEFAULT_PAGINATION_LIMIT,
     BaseRepository,
+    LoadProfiles,
+    Page,
 )
+from src.infrastructure.database.row_estimate import get_count_cache
+from tests.unit.infrastructure.database.test_bulk_copy import postgresql_dialect
 
 
 @pytest.mark.unit
@@ -569,7 +588,7 @@ class TestBaseRepository:
     ) -> None:
         """Verify existence check returns True."""
         # Setup
-        mock_repository_query_result.scalar.return_value = 1
+        mock_repository_query_result.scalar.return_value = True
         mock_async_session.execute.return_value = mock_repository_query_result
 
         repository = repository_factory(mock_async_session, mock_model_class)
@@ -579,6 +598,11 @@ class TestBaseRepository:
 
         # Assert
         assert result is True
+        statement, parameters = mock_async_session.execute.call_args.args
+        sql = str(statement.compile(dialect=postgresql_dialect()))
+        assert sql.startswith("SELECT EXISTS (SELECT test_repo_model.id")
+        assert "count" not in sql
+        assert parameters == {"filter_0": 1}
 
     async def test_exists_when_false(
         self,
@@ -589,7 +613,7 @@ class TestBaseRepository:
     ) -> None:
         """Verify existence check returns False."""
         # Setup
-        mock_repository_query_result.scalar.return_value = 0
+        mock_repository_query_result.scalar.return_value = False
         mock_async_session.execute.return_value = mock_repository_query_result
 
         repository = repository_factory(mock_async_session, mock_model_class)
@@ -600,6 +624,61 @@ class TestBaseRepository:
         # Assert
         assert result is False
 
+    async def test_exists_by_filters(
+        self,
+        repository_factory: MockType,
+        mock_async_session: MockType,
+        mock_model_class: type[BaseModel],
+        mock_repository_query_result: MockType,
+    ) -> None:
+        """Verify existence checks accept filter operators."""
+        # Setup
+        mock_repository_query_result.scalar.return_value = True
+        mock_async_session.execute.return_value = mock_repository_query_result
+
+        repository = repository_factory(mock_async_session, mock_model_class)
+
+        # Execute
+        result = await repository.exists_by(status=In(["active"]), email=None)
+
+        # Assert
+        assert result is True
+        statement, parameters = mock_async_session.execute.call_args.args
+        sql = str(statement.compile(dialect=postgresql_dialect()))
+        assert "WHERE test_repo_model.status IN" in sql
+        assert "test_repo_model.email IS NULL" in sql
+        assert parameters == {"filter_0": ["active"]}
+
+    async def test_aggregate_groups_in_database(
+        self,
+        repository_factory: MockType,
+        mock_async_session: MockType,
+        mock_model_class: type[BaseModel],
+        mock_repository_query_result: MockType,
+    ) -> None:
+        """Verify aggregation runs one GROUP BY with filter parameters."""
+        # Setup
+        rows = [("active", 10, 2)]
+        mock_repository_query_result.all.return_value = rows
+        mock_async_session.execute.return_value = mock_repository_query_result
+
+        repository = repository_factory(mock_async_session, mock_model_class)
+
+        # Execute
+        result = await repository.aggregate(
+            {"total": Sum("id"), "rows": Count()},
+            group_by=["status"],
+            filters={"name": ILikePrefix("a")},
+            time_bucket=("created_at", "1 day"),
+        )
+
+        # Assert
+        assert result == rows
+        statement, parameters = mock_async_session.execute.call_args.args
+        sql = str(statement.compile(dialect=postgresql_dialect()))
+        assert "GROUP BY date_trunc('day', test_repo_model.created_at)" in sql
+        assert parameters == {"filter_0": "a%"}
+
     async def test_filter_by_single_field(
         self,
         repository_factory: MockType,
@@ -655,27 +734,159 @@ class TestBaseRepository:
         repository_factory: MockType,
         mock_async_session: MockType,
         mock_model_class: type[BaseModel],
+    ) -> None:
+        """Test with non-existent field."""
+        repository = repository_factory(mock_async_session, mock_model_class)
+
+        # Execute - we know 'invalid_field' doesn't exist on our test model
+        with pytest.raises(ValueError, match="Unknown field for TestModel"):
+            await repository.filter_by(invalid_field="value")
+
+        # Assert - nothing was sent to the database
+        mock_async_session.execute.assert_not_called()
+
+    async def test_filter_by_operators(
+        self,
+        repository_factory: MockType,
+        mock_async_session: MockType,
+        mock_model_class: type[BaseModel],
+        mock_repository_query_result: MockType,
+    ) -> None:
+        """Verify operators become SQL conditions with bound values."""
+        # Setup
+        mock_repository_query_result.scalars.return_value.all.return_value = []
+        mock_async_session.execute.return_value = mock_repository_query_result
+
+        repository = repository_factory(mock_async_session, mock_model_class)
+
+        # Execute
+        await repository.filter_by(
+            status=In(["active", "pending"]),
+            name=ILikePrefix("te_"),
+            id=Range(10, 20),
+        )
+
+        # Assert
+        statement, parameters = mock_async_session.execute.call_args.args
+        sql = str(statement.compile(dialect=postgresql_dialect()))
+        assert "test_repo_model.status IN (__[POSTCOMPILE_filter_0])" in sql
+        assert "test_repo_model.name ILIKE %(filter_1)s::VARCHAR ESCAPE '\\'" in sql
+        assert "test_repo_model.id >= %(filter_2)s" in sql
+        assert "test_repo_model.id < %(filter_2_end)s" in sql
+        assert parameters == {
+            "filter_0": ["active", "pending"],
+            "filter_1": "te\\_%",
+            "filter_2": 10,
+            "filter_2_end": 20,
+        }
+
+    async def test_project_into_dataclass(
+        self,
+        mocker: MockerFixture,
+        repository_factory: MockType,
+        mock_async_session: MockType,
+        mock_model_class: type[BaseModel],
         mock_repository_query_result: MockType,
+    ) -> None:
+        """Verify projections select their fields and wrap each row."""
+        # Setup
+        mock_repository_query_result.all.return_value = [
+            mocker.Mock(_mapping={"id": 1, "name": "a"}),
+            mocker.Mock(_mapping={"id": 2, "name": "b"}),
+        ]
+        mock_async_session.execute.return_value = mock_repository_query_result
+
+        repository = repository_factory(mock_async_session, mock_model_class)
+
+        # Execute
+        result = await repository.project(NameSummary, {"status": "active"}, limit=2)
+
+        # Assert
+        assert result == [NameSummary(1, "a"), NameSummary(2, "b")]
+        statement = mock_async_session.execute.call_args.args[0]
+        assert list(statement.selected_columns.keys()) == ["id", "name"]
+
+    async def test_project_into_keyword_only_dataclass(
+        self,
         mocker: MockerFixture,
+        repository_factory: MockType,
+        mock_async_session: MockType,
+        mock_model_class: type[BaseModel],
+        mock_repository_query_result: MockType,
     ) -> None:
-        """Test with non-existent field."""
+        """Verify projection fields are passed by name, not position."""
+        # Setup
+        mock_repository_query_result.all.return_value = [
+            mocker.Mock(_mapping={"name": "a", "id": 1}),
+        ]
+        mock_async_session.execute.return_value = mock_repository_query_result
+
+        repository = repository_factory(mock_async_session, mock_model_class)
+
+        # Execute
+        result = await repository.project(NamedEntry)
+
+        # Assert
+        assert result == [NamedEntry(name="a", id=1)]
+
+    async def test_filter_by_statement_cached_per_shape(
+        self,
+        repository_factory: MockType,
+        mock_async_session: MockType,
+        mock_model_class: type[BaseModel],
+        mock_repository_query_result: MockType,
+    ) -> None:
+        """Verify calls differing only in values share one statement."""
         # Setup
-        mock_logger = mocker.patch("src.infrastructure.database.repository.logger")
         mock_repository_query_result.scalars.return_value.all.return_value = []
         mock_async_session.execute.return_value = mock_repository_query_result
 
         repository = repository_factory(mock_async_session, mock_model_class)
 
-        # Execute - we know 'invalid_field' doesn't exist on our test model
-        result = await repository.filter_by(invalid_field="value")
+        # Execute
+        await repository.filter_by(status="active", id=In([1]))
+        await repository.filter_by(status="archived", id=In([2, 3]))
+        await repository.filter_by(status=None)
 
         # Assert
-        assert result == []
-        mock_logger.warning.assert_called_with(
-            "Attempted to filter by non-existent field '{}' on {}",
-            "invalid_field",
-            "TestModel",
+        first, second, third = (
+            call.args[0] for call in mock_async_session.execute.call_args_list
         )
+        assert first is second
+        assert third is not first
+        assert "status IS NULL" in str(third)
+
+    async def test_find_columns_projects_and_orders(
+        self,
+        repository_factory: MockType,
+        mock_async_session: MockType,
+        mock_model_class: type[BaseModel],
+        mock_repository_query_result: MockType,
+    ) -> None:
+        """Verify only the requested columns are selected, in order."""
+        # Setup
+        rows = [("a", 2), ("b", 1)]
+        mock_repository_query_result.all.return_value = rows
+        mock_async_session.execute.return_value = mock_repository_query_result
+
+        repository = repository_factory(mock_async_session, mock_model_class)
+
+        # Execute
+        result = await repository.find_columns(
+            ["name", "id"],
+            {"status": IsNull(is_null=False)},
+            order_by=["-name"],
+            limit=5,
+        )
+
+        # Assert
+        assert result == rows
+        statement, parameters = mock_async_session.execute.call_args.args
+        sql = str(statement.compile(dialect=postgresql_dialect()))
+        assert sql.startswith("SELECT test_repo_model.name, test_repo_model.id \n")
+        assert "WHERE test_repo_model.status IS NOT NULL" in sql
+        assert "ORDER BY test_repo_model.name DESC" in sql
+        assert parameters == {"filter_limit": 5}
 
     async def test_filter_by_empty_kwargs(
         self,
@@ -773,27 +984,16 @@ class TestBaseRepository:
         repository_factory: MockType,
         mock_async_session: MockType,
         mock_model_class: type[BaseModel],
-        mock_repository_query_result: MockType,
-        mocker: MockerFixture,
     ) -> None:
         """Test find_one_by with non-existent field."""
-        # Setup
-        mock_logger = mocker.patch("src.infrastructure.database.repository.logger")
-        mock_repository_query_result.scalar_one_or_none.return_value = None
-        mock_async_session.execute.return_value = mock_repository_query_result
-
         repository = repository_factory(mock_async_session, mock_model_class)
 
         # Execute - we know 'invalid_field' doesn't exist on our test model
-        result = await repository.find_one_by(invalid_field="value")
+        with pytest.raises(ValueError, match="Unknown field for TestModel"):
+            await repository.find_one_by(invalid_field="value")
 
-        # Assert
-        assert result is None
-        mock_logger.warning.assert_called_with(
-            "Attempted to filter by non-existent field '{}' on {}",
-            "invalid_field",
-            "TestModel",
-        )
+        # Assert - nothing was sent to the database
+        mock_async_session.execute.assert_not_called()
 
     def test_concurrent_read_operations(
         self,
@@ -817,10 +1017,10 @@ class TestBaseRepository:
             instance.id = i + 1
             thread_results[i + 1] = instance
 
-        def mock_execute_side_effect(stmt: object) -> MockType:
+        def mock_execute_side_effect(stmt: object, parameters: object) -> MockType:
             # We ignore the stmt parameter for testing purposes
             # In real scenario, we'd parse the SQL but we're testing behavior
-            del stmt  # Explicitly ignore the parameter
+            del stmt, parameters  # Explicitly ignore the parameters
             result = mocker.Mock()
             result.scalar_one_or_none = mocker.Mock(return_value=thread_results.get(1))
             return cast("MockType", result)
@@ -1000,3 +1200,569 @@ class TestBaseRepository:
         # Assert
         assert repository.model_class is mock_model_class
         assert hasattr(repository.model_class, "id")
+
+    async def test_copy_in_delegates_to_copy_records(
+        self,
+        repository_factory: MockType,
+        mock_async_session: MockType,
+        mock_model_class: type[BaseModel],
+        mocker: MockerFixture,
+    ) -> None:
+        """Verify copy_in copies into the repository's model table."""
+        copy_result = CopyResult(rows=2, elapsed_s=0.1)
+        mock_copy = mocker.patch(
+            "src.infrastructure.database.repository.copy_records",
+            return_value=copy_result,
+        )
+        repository = repository_factory(mock_async_session, mock_model_class)
+        rows = [("a",), ("b",)]
+
+        result = await repository.copy_in(rows, conflict_columns=["name"])
+
+        assert result is copy_result
+        mock_copy.assert_awaited_once_with(
+            mock_async_session,
+            mock_model_class,
+            rows,
+            columns=None,
+            conflict_columns=["name"],
+        )
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class NameSummary:
+    """Projection of a test model's ID and name."""
+
+    id: int
+    name: str
+
+
+@dataclasses.dataclass(kw_only=True)
+class NamedEntry:
+    """Keyword-only projection of a test model's name and ID."""
+
+    name: str
+    id: int
+
+
+class WindowRow(NamedTuple):
+    """Result row of an instance and the window count of all matches."""
+
+    instance: object
+    total: int
+
+    @property
+    def _mapping(self) -> dict[str, object]:
+        return {TOTAL_COLUMN: self.total}
+
+
+@pytest.mark.unit
+class TestRepositoryPage:
+    """Test paged listings with exact and estimated totals."""
+
+    async def test_exact_total_from_window_count(
+        self,
+        repository_factory: MockType,
+        mock_async_session: MockType,
+        mock_model_class: type[BaseModel],
+        sample_model_instances: list[MockType],
+        mock_repository_query_result: MockType,
+    ) -> None:
+        """Verify items and total come from a single statement."""
+        # Setup
+        rows = [WindowRow(instance, 42) for instance in sample_model_instances[:2]]
+        mock_repository_query_result.all.return_value = rows
+        mock_async_session.execute.return_value = mock_repository_query_result
+
+        repository = repository_factory(mock_async_session, mock_model_class)
+
+        # Execute
+        page = await repository.page({"status": "active"}, skip=20, limit=2)
+
+        # Assert
+        assert page == Page(items=sample_model_instances[:2], total=42, estimated=False)
+        mock_async_session.execute.assert_called_once()
+        statement, parameters = mock_async_session.execute.call_args.args
+        sql = str(statement.compile(dialect=postgresql_dialect()))
+        assert "count(*) OVER () AS filter_total" in sql
+        assert parameters == {
+            "filter_0": "active",
+            "filter_limit": 2,
+            "filter_offset": 20,
+        }
+
+    async def test_exact_total_past_last_page(
+        self,
+        repository_factory: MockType,
+        mock_async_session: MockType,
+        mock_model_class: type[BaseModel],
+        mocker: MockerFixture,
+    ) -> None:
+        """Verify an empty page past the end still reports the total."""
+        # Setup
+        empty_page = mocker.Mock()
+        empty_page.all.return_value = []
+        count_result = mocker.Mock()
+        count_result.scalar.return_value = 7
+        mock_async_session.execute.side_effect = [empty_page, count_result]
+
+        repository = repository_factory(mock_async_session, mock_model_class)
+
+        # Execute
+        page = await repository.page(skip=100, limit=10)
+
+        # Assert
+        assert page == Page(items=[], total=7, estimated=False)
+        count_statement = mock_async_session.execute.call_args.args[0]
+        assert "count(*)" in str(count_statement)
+
+    async def test_estimated_total_from_table_statistics(
+        self,
+        repository_factory: MockType,
+        mock_async_session: MockType,
+        mock_model_class: type[BaseModel],
+        sample_model_instances: list[MockType],
+        mocker: MockerFixture,
+    ) -> None:
+        """Verify unfiltered listings estimate from table statistics."""
+        # Setup
+        mock_repository_query_result = mocker.Mock()
+        mock_repository_query_result.scalars.return_value.all.return_value = (
+            sample_model_instances[:2]
+        )
+        mock_async_session.execute.return_value = mock_repository_query_result
+        mock_table_rows = mocker.patch(
+            "src.infrastructure.database.repository.estimate_table_rows",
+            return_value=1_000_000,
+        )
+        mock_query_rows = mocker.patch(
+            "src.infrastructure.database.repository.estimate_query_rows"
+        )
+
+        repository = repository_factory(mock_async_session, mock_model_class)
+
+        # Execute
+        page = await repository.page(limit=2, count="estimated")
+
+        # Assert
+        assert page.total == 1_000_000
+        assert page.estimated is True
+        statement = mock_async_session.execute.call_args.args[0]
+        assert "OVER" not in str(statement)
+        mock_table_rows.assert_awaited_once()
+        mock_query_rows.assert_not_called()
+
+    async def test_estimated_total_from_plan_for_filters(
+        self,
+        repository_factory: MockType,
+        mock_async_session: MockType,
+        mock_model_class: type[BaseModel],
+        sample_model_instances: list[MockType],
+        mocker: MockerFixture,
+    ) -> None:
+        """Verify filtered listings estimate from the plan, bounded below."""
+        # Setup
+        mock_repository_query_result = mocker.Mock()
+        mock_repository_query_result.scalars.return_value.all.return_value = (
+            sample_model_instances[:2]
+        )
+        mock_async_session.execute.return_value = mock_repository_query_result
+        mock_query_rows = mocker.patch(
+            "src.infrastructure.database.repository.estimate_query_rows",
+            return_value=5,
+        )
+
+        repository = repository_factory(mock_async_session, mock_model_class)
+
+        # Execute
+        page = await repository.page(
+            {"status": "active"}, skip=10, limit=2, count="estimated"
+        )
+
+        # Assert - at least the rows up to the end of this page exist
+        assert page.total == 12
+        assert page.estimated is True
+        assert mock_query_rows.call_args.args[2] == {"filter_0": "active"}
+
+    async def test_estimated_total_exact_on_last_page(
+        self,
+        repository_factory: MockType,
+        mock_async_session: MockType,
+        mock_model_class: type[BaseModel],
+        sample_model_instances: list[MockType],
+        mocker: MockerFixture,
+    ) -> None:
+        """Verify a short page makes the total exact without estimating."""
+        # Setup
+        mock_repository_query_result = mocker.Mock()
+        mock_repository_query_result.scalars.return_value.all.return_value = (
+            sample_model_instances[:3]
+        )
+        mock_async_session.execute.return_value = mock_repository_query_result
+        mock_table_rows = mocker.patch(
+            "src.infrastructure.database.repository.estimate_table_rows"
+        )
+
+        repository = repository_factory(mock_async_session, mock_model_class)
+
+        # Execute
+        page = await repository.page(skip=50, limit=10, count="estimated")
+
+        # Assert
+        assert page == Page(items=sample_model_instances[:3], total=53, estimated=False)
+        mock_table_rows.assert_not_called()
+
+
+def profiled_repository(
+    session: AsyncSession, model_class: type[BaseModel]
+) -> BaseRepository[BaseModel]:
+    """Create a repository declaring a list and a detail load profile."""
+
+    class ProfiledRepository(BaseRepository[BaseModel]):
+        load_profiles: ClassVar[LoadProfiles] = {
+            "list": (defer(model_class.__mapper__.attrs["email"].class_attribute),),
+            "detail": (raiseload("*"),),
+        }
+
+    return ProfiledRepository(session, model_class)
+
+
+@pytest.mark.unit
+class TestRepositoryLoadProfiles:
+    """Test loader options applied by named load profiles."""
+
+    async def test_get_by_id_applies_profile(
+        self,
+        mock_async_session: MockType,
+        mock_model_class: type[BaseModel],
+        sample_model_instances: list[MockType],
+        mock_repository_query_result: MockType,
+    ) -> None:
+        """Verify profile options apply and joined rows are deduplicated."""
+        # Setup
+        unique_result = mock_repository_query_result.unique.return_value
+        unique_result.scalar_one_or_none.return_value = sample_model_instances[0]
+        mock_async_session.execute.return_value = mock_repository_query_result
+
+        repository = profiled_repository(mock_async_session, mock_model_class)
+
+        # Execute
+        result = await repository.get_by_id(1, load="detail")
+
+        # Assert
+        assert result is sample_model_instances[0]
+        statement = mock_async_session.execute.call_args.args[0]
+        assert statement._with_options == repository.load_profiles["detail"]
+
+    async def test_filter_by_statement_cached_per_profile(
+        self,
+        mock_async_session: MockType,
+        mock_model_class: type[BaseModel],
+        mock_repository_query_result: MockType,
+    ) -> None:
+        """Verify a profile is part of the query shape."""
+        # Setup
+        mock_repository_query_result.unique.return_value = mock_repository_query_result
+        mock_repository_query_result.scalars.return_value.all.return_value = []
+        mock_async_session.execute.return_value = mock_repository_query_result
+
+        repository = profiled_repository(mock_async_session, mock_model_class)
+
+        # Execute
+        await repository.filter_by(load="list", status="active")
+        await repository.filter_by(load="list", status="archived")
+        await repository.filter_by(status="active")
+
+        # Assert
+        first, second, third = (
+            call.args[0] for call in mock_async_session.execute.call_args_list
+        )
+        assert first is second
+        assert third is not first
+        assert "test_repo_model.email" not in str(first)
+        assert "test_repo_model.email" in str(third)
+
+    async def test_get_all_defers_columns(
+        self,
+        mock_async_session: MockType,
+        mock_model_class: type[BaseModel],
+        mock_repository_query_result: MockType,
+    ) -> None:
+        """Verify deferred columns are left out of listings."""
+        # Setup
+        mock_repository_query_result.unique.return_value = mock_repository_query_result
+        mock_repository_query_result.scalars.return_value.all.return_value = []
+        mock_async_session.execute.return_value = mock_repository_query_result
+
+        repository = profiled_repository(mock_async_session, mock_model_class)
+
+        # Execute
+        await repository.get_all(limit=10, load="list")
+
+        # Assert
+        statement = mock_async_session.execute.call_args.args[0]
+        sql = str(statement.compile(dialect=postgresql_dialect()))
+        assert "test_repo_model.name" in sql
+        assert "test_repo_model.email" not in sql
+
+    async def test_unknown_profile_rejected(
+        self, mock_async_session: MockType, mock_model_class: type[BaseModel]
+    ) -> None:
+        """Verify only declared profiles can be used."""
+        repository = profiled_repository(mock_async_session, mock_model_class)
+
+        with pytest.raises(
+            ValueError, match="Unknown load profile for ProfiledRepository: summary"
+        ):
+            await repository.find_one_by(load="summary", status="active")
+
+        mock_async_session.execute.assert_not_called()
+
+
+@pytest.mark.unit
+class TestRepositoryCount:
+    """Test estimated and cached counts."""
+
+    @pytest.mark.parametrize(("estimate", "expected"), [(1234, 1234), (None, 7)])
+    async def test_estimated_count(
+        self,
+        mocker: MockerFixture,
+        mock_async_session: MockType,
+        mock_model_class: type[BaseModel],
+        estimate: int | None,
+        expected: int,
+    ) -> None:
+        """Verify estimates come from statistics, when there are any."""
+        # Setup
+        mock_table_rows = mocker.patch(
+            "src.infrastructure.database.repository.estimate_table_rows",
+            return_value=estimate,
+        )
+        mock_async_session.execute.return_value.scalar = mocker.Mock(return_value=7)
+
+        repository = BaseRepository(mock_async_session, mock_model_class)
+
+        # Execute
+        result = await repository.count(estimate=True)
+
+        # Assert
+        assert result == expected
+        assert mock_table_rows.call_args.args[1] is mock_model_class.__table__
+        assert mock_async_session.execute.called is (estimate is None)
+
+    async def test_exact_count_cached_until_deletion(
+        self,
+        mocker: MockerFixture,
+        mock_async_session: MockType,
+        mock_model_class: type[BaseModel],
+    ) -> None:
+        """Verify repositories with a time to live reuse exact counts."""
+
+        # Setup
+        class CachedCountRepository(BaseRepository[BaseModel]):
+            count_cache_ttl_s: ClassVar[float | None] = 60.0
+
+        get_count_cache().invalidate(mock_model_class)
+        result = mock_async_session.execute.return_value
+        result.scalar = mocker.Mock(side_effect=[5, 4, 4])
+        result.rowcount = 1
+
+        repository = CachedCountRepository(mock_async_session, mock_model_class)
+
+        # Execute
+        counts = [await repository.count(), await repository.count()]
+        await repository.delete(1)
+        counts.extend([await repository.count(), await repository.count()])
+
+        # Assert
+        assert counts == [5, 5, 4, 4]
+        assert mock_async_session.execute.call_count == 4
+        assert get_count_cache().get(mock_model_class, 60.0) == 5
+
+    async def test_count_cache_invalidated_when_transaction_ends(
+        self,
+        mocker: MockerFixture,
+        mock_async_session: MockType,
+        mock_model_class: type[BaseModel],
+    ) -> None:
+        """Verify uncommitted deletions invalidate the cache at commit only."""
+
+        # Setup
+        class CachedCountRepository(BaseRepository[BaseModel]):
+            count_cache_ttl_s: ClassVar[float | None] = 60.0
+
+        get_count_cache().invalidate(mock_model_class)
+        session = AsyncSession()
+        mocker.patch.object(
+            session, "execute", return_value=mock_async_session.execute.return_value
+        )
+        result = mock_async_session.execute.return_value
+        result.scalar = mocker.Mock(side_effect=[5, 4, 4])
+        result.rowcount = 1
+
+        repository = CachedCountRepository(session, mock_model_class)
+
+        # Execute
+        await repository.count()
+        await session.begin()
+        await repository.delete(1)
+        in_transaction = await repository.count()
+        cached_in_transaction = get_count_cache().get(mock_model_class, 60.0)
+        await session.commit()
+
+        # Assert
+        assert in_transaction == 4
+        assert cached_in_transaction == 5
+        assert get_count_cache().get(mock_model_class, 60.0) is None
+        assert await repository.count() == 4
+        assert get_count_cache().get(mock_model_class, 60.0) == 4
+
+
+class StreamedScalars:
+    """Scalars streamed from a cursor, recording whether it was closed."""
+
+    def __init__(self, instances: list[object]) -> None:
+        self.instances = instances
+        self.closed = False
+
+    async def __aiter__(self) -> AsyncIterator[object]:
+        """Yield the instances."""
+        for instance in self.instances:
+            yield instance
+
+    async def close(self) -> None:
+        """Record that the cursor was closed."""
+        self.closed = True
+
+
+def streaming_session(
+    mocker: MockerFixture, session: MockType, isolation_level: str | None
+) -> MockType:
+    """Give a mock session a bind with an isolation level.
+
+    Returns the engine that streams of autocommit sessions connect to.
+    """
+    bind = session.get_bind.return_value
+    bind.get_execution_options.return_value = (
+        {} if isolation_level is None else {"isolation_level": isolation_level}
+    )
+    engine_class = mocker.patch("src.infrastructure.database.repository.AsyncEngine")
+    return cast("MockType", engine_class.return_value)
+
+
+WINDOW_START = datetime(2025, 3, 1, tzinfo=UTC)
+WINDOW_END = datetime(2025, 4, 1, tzinfo=UTC)
+
+
+@pytest.mark.unit
+class TestRepositoryTimeWindow:
+    """Test streaming the instances of a time window."""
+
+    async def test_window_streamed_in_time_order(
+        self,
+        mocker: MockerFixture,
+        mock_async_session: MockType,
+        mock_model_class: type[BaseModel],
+    ) -> None:
+        """Verify windows are half-open, filtered and streamed in batches."""
+        # Setup
+        engine = streaming_session(mocker, mock_async_session, None)
+        streamed = StreamedScalars(["newest", "oldest"])
+        mock_async_session.stream_scalars = mocker.AsyncMock(return_value=streamed)
+
+        repository = BaseRepository(mock_async_session, mock_model_class)
+
+        # Execute
+        instances: list[object] = [
+            instance
+            async for instance in repository.in_window(
+                WINDOW_START,
+                WINDOW_END,
+                {"status": "open"},
+                field="updated_at",
+                descending=True,
+                batch_size=50,
+            )
+        ]
+
+        # Assert
+        assert instances == ["newest", "oldest"]
+        assert streamed.closed
+        engine.connect.assert_not_called()
+        call = mock_async_session.stream_scalars.call_args
+        statement, parameters = call.args
+        sql = str(statement.compile(dialect=postgresql_dialect()))
+        assert (
+            "WHERE test_repo_model.updated_at >= %(filter_0)s::TIMESTAMP WITH TIME "
+            "ZONE AND test_repo_model.updated_at < %(filter_0_end)s::TIMESTAMP WITH "
+            "TIME ZONE AND test_repo_model.status = %(filter_1)s::VARCHAR"
+        ) in sql
+        assert sql.endswith(
+            "ORDER BY test_repo_model.updated_at DESC, test_repo_model.id DESC"
+        )
+        assert parameters == {
+            "filter_0": WINDOW_START,
+            "filter_0_end": WINDOW_END,
+            "filter_1": "open",
+        }
+        assert call.kwargs == {"execution_options": {"yield_per": 50}}
+
+    async def test_autocommit_sessions_stream_on_own_connection(
+        self,
+        mocker: MockerFixture,
+        mock_async_session: MockType,
+        mock_model_class: type[BaseModel],
+    ) -> None:
+        """Verify cursors of autocommit sessions get a read-only transaction."""
+        # Setup
+        engine = streaming_session(mocker, mock_async_session, "AUTOCOMMIT")
+        stream_connection = mocker.MagicMock()
+        stream_connection.execution_options = mocker.AsyncMock()
+        engine.connect.return_value.__aenter__.return_value = stream_connection
+        stream_session_class = mocker.patch(
+            "src.infrastructure.database.repository.AsyncSession"
+        )
+        stream_session = mocker.Mock()
+        stream_session_class.return_value.__aenter__.return_value = stream_session
+        streamed = StreamedScalars(["first", "second"])
+        stream_session.stream_scalars = mocker.AsyncMock(return_value=streamed)
+
+        repository = BaseRepository(mock_async_session, mock_model_class)
+
+        # Execute
+        instances: list[object] = []
+        async with contextlib.aclosing(
+            repository.in_window(WINDOW_START, WINDOW_END)
+        ) as stream:
+            async for instance in stream:
+                instances.append(instance)
+                break
+
+        # Assert
+        assert instances == ["first"]
+        assert streamed.closed
+        mock_async_session.stream_scalars.assert_not_called()
+        mock_async_session.connection.assert_not_called()
+        stream_connection.execution_options.assert_awaited_once_with(
+            isolation_level=stream_connection.default_isolation_level,
+            postgresql_readonly=True,
+        )
+        stream_connection.begin.return_value.__aexit__.assert_awaited_once()
+        stream_session_class.assert_called_once_with(
+            stream_connection, expire_on_commit=False
+        )
+        stream_session_class.return_value.__aexit__.assert_awaited_once()
+        engine.connect.return_value.__aexit__.assert_awaited_once()
+
+    async def test_window_field_filtered_twice_rejected(
+        self, mock_async_session: MockType, mock_model_class: type[BaseModel]
+    ) -> None:
+        """Verify the window field cannot also be filtered."""
+        repository = BaseRepository(mock_async_session, mock_model_class)
+
+        with pytest.raises(ValueError, match="Window field is also filtered"):
+            await anext(
+                repository.in_window(
+                    WINDOW_START, WINDOW_END, {"created_at": WINDOW_START}
+                )
+            )
@@ -0,0 +1,273 @@
+"""Unit tests for src/infrastructure/database/rollups.py module.
+
+This module tests rollup declarations, the generated trigger and backfill
+SQL, the migration helpers, summary reads and reconciliation.
+"""
+
+from datetime import UTC, datetime
+from decimal import Decimal
+
+import pytest
+from pytest_mock import MockerFixture, MockType
+from sqlalchemy import DateTime, Float, Numeric, String
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.schema import CreateTable, DropTable
+
+from src.infrastructure.database.base import BaseModel
+from src.infrastructure.database.rollups import (
+    Rollup,
+    RollupCheck,
+    create_rollup,
+    drop_rollup,
+    reconcile_rollup,
+    reconcile_rollups,
+    registered_rollups,
+    rollup_backfill_sql,
+    rollup_rows,
+    rollup_trigger_ddl,
+)
+from tests.unit.infrastructure.database.test_bulk_copy import postgresql_dialect
+
+
+class RollupTestInvoice(BaseModel):
+    """Test model summarized by rollups."""
+
+    __tablename__ = "rollup_test_invoice"
+
+    category: Mapped[str | None] = mapped_column("category_code", String(20))
+    amount: Mapped[Decimal] = mapped_column(Numeric(12, 2))
+    weight: Mapped[float] = mapped_column(Float)
+    issued_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    local_date: Mapped[datetime] = mapped_column(DateTime)
+
+
+DAILY_TOTALS = Rollup(
+    "rollup_test_daily_totals",
+    RollupTestInvoice,
+    time_field="issued_at",
+    group_by=["category"],
+    sums=["amount", "weight"],
+)
+MONTHLY_COUNTS = Rollup(
+    "rollup_test_monthly_counts",
+    RollupTestInvoice,
+    time_field="local_date",
+    interval="month",
+)
+
+
+@pytest.mark.unit
+class TestRollupDeclaration:
+    """Tests for Rollup."""
+
+    def test_summary_table(self) -> None:
+        """Verify the summary table has one unique row per bucket and group."""
+        sql = str(CreateTable(DAILY_TOTALS.table).compile(dialect=postgresql_dialect()))
+
+        assert "bucket TIMESTAMP WITH TIME ZONE NOT NULL" in sql
+        assert "category VARCHAR(20)," in sql
+        assert "row_count BIGINT DEFAULT 0 NOT NULL" in sql
+        # Sums of fixed precision columns must not overflow it
+        assert "amount NUMERIC DEFAULT 0 NOT NULL" in sql
+        assert "weight FLOAT DEFAULT 0 NOT NULL" in sql
+        assert "UNIQUE NULLS NOT DISTINCT (bucket, category)" in sql
+        assert DAILY_TOTALS.table.metadata is BaseModel.metadata
+
+    def test_rollups_registered_in_order(self) -> None:
+        """Verify declared rollups are available to reconciliation jobs."""
+        rollups = registered_rollups()
+
+        assert rollups.index(DAILY_TOTALS) < rollups.index(MONTHLY_COUNTS)
+
+    @pytest.mark.parametrize(
+        ("name", "options", "message"),
+        [
+            ("Daily", {}, "Invalid rollup name: Daily"),
+            ("rollup_test_daily_totals", {}, "Rollup already declared"),
+            ("rollup_test_other", {"interval": "2 days"}, "Invalid rollup interval"),
+            ("rollup_test_other", {"sums": ["row_count"]}, "not reserved"),
+            ("rollup_test_other", {"group_by": ["missing"]}, "Unknown field"),
+        ],
+    )
+    def test_invalid_declarations_rejected(
+        self, name: str, options: dict[str, object], message: str
+    ) -> None:
+        """Verify names, intervals and fields are validated."""
+        with pytest.raises(ValueError, match=message):
+            Rollup(name, RollupTestInvoice, time_field="issued_at", **options)  # type: ignore[arg-type]
+
+    def test_time_field_must_be_timestamp(self) -> None:
+        """Verify buckets are only taken from timestamps."""
+        with pytest.raises(TypeError, match="must be a timestamp: amount"):
+            Rollup("rollup_test_other", RollupTestInvoice, time_field="amount")
+
+
+@pytest.mark.unit
+class TestRollupSQL:
+    """Tests for the generated trigger and backfill SQL."""
+
+    def test_triggers_per_operation(self) -> None:
+        """Verify one statement trigger per operation with transition tables."""
+        function, *triggers = rollup_trigger_ddl(DAILY_TOTALS)
+
+        assert function.startswith(
+            'CREATE OR REPLACE FUNCTION "rollup_test_daily_totals_maintain"()'
+        )
+        assert triggers == [
+            (
+                'CREATE OR REPLACE TRIGGER "rollup_test_daily_totals_insert" '
+                'AFTER INSERT ON "rollup_test_invoice" REFERENCING NEW TABLE AS '
+                "new_rows FOR EACH STATEMENT EXECUTE FUNCTION "
+                '"rollup_test_daily_totals_maintain"()'
+            ),
+            (
+                'CREATE OR REPLACE TRIGGER "rollup_test_daily_totals_update" '
+                'AFTER UPDATE ON "rollup_test_invoice" REFERENCING OLD TABLE AS '
+                "old_rows NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION "
+                '"rollup_test_daily_totals_maintain"()'
+            ),
+            (
+                'CREATE OR REPLACE TRIGGER "rollup_test_daily_totals_delete" '
+                'AFTER DELETE ON "rollup_test_invoice" REFERENCING OLD TABLE AS '
+                "old_rows FOR EACH STATEMENT EXECUTE FUNCTION "
+                '"rollup_test_daily_totals_maintain"()'
+            ),
+        ]
+
+    def test_update_applies_net_change(self) -> None:
+        """Verify updates subtract old rows, add new ones and skip no-ops."""
+        function = rollup_trigger_ddl(DAILY_TOTALS)[0]
+        update = function.split("ELSIF TG_OP = 'UPDATE' THEN")[1].split("ELSIF")[0]
+
+        assert (
+            "SELECT date_trunc('day', \"issued_at\", 'UTC') AS \"bucket\", "
+            '"category_code" AS "category", -1 AS "row_count", '
+            '-1 * coalesce("amount", 0) AS "amount", '
+            '-1 * coalesce("weight", 0) AS "weight" FROM old_rows UNION ALL '
+        ) in update
+        assert '1 AS "row_count"' in update.split("UNION ALL")[1]
+        assert 'HAVING sum("row_count") <> 0 OR sum("amount") <> 0' in update
+        assert (
+            'ORDER BY "bucket", "category" ON CONFLICT ("bucket", "category")'
+        ) in update
+        assert (
+            'ON CONFLICT ("bucket", "category") DO UPDATE SET '
+            '"row_count" = r."row_count" + excluded."row_count"'
+        ) in update
+
+    def test_backfill_from_source_rows(self) -> None:
+        """Verify naive timestamps are truncated without a time zone."""
+        assert rollup_backfill_sql(MONTHLY_COUNTS) == (
+            'INSERT INTO "rollup_test_monthly_counts" ("bucket", "row_count") '
+            "SELECT date_trunc('month', \"local_date\"), count(*) "
+            'FROM "rollup_test_invoice" GROUP BY 1'
+        )
+
+
+@pytest.mark.unit
+class TestRollupMigrations:
+    """Tests for create_rollup and drop_rollup."""
+
+    @pytest.mark.parametrize(("backfill", "statements"), [(True, 6), (False, 5)])
+    def test_create_rollup(
+        self, mocker: MockerFixture, backfill: bool, statements: int
+    ) -> None:
+        """Verify the table, then triggers, then the backfill are created."""
+        operations = mocker.Mock()
+
+        create_rollup(operations, DAILY_TOTALS, backfill=backfill)
+
+        executed = [call.args[0] for call in operations.execute.call_args_list]
+        assert len(executed) == statements
+        assert isinstance(executed[0], CreateTable)
+        assert executed[1:5] == rollup_trigger_ddl(DAILY_TOTALS)
+        if backfill:
+            assert executed[5] == rollup_backfill_sql(DAILY_TOTALS)
+
+    def test_drop_rollup(self, mocker: MockerFixture) -> None:
+        """Verify triggers and the function go before the table."""
+        operations = mocker.Mock()
+
+        drop_rollup(operations, MONTHLY_COUNTS)
+
+        *ddl, drop_table = [call.args[0] for call in operations.execute.call_args_list]
+        assert ddl == [
+            (
+                'DROP TRIGGER IF EXISTS "rollup_test_monthly_counts_insert" '
+                'ON "rollup_test_invoice"'
+            ),
+            (
+                'DROP TRIGGER IF EXISTS "rollup_test_monthly_counts_update" '
+                'ON "rollup_test_invoice"'
+            ),
+            (
+                'DROP TRIGGER IF EXISTS "rollup_test_monthly_counts_delete" '
+                'ON "rollup_test_invoice"'
+            ),
+            'DROP FUNCTION IF EXISTS "rollup_test_monthly_counts_maintain"()',
+        ]
+        assert isinstance(drop_table, DropTable)
+
+
+@pytest.mark.unit
+class TestRollupReads:
+    """Tests for rollup_rows and reconciliation."""
+
+    async def test_rows_of_time_window(
+        self, mocker: MockerFixture, mock_async_session: MockType
+    ) -> None:
+        """Verify summaries of a window are read, without emptied groups."""
+        rows = [(datetime(2025, 1, 1, tzinfo=UTC), "a", 3, Decimal(10), 1.5)]
+        mock_async_session.execute.return_value.all = mocker.Mock(return_value=rows)
+
+        result = await rollup_rows(
+            mock_async_session,
+            DAILY_TOTALS,
+            start=datetime(2025, 1, 1, tzinfo=UTC),
+            end=datetime(2025, 2, 1, tzinfo=UTC),
+        )
+
+        assert result == rows
+        statement = mock_async_session.execute.call_args.args[0]
+        sql = str(statement.compile(dialect=postgresql_dialect()))
+        assert "WHERE rollup_test_daily_totals.row_count != %(row_count_1)s" in sql
+        assert "rollup_test_daily_totals.bucket >= %(bucket_1)s" in sql
+        assert "rollup_test_daily_totals.bucket < %(bucket_2)s" in sql
+        assert sql.endswith(
+            "ORDER BY rollup_test_daily_totals.bucket, "
+            "rollup_test_daily_totals.category"
+        )
+
+    async def test_matching_rollup_not_repaired(
+        self, mocker: MockerFixture, mock_async_session: MockType
+    ) -> None:
+        """Verify summaries and source rows are compared in one statement."""
+        mock_async_session.execute.return_value.scalar_one = mocker.Mock(return_value=0)
+
+        check = await reconcile_rollup(mock_async_session, MONTHLY_COUNTS, repair=True)
+
+        assert check == RollupCheck("rollup_test_monthly_counts", 0, repaired=False)
+        statement = str(mock_async_session.execute.call_args.args[0])
+        assert "EXCEPT ALL" in statement
+        mock_async_session.execute.assert_called_once()
+
+    async def test_mismatched_rollups_rebuilt(
+        self, mocker: MockerFixture, mock_async_session: MockType
+    ) -> None:
+        """Verify repairs lock out writers and rebuild the summaries."""
+        mocker.patch("src.infrastructure.database.rollups.logger")
+        mock_async_session.execute.return_value.scalar_one = mocker.Mock(return_value=2)
+
+        checks = await reconcile_rollups(
+            mock_async_session, [MONTHLY_COUNTS], repair=True
+        )
+
+        assert checks == [RollupCheck("rollup_test_monthly_counts", 2, repaired=True)]
+        statements = [
+            str(call.args[0]) for call in mock_async_session.execute.call_args_list
+        ]
+        assert statements[1:] == [
+            'LOCK TABLE "rollup_test_invoice" IN SHARE MODE',
+            'DELETE FROM "rollup_test_monthly_counts"',
+            rollup_backfill_sql(MONTHLY_COUNTS),
+        ]
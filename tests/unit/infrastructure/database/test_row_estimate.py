@@ -0,0 +1,122 @@
+"""Unit tests for src/infrastructure/database/row_estimate.py module.
+
+This module tests row estimates from table statistics and query plans,
+and the time to live of cached counts.
+"""
+
+import json
+
+import pytest
+from pytest_mock import MockerFixture, MockType
+from sqlalchemy import MetaData, Table
+
+from src.infrastructure.database.filters import (
+    In,
+    filter_parameters,
+    filter_query,
+    filtered_select,
+)
+from src.infrastructure.database.row_estimate import (
+    CountCache,
+    estimate_query_rows,
+    estimate_table_rows,
+    get_count_cache,
+)
+from tests.unit.infrastructure.database.test_bulk_copy import (
+    CopyTestModel,
+    postgresql_dialect,
+)
+
+
+@pytest.mark.unit
+class TestEstimateTableRows:
+    """Tests for estimate_table_rows."""
+
+    @pytest.mark.parametrize(
+        ("reltuples", "expected"),
+        [(1234.6, 1235), (0.0, 0), (-1.0, None), (None, None)],
+    )
+    async def test_estimate_from_statistics(
+        self,
+        mocker: MockerFixture,
+        mock_async_session: MockType,
+        reltuples: float | None,
+        expected: int | None,
+    ) -> None:
+        """Verify tables without statistics have no estimate."""
+        mock_async_session.execute.return_value.scalar = mocker.Mock(
+            return_value=reltuples
+        )
+        mock_async_session.in_transaction.return_value = True
+
+        estimate = await estimate_table_rows(
+            mock_async_session, Table("Orders", MetaData(), schema="sales")
+        )
+
+        assert estimate == expected
+        parameters = mock_async_session.execute.call_args.args[1]
+        assert parameters == {"table_name": '"sales"."Orders"'}
+
+
+@pytest.mark.unit
+class TestEstimateQueryRows:
+    """Tests for estimate_query_rows."""
+
+    async def test_estimate_from_plan(
+        self, mocker: MockerFixture, mock_async_session: MockType
+    ) -> None:
+        """Verify the query is explained with its bound values."""
+        connection = mocker.Mock()
+        connection.dialect = postgresql_dialect("asyncpg")
+        plan = json.dumps([{"Plan": {"Node Type": "Seq Scan", "Plan Rows": 420}}])
+        connection.exec_driver_sql = mocker.AsyncMock(
+            return_value=mocker.Mock(scalar_one=mocker.Mock(return_value=plan))
+        )
+        mock_async_session.connection = mocker.AsyncMock(return_value=connection)
+        filters = {"code": In(["a", "b"])}
+        statement = filtered_select(filter_query(CopyTestModel, filters))
+
+        estimate = await estimate_query_rows(
+            mock_async_session, statement, filter_parameters(filters)
+        )
+
+        assert estimate == 420
+        sql, arguments = connection.exec_driver_sql.call_args.args
+        assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT")
+        assert "IN ($1::VARCHAR, $2::VARCHAR)" in sql
+        assert arguments == ("a", "b")
+
+
+@pytest.mark.unit
+class TestCountCache:
+    """Tests for CountCache."""
+
+    def test_count_reused_until_too_old(self, mocker: MockerFixture) -> None:
+        """Verify counts expire after the maximum age."""
+        monotonic = mocker.patch(
+            "src.infrastructure.database.row_estimate.time.monotonic",
+            return_value=100.0,
+        )
+        cache = CountCache()
+        cache.put(CopyTestModel, 42)
+
+        monotonic.return_value = 129.9
+        assert cache.get(CopyTestModel, 30.0) == 42
+        monotonic.return_value = 130.0
+        assert cache.get(CopyTestModel, 30.0) is None
+
+    def test_invalidated_count_forgotten(self) -> None:
+        """Verify invalidation drops the count of one model only."""
+        cache = CountCache()
+        cache.put(CopyTestModel, 42)
+        cache.put(Table, 7)
+
+        cache.invalidate(CopyTestModel)
+        cache.invalidate(CopyTestModel)
+
+        assert cache.get(CopyTestModel, 60.0) is None
+        assert cache.get(Table, 60.0) == 7
+
+    def test_cache_is_shared(self) -> None:
+        """Verify one cache serves the whole process."""
+        assert get_count_cache() is get_count_cache()
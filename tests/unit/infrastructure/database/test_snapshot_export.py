@@ -0,0 +1,216 @@
+"""Unit tests for src/infrastructure/database/snapshot_export.py module.
+
+This module tests key range splitting and the coordination of parallel
+exports: snapshot export and import, and the ordered merge of ranges.
+"""
+
+from collections.abc import Awaitable, Callable
+from typing import Any, cast
+
+import pytest
+from pytest_mock import MockerFixture, MockType
+from sqlalchemy import Select, func, select
+
+from src.infrastructure.database.snapshot_export import (
+    export_snapshot_csv,
+    split_key_range,
+)
+from tests.unit.infrastructure.database.test_bulk_copy import (
+    CopyTestModel,
+    postgresql_dialect,
+)
+
+SNAPSHOT_ID = "00000003-0000001B-1"
+
+type CopySink = Callable[[bytes], Awaitable[None]]
+type RangeCopy = Callable[..., Awaitable[str]]
+
+
+async def copy_range(
+    query: str, *args: object, output: CopySink, header: bool, **_options: object
+) -> str:
+    """Emit one line naming the key range of the query."""
+    if header:
+        await output(b"id\n")
+    bounds = ",".join(str(arg) for arg in args) if "WHERE" in query else "all"
+    await output(f"{bounds}\n".encode())
+    return "COPY 1"
+
+
+async def copy_failing_last_range(
+    query: str, *args: object, output: CopySink, header: bool, **options: object
+) -> str:
+    """Copy like copy_range, except for the range ending after key 10."""
+    if args and args[-1] == 11:
+        msg = "range failed"
+        raise RuntimeError(msg)
+    return await copy_range(query, *args, output=output, header=header, **options)
+
+
+@pytest.fixture
+def key_bounds() -> tuple[int | None, int | None]:
+    """Smallest and largest key of the exported rows."""
+    return 1, 10
+
+
+@pytest.fixture
+def range_copy() -> RangeCopy:
+    """COPY behavior of every connection."""
+    return copy_range
+
+
+@pytest.fixture
+def driver_connections(
+    mocker: MockerFixture,
+    key_bounds: tuple[int | None, int | None],
+    range_copy: RangeCopy,
+) -> list[MockType]:
+    """Driver connections in checkout order; the first one coordinates."""
+    mocker.patch("src.infrastructure.database.snapshot_export.logger")
+    mocker.patch(
+        "src.infrastructure.database.snapshot_export.get_pool_capacity",
+        return_value=3,
+    )
+    driver_connections: list[MockType] = []
+
+    def connect() -> MockType:
+        driver_connection = mocker.Mock()
+        transaction = driver_connection.transaction.return_value
+        transaction.__aenter__ = mocker.AsyncMock(return_value=transaction)
+        transaction.__aexit__ = mocker.AsyncMock(return_value=None)
+        driver_connection.fetchval = mocker.AsyncMock(return_value=SNAPSHOT_ID)
+        driver_connection.fetchrow = mocker.AsyncMock(return_value=key_bounds)
+        driver_connection.execute = mocker.AsyncMock()
+        driver_connection.copy_from_query = mocker.AsyncMock(side_effect=range_copy)
+        driver_connections.append(driver_connection)
+        connection = mocker.Mock()
+        connection.dialect = postgresql_dialect("asyncpg")
+        connection.get_raw_connection = mocker.AsyncMock(
+            return_value=mocker.Mock(driver_connection=driver_connection)
+        )
+        context = mocker.Mock()
+        context.__aenter__ = mocker.AsyncMock(return_value=connection)
+        context.__aexit__ = mocker.AsyncMock(return_value=None)
+        return cast("MockType", context)
+
+    engine = mocker.Mock()
+    engine.connect.side_effect = connect
+    mocker.patch(
+        "src.infrastructure.database.snapshot_export.get_engine", return_value=engine
+    )
+    return driver_connections
+
+
+@pytest.mark.unit
+class TestSplitKeyRange:
+    """Tests for split_key_range."""
+
+    @pytest.mark.parametrize(
+        ("low", "high", "parts", "expected"),
+        [
+            (1, 10, 3, [(1, 5), (5, 8), (8, 11)]),
+            (1, 2, 4, [(1, 2), (2, 3)]),
+            (5, 5, 2, [(5, 6)]),
+            (-4, 3, 2, [(-4, 0), (0, 4)]),
+        ],
+    )
+    def test_ranges_are_contiguous(
+        self, low: int, high: int, parts: int, expected: list[tuple[int, int]]
+    ) -> None:
+        """Verify the ranges cover every key exactly once."""
+        assert split_key_range(low, high, parts) == expected
+
+
+@pytest.mark.unit
+class TestExportSnapshotCSV:
+    """Tests for export_snapshot_csv."""
+
+    async def test_ranges_merged_in_key_order(
+        self, driver_connections: list[MockType]
+    ) -> None:
+        """Verify workers import the snapshot and ranges come out in order."""
+        statement = select(CopyTestModel.id).order_by(CopyTestModel.code)
+
+        chunks = [
+            chunk
+            async for chunk in export_snapshot_csv(
+                statement, CopyTestModel.id, workers=8
+            )
+        ]
+
+        # Capped at the pool capacity of three connections
+        assert b"".join(chunks) == b"id\n1,5\n5,8\n8,11\n"
+        coordinator, *workers = driver_connections
+        assert len(workers) == 2
+        coordinator.fetchval.assert_awaited_once_with("SELECT pg_export_snapshot()")
+        coordinator.execute.assert_not_awaited()
+        for worker in workers:
+            worker.execute.assert_awaited_once_with(
+                f"SET TRANSACTION SNAPSHOT '{SNAPSHOT_ID}'"
+            )
+            assert worker.copy_from_query.call_args.kwargs["header"] is False
+        for driver_connection in driver_connections:
+            driver_connection.transaction.assert_called_once_with(
+                isolation="repeatable_read", readonly=True
+            )
+            query = driver_connection.copy_from_query.call_args.args[0]
+            assert query.endswith("ORDER BY bulk_copy_test_model.id")
+
+    @pytest.mark.parametrize("key_bounds", [(None, None)])
+    async def test_no_rows_exported_by_coordinator(
+        self, driver_connections: list[MockType]
+    ) -> None:
+        """Verify a query without rows is exported once, without workers."""
+        chunks = [
+            chunk
+            async for chunk in export_snapshot_csv(
+                select(CopyTestModel.id), CopyTestModel.id
+            )
+        ]
+
+        assert chunks == [b"id\n", b"all\n"]
+        assert len(driver_connections) == 1
+
+    @pytest.mark.parametrize("range_copy", [copy_failing_last_range])
+    async def test_failing_range_aborts_export(
+        self, driver_connections: list[MockType]
+    ) -> None:
+        """Verify a failed range raises from the consuming iteration."""
+        with pytest.raises(RuntimeError, match="range failed"):
+            _ = [
+                chunk
+                async for chunk in export_snapshot_csv(
+                    select(CopyTestModel.id), CopyTestModel.id
+                )
+            ]
+
+        assert len(driver_connections) == 3
+
+    async def test_invalid_worker_count_rejected(self) -> None:
+        """Verify at least one worker is required."""
+        with pytest.raises(ValueError, match="at least one worker"):
+            _ = [
+                chunk
+                async for chunk in export_snapshot_csv(
+                    select(CopyTestModel.id), CopyTestModel.id, workers=0
+                )
+            ]
+
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            select(CopyTestModel.id).limit(10),
+            select(CopyTestModel.id).offset(10),
+            select(CopyTestModel.id).distinct(),
+            select(CopyTestModel.id, func.count()).group_by(CopyTestModel.id),
+        ],
+    )
+    async def test_statements_not_splittable_rejected(
+        self, statement: Select[Any]
+    ) -> None:
+        """Verify statements whose rows change per range are rejected."""
+        with pytest.raises(ValueError, match="Cannot split an export by key range"):
+            _ = [
+                chunk
+                async for chunk in export_snapshot_csv(statement, CopyTestModel.id)
+            ]
@@ -0,0 +1,109 @@
+"""Unit tests for src/infrastructure/database/sql_comment.py module.
+
+This module tests sqlcommenter formatting and the stable route/controller
+tags appended to statements executed within a request.
+"""
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.core.resource_usage import request_usage_scope
+from src.infrastructure.database.sql_comment import (
+    add_stable_sql_comment,
+    format_sql_comment,
+)
+
+
+def get_user() -> None:
+    """Endpoint stand-in for route matching."""
+
+
+def make_scope() -> dict[str, object]:
+    """Build an ASGI scope with a matched route."""
+    route = type("Route", (), {"path": "/users/{user_id}", "endpoint": get_user})()
+    return {"path": "/users/42", "route": route}
+
+
+@pytest.mark.unit
+class TestFormatSQLComment:
+    """Tests for format_sql_comment."""
+
+    def test_keys_sorted_and_values_encoded(self) -> None:
+        """Verify the output follows the sqlcommenter specification."""
+        comment = format_sql_comment({"route": "/users/{id}", "controller": "get"})
+
+        assert comment == "/*controller='get',route='%2Fusers%2F%7Bid%7D'*/"
+
+    def test_empty_values_are_skipped(self) -> None:
+        """Verify no comment is produced without tag values."""
+        assert format_sql_comment({"route": "", "controller": ""}) == ""
+
+
+@pytest.mark.unit
+class TestAddStableSQLComment:
+    """Tests for the stable commenter listener."""
+
+    def test_appends_route_and_controller(self, mocker: MockerFixture) -> None:
+        """Verify statements in a request are tagged with stable values."""
+        with request_usage_scope(scope=make_scope()):
+            statement, parameters = add_stable_sql_comment(
+                mocker.Mock(),
+                mocker.Mock(),
+                "SELECT * FROM users WHERE id = $1",
+                (42,),
+                mocker.Mock(),
+                _executemany=False,
+            )
+
+        assert statement == (
+            "SELECT * FROM users WHERE id = $1 "
+            "/*controller='get_user',route='%2Fusers%2F%7Buser_id%7D'*/"
+        )
+        assert parameters == (42,)
+
+    def test_same_text_for_every_request_of_a_route(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Verify the statement text does not vary between requests."""
+        texts = set()
+        for _ in range(3):
+            with request_usage_scope(scope=make_scope()):
+                statement, _ = add_stable_sql_comment(
+                    mocker.Mock(),
+                    mocker.Mock(),
+                    "SELECT 1",
+                    None,
+                    mocker.Mock(),
+                    _executemany=False,
+                )
+            texts.add(statement)
+
+        assert len(texts) == 1
+
+    def test_outside_request_unchanged(self, mocker: MockerFixture) -> None:
+        """Verify statements outside of a request are not modified."""
+        statement, parameters = add_stable_sql_comment(
+            mocker.Mock(),
+            mocker.Mock(),
+            "SELECT 1",
+            None,
+            mocker.Mock(),
+            _executemany=False,
+        )
+
+        assert statement == "SELECT 1"
+        assert parameters is None
+
+    def test_existing_comment_unchanged(self, mocker: MockerFixture) -> None:
+        """Verify statements already carrying a trailing comment are kept."""
+        with request_usage_scope(scope=make_scope()):
+            statement, _ = add_stable_sql_comment(
+                mocker.Mock(),
+                mocker.Mock(),
+                "SELECT 1 /*traceparent='x'*/",
+                None,
+                mocker.Mock(),
+                _executemany=False,
+            )
+
+        assert statement == "SELECT 1 /*traceparent='x'*/"
@@ -0,0 +1,90 @@
+"""Unit tests for src/infrastructure/database/statement_cache.py module.
+
+This module tests the prepared statement cache hit and miss counters and
+the pool listener installing the counting cache.
+"""
+
+import pytest
+from pytest_mock import MockerFixture
+from sqlalchemy.util import LRUCache
+
+from src.infrastructure.database.statement_cache import (
+    StatementCacheStats,
+    _CountingStatementCache,
+    get_statement_cache_stats,
+    install_statement_cache_metrics,
+)
+
+
+@pytest.mark.unit
+class TestStatementCacheStats:
+    """Tests for StatementCacheStats."""
+
+    def test_hit_rate(self) -> None:
+        """Verify hits and misses produce the hit rate."""
+        stats = StatementCacheStats()
+
+        assert stats.as_dict() == {"hits": 0, "misses": 0, "hit_rate": None}
+
+        stats.record(hit=True)
+        stats.record(hit=True)
+        stats.record(hit=True)
+        stats.record(hit=False)
+
+        assert stats.as_dict() == {"hits": 3, "misses": 1, "hit_rate": 0.75}
+
+    def test_reset(self) -> None:
+        """Verify reset clears the counters."""
+        stats = StatementCacheStats()
+        stats.record(hit=False)
+
+        stats.reset()
+
+        assert stats.as_dict()["misses"] == 0
+
+    def test_counting_cache_counts_lookups(self) -> None:
+        """Verify membership checks are counted as hits and misses."""
+        stats = StatementCacheStats()
+        cache = _CountingStatementCache(2, stats)
+        cache["SELECT 1"] = object()
+
+        assert "SELECT 1" in cache
+        assert "SELECT 2" not in cache
+        assert stats.hits == 1
+        assert stats.misses == 1
+
+
+@pytest.mark.unit
+class TestInstallStatementCacheMetrics:
+    """Tests for the pool connect listener."""
+
+    def test_replaces_cache_with_same_capacity(self, mocker: MockerFixture) -> None:
+        """Verify the driver cache is swapped for a counting one."""
+        connection = mocker.Mock()
+        connection._prepared_statement_cache = LRUCache(250)
+
+        install_statement_cache_metrics(connection, mocker.Mock())
+
+        cache = connection._prepared_statement_cache
+        assert isinstance(cache, _CountingStatementCache)
+        assert cache.capacity == 250
+        assert cache._stats is get_statement_cache_stats()
+
+    def test_disabled_cache_left_unchanged(self, mocker: MockerFixture) -> None:
+        """Verify connections without a statement cache are not modified."""
+        connection = mocker.Mock()
+        connection._prepared_statement_cache = None
+
+        install_statement_cache_metrics(connection, mocker.Mock())
+
+        assert connection._prepared_statement_cache is None
+
+    def test_counting_cache_not_wrapped_twice(self, mocker: MockerFixture) -> None:
+        """Verify an already counting cache is kept."""
+        connection = mocker.Mock()
+        cache = _CountingStatementCache(10, StatementCacheStats())
+        connection._prepared_statement_cache = cache
+
+        install_statement_cache_metrics(connection, mocker.Mock())
+
+        assert connection._prepared_statement_cache is cache